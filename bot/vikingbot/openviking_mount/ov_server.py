@@ -240,7 +240,8 @@ class VikingClient:
 
                 session.add_message(role=role, parts=parts)
 
-            result = session.commit()
+            # Archive now; memories are extracted by a background commit job
+            result = await self.client.commit_session(session_id)
         else:
             for message in messages:
                 await session.add_message(role=message.get("role"), content=message.get("content"))
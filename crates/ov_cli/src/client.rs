@@ -431,6 +431,7 @@ impl HttpClient {
         include: Option<String>,
         exclude: Option<String>,
         directly_upload_media: bool,
+        incremental: bool,
     ) -> Result<serde_json::Value> {
         let path_obj = Path::new(path);
         
@@ -452,6 +453,7 @@ impl HttpClient {
                 "include": include,
                 "exclude": exclude,
                 "directly_upload_media": directly_upload_media,
+                "incremental": incremental,
             });
             
             self.post("/api/v1/resources", &body).await
@@ -469,6 +471,7 @@ impl HttpClient {
                 "include": include,
                 "exclude": exclude,
                 "directly_upload_media": directly_upload_media,
+                "incremental": incremental,
             });
             
             self.post("/api/v1/resources", &body).await
@@ -32,6 +32,16 @@ pub async fn vlm(
     Ok(())
 }
 
+pub async fn cache(
+    client: &HttpClient,
+    output_format: OutputFormat,
+    compact: bool,
+) -> Result<()> {
+    let response: serde_json::Value = client.get("/api/v1/observer/cache", &[]).await?;
+    output_success(&response, output_format, compact);
+    Ok(())
+}
+
 pub async fn system(
     client: &HttpClient,
     output_format: OutputFormat,
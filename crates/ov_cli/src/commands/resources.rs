@@ -15,6 +15,7 @@ pub async fn add_resource(
     include: Option<String>,
     exclude: Option<String>,
     directly_upload_media: bool,
+    incremental: bool,
     format: OutputFormat,
     compact: bool,
 ) -> Result<()> {
@@ -31,6 +32,7 @@ pub async fn add_resource(
             include,
             exclude,
             directly_upload_media,
+            incremental,
         )
         .await?;
     output_success(&result, format, compact);
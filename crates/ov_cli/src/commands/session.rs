@@ -141,7 +141,9 @@ pub async fn add_memory(
 
     // 3. Commit
     let commit_path = format!("/api/v1/sessions/{}/commit", url_encode(session_id));
-    let commit_response: serde_json::Value = client.post(&commit_path, &json!({})).await?;
+    // Wait for memory extraction so the extracted count can be reported
+    let commit_response: serde_json::Value =
+        client.post(&commit_path, &json!({"wait": true})).await?;
 
     // Extract memories count from commit response
     let memories_extracted = commit_response["memories_extracted"].as_i64().unwrap_or(0);
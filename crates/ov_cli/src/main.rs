@@ -92,6 +92,9 @@ enum Commands {
         /// Do not directly upload media files
         #[arg(long = "no-directly-upload-media", default_value_t = false)]
         no_directly_upload_media: bool,
+        /// Update an existing resource in place, re-processing only changed files
+        #[arg(long, default_value_t = false)]
+        incremental: bool,
     },
     /// Add a skill into OpenViking
     AddSkill {
@@ -351,6 +354,8 @@ enum ObserverCommands {
     Vikingdb,
     /// Get VLM status
     Vlm,
+    /// Get query and embedding cache hit rates
+    Cache,
     /// Get overall system status
     System,
 }
@@ -482,6 +487,7 @@ async fn main() {
             include,
             exclude,
             no_directly_upload_media,
+            incremental,
         } => {
             handle_add_resource(
                 path,
@@ -495,6 +501,7 @@ async fn main() {
                 include,
                 exclude,
                 no_directly_upload_media,
+                incremental,
                 ctx,
             )
             .await
@@ -594,6 +601,7 @@ async fn handle_add_resource(
     include: Option<String>,
     exclude: Option<String>,
     no_directly_upload_media: bool,
+    incremental: bool,
     ctx: CliContext,
 ) -> Result<()> {
     // Validate path: if it's a local path, check if it exists
@@ -641,6 +649,7 @@ async fn handle_add_resource(
         include,
         exclude,
         directly_upload_media,
+        incremental,
         ctx.output_format,
         ctx.compact,
     ).await
@@ -733,6 +742,9 @@ async fn handle_observer(cmd: ObserverCommands, ctx: CliContext) -> Result<()> {
         ObserverCommands::Vlm => {
             commands::observer::vlm(&client, ctx.output_format, ctx.compact).await
         }
+        ObserverCommands::Cache => {
+            commands::observer::cache(&client, ctx.output_format, ctx.compact).await
+        }
         ObserverCommands::System => {
             commands::observer::system(&client, ctx.output_format, ctx.compact).await
         }
@@ -162,10 +162,19 @@ class AsyncOpenViking:
             session_id=session_id, role=role, content=content, parts=parts
         )
 
-    async def commit_session(self, session_id: str) -> Dict[str, Any]:
-        """Commit a session (archive and extract memories)."""
+    async def commit_session(self, session_id: str, wait: bool = False) -> Dict[str, Any]:
+        """Commit a session (archive and extract memories).
+
+        Unless ``wait`` is set, memories are extracted by a background job whose
+        ``job_id`` is returned; poll it with get_commit_job().
+        """
+        await self._ensure_initialized()
+        return await self._client.commit_session(session_id, wait=wait)
+
+    async def get_commit_job(self, session_id: str, job_id: str) -> Dict[str, Any]:
+        """Get the status and result of a background commit job."""
         await self._ensure_initialized()
-        return await self._client.commit_session(session_id)
+        return await self._client.get_commit_job(session_id, job_id)
 
     # ============= Resource methods =============
 
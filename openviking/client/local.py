@@ -201,8 +201,7 @@ class LocalClient(BaseClient):
         """Semantic search with optional session context."""
         session = None
         if session_id:
-            session = self._service.sessions.session(self._ctx, session_id)
-            await session.load()
+            session = await self._service.sessions.load(self._ctx, session_id)
         return await self._service.search.search(
             query=query,
             ctx=self._ctx,
@@ -264,9 +263,13 @@ class LocalClient(BaseClient):
         """Delete a session."""
         await self._service.sessions.delete(session_id, self._ctx)
 
-    async def commit_session(self, session_id: str) -> Dict[str, Any]:
+    async def commit_session(self, session_id: str, wait: bool = False) -> Dict[str, Any]:
         """Commit a session (archive and extract memories)."""
-        return await self._service.sessions.commit(session_id, self._ctx)
+        return await self._service.sessions.commit(session_id, self._ctx, wait=wait)
+
+    async def get_commit_job(self, session_id: str, job_id: str) -> Dict[str, Any]:
+        """Get the status and result of a background commit job."""
+        return self._service.sessions.get_commit_job(session_id, job_id, self._ctx)
 
     async def add_message(
         self,
@@ -287,9 +290,6 @@ class LocalClient(BaseClient):
         """
         from openviking.message.part import Part, TextPart, part_from_dict
 
-        session = self._service.sessions.session(self._ctx, session_id)
-        await session.load()
-
         message_parts: list[Part]
         if parts is not None:
             message_parts = [part_from_dict(p) for p in parts]
@@ -298,10 +298,12 @@ class LocalClient(BaseClient):
         else:
             raise ValueError("Either content or parts must be provided")
 
-        session.add_message(role, message_parts)
+        async with self._service.sessions.locked(self._ctx, session_id) as session:
+            session.add_message(role, message_parts)
+            message_count = len(session.messages)
         return {
             "session_id": session_id,
-            "message_count": len(session.messages),
+            "message_count": message_count,
         }
 
     # ============= Pack =============
@@ -28,6 +28,8 @@ class BuildingTree:
         self._contexts: List["Context"] = []
         self._uri_map: Dict[str, "Context"] = {}
         self._root_uri: Optional[str] = None
+        # File counts of an incremental re-import; None for a regular import.
+        self.sync_stats: Optional[Dict[str, int]] = None
 
     def add_context(self, context: "Context") -> None:
         """Add a context to the tree."""
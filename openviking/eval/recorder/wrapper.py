@@ -130,6 +130,7 @@ class RecordingVikingFS:
             "delete_temp",
             "write_context",
             "get_relations",
+            "get_relations_many",
             "get_relations_with_content",
             "find",
             "search",
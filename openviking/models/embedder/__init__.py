@@ -22,6 +22,13 @@ from openviking.models.embedder.base import (
     HybridEmbedderBase,
     SparseEmbedderBase,
 )
+from openviking.models.embedder.cache import (
+    CachedEmbedder,
+    EmbeddingCache,
+    EmbeddingCacheStats,
+    get_embedding_cache,
+    init_embedding_cache,
+)
 from openviking.models.embedder.jina_embedders import JinaDenseEmbedder
 from openviking.models.embedder.openai_embedders import OpenAIDenseEmbedder
 from openviking.models.embedder.vikingdb_embedders import (
@@ -43,6 +50,12 @@ __all__ = [
     "SparseEmbedderBase",
     "HybridEmbedderBase",
     "CompositeHybridEmbedder",
+    # Cache
+    "CachedEmbedder",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "get_embedding_cache",
+    "init_embedding_cache",
     # Jina AI implementations
     "JinaDenseEmbedder",
     # OpenAI implementations
@@ -0,0 +1,452 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Content-addressed embedding cache.
+
+Embedding results are keyed by (model, dimension, sha256(text)) and kept in two
+tiers: an in-memory LRU and an optional SQLite file under the workspace, so
+re-imports and repeated queries do not pay for the same provider call twice.
+Both tiers are bounded by the serialized size of the cached vectors.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from openviking.models.embedder.base import EmbedderBase, EmbedResult
+from openviking_cli.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Serialized entry: (dense vector as float64 bytes, sparse vector as JSON)
+_Entry = Tuple[Optional[bytes], Optional[str]]
+
+# Fraction of the disk limit kept after an eviction pass, so that eviction
+# does not run again on every insert once the tier is full.
+_DISK_EVICT_TARGET = 0.9
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Counters of an EmbeddingCache."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    memory_entries: int = 0
+    memory_bytes: int = 0
+    disk_entries: int = 0
+    disk_bytes: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _encode(result: EmbedResult) -> _Entry:
+    dense = array("d", result.dense_vector).tobytes() if result.dense_vector is not None else None
+    sparse = json.dumps(result.sparse_vector) if result.sparse_vector is not None else None
+    return dense, sparse
+
+
+def _decode(entry: _Entry) -> EmbedResult:
+    dense, sparse = entry
+    dense_vector = None
+    if dense is not None:
+        values = array("d")
+        values.frombytes(dense)
+        dense_vector = values.tolist()
+    return EmbedResult(
+        dense_vector=dense_vector,
+        sparse_vector=json.loads(sparse) if sparse is not None else None,
+    )
+
+
+def _entry_size(entry: _Entry) -> int:
+    dense, sparse = entry
+    return (len(dense) if dense else 0) + (len(sparse) if sparse else 0)
+
+
+class EmbeddingCache:
+    """Two-tier (memory LRU + SQLite) cache of embedding results.
+
+    Thread-safe; embedders are called from worker threads.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        memory_max_bytes: int = 64 * 1024 * 1024,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file of the disk tier. None keeps the cache in memory only.
+            memory_max_bytes: Size limit of the memory tier (0 disables it).
+            disk_max_bytes: Size limit of the disk tier (0 disables it).
+        """
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._memory_max_bytes = memory_max_bytes
+        self._disk_max_bytes = disk_max_bytes
+        self._stats = EmbeddingCacheStats()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_entries = 0
+        self._disk_bytes = 0
+        self.path = path if path and disk_max_bytes > 0 else None
+
+        if self.path:
+            try:
+                self._open_disk(self.path)
+            except sqlite3.Error as e:
+                logger.warning(f"[EmbeddingCache] Disk tier disabled, cannot open {self.path}: {e}")
+                self._conn = None
+                self.path = None
+
+    def _open_disk(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, dense BLOB, sparse TEXT, "
+            "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_accessed ON embeddings(accessed)")
+        conn.commit()
+        count, size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM embeddings"
+        ).fetchone()
+        self._conn = conn
+        self._disk_entries = count
+        self._disk_bytes = size
+
+    @staticmethod
+    def make_key(model: str, dimension: int, text: str) -> str:
+        """Build the cache key for a text embedded by a given model."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model}:{dimension}:{digest}"
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[EmbedResult]]:
+        """Look up several keys. Disk hits are promoted to the memory tier."""
+        results: List[Optional[EmbedResult]] = [None] * len(keys)
+        with self._lock:
+            disk_lookup: Dict[str, List[int]] = {}
+            for i, key in enumerate(keys):
+                entry = self._memory.get(key)
+                if entry is not None:
+                    self._memory.move_to_end(key)
+                    self._stats.memory_hits += 1
+                    results[i] = _decode(entry)
+                else:
+                    disk_lookup.setdefault(key, []).append(i)
+
+            found: Dict[str, _Entry] = {}
+            if disk_lookup and self._conn is not None:
+                try:
+                    found = self._disk_get(list(disk_lookup))
+                except sqlite3.Error as e:
+                    logger.warning(f"[EmbeddingCache] Disk lookup failed: {e}")
+
+            for key, positions in disk_lookup.items():
+                entry = found.get(key)
+                if entry is None:
+                    self._stats.misses += len(positions)
+                    continue
+                self._stats.disk_hits += len(positions)
+                self._memory_put(key, entry)
+                for i in positions:
+                    results[i] = _decode(entry)
+        return results
+
+    def put_many(self, items: Sequence[Tuple[str, EmbedResult]]) -> None:
+        """Store several results in both tiers."""
+        if not items:
+            return
+        with self._lock:
+            entries = [(key, _encode(result)) for key, result in items]
+            for key, entry in entries:
+                self._memory_put(key, entry)
+            if self._conn is not None:
+                try:
+                    self._disk_put(entries)
+                except sqlite3.Error as e:
+                    logger.warning(f"[EmbeddingCache] Disk write failed: {e}")
+
+    def get(self, key: str) -> Optional[EmbedResult]:
+        return self.get_many([key])[0]
+
+    def put(self, key: str, result: EmbedResult) -> None:
+        self.put_many([(key, result)])
+
+    def get_stats(self) -> EmbeddingCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return EmbeddingCacheStats(
+                memory_hits=self._stats.memory_hits,
+                disk_hits=self._stats.disk_hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                memory_entries=len(self._memory),
+                memory_bytes=self._memory_bytes,
+                disk_entries=self._disk_entries,
+                disk_bytes=self._disk_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embeddings")
+                self._conn.commit()
+                self._disk_entries = 0
+                self._disk_bytes = 0
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ========== Memory tier ==========
+
+    def _memory_put(self, key: str, entry: _Entry) -> None:
+        size = _entry_size(entry)
+        if size > self._memory_max_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= _entry_size(old)
+        self._memory[key] = entry
+        self._memory_bytes += size
+        while self._memory_bytes > self._memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= _entry_size(evicted)
+            self._stats.evictions += 1
+
+    # ========== Disk tier ==========
+
+    def _disk_get(self, keys: List[str]) -> Dict[str, _Entry]:
+        found: Dict[str, _Entry] = {}
+        # Stay below SQLite's default limit on bound parameters.
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, dense, sparse FROM embeddings WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            for key, dense, sparse in rows:
+                found[key] = (dense, sparse)
+        if found:
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE embeddings SET accessed = ? WHERE key = ?", [(now, k) for k in found]
+            )
+            self._conn.commit()
+        return found
+
+    def _disk_put(self, entries: List[Tuple[str, _Entry]]) -> None:
+        now = time.time()
+        keys = [key for key, _ in entries]
+        replaced = 0
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for (size,) in self._conn.execute(
+                f"SELECT size FROM embeddings WHERE key IN ({placeholders})", chunk
+            ):
+                self._disk_bytes -= size
+                replaced += 1
+        rows = {}
+        for key, entry in entries:
+            rows[key] = (key, entry[0], entry[1], _entry_size(entry), now)
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, dense, sparse, size, accessed) "
+            "VALUES (?, ?, ?, ?, ?)",
+            list(rows.values()),
+        )
+        self._disk_entries += len(rows) - replaced
+        self._disk_bytes += sum(row[3] for row in rows.values())
+        if self._disk_bytes > self._disk_max_bytes:
+            self._disk_evict()
+        self._conn.commit()
+
+    def _disk_evict(self) -> None:
+        target = int(self._disk_max_bytes * _DISK_EVICT_TARGET)
+        victims: List[Tuple[str]] = []
+        freed = 0
+        for key, size in self._conn.execute("SELECT key, size FROM embeddings ORDER BY accessed"):
+            if self._disk_bytes - freed <= target:
+                break
+            victims.append((key,))
+            freed += size
+        self._conn.executemany("DELETE FROM embeddings WHERE key = ?", victims)
+        self._disk_entries -= len(victims)
+        self._disk_bytes -= freed
+        self._stats.evictions += len(victims)
+
+
+# Settings that change the vectors an embedder returns for the same model and
+# text: the endpoint it calls and provider-specific request options.
+_NAMESPACE_ATTRS = (
+    "api_base",
+    "host",
+    "region",
+    "model_version",
+    "task",
+    "late_chunking",
+    "input_type",
+    "embedding_type",
+)
+
+
+def _namespace(embedder: EmbedderBase) -> str:
+    """Cache namespace of an embedder.
+
+    The class name separates providers and dense/sparse/hybrid embedders of
+    one model; the remaining parts separate configurations of one provider.
+    """
+    parts = [type(embedder).__name__, embedder.model_name]
+    for attr in _NAMESPACE_ATTRS:
+        value = getattr(embedder, attr, None)
+        if value is not None:
+            parts.append(f"{attr}={value}")
+    for attr in ("dense_embedder", "sparse_embedder"):
+        inner = getattr(embedder, attr, None)
+        if isinstance(inner, EmbedderBase):
+            parts.append(f"{attr}=({_namespace(inner)})")
+    return "/".join(parts)
+
+
+class CachedEmbedder(EmbedderBase):
+    """Embedder wrapper that serves repeated texts from an EmbeddingCache.
+
+    Only cache misses reach the wrapped embedder; embed_batch sends all misses
+    of a batch in one embed_batch call.
+    """
+
+    def __init__(self, embedder: EmbedderBase, cache: Optional[EmbeddingCache] = None):
+        """Wrap an embedder.
+
+        Args:
+            embedder: Embedder to call on cache misses.
+            cache: Cache to use. None uses the process-wide cache.
+        """
+        super().__init__(embedder.model_name, embedder.config)
+        self.embedder = embedder
+        self._cache = cache
+        try:
+            dimension = embedder.get_dimension()
+        except Exception:
+            dimension = 0
+        self._namespace = _namespace(embedder)
+        self._dimension = dimension or 0
+
+    @property
+    def cache(self) -> EmbeddingCache:
+        return self._cache or get_embedding_cache()
+
+    def _key(self, text: str) -> str:
+        return EmbeddingCache.make_key(self._namespace, self._dimension, text)
+
+    def embed(self, text: str) -> EmbedResult:
+        cache = self.cache
+        key = self._key(text)
+        result = cache.get(key)
+        if result is None:
+            result = self.embedder.embed(text)
+            cache.put(key, result)
+        return result
+
+    def embed_batch(self, texts: List[str]) -> List[EmbedResult]:
+        if not texts:
+            return []
+        cache = self.cache
+        keys = [self._key(text) for text in texts]
+        results = cache.get_many(keys)
+
+        # Embed each distinct missing text once.
+        missing: Dict[str, List[int]] = {}
+        for i, result in enumerate(results):
+            if result is None:
+                missing.setdefault(keys[i], []).append(i)
+        if missing:
+            miss_texts = [texts[positions[0]] for positions in missing.values()]
+            embedded = self.embedder.embed_batch(miss_texts)
+            cache.put_many(list(zip(missing.keys(), embedded)))
+            for positions, result in zip(missing.values(), embedded):
+                for i in positions:
+                    results[i] = result
+        return results
+
+    def get_dimension(self) -> int:
+        return self.embedder.get_dimension()
+
+    def close(self):
+        self.embedder.close()
+
+    @property
+    def is_dense(self) -> bool:
+        return self.embedder.is_dense
+
+    @property
+    def is_sparse(self) -> bool:
+        return self.embedder.is_sparse
+
+    @property
+    def is_hybrid(self) -> bool:
+        return self.embedder.is_hybrid
+
+
+# ========== Singleton Pattern ==========
+_instance: Optional[EmbeddingCache] = None
+_instance_lock = threading.Lock()
+
+
+def init_embedding_cache(
+    path: Optional[str] = None,
+    memory_max_bytes: int = 64 * 1024 * 1024,
+    disk_max_bytes: int = 512 * 1024 * 1024,
+) -> EmbeddingCache:
+    """Initialize the process-wide embedding cache, replacing any previous one."""
+    global _instance
+    with _instance_lock:
+        if _instance is not None:
+            _instance.close()
+        _instance = EmbeddingCache(
+            path=path, memory_max_bytes=memory_max_bytes, disk_max_bytes=disk_max_bytes
+        )
+        logger.info(
+            f"[EmbeddingCache] Initialized (disk={_instance.path or 'disabled'}, "
+            f"memory_max_bytes={memory_max_bytes}, disk_max_bytes={disk_max_bytes})"
+        )
+        return _instance
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache, creating a memory-only one if needed."""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = EmbeddingCache()
+    return _instance
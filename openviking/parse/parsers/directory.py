@@ -8,17 +8,21 @@ Text, code, etc.).  Follows the same three-phase pattern as
 CodeRepositoryParser:
 
 1. Scan → classify files with ``scan_directory()``
-2. For each file:
+2. For each file (up to ``max_concurrency`` files at a time):
    - Files WITH a dedicated parser → ``parser.parse()`` handles conversion
-     and VikingFS temp creation; results are merged into the main temp.
+     and VikingFS temp creation; results are merged into the main temp in
+     scan order.  CPU-heavy conversions (PDF, Office, EPUB, HTML) run in the
+     parse process pool (see ``openviking.parse.process_pool``).
    - Files WITHOUT a parser (code, config, …) → written directly to VikingFS.
 3. Return ``ParseResult`` so that ``TreeBuilder.finalize_from_temp``
    can move the content to AGFS and enqueue semantic processing.
 """
 
+import asyncio
 import time
+from dataclasses import dataclass, field
 from pathlib import Path, PurePosixPath
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from openviking.parse.base import (
     NodeType,
@@ -28,6 +32,7 @@ from openviking.parse.base import (
 )
 from openviking.parse.parsers.base_parser import BaseParser
 from openviking.parse.parsers.media.constants import MEDIA_EXTENSIONS
+from openviking_cli.utils.config import get_openviking_config
 from openviking_cli.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -37,6 +42,17 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@dataclass
+class _FileOutcome:
+    """Result of parsing / uploading one file of the directory."""
+
+    parser_name: str
+    ok: bool = False
+    # Parser temp output still to be merged into the directory temp.
+    temp_dir_path: Optional[str] = None
+    warnings: List[str] = field(default_factory=list)
+
+
 class DirectoryParser(BaseParser):
     """
     Parser for local directories.
@@ -76,7 +92,11 @@ class DirectoryParser(BaseParser):
             instruction: Processing instruction (forwarded where applicable).
             **kwargs: Extra options forwarded to ``scan_directory``:
                 ``strict``, ``ignore_dirs``, ``include``, ``exclude``,
-                ``directly_upload_media``.
+                ``directly_upload_media``.  ``max_concurrency`` bounds how
+                many files are processed at once (default: the
+                ``parse_directory_concurrency`` setting) and ``progress_callback``
+                is called as ``(completed, total, rel_path, ok)`` after each
+                file.
 
         Returns:
             ``ParseResult`` with ``temp_dir_path`` pointing to VikingFS temp.
@@ -132,58 +152,58 @@ class DirectoryParser(BaseParser):
                 result.temp_dir_path = temp_uri
                 return result
 
-            # ── Phase 2: process each file ────────────────────────────
+            # ── Phase 2: process files concurrently ───────────────────
+            # Up to ``max_concurrency`` files are parsed / uploaded at once;
+            # parser output is merged afterwards in scan order, so the
+            # resulting tree does not depend on which file finished first.
+            max_concurrency = max(
+                1,
+                kwargs.get("max_concurrency")
+                or get_openviking_config().parse_directory_concurrency,
+            )
+            progress_callback = kwargs.get("progress_callback")
+            semaphore = asyncio.Semaphore(max_concurrency)
+            total = len(processable_files)
+            completed = 0
+
+            async def _run(cf: "ClassifiedFile") -> _FileOutcome:
+                nonlocal completed
+                async with semaphore:
+                    outcome = await self._handle_file(
+                        cf, registry, target_uri, viking_fs, directly_upload_media
+                    )
+                completed += 1
+                logger.info(
+                    f"[DirectoryParser] ({completed}/{total}) {cf.rel_path} "
+                    f"[{outcome.parser_name}] {'done' if outcome.ok else 'failed'}"
+                )
+                if progress_callback:
+                    progress_callback(completed, total, cf.rel_path, outcome.ok)
+                return outcome
+
+            outcomes = await asyncio.gather(*(_run(cf) for cf in processable_files))
+
             file_count = 0
             processed_files: List[Dict[str, str]] = []
             failed_files: List[Dict[str, str]] = []
 
-            for cf in processable_files:
-                file_parser = self._assign_parser(cf, registry)
-                parser_name = type(file_parser).__name__ if file_parser else "direct"
-
-                # Check if this is a media parser and we should directly upload
-                is_media_parser = file_parser and parser_name in [
-                    "ImageParser",
-                    "AudioParser",
-                    "VideoParser",
-                ]
-                ext = Path(cf.path).suffix.lower()
-                is_media_file = ext in MEDIA_EXTENSIONS
-
-                if directly_upload_media and is_media_parser and is_media_file:
-                    # Directly upload media file without using media parser
-                    ok = await self._upload_file_directly(
+            for cf, outcome in zip(processable_files, outcomes):
+                ok = outcome.ok
+                if ok and outcome.temp_dir_path:
+                    ok = await self._merge_parsed_file(
                         cf,
+                        outcome.temp_dir_path,
                         target_uri,
                         viking_fs,
-                        warnings,
+                        outcome.warnings,
                     )
-                    parser_name = "direct_upload"
-                else:
-                    # Normal processing with parser
-                    ok = await self._process_single_file(
-                        cf,
-                        file_parser,
-                        target_uri,
-                        viking_fs,
-                        warnings,
-                    )
-
+                warnings.extend(outcome.warnings)
+                entry = {"path": cf.rel_path, "parser": outcome.parser_name}
                 if ok:
                     file_count += 1
-                    processed_files.append(
-                        {
-                            "path": cf.rel_path,
-                            "parser": parser_name,
-                        }
-                    )
+                    processed_files.append(entry)
                 else:
-                    failed_files.append(
-                        {
-                            "path": cf.rel_path,
-                            "parser": parser_name,
-                        }
-                    )
+                    failed_files.append(entry)
 
             # Collect unsupported files from scan result
             unsupported_files = [
@@ -312,6 +332,48 @@ class DirectoryParser(BaseParser):
     # Per-file processing
     # ------------------------------------------------------------------
 
+    async def _handle_file(
+        self,
+        classified_file: "ClassifiedFile",
+        registry: "ParserRegistry",
+        target_uri: str,
+        viking_fs: Any,
+        directly_upload_media: bool,
+    ) -> _FileOutcome:
+        """Parse or upload one file; parser output is left in its own temp."""
+        file_parser = self._assign_parser(classified_file, registry)
+        parser_name = type(file_parser).__name__ if file_parser else "direct"
+        outcome = _FileOutcome(parser_name=parser_name)
+
+        # Check if this is a media parser and we should directly upload
+        is_media_parser = file_parser and parser_name in [
+            "ImageParser",
+            "AudioParser",
+            "VideoParser",
+        ]
+        ext = Path(classified_file.path).suffix.lower()
+        is_media_file = ext in MEDIA_EXTENSIONS
+
+        if directly_upload_media and is_media_parser and is_media_file:
+            # Directly upload media file without using media parser
+            outcome.parser_name = "direct_upload"
+            outcome.ok = await self._upload_file_directly(
+                classified_file,
+                target_uri,
+                viking_fs,
+                outcome.warnings,
+            )
+        else:
+            # Normal processing with parser
+            outcome.ok, outcome.temp_dir_path = await self._process_single_file(
+                classified_file,
+                file_parser,
+                target_uri,
+                viking_fs,
+                outcome.warnings,
+            )
+        return outcome
+
     @staticmethod
     async def _process_single_file(
         classified_file: "ClassifiedFile",
@@ -319,15 +381,16 @@ class DirectoryParser(BaseParser):
         target_uri: str,
         viking_fs: Any,
         warnings: List[str],
-    ) -> bool:
-        """Process one file into the VikingFS directory temp.
+    ) -> Tuple[bool, Optional[str]]:
+        """Process one file for the VikingFS directory temp.
 
-        - Files WITH a parser → ``parser.parse()`` → merge output into
-          *target_uri* at the correct relative location.
+        - Files WITH a parser → ``parser.parse()``; its temp output is
+          returned for ``_merge_parsed_file``.
         - Files WITHOUT a parser → read and write directly to VikingFS.
 
         Returns:
-            *True* on success, *False* on failure.
+            ``(ok, temp_dir_path)``; ``temp_dir_path`` is *None* when there
+            is nothing to merge.
         """
         rel_path = classified_file.rel_path
         src_file = classified_file.path
@@ -335,27 +398,43 @@ class DirectoryParser(BaseParser):
         if parser:
             try:
                 sub_result = await parser.parse(str(src_file))
-                if sub_result.temp_dir_path:
-                    parent = str(PurePosixPath(rel_path).parent)
-                    dest = f"{target_uri}/{parent}" if parent != "." else target_uri
-                    await DirectoryParser._merge_temp(
-                        viking_fs,
-                        sub_result.temp_dir_path,
-                        dest,
-                    )
-                return True
+                return True, sub_result.temp_dir_path
             except Exception as exc:
                 warnings.append(f"Failed to parse {rel_path}: {exc}")
-                return False
+                return False, None
         else:
             try:
                 content = src_file.read_bytes()
                 dst_uri = f"{target_uri}/{rel_path}"
                 await viking_fs.write_file(dst_uri, content)
-                return True
+                return True, None
             except Exception as exc:
                 warnings.append(f"Failed to upload {rel_path}: {exc}")
-                return False
+                return False, None
+
+    @staticmethod
+    async def _merge_parsed_file(
+        classified_file: "ClassifiedFile",
+        temp_dir_path: str,
+        target_uri: str,
+        viking_fs: Any,
+        warnings: List[str],
+    ) -> bool:
+        """Merge a parser's temp output into *target_uri* at the file's
+        relative location.
+
+        Returns:
+            *True* on success, *False* on failure.
+        """
+        rel_path = classified_file.rel_path
+        parent = str(PurePosixPath(rel_path).parent)
+        dest = f"{target_uri}/{parent}" if parent != "." else target_uri
+        try:
+            await DirectoryParser._merge_temp(viking_fs, temp_dir_path, dest)
+            return True
+        except Exception as exc:
+            warnings.append(f"Failed to parse {rel_path}: {exc}")
+            return False
 
     @staticmethod
     async def _upload_file_directly(
@@ -15,6 +15,7 @@ from typing import List, Optional, Union
 
 from openviking.parse.base import ParseResult
 from openviking.parse.parsers.base_parser import BaseParser
+from openviking.parse.process_pool import run_in_parse_pool
 from openviking_cli.utils.config.parser_config import ParserConfig
 from openviking_cli.utils.logger import get_logger
 
@@ -47,7 +48,7 @@ class EPubParser(BaseParser):
         path = Path(source)
 
         if path.exists():
-            markdown_content = self._convert_to_markdown(path)
+            markdown_content = await run_in_parse_pool(self._convert_to_markdown, path)
             result = await self._md_parser.parse_content(
                 markdown_content, source_path=str(path), instruction=instruction, **kwargs
             )
@@ -12,6 +12,7 @@ from typing import List, Optional, Union
 
 from openviking.parse.base import ParseResult
 from openviking.parse.parsers.base_parser import BaseParser
+from openviking.parse.process_pool import run_in_parse_pool
 from openviking_cli.utils.config.parser_config import ParserConfig
 from openviking_cli.utils.logger import get_logger
 
@@ -51,9 +52,7 @@ class ExcelParser(BaseParser):
         path = Path(source)
 
         if path.exists():
-            import openpyxl
-
-            markdown_content = self._convert_to_markdown(path, openpyxl)
+            markdown_content = await run_in_parse_pool(self._convert_file, path)
             result = await self._md_parser.parse_content(
                 markdown_content, source_path=str(path), instruction=instruction, **kwargs
             )
@@ -74,6 +73,12 @@ class ExcelParser(BaseParser):
         result.parser_name = "ExcelParser"
         return result
 
+    def _convert_file(self, path: Path) -> str:
+        """Convert the file at *path* to Markdown; runs in the parse process pool."""
+        import openpyxl
+
+        return self._convert_to_markdown(path, openpyxl)
+
     def _convert_to_markdown(self, path: Path, openpyxl) -> str:
         """Convert Excel spreadsheet to Markdown string."""
         wb = openpyxl.load_workbook(path, data_only=True)
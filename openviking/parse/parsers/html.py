@@ -28,6 +28,7 @@ from openviking.parse.base import (
     lazy_import,
 )
 from openviking.parse.parsers.base_parser import BaseParser
+from openviking.parse.process_pool import run_in_parse_pool
 from openviking_cli.utils.config import get_openviking_config
 
 
@@ -201,6 +202,13 @@ class HTMLParser(BaseParser):
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
         self._url_detector = URLTypeDetector()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Lazily imported modules cannot be pickled into the parse process pool.
+        state = self.__dict__.copy()
+        state.pop("_readabilipy", None)
+        state.pop("_markdownify", None)
+        return state
+
     def _get_readabilipy(self):
         """Lazy import of readabilipy."""
         if not hasattr(self, "_readabilipy") or self._readabilipy is None:
@@ -450,8 +458,8 @@ class HTMLParser(BaseParser):
             )
 
         try:
-            content = self._read_file(path)
-            result = await self.parse_content(content, source_path=str(path), **kwargs)
+            markdown_content = await run_in_parse_pool(self._convert_file, path)
+            result = await self._parse_markdown(markdown_content, source_path=str(path), **kwargs)
 
             # Add timing info
             result.parse_time = time.time() - start_time
@@ -606,7 +614,12 @@ class HTMLParser(BaseParser):
         """
         # Convert HTML to Markdown
         markdown_content = self._html_to_markdown(content, base_url=source_path or "")
+        return await self._parse_markdown(markdown_content, source_path=source_path, **kwargs)
 
+    async def _parse_markdown(
+        self, markdown_content: str, source_path: Optional[str] = None, **kwargs
+    ) -> ParseResult:
+        """Build the document tree from converted Markdown."""
         # Delegate to MarkdownParser (using three-phase architecture)
         from openviking.parse.parsers.markdown import MarkdownParser
 
@@ -619,6 +632,10 @@ class HTMLParser(BaseParser):
 
         return result
 
+    def _convert_file(self, path: Path) -> str:
+        """Read a local HTML file and convert it to Markdown; runs in the parse process pool."""
+        return self._html_to_markdown(self._read_file(path), base_url=str(path))
+
     def _sanitize_for_path(self, text: str, max_length: int = 50) -> str:
         """Sanitize text for use in file path, hash & shorten if too long."""
         safe = re.sub(
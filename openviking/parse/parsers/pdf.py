@@ -12,10 +12,12 @@ This design simplifies PDF handling by delegating structure analysis
 to the MarkdownParser after conversion.
 """
 
+import asyncio
 import logging
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from openviking.parse.base import (
     NodeType,
@@ -25,11 +27,24 @@ from openviking.parse.base import (
     lazy_import,
 )
 from openviking.parse.parsers.base_parser import BaseParser
+from openviking.parse.process_pool import run_in_parse_pool
 from openviking_cli.utils.config.parser_config import PDFConfig
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PageExtraction:
+    """Markdown parts and counters extracted from one PDF page."""
+
+    page_num: int
+    parts: List[str] = field(default_factory=list)
+    has_text: bool = False
+    tables: int = 0
+    images: int = 0
+    seconds: float = 0.0
+
+
 class PDFParser(BaseParser):
     """
     PDF parser with dual conversion strategy.
@@ -191,6 +206,9 @@ class PDFParser(BaseParser):
         """
         Convert PDF to Markdown using pdfplumber.
 
+        Pages are extracted in shards of ``config.local_pages_per_shard`` on
+        the parse process pool and reassembled in page order.
+
         Args:
             pdf_path: Path to PDF file
             storage: Optional StoragePath for saving images
@@ -224,52 +242,22 @@ class PDFParser(BaseParser):
         }
 
         try:
+            start_time = time.time()
             with pdfplumber.open(str(pdf_path)) as pdf:
                 meta["total_pages"] = len(pdf.pages)
 
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # Extract text
-                    text = page.extract_text()
-                    if text and text.strip():
-                        # Add page marker as HTML comment
-                        parts.append(f"<!-- Page {page_num} -->\n{text.strip()}")
-                        meta["pages_processed"] += 1
-
-                    # Extract tables
-                    tables = page.extract_tables()
-                    for table_idx, table in enumerate(tables or []):
-                        if table and len(table) > 0:
-                            md_table = self._format_table_markdown(table)
-                            if md_table:
-                                parts.append(
-                                    f"<!-- Page {page_num} Table {table_idx + 1} -->\n{md_table}"
-                                )
-                                meta["tables_extracted"] += 1
-
-                    # Extract images
-                    images = page.images
-                    for img_idx, img in enumerate(images or []):
-                        try:
-                            # Extract image using underlying PDF object
-                            image_obj = self._extract_image_from_page(page, img)
-                            if image_obj:
-                                # Save image
-                                filename = f"page{page_num}_img{img_idx + 1}"
-                                image_path = storage.save_image(
-                                    resource_name, image_obj, filename=filename
-                                )
-
-                                # Generate relative path for markdown
-                                rel_path = image_path.relative_to(Path.cwd())
-                                parts.append(
-                                    f"<!-- Page {page_num} Image {img_idx + 1} -->\n"
-                                    f"![Page {page_num} Image {img_idx + 1}]({rel_path})"
-                                )
-                                meta["images_extracted"] += 1
-                        except Exception as img_err:
-                            logger.warning(
-                                f"Failed to extract image {img_idx + 1} on page {page_num}: {img_err}"
-                            )
+            page_times = []
+            async for page in self._iter_local_pages(
+                pdf_path, meta["total_pages"], storage, resource_name
+            ):
+                parts.extend(page.parts)
+                meta["pages_processed"] += page.has_text
+                meta["tables_extracted"] += page.tables
+                meta["images_extracted"] += page.images
+                page_times.append(round(page.seconds, 4))
+
+            meta["page_times"] = page_times
+            meta["extraction_time"] = time.time() - start_time
 
             if not parts:
                 logger.warning(f"No content extracted from {pdf_path}")
@@ -279,7 +267,7 @@ class PDFParser(BaseParser):
             logger.info(
                 f"Local conversion: {meta['pages_processed']}/{meta['total_pages']} pages, "
                 f"{meta['images_extracted']} images, {meta['tables_extracted']} tables → "
-                f"{len(markdown_content)} chars"
+                f"{len(markdown_content)} chars in {meta['extraction_time']:.2f}s"
             )
 
             return markdown_content, meta
@@ -288,6 +276,96 @@ class PDFParser(BaseParser):
             logger.error(f"pdfplumber conversion failed: {e}")
             raise
 
+    async def _iter_local_pages(
+        self, pdf_path: Path, total_pages: int, storage, resource_name: str
+    ) -> AsyncIterator["_PageExtraction"]:
+        """Yield extracted pages in order while later shards are still running.
+
+        Every shard is submitted to the parse process pool up front; pages of
+        a shard are yielded as soon as it and all earlier shards are done.
+        """
+        shard_size = self.config.local_pages_per_shard
+        shards = [
+            asyncio.ensure_future(
+                run_in_parse_pool(
+                    self._extract_page_range,
+                    str(pdf_path),
+                    first,
+                    min(first + shard_size, total_pages),
+                    storage,
+                    resource_name,
+                )
+            )
+            for first in range(0, total_pages, shard_size)
+        ]
+        try:
+            for shard in shards:
+                for page in await shard:
+                    yield page
+        finally:
+            for shard in shards:
+                shard.cancel()
+
+    def _extract_page_range(
+        self, pdf_path: str, first: int, last: int, storage, resource_name: str
+    ) -> List["_PageExtraction"]:
+        """Extract text, tables and images of pages [first, last); runs in the parse pool."""
+        pdfplumber = lazy_import("pdfplumber")
+
+        pages = []
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_num, page in enumerate(pdf.pages[first:last], first + 1):
+                page_start = time.perf_counter()
+                extraction = _PageExtraction(page_num=page_num)
+                parts = extraction.parts
+
+                # Extract text
+                text = page.extract_text()
+                if text and text.strip():
+                    # Add page marker as HTML comment
+                    parts.append(f"<!-- Page {page_num} -->\n{text.strip()}")
+                    extraction.has_text = True
+
+                # Extract tables
+                tables = page.extract_tables()
+                for table_idx, table in enumerate(tables or []):
+                    if table and len(table) > 0:
+                        md_table = self._format_table_markdown(table)
+                        if md_table:
+                            parts.append(
+                                f"<!-- Page {page_num} Table {table_idx + 1} -->\n{md_table}"
+                            )
+                            extraction.tables += 1
+
+                # Extract images
+                images = page.images
+                for img_idx, img in enumerate(images or []):
+                    try:
+                        # Extract image using underlying PDF object
+                        image_obj = self._extract_image_from_page(page, img)
+                        if image_obj:
+                            # Save image
+                            filename = f"page{page_num}_img{img_idx + 1}"
+                            image_path = storage.save_image(
+                                resource_name, image_obj, filename=filename
+                            )
+
+                            # Generate relative path for markdown
+                            rel_path = image_path.relative_to(Path.cwd())
+                            parts.append(
+                                f"<!-- Page {page_num} Image {img_idx + 1} -->\n"
+                                f"![Page {page_num} Image {img_idx + 1}]({rel_path})"
+                            )
+                            extraction.images += 1
+                    except Exception as img_err:
+                        logger.warning(
+                            f"Failed to extract image {img_idx + 1} on page {page_num}: {img_err}"
+                        )
+
+                extraction.seconds = time.perf_counter() - page_start
+                pages.append(extraction)
+        return pages
+
     def _extract_image_from_page(self, page, img_info: dict) -> Optional[bytes]:
         """
         Extract image data from PDF page.
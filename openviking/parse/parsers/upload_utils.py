@@ -17,6 +17,7 @@ from openviking.parse.parsers.constants import (
     TEXT_ENCODINGS,
     UTF8_VARIANTS,
 )
+from openviking.storage.async_agfs import run_agfs
 from openviking_cli.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -275,7 +276,7 @@ async def upload_directory(
         for dir_uri in sorted(parent_uris):
             _mkdir_with_parents(viking_fs._uri_to_path(dir_uri))
 
-    await asyncio.to_thread(_create_all_dirs)
+    await run_agfs(_create_all_dirs)
 
     # --- Phase 3: Upload files concurrently ---
     sem = asyncio.Semaphore(_UPLOAD_CONCURRENCY)
@@ -291,7 +292,7 @@ async def upload_directory(
                 viking_fs.agfs.write(agfs_path, encoded)
 
             try:
-                await asyncio.to_thread(_do)
+                await run_agfs(_do)
             except Exception as exc:
                 errors[idx] = f"Failed to upload {file_path}: {exc}"
 
@@ -0,0 +1,122 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Process pool for CPU-bound document conversion.
+
+Converting PDF, Office, EPUB and HTML files to Markdown is pure-Python CPU work
+that holds the GIL, so running it on the event loop (or on a thread) stalls
+every other coroutine and keeps concurrent parses on a single core. Parsers
+hand the conversion step to ``run_in_parse_pool``, which runs it on a shared,
+bounded process pool.
+
+Workers are started with the ``spawn`` method: the parent runs an event loop
+and AGFS I/O threads, which ``fork`` would copy in an undefined state. The
+callable and its arguments must be picklable (module-level functions or bound
+methods of picklable parsers). When the pool is disabled or cannot run the
+call, the conversion falls back to a worker thread.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from openviking_cli.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+_max_workers = DEFAULT_MAX_PARSE_WORKERS
+
+
+def _new_executor() -> Optional[ProcessPoolExecutor]:
+    if _max_workers <= 0:
+        return None
+    return ProcessPoolExecutor(
+        max_workers=_max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def init_parse_executor(max_workers: int = DEFAULT_MAX_PARSE_WORKERS) -> None:
+    """(Re)create the shared parse process pool.
+
+    Args:
+        max_workers: Number of worker processes. 0 disables the pool and runs
+            conversions on a thread instead.
+    """
+    global _executor, _max_workers
+    with _executor_lock:
+        old = _executor
+        _max_workers = max(0, max_workers)
+        _executor = _new_executor()
+    if old is not None:
+        old.shutdown(wait=False, cancel_futures=False)
+    logger.debug(f"[ParsePool] Initialized parse process pool with {_max_workers} workers")
+
+
+def get_parse_executor() -> Optional[ProcessPoolExecutor]:
+    """Get the shared parse process pool, creating it lazily (None if disabled)."""
+    global _executor
+    if _executor is None and _max_workers > 0:
+        with _executor_lock:
+            if _executor is None:
+                _executor = _new_executor()
+    return _executor
+
+
+def shutdown_parse_executor() -> None:
+    """Stop the shared parse process pool and wait for its workers to exit.
+
+    Queued conversions are cancelled. A later conversion starts a new pool.
+    """
+    global _executor
+    with _executor_lock:
+        executor = _executor
+        _executor = None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+        logger.debug("[ParsePool] Parse process pool shut down")
+
+
+def _discard_executor(broken: ProcessPoolExecutor) -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_parse_pool(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a CPU-bound, picklable callable on the parse process pool.
+
+    Exceptions raised by ``func`` propagate unchanged. If the call cannot be
+    shipped to a worker (pool disabled, unpicklable arguments), it runs on a
+    thread instead. A worker that dies mid-call is not retried in-process:
+    the pool is replaced and ``BrokenProcessPool`` is raised for that call.
+    """
+    call = functools.partial(func, *args, **kwargs)
+    executor = get_parse_executor()
+    if executor is not None:
+        # Decide up front, so that errors raised by func in a worker are never
+        # mistaken for pickling failures.
+        try:
+            pickle.dumps(call)
+        except Exception as exc:
+            logger.debug(f"[ParsePool] {func!r} is not picklable, running on a thread: {exc}")
+        else:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(executor, call)
+            except BrokenProcessPool as exc:
+                logger.warning(f"[ParsePool] Worker process died, restarting pool: {exc}")
+                _discard_executor(executor)
+                raise
+    return await asyncio.to_thread(call)
@@ -22,11 +22,12 @@ IMPORTANT (v5.0 Architecture):
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from openviking.core.building_tree import BuildingTree
 from openviking.parse.parsers.media.utils import get_media_base_uri, get_media_type
 from openviking.server.identity import RequestContext
+from openviking.storage.async_agfs import run_agfs
 from openviking.storage.queuefs import SemanticMsg, get_queue_manager
 from openviking.storage.viking_fs import get_viking_fs
 from openviking.utils import parse_code_hosting_url
@@ -37,6 +38,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Files OpenViking generates inside resource directories. They never come from
+# the parsed source, so incremental sync neither diffs nor deletes them.
+_GENERATED_FILES = frozenset({".abstract.md", ".overview.md", ".relations.json", ".semantic.json"})
+
+
+def _parent_rel(rel_path: str) -> str:
+    """Parent of a relative path ("" for the resource root)."""
+    return rel_path.rsplit("/", 1)[0] if "/" in rel_path else ""
+
+
+def _top_level(rel_dirs: Set[str]) -> List[str]:
+    """Directories in rel_dirs that are not nested in another one of them."""
+    return sorted(
+        d
+        for d in rel_dirs
+        if not any(d.startswith(other + "/") for other in rel_dirs if other != d)
+    )
+
 
 class TreeBuilder:
     """
@@ -91,6 +110,7 @@ class TreeBuilder:
         base_uri: Optional[str] = None,
         source_path: Optional[str] = None,
         source_format: Optional[str] = None,
+        incremental: bool = False,
     ) -> "BuildingTree":
         """
         Finalize tree from temporary directory (v5.0 architecture).
@@ -100,6 +120,12 @@ class TreeBuilder:
         2. Enqueue to SemanticQueue for async semantic generation
         3. Scan and create Resource objects (for compatibility)
 
+        With ``incremental=True`` and an existing directory at the target URI,
+        the temp tree is synced into it instead of creating a ``name_N`` copy:
+        only added/changed files are moved, removed files are deleted together
+        with their vector records, and semantic generation is enqueued only for
+        the affected directories.
+
         Args:
             temp_dir_path: Temporary directory Viking URI (e.g., viking://temp/xxx)
             scope: Scope ("resources", "user", or "agent")
@@ -107,6 +133,7 @@ class TreeBuilder:
             source_node: Source ResourceNode
             source_path: Source file path
             source_format: Source file format
+            incremental: Sync into an existing target instead of copying
 
         Returns:
             Complete BuildingTree with all resources moved to AGFS
@@ -166,6 +193,11 @@ class TreeBuilder:
                 candidate_uri = VikingURI.build(base_viking_uri.scope, *sanitized_parts)
             else:
                 candidate_uri = VikingURI(base_uri or auto_base_uri).join(doc_name).uri
+        if incremental and await self._is_dir(candidate_uri, ctx=ctx):
+            return await self._finalize_incremental(
+                temp_uri, temp_doc_uri, candidate_uri, ctx, source_path, source_format
+            )
+
         final_uri = await self._resolve_unique_uri(candidate_uri, ctx=ctx)
 
         if final_uri != candidate_uri:
@@ -200,6 +232,199 @@ class TreeBuilder:
 
         return tree
 
+    async def _finalize_incremental(
+        self,
+        temp_uri: str,
+        temp_doc_uri: str,
+        final_uri: str,
+        ctx: RequestContext,
+        source_path: Optional[str],
+        source_format: Optional[str],
+    ) -> "BuildingTree":
+        """Sync the temp tree into the existing final_uri and enqueue dirty directories."""
+        viking_fs = get_viking_fs()
+        logger.info(f"[TreeBuilder] Incremental sync: {temp_doc_uri} -> {final_uri}")
+
+        changes = await self._sync_temp_to_dest(viking_fs, temp_doc_uri, final_uri, ctx=ctx)
+
+        try:
+            await viking_fs.delete_temp(temp_uri, ctx=ctx)
+            logger.info(f"[TreeBuilder] Cleaned up temp root: {temp_uri}")
+        except Exception as e:
+            logger.warning(f"[TreeBuilder] Failed to cleanup temp root: {e}")
+
+        try:
+            await self._enqueue_incremental_generation(final_uri, changes, "resource", ctx=ctx)
+        except Exception as e:
+            logger.error(f"[TreeBuilder] Failed to enqueue semantic generation: {e}", exc_info=True)
+
+        tree = BuildingTree(
+            source_path=source_path,
+            source_format=source_format,
+        )
+        tree._root_uri = final_uri
+        tree.sync_stats = {
+            "added": len(changes["added"]),
+            "updated": len(changes["updated"]),
+            "deleted": len(changes["deleted"]),
+            "unchanged": changes["unchanged"],
+        }
+        logger.info(f"[TreeBuilder] Incremental sync of {final_uri} done: {tree.sync_stats}")
+        return tree
+
+    async def _sync_temp_to_dest(
+        self, viking_fs, src_uri: str, dst_uri: str, ctx: RequestContext
+    ) -> Dict[str, Any]:
+        """Apply the difference between the temp tree and the existing destination.
+
+        Files present in both trees are compared by size and then by AGFS
+        digest (xxh3), so unchanged files are neither moved nor re-processed.
+
+        Returns:
+            Dict with relative paths of "added"/"updated"/"deleted" files, the
+            top-level "new_dirs" moved as a whole, and the "unchanged" count.
+        """
+        src_path = viking_fs._uri_to_path(src_uri, ctx=ctx)
+        dst_path = viking_fs._uri_to_path(dst_uri, ctx=ctx)
+        (src_files, src_dirs), (dst_files, dst_dirs) = await asyncio.gather(
+            self._list_tree(viking_fs, src_path), self._list_tree(viking_fs, dst_path)
+        )
+
+        common = sorted(set(src_files) & set(dst_files))
+        same_size = [rel for rel in common if src_files[rel] == dst_files[rel]]
+        updated = [rel for rel in common if src_files[rel] != dst_files[rel]]
+        equal = await asyncio.gather(
+            *(
+                self._same_digest(viking_fs, f"{src_path}/{rel}", f"{dst_path}/{rel}")
+                for rel in same_size
+            )
+        )
+        updated.extend(rel for rel, same in zip(same_size, equal) if not same)
+        unchanged = sum(1 for same in equal if same)
+
+        removed_dirs = _top_level(dst_dirs - src_dirs)
+        new_dirs = _top_level(src_dirs - dst_dirs)
+        deleted = sorted(set(dst_files) - set(src_files))
+        added = sorted(set(src_files) - set(dst_files))
+
+        # 1. Deletions first, so type changes (file <-> directory) do not collide.
+        for rel in removed_dirs:
+            await viking_fs.rm(f"{dst_uri}/{rel}", recursive=True, ctx=ctx)
+        for rel in deleted:
+            if not any(rel.startswith(d + "/") for d in removed_dirs):
+                await viking_fs.rm(f"{dst_uri}/{rel}", ctx=ctx)
+
+        # 2. New directories are moved as a whole; their files need no diff.
+        for rel in new_dirs:
+            await run_agfs(viking_fs.agfs.mv, f"{src_path}/{rel}", f"{dst_path}/{rel}")
+
+        # 3. Changed files replace the old copy; the vector record is overwritten
+        #    when the file is vectorized again.
+        for rel in updated:
+            await run_agfs(viking_fs.agfs.rm, f"{dst_path}/{rel}")
+            await run_agfs(viking_fs.agfs.mv, f"{src_path}/{rel}", f"{dst_path}/{rel}")
+        for rel in added:
+            if not any(rel.startswith(d + "/") for d in new_dirs):
+                await run_agfs(viking_fs.agfs.mv, f"{src_path}/{rel}", f"{dst_path}/{rel}")
+
+        return {
+            "added": added,
+            "updated": sorted(updated),
+            "deleted": deleted,
+            "new_dirs": new_dirs,
+            "removed_dirs": removed_dirs,
+            "unchanged": unchanged,
+        }
+
+    async def _list_tree(self, viking_fs, root_path: str) -> Tuple[Dict[str, int], Set[str]]:
+        """List a directory tree level by level.
+
+        Returns:
+            ({relative file path: size}, {relative directory paths}), without
+            the files OpenViking generates itself.
+        """
+        files: Dict[str, int] = {}
+        dirs: Set[str] = set()
+        level = [""]
+        while level:
+            listings = await asyncio.gather(
+                *(
+                    viking_fs._ls_entries(f"{root_path}/{rel}" if rel else root_path)
+                    for rel in level
+                )
+            )
+            next_level = []
+            for rel, entries in zip(level, listings):
+                for entry in entries:
+                    name = entry.get("name", "")
+                    if not name or name in (".", ".."):
+                        continue
+                    child = f"{rel}/{name}" if rel else name
+                    if entry.get("isDir"):
+                        dirs.add(child)
+                        next_level.append(child)
+                    elif name not in _GENERATED_FILES:
+                        files[child] = entry.get("size", 0)
+            level = next_level
+        return files, dirs
+
+    async def _same_digest(self, viking_fs, path_a: str, path_b: str) -> bool:
+        """Compare two files by AGFS digest; errors count as different."""
+        try:
+            a, b = await asyncio.gather(
+                run_agfs(viking_fs.agfs.digest, path_a), run_agfs(viking_fs.agfs.digest, path_b)
+            )
+            return bool(a.get("digest")) and a.get("digest") == b.get("digest")
+        except Exception as e:
+            logger.debug(f"[TreeBuilder] Digest failed for {path_a} / {path_b}: {e}")
+            return False
+
+    async def _is_dir(self, uri: str, ctx: RequestContext) -> bool:
+        try:
+            return bool((await get_viking_fs().stat(uri, ctx=ctx)).get("isDir"))
+        except Exception:
+            return False
+
+    async def _enqueue_incremental_generation(
+        self, root_uri: str, changes: Dict[str, Any], context_type: str, ctx: RequestContext
+    ) -> None:
+        """Enqueue semantic generation for the directories touched by a sync.
+
+        New directories are processed recursively. Every other directory on the
+        path from a change up to root_uri is processed non-recursively, deepest
+        first; the semantic queue is consumed in order, so each parent sees the
+        fresh abstracts of its children.
+        """
+        dirty: Set[str] = set()
+        for rel in changes["added"] + changes["updated"] + changes["deleted"]:
+            dirty.add(_parent_rel(rel))
+        for rel in changes["new_dirs"] + changes["removed_dirs"]:
+            dirty.add(_parent_rel(rel))
+        if not dirty:
+            logger.info(f"[TreeBuilder] No changes for {root_uri}, skip semantic generation")
+            return
+
+        new_dirs = set(changes["new_dirs"])
+        for rel in list(dirty):
+            while rel:
+                rel = _parent_rel(rel)
+                dirty.add(rel)
+        # New directories are covered by their recursive message; removed ones are gone.
+        skipped = new_dirs | set(changes["removed_dirs"])
+        dirty = {
+            rel for rel in dirty if not any(rel == d or rel.startswith(d + "/") for d in skipped)
+        }
+
+        for rel in sorted(new_dirs, key=lambda r: -r.count("/")):
+            await self._enqueue_semantic_generation(f"{root_uri}/{rel}", context_type, ctx=ctx)
+        for rel in sorted(dirty, key=lambda r: (-(r.count("/") + 1) if r else 0, r)):
+            uri = f"{root_uri}/{rel}" if rel else root_uri
+            await self._enqueue_semantic_generation(uri, context_type, ctx=ctx, recursive=False)
+        logger.info(
+            f"[TreeBuilder] Enqueued semantic generation for {len(new_dirs)} new and "
+            f"{len(dirty)} dirty directories under {root_uri}"
+        )
+
     async def _resolve_unique_uri(
         self, uri: str, max_attempts: int = 100, ctx: Optional[RequestContext] = None
     ) -> str:
@@ -238,7 +463,7 @@ class TreeBuilder:
         src_path = viking_fs._uri_to_path(src_uri, ctx=ctx)
         dst_path = viking_fs._uri_to_path(dst_uri, ctx=ctx)
         await self._ensure_parent_dirs(dst_uri, ctx=ctx)
-        await asyncio.to_thread(viking_fs.agfs.mv, src_path, dst_path)
+        await run_agfs(viking_fs.agfs.mv, src_path, dst_path)
 
     async def _ensure_parent_dirs(self, uri: str, ctx: RequestContext) -> None:
         """Recursively create parent directories."""
@@ -260,7 +485,7 @@ class TreeBuilder:
                 logger.debug(f"Parent dir {parent_uri} may already exist: {e}")
 
     async def _enqueue_semantic_generation(
-        self, uri: str, context_type: str, ctx: RequestContext
+        self, uri: str, context_type: str, ctx: RequestContext, recursive: bool = True
     ) -> None:
         """
         Enqueue a directory for semantic generation.
@@ -268,6 +493,7 @@ class TreeBuilder:
         Args:
             uri: Directory URI to enqueue
             context_type: resource/memory/skill
+            recursive: Also process all subdirectories
         """
 
         queue_manager = get_queue_manager()
@@ -279,6 +505,7 @@ class TreeBuilder:
         msg = SemanticMsg(
             uri=uri,
             context_type=context_type,
+            recursive=recursive,
             account_id=ctx.account_id,
             user_id=ctx.user.user_id,
             agent_id=ctx.user.agent_id,
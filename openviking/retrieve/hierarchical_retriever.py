@@ -7,6 +7,7 @@ Implements directory-based hierarchical retrieval with recursive search
 and rerank-based relevance scoring.
 """
 
+import asyncio
 import heapq
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
@@ -43,12 +44,14 @@ class HierarchicalRetriever:
     DIRECTORY_DOMINANCE_RATIO = 1.2  # Directory score must exceed max child score
     GLOBAL_SEARCH_TOPK = 3  # Global retrieval count
     HOTNESS_ALPHA = 0.2  # Weight for hotness score in final ranking (0 = disabled)
+    FRONTIER_BATCH_SIZE = 1  # Directories expanded per vector query (1 = one at a time)
 
     def __init__(
         self,
         storage: VikingVectorIndexBackend,
         embedder: Optional[Any],
         rerank_config: Optional[RerankConfig] = None,
+        frontier_batch_size: Optional[int] = None,
     ):
         """Initialize hierarchical retriever with rerank_config.
 
@@ -56,10 +59,13 @@ class HierarchicalRetriever:
             storage: VikingVectorIndexBackend instance
             embedder: Embedder instance (supports dense/sparse/hybrid)
             rerank_config: Rerank configuration (optional, will fallback to vector search only)
+            frontier_batch_size: Number of top frontier directories expanded together
+                with one vector query (default: FRONTIER_BATCH_SIZE)
         """
         self.vector_store = storage
         self.embedder = embedder
         self.rerank_config = rerank_config
+        self.frontier_batch_size = max(1, frontier_batch_size or self.FRONTIER_BATCH_SIZE)
 
         # Use rerank threshold if available, otherwise use a default
         self.threshold = rerank_config.threshold if rerank_config else 0
@@ -98,11 +104,6 @@ class HierarchicalRetriever:
             scope_dsl: Additional scope constraints passed from public find/search filter
         """
 
-        # Use custom threshold or default threshold
-        effective_threshold = score_threshold if score_threshold is not None else self.threshold
-
-        target_dirs = [d for d in (query.target_directories or []) if d]
-
         if not await self.vector_store.collection_exists_bound():
             logger.warning(
                 "[RecursiveSearch] Collection %s does not exist",
@@ -115,20 +116,10 @@ class HierarchicalRetriever:
             )
 
         # Generate query vectors once to avoid duplicate embedding calls
-        query_vector = None
-        sparse_query_vector = None
-        if self.embedder:
-            result: EmbedResult = self.embedder.embed(query.query)
-            query_vector = result.dense_vector
-            sparse_query_vector = result.sparse_vector
-
-        # Step 1: Determine starting directories based on target_directories or context_type
-        if target_dirs:
-            root_uris = target_dirs
-        else:
-            root_uris = self._get_root_uris_for_type(query.context_type, ctx=ctx)
+        query_vector, sparse_query_vector = self._embed_query(query)
+        target_dirs = [d for d in (query.target_directories or []) if d]
 
-        # Step 2: Global vector search to supplement starting points
+        # Global vector search to supplement starting points
         global_results = await self._global_vector_search(
             ctx=ctx,
             query_vector=query_vector,
@@ -138,11 +129,120 @@ class HierarchicalRetriever:
             scope_dsl=scope_dsl,
             limit=self.GLOBAL_SEARCH_TOPK,
         )
+        return await self._retrieve_from_global_results(
+            query=query,
+            ctx=ctx,
+            query_vector=query_vector,
+            sparse_query_vector=sparse_query_vector,
+            global_results=global_results,
+            limit=limit,
+            mode=mode,
+            score_threshold=score_threshold,
+            score_gte=score_gte,
+            scope_dsl=scope_dsl,
+        )
+
+    async def retrieve_many(
+        self,
+        queries: List[TypedQuery],
+        ctx: RequestContext,
+        limit: int = 5,
+        mode: RetrieverMode = RetrieverMode.THINKING,
+        score_threshold: Optional[float] = None,
+        score_gte: bool = False,
+        scope_dsl: Optional[Dict[str, Any]] = None,
+    ) -> List[QueryResult]:
+        """
+        Execute hierarchical retrieval for several queries.
+
+        The global searches that seed every query run as one batched vector
+        search; the recursive searches then run concurrently. Each result is
+        the one retrieve() returns for that query.
+        """
+        if not await self.vector_store.collection_exists_bound():
+            logger.warning(
+                "[RecursiveSearch] Collection %s does not exist",
+                self.vector_store.collection_name,
+            )
+            return [
+                QueryResult(query=query, matched_contexts=[], searched_directories=[])
+                for query in queries
+            ]
+
+        vectors = [self._embed_query(query) for query in queries]
+        global_results = await self.vector_store.search_global_roots_batch_in_tenant(
+            ctx=ctx,
+            queries=[
+                {
+                    "query_vector": query_vector,
+                    "sparse_query_vector": sparse_query_vector,
+                    "context_type": query.context_type.value if query.context_type else None,
+                    "target_directories": [d for d in (query.target_directories or []) if d],
+                }
+                for query, (query_vector, sparse_query_vector) in zip(queries, vectors)
+            ],
+            extra_filter=scope_dsl,
+            limit=self.GLOBAL_SEARCH_TOPK,
+        )
+        return list(
+            await asyncio.gather(
+                *[
+                    self._retrieve_from_global_results(
+                        query=query,
+                        ctx=ctx,
+                        query_vector=query_vector,
+                        sparse_query_vector=sparse_query_vector,
+                        global_results=results,
+                        limit=limit,
+                        mode=mode,
+                        score_threshold=score_threshold,
+                        score_gte=score_gte,
+                        scope_dsl=scope_dsl,
+                    )
+                    for query, (query_vector, sparse_query_vector), results in zip(
+                        queries, vectors, global_results
+                    )
+                ]
+            )
+        )
+
+    def _embed_query(
+        self, query: TypedQuery
+    ) -> Tuple[Optional[List[float]], Optional[Dict[str, float]]]:
+        if not self.embedder:
+            return None, None
+        result: EmbedResult = self.embedder.embed(query.query)
+        return result.dense_vector, result.sparse_vector
+
+    async def _retrieve_from_global_results(
+        self,
+        query: TypedQuery,
+        ctx: RequestContext,
+        query_vector: Optional[List[float]],
+        sparse_query_vector: Optional[Dict[str, float]],
+        global_results: List[Dict[str, Any]],
+        limit: int,
+        mode: RetrieverMode,
+        score_threshold: Optional[float],
+        score_gte: bool,
+        scope_dsl: Optional[Dict[str, Any]],
+    ) -> QueryResult:
+        """Recursive search and result conversion once the global search is done."""
+        # Use custom threshold or default threshold
+        effective_threshold = score_threshold if score_threshold is not None else self.threshold
+
+        target_dirs = [d for d in (query.target_directories or []) if d]
 
-        # Step 3: Merge starting points
+        # Step 1: Determine starting directories based on target_directories or context_type
+        if target_dirs:
+            root_uris = target_dirs
+        else:
+            root_uris = self._get_root_uris_for_type(query.context_type, ctx=ctx)
+
+        # Step 2: Merge starting points
         starting_points = self._merge_starting_points(query.query, root_uris, global_results)
 
-        # Step 4: Recursive search
+        # Step 3: Recursive search
         candidates = await self._recursive_search(
             query=query.query,
             ctx=ctx,
@@ -158,7 +258,7 @@ class HierarchicalRetriever:
             scope_dsl=scope_dsl,
         )
 
-        # Step 6: Convert results
+        # Step 4: Convert results
         matched = await self._convert_to_matched_contexts(candidates, ctx=ctx)
 
         return QueryResult(
@@ -245,6 +345,11 @@ class HierarchicalRetriever:
         """
         Recursive search with directory priority return and score propagation.
 
+        Up to ``frontier_batch_size`` of the best unvisited directories are
+        expanded per vector query. Their results are then merged one directory
+        at a time, best first, with the same score propagation and convergence
+        check as single-directory expansion.
+
         Args:
             threshold: Score threshold
             score_gte: True uses >=, False uses >
@@ -274,90 +379,133 @@ class HierarchicalRetriever:
         for uri, score in starting_points:
             heapq.heappush(dir_queue, (-score, uri))
 
-        while dir_queue:
-            temp_score, current_uri = heapq.heappop(dir_queue)
-            current_score = -temp_score
-            if current_uri in visited:
-                continue
-            visited.add(current_uri)
-            logger.info(f"[RecursiveSearch] Entering URI: {current_uri}")
+        pre_filter_limit = max(limit * 2, 20)
+        converged = False
 
-            pre_filter_limit = max(limit * 2, 20)
+        while dir_queue and not converged:
+            frontier: List[Tuple[str, float]] = []
+            while dir_queue and len(frontier) < self.frontier_batch_size:
+                temp_score, uri = heapq.heappop(dir_queue)
+                if uri in visited:
+                    continue
+                visited.add(uri)
+                frontier.append((uri, -temp_score))
+            if not frontier:
+                break
 
-            results = await self.vector_store.search_children_in_tenant(
+            children = await self._search_children(
                 ctx=ctx,
-                parent_uri=current_uri,
+                parent_uris=[uri for uri, _ in frontier],
                 query_vector=query_vector,
-                sparse_query_vector=sparse_query_vector,  # Pass sparse vector
+                sparse_query_vector=sparse_query_vector,
                 context_type=context_type,
-                target_directories=target_dirs,
-                extra_filter=scope_dsl,
+                target_dirs=target_dirs,
+                scope_dsl=scope_dsl,
                 limit=pre_filter_limit,
             )
 
-            if not results:
-                continue
-
-            query_scores = []
-            if self._rerank_client and mode == RetrieverMode.THINKING:
-                documents = []
-                for r in results:
-                    # todo: multi-modal
-                    doc = r["abstract"]
-                    documents.append(doc)
-
-                rerank_scores = self._rerank_client.rerank_batch(query, documents)
-                query_scores = rerank_scores
-            else:
-                for r in results:
-                    query_scores.append(r.get("_score", 0))
-
-            for r, score in zip(results, query_scores):
-                uri = r.get("uri", "")
-                final_score = (
-                    alpha * score + (1 - alpha) * current_score if current_score else score
-                )
-
-                if not passes_threshold(final_score):
-                    logger.debug(
-                        f"[RecursiveSearch] URI {uri} score {final_score} did not pass threshold {effective_threshold}"
-                    )
+            for current_uri, current_score in frontier:
+                logger.info(f"[RecursiveSearch] Entering URI: {current_uri}")
+                results = children.get(current_uri)
+                if not results:
                     continue
 
-                # Always collect results that pass threshold, even if already
-                # visited as a directory starting point. The visited set only
-                # prevents re-entering directories for child search.
-                if not any(c.get("uri") == uri for c in collected):
-                    r["_final_score"] = final_score
-                    collected.append(r)
-                    logger.debug(
-                        f"[RecursiveSearch] Added URI: {uri} to candidates with score: {final_score}"
+                query_scores = []
+                if self._rerank_client and mode == RetrieverMode.THINKING:
+                    documents = []
+                    for r in results:
+                        # todo: multi-modal
+                        doc = r["abstract"]
+                        documents.append(doc)
+
+                    rerank_scores = self._rerank_client.rerank_batch(query, documents)
+                    query_scores = rerank_scores
+                else:
+                    for r in results:
+                        query_scores.append(r.get("_score", 0))
+
+                for r, score in zip(results, query_scores):
+                    uri = r.get("uri", "")
+                    final_score = (
+                        alpha * score + (1 - alpha) * current_score if current_score else score
                     )
 
-                if uri not in visited:
-                    if r.get("level") == 2:
-                        visited.add(uri)
-                    else:
-                        heapq.heappush(dir_queue, (-final_score, uri))
-
-            # Convergence check
-            current_topk = sorted(collected, key=lambda x: x.get("_final_score", 0), reverse=True)[
-                :limit
-            ]
-            current_topk_uris = {c.get("uri", "") for c in current_topk}
-
-            if current_topk_uris == prev_topk_uris and len(current_topk_uris) >= limit:
-                convergence_rounds += 1
-
-                if convergence_rounds >= self.MAX_CONVERGENCE_ROUNDS:
-                    break
-            else:
-                convergence_rounds = 0
-                prev_topk_uris = current_topk_uris
+                    if not passes_threshold(final_score):
+                        logger.debug(
+                            f"[RecursiveSearch] URI {uri} score {final_score} did not pass threshold {effective_threshold}"
+                        )
+                        continue
+
+                    # Always collect results that pass threshold, even if already
+                    # visited as a directory starting point. The visited set only
+                    # prevents re-entering directories for child search.
+                    if not any(c.get("uri") == uri for c in collected):
+                        r["_final_score"] = final_score
+                        collected.append(r)
+                        logger.debug(
+                            f"[RecursiveSearch] Added URI: {uri} to candidates with score: {final_score}"
+                        )
+
+                    if uri not in visited:
+                        if r.get("level") == 2:
+                            visited.add(uri)
+                        else:
+                            heapq.heappush(dir_queue, (-final_score, uri))
+
+                # Convergence check
+                current_topk = sorted(
+                    collected, key=lambda x: x.get("_final_score", 0), reverse=True
+                )[:limit]
+                current_topk_uris = {c.get("uri", "") for c in current_topk}
+
+                if current_topk_uris == prev_topk_uris and len(current_topk_uris) >= limit:
+                    convergence_rounds += 1
+
+                    if convergence_rounds >= self.MAX_CONVERGENCE_ROUNDS:
+                        converged = True
+                        break
+                else:
+                    convergence_rounds = 0
+                    prev_topk_uris = current_topk_uris
 
         collected.sort(key=lambda x: x.get("_final_score", 0), reverse=True)
         return collected[:limit]
 
+    async def _search_children(
+        self,
+        ctx: RequestContext,
+        parent_uris: List[str],
+        query_vector: Optional[List[float]],
+        sparse_query_vector: Optional[Dict[str, float]],
+        context_type: Optional[str],
+        target_dirs: Optional[List[str]],
+        scope_dsl: Optional[Dict[str, Any]],
+        limit: int,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search the children of each frontier directory, batched when possible."""
+        if len(parent_uris) == 1:
+            results = await self.vector_store.search_children_in_tenant(
+                ctx=ctx,
+                parent_uri=parent_uris[0],
+                query_vector=query_vector,
+                sparse_query_vector=sparse_query_vector,
+                context_type=context_type,
+                target_directories=target_dirs,
+                extra_filter=scope_dsl,
+                limit=limit,
+            )
+            return {parent_uris[0]: results}
+        return await self.vector_store.search_children_many_in_tenant(
+            ctx=ctx,
+            parent_uris=parent_uris,
+            query_vector=query_vector,
+            sparse_query_vector=sparse_query_vector,
+            context_type=context_type,
+            target_directories=target_dirs,
+            extra_filter=scope_dsl,
+            limit=limit,
+        )
+
     async def _convert_to_matched_contexts(
         self,
         candidates: List[Dict[str, Any]],
@@ -371,20 +519,10 @@ class HierarchicalRetriever:
         is controlled by ``HOTNESS_ALPHA`` (0 disables the boost).
         """
         results = []
+        relations_by_uri = await self._read_relations(candidates, ctx)
 
         for c in candidates:
-            # Read related contexts and get summaries
-            relations = []
-            if get_viking_fs():
-                related_uris = await get_viking_fs().get_relations(c.get("uri", ""), ctx=ctx)
-                if related_uris:
-                    related_abstracts = await get_viking_fs().read_batch(
-                        related_uris[: self.MAX_RELATIONS], level="l0", ctx=ctx
-                    )
-                    for uri in related_uris[: self.MAX_RELATIONS]:
-                        abstract = related_abstracts.get(uri, "")
-                        if abstract:
-                            relations.append(RelatedContext(uri=uri, abstract=abstract))
+            relations = list(relations_by_uri.get(c.get("uri", ""), []))
 
             semantic_score = c.get("_final_score", c.get("_score", 0.0))
 
@@ -426,6 +564,39 @@ class HierarchicalRetriever:
         results.sort(key=lambda x: x.score, reverse=True)
         return results
 
+    async def _read_relations(
+        self,
+        candidates: List[Dict[str, Any]],
+        ctx: RequestContext,
+    ) -> Dict[str, List[RelatedContext]]:
+        """Read related contexts of all candidates with one relation lookup and
+        one batched abstract read.
+
+        Returns:
+            {candidate_uri: [RelatedContext, ...]} for candidates with relations
+        """
+        if not candidates:
+            return {}
+        viking_fs = get_viking_fs()
+        if not viking_fs:
+            return {}
+
+        related = await viking_fs.get_relations_many(
+            [c.get("uri", "") for c in candidates], ctx=ctx
+        )
+        related = {
+            uri: targets[: self.MAX_RELATIONS] for uri, targets in related.items() if targets
+        }
+        if not related:
+            return {}
+
+        to_read = list(dict.fromkeys(u for targets in related.values() for u in targets))
+        abstracts = await viking_fs.read_batch(to_read, level="l0", ctx=ctx)
+        return {
+            uri: [RelatedContext(uri=u, abstract=abstracts[u]) for u in targets if abstracts.get(u)]
+            for uri, targets in related.items()
+        }
+
     def _get_root_uris_for_type(
         self, context_type: Optional[ContextType], ctx: Optional[RequestContext] = None
     ) -> List[str]:
@@ -12,6 +12,7 @@ from typing import Dict, Optional
 from pyagfs import AGFSClient
 
 from openviking.server.identity import ResolvedIdentity, Role
+from openviking.storage.async_agfs import AsyncAGFSClient
 from openviking_cli.exceptions import (
     AlreadyExistsError,
     NotFoundError,
@@ -55,21 +56,22 @@ class APIKeyManager:
     def __init__(self, root_key: str, agfs_url: str):
         self._root_key = root_key
         self._agfs = AGFSClient(agfs_url)
+        self._async_agfs = AsyncAGFSClient(self._agfs)
         self._accounts: Dict[str, AccountInfo] = {}
         self._user_keys: Dict[str, UserKeyEntry] = {}
 
     async def load(self) -> None:
         """Load accounts and user keys from AGFS into memory."""
-        accounts_data = self._read_json(ACCOUNTS_PATH)
+        accounts_data = await self._read_json(ACCOUNTS_PATH)
         if accounts_data is None:
             # First run: create default account
             now = datetime.now(timezone.utc).isoformat()
             accounts_data = {"accounts": {"default": {"created_at": now}}}
-            self._write_json(ACCOUNTS_PATH, accounts_data)
+            await self._write_json(ACCOUNTS_PATH, accounts_data)
 
         for account_id, info in accounts_data.get("accounts", {}).items():
             users_path = USERS_PATH_TEMPLATE.format(account_id=account_id)
-            users_data = self._read_json(users_path)
+            users_data = await self._read_json(users_path)
             users = users_data.get("users", {}) if users_data else {}
 
             self._accounts[account_id] = AccountInfo(
@@ -131,8 +133,8 @@ class APIKeyManager:
             role=Role.ADMIN,
         )
 
-        self._save_accounts_json()
-        self._save_users_json(account_id)
+        await self._save_accounts_json()
+        await self._save_users_json(account_id)
         return key
 
     async def delete_account(self, account_id: str) -> None:
@@ -148,7 +150,7 @@ class APIKeyManager:
             key = user_info.get("key", "")
             self._user_keys.pop(key, None)
 
-        self._save_accounts_json()
+        await self._save_accounts_json()
 
     async def register_user(self, account_id: str, user_id: str, role: str = "user") -> str:
         """Register a new user in an account. Returns the user's API key."""
@@ -166,7 +168,7 @@ class APIKeyManager:
             role=Role(role),
         )
 
-        self._save_users_json(account_id)
+        await self._save_users_json(account_id)
         return key
 
     async def remove_user(self, account_id: str, user_id: str) -> None:
@@ -181,7 +183,7 @@ class APIKeyManager:
         key = user_info.get("key", "")
         self._user_keys.pop(key, None)
 
-        self._save_users_json(account_id)
+        await self._save_users_json(account_id)
 
     async def regenerate_key(self, account_id: str, user_id: str) -> str:
         """Regenerate a user's API key. Old key is immediately invalidated."""
@@ -202,7 +204,7 @@ class APIKeyManager:
             role=Role(account.users[user_id]["role"]),
         )
 
-        self._save_users_json(account_id)
+        await self._save_users_json(account_id)
         return new_key
 
     async def set_role(self, account_id: str, user_id: str, role: str) -> None:
@@ -223,7 +225,7 @@ class APIKeyManager:
                 role=Role(role),
             )
 
-        self._save_users_json(account_id)
+        await self._save_users_json(account_id)
 
     def get_accounts(self) -> list:
         """List all accounts."""
@@ -256,48 +258,48 @@ class APIKeyManager:
 
     # ---- internal helpers ----
 
-    def _read_json(self, path: str) -> Optional[dict]:
+    async def _read_json(self, path: str) -> Optional[dict]:
         """Read a JSON file from AGFS. Returns None if not found."""
         try:
-            content = self._agfs.read(path)
+            content = await self._async_agfs.read(path)
             if isinstance(content, bytes):
                 content = content.decode("utf-8")
             return json.loads(content)
         except Exception:
             return None
 
-    def _write_json(self, path: str, data: dict) -> None:
+    async def _write_json(self, path: str, data: dict) -> None:
         """Write a JSON file to AGFS, creating parent directories as needed."""
         content = json.dumps(data, ensure_ascii=False, indent=2)
         if isinstance(content, str):
             content = content.encode("utf-8")
-        self._ensure_parent_dirs(path)
-        self._agfs.write(path, content)
+        await self._ensure_parent_dirs(path)
+        await self._async_agfs.write(path, content)
 
-    def _ensure_parent_dirs(self, path: str) -> None:
+    async def _ensure_parent_dirs(self, path: str) -> None:
         """Recursively create all parent directories for a file path."""
         parts = path.lstrip("/").split("/")
         for i in range(1, len(parts)):
             parent = "/" + "/".join(parts[:i])
             try:
-                self._agfs.mkdir(parent)
+                await self._async_agfs.mkdir(parent)
             except Exception:
                 pass
 
-    def _save_accounts_json(self) -> None:
+    async def _save_accounts_json(self) -> None:
         """Persist the global accounts list."""
         data = {
             "accounts": {
                 aid: {"created_at": info.created_at} for aid, info in self._accounts.items()
             }
         }
-        self._write_json(ACCOUNTS_PATH, data)
+        await self._write_json(ACCOUNTS_PATH, data)
 
-    def _save_users_json(self, account_id: str) -> None:
+    async def _save_users_json(self, account_id: str) -> None:
         """Persist a single account's user registry."""
         account = self._accounts.get(account_id)
         if account is None:
             return
         data = {"users": account.users}
         path = USERS_PATH_TEMPLATE.format(account_id=account_id)
-        self._write_json(path, data)
+        await self._write_json(path, data)
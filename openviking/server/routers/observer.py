@@ -7,6 +7,7 @@ Mirrors the SDK's client.observer API:
 - /api/v1/observer/queue - Queue status
 - /api/v1/observer/vikingdb - VikingDB status
 - /api/v1/observer/vlm - VLM status
+- /api/v1/observer/cache - Query and embedding cache hit rates
 - /api/v1/observer/system - System overall status
 """
 
@@ -82,6 +83,16 @@ async def observer_transaction(
     return Response(status="ok", result=_component_to_dict(component))
 
 
+@router.get("/cache")
+async def observer_cache(
+    _ctx: RequestContext = Depends(get_request_context),
+):
+    """Get query result cache and embedding cache status."""
+    service = get_service()
+    component = service.debug.observer.cache
+    return Response(status="ok", result=_component_to_dict(component))
+
+
 @router.get("/system")
 async def observer_system(
     _ctx: RequestContext = Depends(get_request_context),
@@ -34,6 +34,7 @@ class AddResourceRequest(BaseModel):
     include: Optional[str] = None
     exclude: Optional[str] = None
     directly_upload_media: bool = True
+    incremental: bool = False
 
     @model_validator(mode="after")
     def check_path_or_temp_path(self):
@@ -114,6 +115,7 @@ async def add_resource(
         include=request.include,
         exclude=request.exclude,
         directly_upload_media=request.directly_upload_media,
+        incremental=request.incremental,
     )
     return Response(status="ok", result=result)
 
@@ -83,8 +83,7 @@ async def search(
     # Get session if session_id provided
     session = None
     if request.session_id:
-        session = service.sessions.session(_ctx, request.session_id)
-        await session.load()
+        session = await service.sessions.load(_ctx, request.session_id)
 
     result = await service.search.search(
         query=request.query,
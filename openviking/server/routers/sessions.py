@@ -69,6 +69,17 @@ class AddMessageRequest(BaseModel):
         return self
 
 
+class CommitSessionRequest(BaseModel):
+    """Request model for commit.
+
+    By default the messages are archived and memory extraction runs as a
+    background job; poll it with GET /sessions/{session_id}/commit/{job_id}.
+    Set `wait` to extract memories before the response is returned.
+    """
+
+    wait: bool = False
+
+
 def _to_jsonable(value: Any) -> Any:
     """Convert internal objects (e.g. Context) into JSON-serializable values."""
     to_dict = getattr(value, "to_dict", None)
@@ -140,12 +151,26 @@ async def delete_session(
 
 @router.post("/{session_id}/commit")
 async def commit_session(
+    request: Optional[CommitSessionRequest] = None,
     session_id: str = Path(..., description="Session ID"),
     _ctx: RequestContext = Depends(get_request_context),
 ):
     """Commit a session (archive and extract memories)."""
     service = get_service()
-    result = await service.sessions.commit(session_id, _ctx)
+    wait = request.wait if request is not None else False
+    result = await service.sessions.commit(session_id, _ctx, wait=wait)
+    return Response(status="ok", result=result)
+
+
+@router.get("/{session_id}/commit/{job_id}")
+async def get_commit_job(
+    session_id: str = Path(..., description="Session ID"),
+    job_id: str = Path(..., description="Commit job ID"),
+    _ctx: RequestContext = Depends(get_request_context),
+):
+    """Get the status and result of a background commit job."""
+    service = get_service()
+    result = service.sessions.get_commit_job(session_id, job_id, _ctx)
     return Response(status="ok", result=result)
 
 
@@ -181,19 +206,18 @@ async def add_message(
     If both `content` and `parts` are provided, `parts` takes precedence.
     """
     service = get_service()
-    session = service.sessions.session(_ctx, session_id)
-    await session.load()
-
     if request.parts is not None:
         parts = [part_from_dict(p) for p in request.parts]
     else:
         parts = [TextPart(text=request.content or "")]
 
-    session.add_message(request.role, parts)
+    async with service.sessions.locked(_ctx, session_id) as session:
+        session.add_message(request.role, parts)
+        message_count = len(session.messages)
     return Response(
         status="ok",
         result={
             "session_id": session_id,
-            "message_count": len(session.messages),
+            "message_count": message_count,
         },
     )
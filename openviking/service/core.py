@@ -6,11 +6,13 @@ OpenViking Service Core.
 Main service class that composes all sub-services and manages infrastructure lifecycle.
 """
 
+import asyncio
 import os
 from typing import Any, Optional
 
 from openviking.agfs_manager import AGFSManager
 from openviking.core.directories import DirectoryInitializer
+from openviking.parse.process_pool import init_parse_executor, shutdown_parse_executor
 from openviking.server.identity import RequestContext, Role
 from openviking.service.debug_service import DebugService
 from openviking.service.fs_service import FSService
@@ -22,7 +24,10 @@ from openviking.service.session_service import SessionService
 from openviking.session.compressor import SessionCompressor
 from openviking.storage import VikingDBManager
 from openviking.storage.collection_schemas import init_context_collection
+from openviking.storage.query_cache import init_query_cache
 from openviking.storage.queuefs.queue_manager import QueueManager, init_queue_manager
+from openviking.storage.relation_index import init_relation_index
+from openviking.storage.summary_cache import init_summary_cache
 from openviking.storage.transaction import TransactionManager, init_transaction_manager
 from openviking.storage.viking_fs import VikingFS, init_viking_fs
 from openviking.utils.resource_processor import ResourceProcessor
@@ -93,22 +98,48 @@ class OpenVikingService:
 
         # Initialize storage
         self._init_storage(
-            config.storage, config.embedding.max_concurrent, config.vlm.max_concurrent
+            config.storage,
+            config.embedding.max_concurrent,
+            config.vlm.max_concurrent,
+            embedding_batch_size=config.embedding.batch_size,
+            embedding_batch_wait_ms=config.embedding.batch_wait_ms,
         )
 
+        # Initialize embedding cache before any embedder is created
+        self._init_embedding_cache()
+
         # Initialize embedder
         self._embedder = config.embedding.get_embedder()
         logger.info(
             f"Initialized embedder (dim {config.embedding.dimension}, sparse {self._embedder.is_sparse})"
         )
 
+    def _init_embedding_cache(self) -> None:
+        """Initialize the process-wide embedding cache under the workspace."""
+        from openviking.models.embedder.cache import init_embedding_cache
+
+        cache_config = self._config.embedding.cache
+        if not cache_config.enabled:
+            return
+        path = cache_config.path or os.path.join(
+            self._config.storage.workspace, "embedding_cache.db"
+        )
+        init_embedding_cache(
+            path=path,
+            memory_max_bytes=cache_config.memory_max_mb * 1024 * 1024,
+            disk_max_bytes=cache_config.disk_max_mb * 1024 * 1024,
+        )
+
     def _init_storage(
         self,
         config: StorageConfig,
         max_concurrent_embedding: int = 10,
         max_concurrent_semantic: int = 100,
+        embedding_batch_size: int = 1,
+        embedding_batch_wait_ms: int = 50,
     ) -> None:
         """Initialize storage resources."""
+        from openviking.storage.async_agfs import init_agfs_executor
         from openviking.utils.agfs_utils import create_agfs_client
 
         mode = getattr(config.agfs, "mode", "http-client")
@@ -122,6 +153,7 @@ class OpenVikingService:
 
         # Create AGFS client using utility
         self._agfs_client = create_agfs_client(config.agfs)
+        init_agfs_executor(config.agfs.max_io_workers)
 
         # Initialize QueueManager with agfs_client
         if self._agfs_client:
@@ -130,6 +162,8 @@ class OpenVikingService:
                 timeout=config.agfs.timeout,
                 max_concurrent_embedding=max_concurrent_embedding,
                 max_concurrent_semantic=max_concurrent_semantic,
+                embedding_batch_size=embedding_batch_size,
+                embedding_batch_wait_ms=embedding_batch_wait_ms,
             )
         else:
             logger.warning("AGFS client not initialized, skipping queue manager")
@@ -217,6 +251,8 @@ class OpenVikingService:
                 self._config.storage,
                 self._config.embedding.max_concurrent,
                 self._config.vlm.max_concurrent,
+                embedding_batch_size=self._config.embedding.batch_size,
+                embedding_batch_wait_ms=self._config.embedding.batch_wait_ms,
             )
 
         if self._embedder is None:
@@ -236,7 +272,21 @@ class OpenVikingService:
             rerank_config=config.rerank,
             vector_store=self._vikingdb_manager,
             enable_recorder=enable_recorder,
+            search_frontier_batch_size=config.search_frontier_batch_size,
+        )
+        init_query_cache(
+            max_entries=config.query_cache_max_entries,
+            ttl_seconds=config.query_cache_ttl_seconds,
         )
+        init_summary_cache(
+            max_entries=config.summary_cache_max_entries,
+            ttl_seconds=config.summary_cache_ttl_seconds,
+        )
+        init_relation_index(
+            max_entries=config.relation_index_max_entries,
+            ttl_seconds=config.relation_index_ttl_seconds,
+        )
+        init_parse_executor(config.parse_max_workers)
         if enable_recorder:
             logger.info("VikingFS IO Recorder enabled")
 
@@ -255,7 +305,10 @@ class OpenVikingService:
         # Initialize processors
         self._resource_processor = ResourceProcessor(vikingdb=self._vikingdb_manager)
         self._skill_processor = SkillProcessor(vikingdb=self._vikingdb_manager)
-        self._session_compressor = SessionCompressor(vikingdb=self._vikingdb_manager)
+        self._session_compressor = SessionCompressor(
+            vikingdb=self._vikingdb_manager,
+            max_concurrency=self._config.memory_extraction_concurrency,
+        )
 
         # Start TransactionManager if initialized
         if self._transaction_manager:
@@ -277,6 +330,9 @@ class OpenVikingService:
             vikingdb=self._vikingdb_manager,
             viking_fs=self._viking_fs,
             session_compressor=self._session_compressor,
+            max_cached_sessions=config.session_cache_max_entries,
+            commit_workers=config.session_commit_workers,
+            max_pending_commits=config.session_commit_max_pending,
         )
         self._debug_service.set_dependencies(
             vikingdb=self._vikingdb_manager,
@@ -288,6 +344,9 @@ class OpenVikingService:
 
     async def close(self) -> None:
         """Close OpenViking and release resources."""
+        # Commit jobs still use the storage below: let running ones finish first.
+        await asyncio.to_thread(self._session_service.close)
+
         if self._transaction_manager:
             self._transaction_manager.stop()
             self._transaction_manager = None
@@ -305,6 +364,13 @@ class OpenVikingService:
             self._agfs_manager.stop()
             self._agfs_manager = None
 
+        if self._config.embedding.cache.enabled:
+            from openviking.models.embedder.cache import get_embedding_cache
+
+            get_embedding_cache().close()
+
+        await asyncio.to_thread(shutdown_parse_executor)
+
         self._viking_fs = None
         self._resource_processor = None
         self._skill_processor = None
@@ -9,12 +9,16 @@ from typing import Dict, List, Optional
 
 from openviking.storage import VikingDBManager
 from openviking.storage.observers import (
+    CacheObserver,
     QueueObserver,
     TransactionObserver,
     VikingDBObserver,
     VLMObserver,
 )
+from openviking.storage.query_cache import get_query_cache
 from openviking.storage.queuefs import get_queue_manager
+from openviking.storage.relation_index import get_relation_index
+from openviking.storage.summary_cache import get_summary_cache
 from openviking.storage.transaction import get_transaction_manager
 from openviking_cli.utils.config import OpenVikingConfig
 
@@ -153,6 +157,24 @@ class ObserverService:
             status=observer.get_status_table(),
         )
 
+    @property
+    def cache(self) -> ComponentStatus:
+        """Get query result, directory summary, relation index and embedding cache status."""
+        embedding_cache = None
+        if self._config is not None and self._config.embedding.cache.enabled:
+            from openviking.models.embedder.cache import get_embedding_cache
+
+            embedding_cache = get_embedding_cache()
+        observer = CacheObserver(
+            get_query_cache(), embedding_cache, get_summary_cache(), get_relation_index()
+        )
+        return ComponentStatus(
+            name="cache",
+            is_healthy=observer.is_healthy(),
+            has_errors=observer.has_errors(),
+            status=observer.get_status_table(),
+        )
+
     @property
     def system(self) -> SystemStatus:
         """Get system overall status."""
@@ -161,6 +183,7 @@ class ObserverService:
             "vikingdb": self.vikingdb,
             "vlm": self.vlm,
             "transaction": self.transaction,
+            "cache": self.cache,
         }
         errors = [f"{c.name} has errors" for c in components.values() if c.has_errors]
         return SystemStatus(
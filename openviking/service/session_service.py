@@ -4,12 +4,27 @@
 Session Service for OpenViking.
 
 Provides session management operations: session, sessions, add_message, commit, delete.
+
+Loaded sessions are kept in a bounded LRU cache, so a hot conversation is read
+from AGFS once instead of on every message. Session writes go straight to AGFS
+(write-through), hence evicting a session loses nothing: it is reloaded from
+storage on next use. A session is never evicted while a writer holds its lock.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from openviking.server.identity import RequestContext
 from openviking.session import Session
+from openviking.session.commit_jobs import (
+    DEFAULT_COMMIT_WORKERS,
+    DEFAULT_MAX_PENDING_COMMITS,
+    CommitJobManager,
+)
 from openviking.session.compressor import SessionCompressor
 from openviking.storage import VikingDBManager
 from openviking.storage.viking_fs import VikingFS
@@ -18,6 +33,16 @@ from openviking_cli.utils import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_MAX_CACHED_SESSIONS = 256
+
+_SessionKey = Tuple[str, str, str, str, str]
+
+
+@dataclass
+class _CachedSession:
+    session: Session
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
 
 class SessionService:
     """Session management service."""
@@ -27,21 +52,45 @@ class SessionService:
         vikingdb: Optional[VikingDBManager] = None,
         viking_fs: Optional[VikingFS] = None,
         session_compressor: Optional[SessionCompressor] = None,
+        max_cached_sessions: int = DEFAULT_MAX_CACHED_SESSIONS,
+        commit_workers: int = DEFAULT_COMMIT_WORKERS,
+        max_pending_commits: int = DEFAULT_MAX_PENDING_COMMITS,
     ):
         self._vikingdb = vikingdb
         self._viking_fs = viking_fs
         self._session_compressor = session_compressor
+        self._max_cached_sessions = max(0, max_cached_sessions)
+        self._cache: "OrderedDict[_SessionKey, _CachedSession]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._commit_jobs = CommitJobManager(
+            max_workers=commit_workers, max_pending=max_pending_commits
+        )
 
     def set_dependencies(
         self,
         vikingdb: VikingDBManager,
         viking_fs: VikingFS,
         session_compressor: SessionCompressor,
+        max_cached_sessions: Optional[int] = None,
+        commit_workers: int = DEFAULT_COMMIT_WORKERS,
+        max_pending_commits: int = DEFAULT_MAX_PENDING_COMMITS,
     ) -> None:
         """Set dependencies (for deferred initialization)."""
         self._vikingdb = vikingdb
         self._viking_fs = viking_fs
         self._session_compressor = session_compressor
+        if max_cached_sessions is not None:
+            self._max_cached_sessions = max(0, max_cached_sessions)
+        with self._cache_lock:
+            self._cache.clear()
+        self._commit_jobs.shutdown()
+        self._commit_jobs = CommitJobManager(
+            max_workers=commit_workers, max_pending=max_pending_commits
+        )
+
+    def close(self) -> None:
+        """Wait for running commit jobs and cancel queued ones."""
+        self._commit_jobs.shutdown()
 
     def _ensure_initialized(self) -> None:
         """Ensure all dependencies are initialized."""
@@ -51,6 +100,9 @@ class SessionService:
     def session(self, ctx: RequestContext, session_id: Optional[str] = None) -> Session:
         """Create a new session or load an existing one.
 
+        Returns the cached instance of ``session_id`` when there is one, so that
+        every caller in this process shares the same in-memory session.
+
         Args:
             session_id: Session ID, creates a new session (auto-generated ID) if None
 
@@ -58,6 +110,9 @@ class SessionService:
             Session instance
         """
         self._ensure_initialized()
+        return self._checkout(ctx, session_id).session
+
+    def _new_session(self, ctx: RequestContext, session_id: Optional[str]) -> Session:
         return Session(
             viking_fs=self._viking_fs,
             vikingdb_manager=self._vikingdb,
@@ -67,6 +122,80 @@ class SessionService:
             session_id=session_id,
         )
 
+    @staticmethod
+    def _cache_key(ctx: RequestContext, session_id: str) -> _SessionKey:
+        # A cached Session keeps the user and ctx it was created with, so the
+        # key holds the full identity and role: every request sharing an entry
+        # has an equal context.
+        user = ctx.user
+        return (user.account_id, user.user_id, user.agent_id, ctx.role.value, session_id)
+
+    def _checkout(self, ctx: RequestContext, session_id: Optional[str]) -> _CachedSession:
+        """Get the cache entry of a session, creating (and caching) it if needed."""
+        if self._max_cached_sessions == 0:
+            return _CachedSession(self._new_session(ctx, session_id))
+
+        session = self._new_session(ctx, session_id) if session_id is None else None
+        key = self._cache_key(ctx, session_id or session.session_id)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                return entry
+            entry = _CachedSession(session or self._new_session(ctx, session_id))
+            self._cache[key] = entry
+            self._evict_locked()
+            return entry
+
+    def _evict_locked(self) -> None:
+        """Drop least recently used sessions beyond the limit, skipping locked ones."""
+        excess = len(self._cache) - self._max_cached_sessions
+        if excess <= 0:
+            return
+        for key in list(self._cache):
+            if excess <= 0:
+                break
+            if self._cache[key].lock.locked():
+                continue
+            del self._cache[key]
+            excess -= 1
+
+    def _forget(self, ctx: RequestContext, session_id: str) -> None:
+        """Drop every cached instance of a session of the caller's user.
+
+        Agents of one user share the session's storage, so all of them go.
+        """
+        with self._cache_lock:
+            for key in list(self._cache):
+                if key[:2] == (ctx.account_id, ctx.user.user_id) and key[-1] == session_id:
+                    del self._cache[key]
+
+    def cached_session_count(self) -> int:
+        """Number of sessions currently held in memory."""
+        with self._cache_lock:
+            return len(self._cache)
+
+    async def load(self, ctx: RequestContext, session_id: str) -> Session:
+        """Get a loaded session, reading it from storage only on a cache miss."""
+        self._ensure_initialized()
+        session = self._checkout(ctx, session_id).session
+        await session.load()
+        return session
+
+    @asynccontextmanager
+    async def locked(self, ctx: RequestContext, session_id: str) -> AsyncIterator[Session]:
+        """Load a session and hold its lock, serializing concurrent writers.
+
+        Example:
+            async with service.sessions.locked(ctx, session_id) as session:
+                session.add_message("user", parts)
+        """
+        self._ensure_initialized()
+        entry = self._checkout(ctx, session_id)
+        async with entry.lock:
+            await entry.session.load()
+            yield entry.session
+
     async def create(self, ctx: RequestContext) -> Session:
         """Create a session and persist its root path."""
         session = self.session(ctx)
@@ -80,6 +209,7 @@ class SessionService:
         """
         session = self.session(ctx, session_id)
         if not await session.exists():
+            self._forget(ctx, session_id)
             raise NotFoundError(session_id, "session")
         await session.load()
         return session
@@ -123,6 +253,7 @@ class SessionService:
         self._ensure_initialized()
         session_uri = f"viking://session/{ctx.user.user_space_name()}/{session_id}"
 
+        self._forget(ctx, session_id)
         try:
             await self._viking_fs.rm(session_uri, recursive=True, ctx=ctx)
             logger.info(f"Deleted session: {session_id}")
@@ -131,18 +262,79 @@ class SessionService:
             logger.error(f"Failed to delete session {session_id}: {e}")
             raise NotFoundError(session_id, "session")
 
-    async def commit(self, session_id: str, ctx: RequestContext) -> Dict[str, Any]:
+    async def commit(
+        self, session_id: str, ctx: RequestContext, wait: bool = False
+    ) -> Dict[str, Any]:
         """Commit a session (archive messages and extract memories).
 
         Args:
             session_id: Session ID to commit
+            wait: Extract memories before returning. If False, only archive the
+                messages; memory extraction runs as a background job whose id is
+                returned as ``job_id`` (see get_commit_job).
 
         Returns:
             Commit result
+
+        Raises:
+            UnavailableError: wait is False and the commit job queue is full;
+                nothing is archived in that case
         """
         self._ensure_initialized()
-        session = await self.get(session_id, ctx)
-        return session.commit()
+        await self.get(session_id, ctx)
+        async with self.locked(ctx, session_id) as session:
+            if wait:
+                return session.commit()
+            # Take the queue slot first so that a full queue rejects the
+            # commit before messages are archived.
+            job = self._commit_jobs.reserve(session_id, owner=self._job_owner(ctx))
+            try:
+                result, archived = session.archive()
+                snapshot = session.commit_snapshot()
+            except BaseException:
+                self._commit_jobs.release(job)
+                raise
+        if not archived:
+            self._commit_jobs.release(job)
+            return result
+
+        loop = asyncio.get_running_loop()
+
+        def finish() -> Dict[str, Any]:
+            finished = session.finish_commit(archived, dict(result), snapshot)
+            if not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(
+                    self._record_commit(ctx, session_id, finished), loop
+                )
+            return finished
+
+        self._commit_jobs.start(job, finish)
+        return {**result, "status": "accepted", "job_id": job.job_id}
+
+    async def _record_commit(
+        self, ctx: RequestContext, session_id: str, result: Dict[str, Any]
+    ) -> None:
+        """Apply a background commit's statistics to the session under its lock."""
+        try:
+            async with self.locked(ctx, session_id) as session:
+                session.record_commit(result)
+        except Exception as e:
+            logger.debug(f"Could not record commit of session {session_id}: {e}")
+
+    def get_commit_job(self, session_id: str, job_id: str, ctx: RequestContext) -> Dict[str, Any]:
+        """Get the status of a background commit job (and its result once completed).
+
+        Raises NotFoundError when the job is unknown, expired, or belongs to
+        another user or session.
+        """
+        job = self._commit_jobs.get(job_id, self._job_owner(ctx))
+        if job is None or job.session_id != session_id:
+            raise NotFoundError(job_id, "commit job")
+        return job.to_dict()
+
+    @staticmethod
+    def _job_owner(ctx: RequestContext) -> Tuple[str, str]:
+        return (ctx.account_id, ctx.user.user_space_name())
 
     async def extract(self, session_id: str, ctx: RequestContext) -> List[Any]:
         """Extract memories from a session.
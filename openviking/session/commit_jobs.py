@@ -0,0 +1,199 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Background session commit jobs.
+
+Committing a session archives its messages (fast), then extracts long-term
+memories with several LLM calls per candidate (slow). CommitJobManager runs the
+slow phase (Session.finish_commit) on a bounded worker pool, so a commit request
+returns right after archiving and clients poll the job by id.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import uuid4
+
+from openviking_cli.exceptions import UnavailableError
+from openviking_cli.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_COMMIT_WORKERS = 2
+DEFAULT_MAX_PENDING_COMMITS = 64
+DEFAULT_MAX_FINISHED_JOBS = 1024
+
+
+class CommitJobStatus(str, Enum):
+    """Lifecycle of a commit job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class CommitJob:
+    """A memory extraction job created by an asynchronous commit."""
+
+    job_id: str
+    session_id: str
+    # (account_id, user space) of the committer; jobs are only visible to them.
+    owner: Tuple[str, str]
+    status: CommitJobStatus = CommitJobStatus.PENDING
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    _finished: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in (CommitJobStatus.COMPLETED, CommitJobStatus.FAILED)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job is finished; returns False on timeout."""
+        return self._finished.wait(timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "session_id": self.session_id,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class CommitJobManager:
+    """Runs commit jobs on a bounded thread pool and keeps their status."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_COMMIT_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING_COMMITS,
+        max_finished: int = DEFAULT_MAX_FINISHED_JOBS,
+    ):
+        """
+        Args:
+            max_workers: Number of commit jobs running at the same time
+            max_pending: Maximum number of queued plus running jobs; further
+                submissions are rejected with UnavailableError
+            max_finished: Number of finished jobs kept for status polling
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self.max_finished = max(0, max_finished)
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, CommitJob]" = OrderedDict()
+        self._pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(
+        self, session_id: str, owner: Tuple[str, str], fn: Callable[[], Dict[str, Any]]
+    ) -> CommitJob:
+        """Queue ``fn`` (returning the commit result) as a job of ``session_id``.
+
+        Raises:
+            UnavailableError: The queue is full
+        """
+        job = self.reserve(session_id, owner)
+        self.start(job, fn)
+        return job
+
+    def reserve(self, session_id: str, owner: Tuple[str, str]) -> CommitJob:
+        """Take a queue slot for a job of ``session_id`` without starting it.
+
+        Lets a caller check capacity before doing work that must not be lost,
+        then start() the job or release() the slot.
+
+        Raises:
+            UnavailableError: The queue is full
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise UnavailableError(
+                    "session commit", f"{self._pending} commit jobs already queued"
+                )
+            job = CommitJob(job_id=uuid4().hex, session_id=session_id, owner=owner)
+            self._jobs[job.job_id] = job
+            self._pending += 1
+            self._prune_locked()
+        return job
+
+    def start(self, job: CommitJob, fn: Callable[[], Dict[str, Any]]) -> None:
+        """Run ``fn`` as the reserved ``job``."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="session-commit"
+                )
+            executor = self._executor
+        executor.submit(self._run, job, fn)
+        logger.info(f"[CommitJobs] Queued commit job {job.job_id} for session {job.session_id}")
+
+    def release(self, job: CommitJob) -> None:
+        """Give back the slot of a reserved job that will not be started."""
+        with self._lock:
+            if self._jobs.pop(job.job_id, None) is not None:
+                self._pending -= 1
+
+    def _run(self, job: CommitJob, fn: Callable[[], Dict[str, Any]]) -> None:
+        job.started_at = time.time()
+        job.status = CommitJobStatus.RUNNING
+        try:
+            job.result = fn()
+            job.status = CommitJobStatus.COMPLETED
+        except Exception as e:
+            logger.error(f"[CommitJobs] Commit job {job.job_id} of {job.session_id} failed: {e}")
+            job.error = str(e)
+            job.status = CommitJobStatus.FAILED
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._pending -= 1
+                self._prune_locked()
+            job._finished.set()
+
+    def _prune_locked(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str, owner: Tuple[str, str]) -> Optional[CommitJob]:
+        """Get a job of ``owner`` by id (None if unknown or owned by someone else)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or job.owner != owner:
+            return None
+        return job
+
+    def pending_count(self) -> int:
+        """Number of queued plus running jobs."""
+        with self._lock:
+            return self._pending
+
+    def shutdown(self) -> None:
+        """Wait for running jobs and fail the ones still queued."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status == CommitJobStatus.PENDING:
+                    job.status = CommitJobStatus.FAILED
+                    job.error = "cancelled: service shut down"
+                    job.finished_at = time.time()
+                    job._finished.set()
+            self._pending = 0
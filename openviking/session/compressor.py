@@ -7,8 +7,11 @@ Handles extraction of long-term memories from session conversations.
 Uses MemoryExtractor for 6-category extraction and MemoryDeduplicator for LLM-based dedup.
 """
 
+import asyncio
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from openviking.core.context import Context, Vectorize
 from openviking.message import Message
@@ -44,6 +47,8 @@ TOOL_SKILL_CATEGORIES = {
     MemoryCategory.SKILLS,
 }
 
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 @dataclass
 class ExtractionStats:
@@ -54,6 +59,16 @@ class ExtractionStats:
     deleted: int = 0
     skipped: int = 0
 
+    # Seconds spent per stage. Candidates run concurrently, so the per-candidate
+    # stages (dedup, write, index) are summed over candidates and may exceed
+    # total_seconds, the wall time of the whole extraction.
+    extract_seconds: float = 0.0
+    dedup_seconds: float = 0.0
+    write_seconds: float = 0.0
+    index_seconds: float = 0.0
+    relations_seconds: float = 0.0
+    total_seconds: float = 0.0
+
 
 class SessionCompressor:
     """Session memory extractor with 6-category memory extraction."""
@@ -61,9 +76,16 @@ class SessionCompressor:
     def __init__(
         self,
         vikingdb: VikingDBManager,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
-        """Initialize session compressor."""
+        """Initialize session compressor.
+
+        Args:
+            vikingdb: VikingDB manager
+            max_concurrency: Maximum number of candidates processed at the same time
+        """
         self.vikingdb = vikingdb
+        self.max_concurrency = max(1, max_concurrency)
         self.extractor = MemoryExtractor()
         self.deduplicator = MemoryDeduplicator(vikingdb=vikingdb)
 
@@ -135,8 +157,14 @@ class SessionCompressor:
         user: Optional["UserIdentifier"] = None,
         session_id: Optional[str] = None,
         ctx: Optional[RequestContext] = None,
+        stats: Optional[ExtractionStats] = None,
     ) -> List[Context]:
-        """Extract long-term memories from messages."""
+        """Extract long-term memories from messages.
+
+        Candidates are deduplicated and written concurrently (at most
+        ``max_concurrency`` at a time). Pass ``stats`` to receive the decision
+        counts and per-stage timings.
+        """
         if not messages:
             return []
 
@@ -144,99 +172,177 @@ class SessionCompressor:
         if not ctx:
             return []
 
-        candidates = await self.extractor.extract(context, user, session_id)
+        stats = stats if stats is not None else ExtractionStats()
+        started = time.perf_counter()
+        with self._timed(stats, "extract_seconds"):
+            candidates = await self.extractor.extract(context, user, session_id)
 
         if not candidates:
             return []
 
-        memories: List[Context] = []
-        stats = ExtractionStats()
         viking_fs = get_viking_fs()
-
         tool_parts = self._extract_tool_parts(messages)
 
-        for candidate in candidates:
-            # Profile: skip dedup, always merge
-            if candidate.category in ALWAYS_MERGE_CATEGORIES:
+        # Candidates touching the same memory file (same category facet, tool or
+        # skill) are serialized so their merge/delete decisions see each other's
+        # writes; everything else runs concurrently under the semaphore.
+        key_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def process(candidate: CandidateMemory) -> List[Context]:
+            lock = key_locks.setdefault(self._candidate_key(candidate, tool_parts), asyncio.Lock())
+            async with lock, semaphore:
+                return await self._process_candidate(
+                    candidate, tool_parts, stats, viking_fs, user, session_id, ctx
+                )
+
+        results = await asyncio.gather(*(process(candidate) for candidate in candidates))
+        memories: List[Context] = [memory for batch in results for memory in batch]
+
+        # Extract URIs used in messages, create relations
+        used_uris = self._extract_used_uris(messages)
+        if used_uris and memories:
+            with self._timed(stats, "relations_seconds"):
+                await self._create_relations(memories, used_uris, ctx=ctx)
+
+        stats.total_seconds = time.perf_counter() - started
+        logger.info(
+            f"Memory extraction: created={stats.created}, "
+            f"merged={stats.merged}, deleted={stats.deleted}, skipped={stats.skipped}, "
+            f"candidates={len(candidates)}, total={stats.total_seconds:.2f}s "
+            f"(extract={stats.extract_seconds:.2f}s, dedup={stats.dedup_seconds:.2f}s, "
+            f"write={stats.write_seconds:.2f}s, index={stats.index_seconds:.2f}s, "
+            f"relations={stats.relations_seconds:.2f}s)"
+        )
+        return memories
+
+    def _candidate_key(self, candidate: CandidateMemory, tool_parts: List) -> Tuple[str, str]:
+        """Key of the memory file(s) a candidate may create, merge into or delete."""
+        if candidate.category in ALWAYS_MERGE_CATEGORIES:
+            return (candidate.category.value, "")
+        if candidate.category in TOOL_SKILL_CATEGORIES:
+            if isinstance(candidate, ToolSkillCandidateMemory):
+                tool_name, skill_name, _ = self._get_tool_skill_info(candidate, tool_parts)
+                if skill_name:
+                    return ("skill", skill_name)
+                return ("tool", tool_name)
+            return (candidate.category.value, "")
+        return (
+            candidate.category.value,
+            MemoryDeduplicator._extract_facet_key(candidate.abstract),
+        )
+
+    @staticmethod
+    @contextmanager
+    def _timed(stats: ExtractionStats, stage: str) -> Iterator[None]:
+        """Add the time spent in the block to ``stats.<stage>``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(stats, stage, getattr(stats, stage) + time.perf_counter() - start)
+
+    async def _process_candidate(
+        self,
+        candidate: CandidateMemory,
+        tool_parts: List,
+        stats: ExtractionStats,
+        viking_fs,
+        user: Optional["UserIdentifier"],
+        session_id: Optional[str],
+        ctx: RequestContext,
+    ) -> List[Context]:
+        """Dedup and persist one candidate; returns the memories it created or merged."""
+        # Profile: skip dedup, always merge
+        if candidate.category in ALWAYS_MERGE_CATEGORIES:
+            with self._timed(stats, "write_seconds"):
                 memory = await self.extractor.create_memory(candidate, user, session_id, ctx=ctx)
-                if memory:
-                    memories.append(memory)
-                    stats.created += 1
-                    await self._index_memory(memory)
+            if not memory:
+                stats.skipped += 1
+                return []
+            stats.created += 1
+            with self._timed(stats, "index_seconds"):
+                await self._index_memory(memory)
+            return [memory]
+
+        # Tool/Skill Memory: 特殊合并逻辑
+        if candidate.category in TOOL_SKILL_CATEGORIES:
+            if not isinstance(candidate, ToolSkillCandidateMemory):
+                return []
+            tool_name, skill_name, tool_status = self._get_tool_skill_info(candidate, tool_parts)
+            candidate.tool_status = tool_status
+            with self._timed(stats, "write_seconds"):
+                if skill_name:
+                    memory = await self.extractor._merge_skill_memory(
+                        skill_name, candidate, ctx=ctx
+                    )
+                elif tool_name:
+                    memory = await self.extractor._merge_tool_memory(tool_name, candidate, ctx=ctx)
                 else:
+                    logger.warning("No tool_name or skill_name found, skipping")
                     stats.skipped += 1
-                continue
-
-            # Tool/Skill Memory: 特殊合并逻辑
-            if candidate.category in TOOL_SKILL_CATEGORIES:
-                if isinstance(candidate, ToolSkillCandidateMemory):
-                    tool_name, skill_name, tool_status = self._get_tool_skill_info(candidate, tool_parts)
-                    candidate.tool_status = tool_status
-                    if skill_name:
-                        memory = await self.extractor._merge_skill_memory(
-                            skill_name, candidate, ctx=ctx
-                        )
-                    elif tool_name:
-                        memory = await self.extractor._merge_tool_memory(
-                            tool_name, candidate, ctx=ctx
-                        )
-                    else:
-                        logger.warning("No tool_name or skill_name found, skipping")
-                        stats.skipped += 1
-                        continue
-                    if memory:
-                        memories.append(memory)
-                        stats.merged += 1
-                        await self._index_memory(memory)
-                continue
-
-            # Dedup check for other categories
+                    return []
+            if not memory:
+                return []
+            stats.merged += 1
+            with self._timed(stats, "index_seconds"):
+                await self._index_memory(memory)
+            return [memory]
+
+        # Dedup check for other categories
+        with self._timed(stats, "dedup_seconds"):
             result = await self.deduplicator.deduplicate(candidate)
-            actions = result.actions or []
-            decision = result.decision
-
-            # Safety net: create+merge should be treated as none.
-            if decision == DedupDecision.CREATE and any(
-                a.decision == MemoryActionDecision.MERGE for a in actions
-            ):
-                logger.warning(
-                    f"Dedup returned create with merge action, normalizing to none: "
-                    f"{candidate.abstract}"
-                )
-                decision = DedupDecision.NONE
+        actions = result.actions or []
+        decision = result.decision
+
+        # Safety net: create+merge should be treated as none.
+        if decision == DedupDecision.CREATE and any(
+            a.decision == MemoryActionDecision.MERGE for a in actions
+        ):
+            logger.warning(
+                f"Dedup returned create with merge action, normalizing to none: "
+                f"{candidate.abstract}"
+            )
+            decision = DedupDecision.NONE
 
-            if decision == DedupDecision.SKIP:
-                stats.skipped += 1
-                continue
+        if decision == DedupDecision.SKIP:
+            stats.skipped += 1
+            return []
 
-            if decision == DedupDecision.NONE:
-                if not actions:
-                    stats.skipped += 1
-                    continue
+        if decision == DedupDecision.NONE:
+            if not actions:
+                stats.skipped += 1
+                return []
 
-                for action in actions:
-                    if action.decision == MemoryActionDecision.DELETE:
-                        if viking_fs and await self._delete_existing_memory(
+            for action in actions:
+                if action.decision == MemoryActionDecision.DELETE:
+                    with self._timed(stats, "write_seconds"):
+                        deleted = viking_fs and await self._delete_existing_memory(
                             action.memory, viking_fs, ctx=ctx
-                        ):
-                            stats.deleted += 1
-                        else:
-                            stats.skipped += 1
-                    elif action.decision == MemoryActionDecision.MERGE:
-                        if candidate.category in MERGE_SUPPORTED_CATEGORIES and viking_fs:
-                            if await self._merge_into_existing(
+                        )
+                    if deleted:
+                        stats.deleted += 1
+                    else:
+                        stats.skipped += 1
+                elif action.decision == MemoryActionDecision.MERGE:
+                    if candidate.category in MERGE_SUPPORTED_CATEGORIES and viking_fs:
+                        # Timed as a write, including the re-index of the merged memory
+                        with self._timed(stats, "write_seconds"):
+                            merged = await self._merge_into_existing(
                                 candidate, action.memory, viking_fs, ctx=ctx
-                            ):
-                                stats.merged += 1
-                            else:
-                                stats.skipped += 1
+                            )
+                        if merged:
+                            stats.merged += 1
                         else:
-                            # events/cases don't support MERGE, treat as SKIP
                             stats.skipped += 1
-                continue
+                    else:
+                        # events/cases don't support MERGE, treat as SKIP
+                        stats.skipped += 1
+            return []
 
-            if decision == DedupDecision.CREATE:
-                # create can optionally include delete actions (delete first, then create)
+        if decision == DedupDecision.CREATE:
+            # create can optionally include delete actions (delete first, then create)
+            with self._timed(stats, "write_seconds"):
                 for action in actions:
                     if action.decision == MemoryActionDecision.DELETE:
                         if viking_fs and await self._delete_existing_memory(
@@ -247,23 +353,15 @@ class SessionCompressor:
                             stats.skipped += 1
 
                 memory = await self.extractor.create_memory(candidate, user, session_id, ctx=ctx)
-                if memory:
-                    memories.append(memory)
-                    stats.created += 1
-                    await self._index_memory(memory)
-                else:
-                    stats.skipped += 1
-
-        # Extract URIs used in messages, create relations
-        used_uris = self._extract_used_uris(messages)
-        if used_uris and memories:
-            await self._create_relations(memories, used_uris, ctx=ctx)
+            if not memory:
+                stats.skipped += 1
+                return []
+            stats.created += 1
+            with self._timed(stats, "index_seconds"):
+                await self._index_memory(memory)
+            return [memory]
 
-        logger.info(
-            f"Memory extraction: created={stats.created}, "
-            f"merged={stats.merged}, deleted={stats.deleted}, skipped={stats.skipped}"
-        )
-        return memories
+        return []
 
     def _extract_tool_parts(self, messages: List[Message]) -> List:
         """Extract all ToolPart from messages."""
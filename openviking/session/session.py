@@ -5,11 +5,13 @@
 Session as Context: Sessions integrated into L0/L1/L2 system.
 """
 
+import asyncio
+import heapq
 import json
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from openviking.message import Message, Part
@@ -62,6 +64,16 @@ class Usage:
     timestamp: str = field(default_factory=get_current_timestamp)
 
 
+@dataclass
+class CommitSnapshot:
+    """Session state the second commit phase works on."""
+
+    user: UserIdentifier
+    ctx: RequestContext
+    usage_records: List[Usage]
+    stats: SessionStats
+
+
 class Session:
     """Session management class - Message = role + parts."""
 
@@ -90,6 +102,8 @@ class Session:
         self._compression: SessionCompression = SessionCompression()
         self._stats: SessionStats = SessionStats()
         self._loaded = False
+        # archive number -> (overview, lowercased overview); None until first search
+        self._archive_overviews: Optional[Dict[int, Tuple[str, str]]] = None
 
         logger.info(f"Session created: {self.session_id} for user {self.user}")
 
@@ -102,11 +116,16 @@ class Session:
             content = await self._viking_fs.read_file(
                 f"{self._session_uri}/messages.jsonl", ctx=self.ctx
             )
-            self._messages = [
-                Message.from_dict(json.loads(line))
-                for line in content.strip().split("\n")
-                if line.strip()
-            ]
+            # messages.jsonl is append-only between commits: a tool update appends the
+            # message again, and the last record of an id replaces the earlier ones.
+            messages: Dict[str, Message] = {}
+            for line in content.strip().split("\n"):
+                if line.strip():
+                    msg = Message.from_dict(json.loads(line))
+                    messages[msg.id] = msg
+            self._messages = list(messages.values())
+            self._stats.total_turns = sum(1 for m in self._messages if m.role == "user")
+            self._stats.total_tokens = sum(len(m.content) // 4 for m in self._messages)
             logger.info(f"Session loaded: {self.session_id} ({len(self._messages)} messages)")
         except (FileNotFoundError, Exception):
             logger.debug(f"Session {self.session_id} not found, starting fresh")
@@ -216,20 +235,52 @@ class Session:
         tool_part.tool_status = status
 
         self._save_tool_result(tool_id, msg, output, status)
-        self._update_message_in_jsonl()
+        self._append_to_jsonl(msg)
 
     def commit(self) -> Dict[str, Any]:
         """Commit session: create archive, extract memories, persist."""
+        result, archived = self.archive()
+        if archived:
+            self.finish_commit(archived, result, self.commit_snapshot())
+            self.record_commit(result)
+        return result
+
+    def commit_snapshot(self) -> CommitSnapshot:
+        """Copy of the identity, usage records and stats for finish_commit().
+
+        finish_commit() may run on another thread while messages and usages
+        keep being added to this session, so it works on a snapshot.
+        """
+        return CommitSnapshot(
+            user=self.user,
+            ctx=self.ctx,
+            usage_records=list(self._usage_records),
+            stats=replace(self._stats),
+        )
+
+    def record_commit(self, result: Dict[str, Any]) -> None:
+        """Apply the statistics of a finished commit to this session."""
+        self._stats.memories_extracted += result.get("memories_extracted", 0)
+
+    def archive(self) -> Tuple[Dict[str, Any], List[Message]]:
+        """First phase of commit: archive current messages and start an empty log.
+
+        Fast (no LLM calls besides the archive summary); new messages can be
+        added as soon as it returns.
+
+        Returns:
+            (commit result so far, archived messages for finish_commit)
+        """
         result = {
             "session_id": self.session_id,
             "status": "committed",
             "memories_extracted": 0,
-            "active_count_updated": 0,
+            "active_count_queued": 0,
             "archived": False,
             "stats": None,
         }
         if not self._messages:
-            return result
+            return result, []
 
         # 1. Archive current messages
         self._compression.compression_index += 1
@@ -254,61 +305,85 @@ class Session:
             f"Archived: {len(messages_to_archive)} messages → history/archive_{self._compression.compression_index:03d}/"
         )
 
-        # 2. Extract long-term memories
+        # 2. Write current messages to AGFS
+        self._write_to_agfs(self._messages)
+        self._stats.total_tokens = 0
+        self._stats.compression_count = self._compression.compression_index
+        return result, messages_to_archive
+
+    def finish_commit(
+        self,
+        messages: List[Message],
+        result: Dict[str, Any],
+        snapshot: CommitSnapshot,
+    ) -> Dict[str, Any]:
+        """Second phase of commit: extract memories, write relations and usage counts.
+
+        Does not modify the session's own state; apply the result with
+        record_commit().
+
+        Args:
+            messages: Messages archived by archive()
+            result: Commit result returned by archive(), completed in place
+            snapshot: State from commit_snapshot(); its stats are updated in
+                place
+
+        Returns:
+            The completed commit result
+        """
+        # 3. Extract long-term memories
         if self._session_compressor:
-            logger.info(
-                f"Starting memory extraction from {len(messages_to_archive)} archived messages"
-            )
+            logger.info(f"Starting memory extraction from {len(messages)} archived messages")
             memories = run_async(
                 self._session_compressor.extract_long_term_memories(
-                    messages=messages_to_archive,
-                    user=self.user,
+                    messages=messages,
+                    user=snapshot.user,
                     session_id=self.session_id,
-                    ctx=self.ctx,
+                    ctx=snapshot.ctx,
                 )
             )
             logger.info(f"Extracted {len(memories)} memories")
             result["memories_extracted"] = len(memories)
-            self._stats.memories_extracted += len(memories)
-
-        # 3. Write current messages to AGFS
-        self._write_to_agfs(self._messages)
+            snapshot.stats.memories_extracted += len(memories)
 
         # 4. Create relations
-        self._write_relations()
+        self._write_relations(snapshot.usage_records, snapshot.ctx)
 
         # 5. Update active_count
-        active_count_updated = self._update_active_counts()
-        result["active_count_updated"] = active_count_updated
+        active_count_queued = self._update_active_counts(snapshot.usage_records, snapshot.ctx)
+        result["active_count_queued"] = active_count_queued
 
         # 6. Update statistics
-        self._stats.compression_count = self._compression.compression_index
+        stats = snapshot.stats
         result["stats"] = {
-            "total_turns": self._stats.total_turns,
-            "contexts_used": self._stats.contexts_used,
-            "skills_used": self._stats.skills_used,
-            "memories_extracted": self._stats.memories_extracted,
+            "total_turns": stats.total_turns,
+            "contexts_used": stats.contexts_used,
+            "skills_used": stats.skills_used,
+            "memories_extracted": stats.memories_extracted,
         }
 
-        self._stats.total_tokens = 0
         logger.info(f"Session {self.session_id} committed")
         return result
 
-    def _update_active_counts(self) -> int:
-        """Update active_count for used contexts/skills."""
+    def _update_active_counts(self, usage_records: List[Usage], ctx: RequestContext) -> int:
+        """Queue active_count increments for used contexts/skills.
+
+        Returns the number of distinct URIs queued; the records themselves are
+        updated later by the backend's batched flush.
+        """
         if not self._vikingdb_manager:
             return 0
 
-        uris = [usage.uri for usage in self._usage_records if usage.uri]
+        uris = [usage.uri for usage in usage_records if usage.uri]
         try:
-            updated = run_async(self._vikingdb_manager.increment_active_count(self.ctx, uris))
+            queued = run_async(self._vikingdb_manager.increment_active_count(ctx, uris))
         except Exception as e:
             logger.debug(f"Could not update active_count for usage URIs: {e}")
-            updated = 0
+            queued = 0
 
-        if updated > 0:
-            logger.info(f"Updated active_count for {updated} contexts/skills")
-        return updated
+        if queued > 0:
+            logger.info(f"Queued active_count updates for {queued} contexts/skills")
+        return queued
 
     async def get_context_for_search(
         self, query: str, max_archives: int = 3, max_messages: int = 20
@@ -331,32 +406,16 @@ class Session:
         summaries = []
         if self.compression.compression_index > 0:
             try:
-                history_items = await self._viking_fs.ls(
-                    f"{self._session_uri}/history", ctx=self.ctx
-                )
+                archives = await self._get_archive_overviews()
                 query_lower = query.lower()
 
-                # Collect all archives with relevance scores
-                scored_archives = []
-                for item in history_items:
-                    name = item.get("name") if isinstance(item, dict) else item
-                    if name and name.startswith("archive_"):
-                        overview_uri = f"{self._session_uri}/history/{name}/.overview.md"
-                        try:
-                            overview = await self._viking_fs.read_file(overview_uri, ctx=self.ctx)
-                            # Calculate relevance by keyword matching
-                            score = 0
-                            if query_lower in overview.lower():
-                                score = overview.lower().count(query_lower)
-                            # Infer time from name (higher archive_NNN = newer)
-                            archive_num = int(name.split("_")[1]) if "_" in name else 0
-                            scored_archives.append((score, archive_num, overview))
-                        except Exception:
-                            pass
-
-                # Sort: relevance first, then time, take top N
-                scored_archives.sort(key=lambda x: (x[0], x[1]), reverse=True)
-                summaries = [overview for _, _, overview in scored_archives[:max_archives]]
+                # Relevance by keyword matching, then time (higher archive_NNN = newer)
+                top = heapq.nlargest(
+                    max_archives,
+                    archives.items(),
+                    key=lambda item: (item[1][1].count(query_lower) if query_lower else 0, item[0]),
+                )
+                summaries = [overview for _, (overview, _) in top]
 
             except Exception:
                 pass
@@ -368,6 +427,46 @@ class Session:
 
     # ============= Internal methods =============
 
+    async def _get_archive_overviews(self) -> Dict[int, Tuple[str, str]]:
+        """Get the overviews of all archives, indexed by archive number.
+
+        The index is read from history/ once and then kept up to date by
+        _write_archive; it is reloaded if archives appeared that this instance
+        did not write.
+        """
+        archives = self._archive_overviews
+        if archives is not None and (
+            max(archives, default=0) >= self._compression.compression_index
+        ):
+            return archives
+
+        history_items = await self._viking_fs.ls(f"{self._session_uri}/history", ctx=self.ctx)
+        names: Dict[int, str] = {}
+        for item in history_items:
+            name = item.get("name") if isinstance(item, dict) else item
+            if name and name.startswith("archive_"):
+                try:
+                    names[int(name.split("_")[1])] = name
+                except ValueError:
+                    continue
+
+        async def read_overview(name: str) -> Optional[str]:
+            try:
+                return await self._viking_fs.read_file(
+                    f"{self._session_uri}/history/{name}/.overview.md", ctx=self.ctx
+                )
+            except Exception:
+                return None
+
+        overviews = await asyncio.gather(*(read_overview(name) for name in names.values()))
+        archives = {
+            number: (overview, overview.lower())
+            for number, overview in zip(names, overviews)
+            if overview is not None
+        }
+        self._archive_overviews = archives
+        return archives
+
     def _extract_abstract_from_summary(self, summary: str) -> str:
         """Extract one-sentence overview from structured summary."""
         if not summary:
@@ -434,6 +533,9 @@ class Session:
             viking_fs.write_file(uri=f"{archive_uri}/.overview.md", content=overview, ctx=self.ctx)
         )
 
+        if self._archive_overviews is not None:
+            self._archive_overviews[index] = (overview, overview.lower())
+
         logger.debug(f"Written archive: {archive_uri}")
 
     def _write_to_agfs(self, messages: List[Message]) -> None:
@@ -486,21 +588,6 @@ class Session:
             )
         )
 
-    def _update_message_in_jsonl(self) -> None:
-        """Update message in messages.jsonl."""
-        if not self._viking_fs:
-            return
-
-        lines = [m.to_jsonl() for m in self._messages]
-        content = "\n".join(lines) + "\n"
-        run_async(
-            self._viking_fs.write_file(
-                f"{self._session_uri}/messages.jsonl",
-                content,
-                ctx=self.ctx,
-            )
-        )
-
     def _save_tool_result(
         self,
         tool_id: str,
@@ -568,15 +655,15 @@ class Session:
             parts.append(f"- Historical archives: `{self._session_uri}/history/`")
         return "\n".join(parts)
 
-    def _write_relations(self) -> None:
+    def _write_relations(self, usage_records: List[Usage], ctx: RequestContext) -> None:
         """Create relations to used contexts/tools."""
         if not self._viking_fs:
             return
 
         viking_fs = self._viking_fs
-        for usage in self._usage_records:
+        for usage in usage_records:
             try:
-                run_async(viking_fs.link(self._session_uri, usage.uri, ctx=self.ctx))
+                run_async(viking_fs.link(self._session_uri, usage.uri, ctx=ctx))
                 logger.debug(f"Created relation: {self._session_uri} -> {usage.uri}")
             except Exception as e:
                 logger.warning(f"Failed to create relation to {usage.uri}: {e}")
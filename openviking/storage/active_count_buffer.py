@@ -0,0 +1,103 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Write-behind buffer for context active_count increments.
+
+Every session commit bumps active_count of the contexts and skills it used.
+Increments are coalesced per (account, URI) in memory and written
+periodically as one batched scalar-field update, so a commit no longer pays a
+read and a full-record upsert per URI.
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from openviking_cli.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (account_id, uri) -> pending increment
+PendingCounts = Dict[Tuple[str, str], int]
+
+
+class ActiveCountBuffer:
+    """Coalesces active_count increments and flushes them in the background."""
+
+    def __init__(
+        self,
+        flush_fn: Callable[[PendingCounts], int],
+        flush_interval: float = 5.0,
+        max_pending: int = 10000,
+    ):
+        """
+        Args:
+            flush_fn: Applies a batch of increments; returns the number of
+                records updated
+            flush_interval: Seconds between background flushes; 0 writes
+                every increment through immediately
+            max_pending: Number of pending URIs that triggers an early flush
+        """
+        self._flush_fn = flush_fn
+        self.flush_interval = max(0.0, flush_interval)
+        self.max_pending = max(1, max_pending)
+        self._lock = threading.Lock()
+        # Serializes flushes so two batches never read-modify-write the same record.
+        self._flush_lock = threading.Lock()
+        self._pending: PendingCounts = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, account_id: str, uris: Iterable[str]) -> int:
+        """Queue one increment for each distinct URI; returns how many were queued."""
+        keys = {(account_id, uri) for uri in uris if uri}
+        if not keys:
+            return 0
+        with self._lock:
+            for key in keys:
+                self._pending[key] = self._pending.get(key, 0) + 1
+            flush_now = self.flush_interval == 0 or len(self._pending) >= self.max_pending
+            if not flush_now:
+                self._ensure_thread_locked()
+        if flush_now:
+            self.flush()
+        return len(keys)
+
+    def pending_count(self) -> int:
+        """Number of (account, URI) pairs waiting to be flushed."""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """Write all pending increments now; returns the number of records updated."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            try:
+                return self._flush_fn(pending)
+            except Exception as e:
+                logger.warning(f"Failed to flush {len(pending)} active_count updates: {e}")
+                # Keep the increments for the next attempt.
+                with self._lock:
+                    for key, delta in pending.items():
+                        self._pending[key] = self._pending.get(key, 0) + delta
+                return 0
+
+    def close(self) -> None:
+        """Stop the background flusher and write what is still pending."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def _ensure_thread_locked(self) -> None:
+        if self._thread is not None or self._stop.is_set():
+            return
+        self._thread = threading.Thread(target=self._run, name="active-count-flusher", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
@@ -0,0 +1,94 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Async AGFS transport.
+
+pyagfs clients (AGFSClient over HTTP, AGFSBindingClient over ctypes) are
+synchronous. Calling them from coroutines blocks the event loop for the whole
+duration of the AGFS request, so one slow ``ls`` stalls every concurrent search.
+
+AsyncAGFSClient wraps a synchronous client and offloads each call to a bounded,
+dedicated thread pool. The pool is shared process-wide so the total number of
+in-flight AGFS requests stays bounded regardless of how many wrappers exist.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from openviking_cli.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_IO_WORKERS = 16
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_max_workers = DEFAULT_MAX_IO_WORKERS
+
+
+def init_agfs_executor(max_workers: int = DEFAULT_MAX_IO_WORKERS) -> ThreadPoolExecutor:
+    """(Re)create the shared AGFS I/O executor.
+
+    Args:
+        max_workers: Maximum number of concurrent AGFS calls.
+    """
+    global _executor, _max_workers
+    with _executor_lock:
+        old = _executor
+        _max_workers = max(1, max_workers)
+        _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="agfs-io")
+    if old is not None:
+        # Let calls already queued on the old pool finish on their own.
+        old.shutdown(wait=False)
+    logger.debug(f"[AsyncAGFS] Initialized AGFS executor with {_max_workers} workers")
+    return _executor
+
+
+def get_agfs_executor() -> ThreadPoolExecutor:
+    """Get the shared AGFS I/O executor, creating it lazily."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_max_workers, thread_name_prefix="agfs-io"
+                )
+    return _executor
+
+
+async def run_agfs(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking AGFS callable on the shared executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_agfs_executor(), functools.partial(func, *args, **kwargs))
+
+
+class AsyncAGFSClient:
+    """Awaitable facade over a synchronous AGFS client.
+
+    Every public method of the wrapped client is exposed as a coroutine with the
+    same signature, e.g. ``await client.read(path)``. Non-callable attributes are
+    returned unchanged.
+    """
+
+    def __init__(self, client: Any):
+        self._client = client
+
+    @property
+    def sync_client(self) -> Any:
+        """The wrapped synchronous client."""
+        return self._client
+
+    async def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Invoke ``method`` of the wrapped client on the AGFS executor."""
+        return await run_agfs(getattr(self._client, method), *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+        return functools.partial(self.call, name)
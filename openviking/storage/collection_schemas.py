@@ -10,10 +10,11 @@ similar to how init_viking_fs encapsulates VikingFS initialization.
 import asyncio
 import hashlib
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from openviking.models.embedder.base import EmbedResult
 from openviking.storage.errors import CollectionNotFoundError
+from openviking.storage.query_cache import get_query_cache
 from openviking.storage.queuefs.embedding_msg import EmbeddingMsg
 from openviking.storage.queuefs.named_queue import DequeueHandlerBase
 from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
@@ -177,21 +178,11 @@ class TextEmbeddingHandler(DequeueHandlerBase):
                 result: EmbedResult = await asyncio.to_thread(
                     self._embedder.embed, embedding_msg.message
                 )
-
-                # Add dense vector
-                if result.dense_vector:
-                    inserted_data["vector"] = result.dense_vector
-                    # Validate vector dimension
-                    if len(result.dense_vector) != self._vector_dim:
-                        error_msg = f"Dense vector dimension mismatch: expected {self._vector_dim}, got {len(result.dense_vector)}"
-                        logger.error(error_msg)
-                        self.report_error(error_msg, data)
-                        return None
-
-                # Add sparse vector if present
-                if result.sparse_vector:
-                    inserted_data["sparse_vector"] = result.sparse_vector
-                    logger.debug(f"Generated sparse vector with {len(result.sparse_vector)} terms")
+                error_msg = self._apply_embedding(inserted_data, result)
+                if error_msg:
+                    logger.error(error_msg)
+                    self.report_error(error_msg, data)
+                    return None
             else:
                 error_msg = "Embedder not initialized, skipping vector generation"
                 logger.warning(error_msg)
@@ -200,13 +191,6 @@ class TextEmbeddingHandler(DequeueHandlerBase):
 
             # Write to vector database
             try:
-                # Ensure vector DB has at most one record per URI.
-                uri = inserted_data.get("uri")
-                if uri:
-                    account_id = inserted_data.get("account_id", "default")
-                    id_seed = f"{account_id}:{uri}"
-                    inserted_data["id"] = hashlib.md5(id_seed.encode("utf-8")).hexdigest()
-
                 record_id = await self._vikingdb.upsert(inserted_data)
                 if record_id:
                     logger.debug(
@@ -229,6 +213,7 @@ class TextEmbeddingHandler(DequeueHandlerBase):
                 self.report_error(str(db_err), data)
                 return None
 
+            self._invalidate_query_cache([inserted_data])
             self.report_success()
             return inserted_data
 
@@ -239,3 +224,124 @@ class TextEmbeddingHandler(DequeueHandlerBase):
             traceback.print_exc()
             self.report_error(str(e), data)
             return None
+
+    async def on_dequeue_batch(self, data_list: List[Dict[str, Any]]) -> None:
+        """Embed a batch of messages with one embed_batch call and write them with one upsert.
+
+        Parse and embedding failures are reported per message; the bulk write
+        succeeds or fails for every message that reached it.
+        """
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any], str]] = []
+        for data in data_list:
+            try:
+                embedding_msg = EmbeddingMsg.from_dict(json.loads(data["data"]))
+            except Exception as e:
+                logger.error(f"Error processing embedding message: {e}")
+                self.report_error(str(e), data)
+                continue
+            if not isinstance(embedding_msg.message, str):
+                logger.debug(f"Skipping non-string message type: {type(embedding_msg.message)}")
+                self.report_success()
+                continue
+            pending.append((data, embedding_msg.context_data, embedding_msg.message))
+        if not pending:
+            return
+
+        if not self._embedder:
+            from openviking_cli.utils.config import get_openviking_config
+
+            self._initialize_embedder(get_openviking_config())
+        if not self._embedder:
+            error_msg = "Embedder not initialized, skipping vector generation"
+            logger.warning(error_msg)
+            for data, _, _ in pending:
+                self.report_error(error_msg, data)
+            return
+
+        texts = [text for _, _, text in pending]
+        try:
+            results = await asyncio.to_thread(self._embedder.embed_batch, texts)
+            if len(results) != len(texts):
+                raise ValueError(f"embed_batch returned {len(results)} results for {len(texts)}")
+        except Exception as e:
+            # One bad input fails the whole provider request; retry one by one so
+            # only the offending messages are reported as errors.
+            logger.warning(f"Batch embedding failed, falling back to single embedding: {e}")
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self._embedder.embed, text) for text in texts),
+                return_exceptions=True,
+            )
+
+        records: List[Dict[str, Any]] = []
+        written: List[Dict[str, Any]] = []
+        for (data, inserted_data, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                error_msg = str(result)
+            else:
+                error_msg = self._apply_embedding(inserted_data, result)
+            if error_msg:
+                logger.error(f"Error processing embedding message: {error_msg}")
+                self.report_error(error_msg, data)
+                continue
+            records.append(inserted_data)
+            written.append(data)
+        if not records:
+            return
+
+        try:
+            await self._vikingdb.upsert_many(records)
+        except CollectionNotFoundError as db_err:
+            if getattr(self._vikingdb, "is_closing", False):
+                logger.debug(f"Skip embedding write during shutdown: {db_err}")
+                for _ in written:
+                    self.report_success()
+                return
+            logger.error(f"Failed to write to vector database: {db_err}")
+            for data in written:
+                self.report_error(str(db_err), data)
+            return
+        except Exception as db_err:
+            logger.error(f"Failed to write to vector database: {db_err}")
+            for data in written:
+                self.report_error(str(db_err), data)
+            return
+
+        logger.debug(f"Successfully wrote {len(records)} embeddings to database")
+        self._invalidate_query_cache(records)
+        for _ in written:
+            self.report_success()
+
+    @staticmethod
+    def _invalidate_query_cache(records: List[Dict[str, Any]]) -> None:
+        """Drop cached find/search results that may include the written records."""
+        uris_by_account: Dict[Optional[str], List[str]] = {}
+        for record in records:
+            uris_by_account.setdefault(record.get("account_id"), []).append(record.get("uri", ""))
+        cache = get_query_cache()
+        for account_id, uris in uris_by_account.items():
+            cache.invalidate(uris, account_id)
+
+    def _apply_embedding(self, inserted_data: Dict[str, Any], result: EmbedResult) -> Optional[str]:
+        """Copy vectors and the URI-derived record id into inserted_data.
+
+        Returns:
+            An error message if the result cannot be written, otherwise None.
+        """
+        if result.dense_vector:
+            inserted_data["vector"] = result.dense_vector
+            # Validate vector dimension
+            if len(result.dense_vector) != self._vector_dim:
+                return f"Dense vector dimension mismatch: expected {self._vector_dim}, got {len(result.dense_vector)}"
+
+        # Add sparse vector if present
+        if result.sparse_vector:
+            inserted_data["sparse_vector"] = result.sparse_vector
+            logger.debug(f"Generated sparse vector with {len(result.sparse_vector)} terms")
+
+        # Ensure vector DB has at most one record per URI.
+        uri = inserted_data.get("uri")
+        if uri:
+            account_id = inserted_data.get("account_id", "default")
+            id_seed = f"{account_id}:{uri}"
+            inserted_data["id"] = hashlib.md5(id_seed.encode("utf-8")).hexdigest()
+        return None
@@ -4,9 +4,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Hashable, List, Optional, Union
 
 
 @dataclass(frozen=True)
@@ -59,3 +59,27 @@ class RawDSL:
 
 
 FilterExpr = Union[And, Or, Eq, In, Range, Contains, TimeRange, RawDSL]
+
+
+def filter_key(expr: FilterExpr | Dict[str, Any] | None) -> Optional[Hashable]:
+    """Structural, hashable key of a filter expression or raw DSL dict.
+
+    Values are tagged with their type so that e.g. ``1`` and ``True`` get
+    different keys. Returns None if the filter holds unhashable values.
+    """
+    try:
+        key = _freeze(expr)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _freeze(value: Any) -> Hashable:
+    if is_dataclass(value):
+        return (type(value).__name__, tuple(_freeze(getattr(value, f.name)) for f in fields(value)))
+    if isinstance(value, dict):
+        return ("dict", tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return ("list", tuple(_freeze(v) for v in value))
+    return (type(value).__name__, value)
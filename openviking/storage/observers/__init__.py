@@ -1,6 +1,7 @@
 # Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 # SPDX-License-Identifier: Apache-2.0
 from .base_observer import BaseObserver
+from .cache_observer import CacheObserver
 from .queue_observer import QueueObserver
 from .transaction_observer import TransactionObserver
 from .vikingdb_observer import VikingDBObserver
@@ -8,6 +9,7 @@ from .vlm_observer import VLMObserver
 
 __all__ = [
     "BaseObserver",
+    "CacheObserver",
     "QueueObserver",
     "TransactionObserver",
     "VikingDBObserver",
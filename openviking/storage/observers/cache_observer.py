@@ -0,0 +1,138 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+CacheObserver: Cache observability tool.
+
+Provides methods to observe and report hit rates of the query result cache, the
+directory summary cache, the relation index and the embedding cache.
+"""
+
+from typing import Optional
+
+from openviking.models.embedder.cache import EmbeddingCache
+from openviking.storage.observers.base_observer import BaseObserver
+from openviking.storage.query_cache import QueryResultCache
+from openviking.storage.relation_index import RelationIndex
+from openviking.storage.summary_cache import SummaryCache
+from openviking_cli.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CacheObserver(BaseObserver):
+    """
+    CacheObserver: System observability tool for cache monitoring.
+
+    Provides methods to query cache statistics and format output.
+    """
+
+    def __init__(
+        self,
+        query_cache: QueryResultCache,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        summary_cache: Optional[SummaryCache] = None,
+        relation_index: Optional[RelationIndex] = None,
+    ):
+        """
+        Initialize CacheObserver.
+
+        Args:
+            query_cache: Query result cache of find/search
+            embedding_cache: Embedding cache, if enabled
+            summary_cache: Cache of directory abstracts/overviews
+            relation_index: Index of directory relation tables
+        """
+        self._query_cache = query_cache
+        self._embedding_cache = embedding_cache
+        self._summary_cache = summary_cache
+        self._relation_index = relation_index
+
+    def get_status_table(self) -> str:
+        """
+        Format cache statistics as a string table.
+
+        Returns:
+            Formatted table string representation of cache statistics
+        """
+        return self._format_status_as_table()
+
+    def _format_status_as_table(self) -> str:
+        from tabulate import tabulate
+
+        query = self._query_cache.get_stats()
+        data = [
+            {
+                "Cache": "query" if self._query_cache.enabled else "query (disabled)",
+                "Entries": query.entries,
+                "Hits": query.hits,
+                "Misses": query.misses,
+                "Hit Rate": f"{query.hit_rate:.1%}",
+                "Evictions": query.evictions + query.expirations,
+                "Invalidations": query.invalidations,
+            }
+        ]
+        if self._summary_cache is not None:
+            summary = self._summary_cache.get_stats()
+            data.append(
+                {
+                    "Cache": "summary" if self._summary_cache.enabled else "summary (disabled)",
+                    "Entries": summary.entries,
+                    "Hits": summary.hits + summary.coalesced,
+                    "Misses": summary.misses - summary.coalesced,
+                    "Hit Rate": f"{summary.hit_rate:.1%}",
+                    "Evictions": summary.evictions + summary.expirations,
+                    "Invalidations": summary.invalidations,
+                }
+            )
+        if self._relation_index is not None:
+            relations = self._relation_index.get_stats()
+            data.append(
+                {
+                    "Cache": "relations"
+                    if self._relation_index.enabled
+                    else "relations (disabled)",
+                    "Entries": relations.entries,
+                    "Hits": relations.hits,
+                    "Misses": relations.misses,
+                    "Hit Rate": f"{relations.hit_rate:.1%}",
+                    "Evictions": relations.evictions + relations.expirations,
+                    "Invalidations": relations.invalidations,
+                }
+            )
+        if self._embedding_cache is not None:
+            embedding = self._embedding_cache.get_stats()
+            data.append(
+                {
+                    "Cache": "embedding",
+                    "Entries": embedding.memory_entries + embedding.disk_entries,
+                    "Hits": embedding.hits,
+                    "Misses": embedding.misses,
+                    "Hit Rate": f"{embedding.hit_rate:.1%}",
+                    "Evictions": embedding.evictions,
+                    "Invalidations": 0,
+                }
+            )
+        return tabulate(data, headers="keys", tablefmt="pretty")
+
+    def __str__(self) -> str:
+        return self.get_status_table()
+
+    def is_healthy(self) -> bool:
+        """
+        Check if the caches are healthy.
+
+        Caches only affect latency, so they are always considered healthy.
+
+        Returns:
+            True
+        """
+        return True
+
+    def has_errors(self) -> bool:
+        """
+        Check if the caches have any errors.
+
+        Returns:
+            False (caches do not track errors)
+        """
+        return False
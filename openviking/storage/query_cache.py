@@ -0,0 +1,251 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Query result cache for VikingFS.find/search.
+
+Results are keyed by the caller's identity and the normalized query parameters,
+expire after a TTL and are evicted least-recently-used once the cache is full.
+Writes that touch a URI covered by a cached query (embedding upserts, rm, mv,
+relation changes) invalidate the affected entries.
+"""
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from openviking.server.identity import RequestContext
+from openviking_cli.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class QueryCacheStats:
+    """Counters of a QueryResultCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    account_id: str
+    target_uri: str
+
+
+def _covers(target_uri: str, uri: str) -> bool:
+    """Whether a write to ``uri`` can change results of a query scoped to ``target_uri``.
+
+    True when either URI is a path prefix of the other; an empty target covers
+    everything.
+    """
+    if not target_uri:
+        return True
+    target = target_uri.rstrip("/")
+    uri = uri.rstrip("/")
+    return uri == target or uri.startswith(target + "/") or target.startswith(uri + "/")
+
+
+class QueryResultCache:
+    """TTL + LRU cache of find/search results with URI-prefix invalidation."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of cached results, 0 disables the cache
+            ttl_seconds: Lifetime of a cached result, 0 disables the cache
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._stats = QueryCacheStats()
+        # Bumped by every invalidation. A result computed across an invalidation
+        # of its account (or of every account) is not stored; the generation of
+        # the latest such invalidation is kept per account.
+        self._generation = 0
+        self._invalidated_at: Dict[str, int] = {}
+        self._all_invalidated_at = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @staticmethod
+    def make_key(
+        op: str,
+        ctx: RequestContext,
+        query: str,
+        target_uri: str = "",
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+        score_threshold: Optional[float] = None,
+        extra: Optional[Dict] = None,
+    ) -> Tuple:
+        """Build the cache key of a find/search call."""
+        user = ctx.user
+        return (
+            op,
+            ctx.account_id,
+            ctx.role.value,
+            user.user_space_name(),
+            user.agent_space_name(),
+            " ".join(query.split()),
+            target_uri.rstrip("/"),
+            json.dumps(filter, sort_keys=True, default=str) if filter else "",
+            limit,
+            score_threshold,
+            json.dumps(extra, sort_keys=True, default=str) if extra else "",
+        )
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a copy of the cached result, or None on miss or expiry."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            value = entry.value
+        return copy.deepcopy(value)
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        account_id: str,
+        target_uri: str = "",
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store a result.
+
+        Args:
+            key: Key from make_key()
+            value: Result to cache (copied)
+            account_id: Account the result belongs to
+            target_uri: URI the query was scoped to ("" for the whole account)
+            generation: Value of ``generation`` read before the result was
+                computed; the result is dropped if ``account_id`` was
+                invalidated since
+        """
+        if not self.enabled:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            if generation is not None and generation < max(
+                self._invalidated_at.get(account_id, 0), self._all_invalidated_at
+            ):
+                return
+            self._entries[key] = _Entry(
+                value=value,
+                expires_at=self._clock() + self.ttl_seconds,
+                account_id=account_id,
+                target_uri=target_uri.rstrip("/"),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, uris: Iterable[str], account_id: Optional[str] = None) -> int:
+        """Drop cached results whose scope covers any of ``uris``.
+
+        Args:
+            uris: URIs that were written, moved or deleted
+            account_id: Account of the write, None matches every account
+
+        Returns:
+            Number of entries removed
+        """
+        uris = [u for u in uris if u]
+        if not uris:
+            return 0
+        with self._lock:
+            self._generation += 1
+            if account_id is None:
+                self._all_invalidated_at = self._generation
+            else:
+                self._invalidated_at[account_id] = self._generation
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if (account_id is None or entry.account_id == account_id)
+                and any(_covers(entry.target_uri, uri) for uri in uris)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._stats.invalidations += len(stale)
+        return len(stale)
+
+    def get_stats(self) -> QueryCacheStats:
+        with self._lock:
+            stats = copy.copy(self._stats)
+            stats.entries = len(self._entries)
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._all_invalidated_at = self._generation
+            self._entries.clear()
+
+
+# ========== Singleton Pattern ==========
+
+_instance: Optional[QueryResultCache] = None
+_instance_lock = threading.Lock()
+
+
+def init_query_cache(max_entries: int = 1024, ttl_seconds: float = 30.0) -> QueryResultCache:
+    """Initialize the process-wide query result cache."""
+    global _instance
+    with _instance_lock:
+        _instance = QueryResultCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        logger.info(
+            f"[QueryResultCache] Initialized (max_entries={max_entries}, ttl={ttl_seconds}s)"
+        )
+        return _instance
+
+
+def get_query_cache() -> QueryResultCache:
+    """Get the process-wide query result cache (disabled until init_query_cache())."""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = QueryResultCache(max_entries=0)
+    return _instance
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
+from openviking.storage.async_agfs import AsyncAGFSClient
 from openviking_cli.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -88,6 +89,19 @@ class DequeueHandlerBase(abc.ABC):
             return None
         return data
 
+    async def on_dequeue_batch(self, data_list: List[Dict[str, Any]]) -> None:
+        """Called with several dequeued messages at once.
+
+        Every message must be reported exactly once through report_success or
+        report_error. The default implementation handles messages one by one;
+        handlers that can share work across messages override it.
+        """
+        for data in data_list:
+            try:
+                await self.on_dequeue(data)
+            except Exception as e:
+                self.report_error(str(e), data)
+
 
 class NamedQueue:
     """NamedQueue: Operation class for specific named queue, supports status tracking."""
@@ -105,6 +119,7 @@ class NamedQueue:
         self.name = name
         self.path = f"{mount_point}/{name}"
         self._agfs = agfs
+        self._async_agfs = AsyncAGFSClient(agfs)
         self._enqueue_hook = enqueue_hook
         self._dequeue_handler = dequeue_handler
         self._initialized = False
@@ -177,7 +192,7 @@ class NamedQueue:
         """Ensure queue directory is created in AGFS."""
         if not self._initialized:
             try:
-                self._agfs.mkdir(self.path)
+                await self._async_agfs.mkdir(self.path)
             except Exception as e:
                 if "exist" not in str(e).lower():
                     logger.warning(f"[NamedQueue] Failed to ensure queue {self.name}: {e}")
@@ -195,15 +210,15 @@ class NamedQueue:
         if isinstance(data, dict):
             data = json.dumps(data)
 
-        msg_id = self._agfs.write(enqueue_file, data.encode("utf-8"))
+        msg_id = await self._async_agfs.write(enqueue_file, data.encode("utf-8"))
         return msg_id if isinstance(msg_id, str) else str(msg_id)
 
-    def _read_queue_message(self) -> Optional[Dict[str, Any]]:
+    async def _read_queue_message(self) -> Optional[Dict[str, Any]]:
         """Read and remove one message from the AGFS queue; return parsed dict or None.
 
         Normalises the various return types AGFSClient.read() may produce.
         """
-        content = self._agfs.read(f"{self.path}/dequeue")
+        content = await self._async_agfs.read(f"{self.path}/dequeue")
         if not content or content == b"{}":
             return None
         if isinstance(content, bytes):
@@ -220,7 +235,7 @@ class NamedQueue:
         """Get and remove message from queue, then invoke the dequeue handler."""
         await self._ensure_initialized()
         try:
-            data = self._read_queue_message()
+            data = await self._read_queue_message()
             if data is None:
                 return None
             if self._dequeue_handler:
@@ -235,7 +250,7 @@ class NamedQueue:
         """Get and remove message from queue without invoking the handler."""
         await self._ensure_initialized()
         try:
-            return self._read_queue_message()
+            return await self._read_queue_message()
         except Exception as e:
             logger.debug(f"[NamedQueue] Dequeue raw failed for {self.name}: {e}")
             return None
@@ -250,13 +265,22 @@ class NamedQueue:
             return await self._dequeue_handler.on_dequeue(data)
         return data
 
+    async def process_dequeued_batch(self, data_list: List[Dict[str, Any]]) -> None:
+        """Invoke the dequeue handler on a batch of already-fetched raw data.
+
+        NOTE: caller must call _on_dequeue_start() once per message before
+        invoking this method.
+        """
+        if self._dequeue_handler:
+            await self._dequeue_handler.on_dequeue_batch(data_list)
+
     async def peek(self) -> Optional[Dict[str, Any]]:
         """Peek at head message without removing."""
         await self._ensure_initialized()
         peek_file = f"{self.path}/peek"
 
         try:
-            content = self._agfs.read(peek_file)
+            content = await self._async_agfs.read(peek_file)
             if not content or content == b"{}":
                 return None
             if isinstance(content, bytes):
@@ -275,7 +299,7 @@ class NamedQueue:
         size_file = f"{self.path}/size"
 
         try:
-            content = self._agfs.read(size_file)
+            content = await self._async_agfs.read(size_file)
             if not content:
                 return 0
             if isinstance(content, bytes):
@@ -294,7 +318,7 @@ class NamedQueue:
         clear_file = f"{self.path}/clear"
 
         try:
-            self._agfs.write(clear_file, b"")
+            await self._async_agfs.write(clear_file, b"")
             return True
         except Exception as e:
             logger.error(f"[NamedQueue] Clear failed for {self.name}: {e}")
@@ -10,7 +10,7 @@ import atexit
 import threading
 import time
 import traceback
-from typing import Any, Dict, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 from openviking_cli.utils.logger import get_logger
 
@@ -30,6 +30,8 @@ def init_queue_manager(
     mount_point: str = "/queue",
     max_concurrent_embedding: int = 10,
     max_concurrent_semantic: int = 100,
+    embedding_batch_size: int = 1,
+    embedding_batch_wait_ms: int = 50,
 ) -> "QueueManager":
     """Initialize QueueManager singleton.
 
@@ -39,6 +41,8 @@ def init_queue_manager(
         mount_point: Path where QueueFS is mounted.
         max_concurrent_embedding: Max concurrent embedding tasks.
         max_concurrent_semantic: Max concurrent semantic tasks.
+        embedding_batch_size: Max embedding messages handled per batch (1 disables batching).
+        embedding_batch_wait_ms: Max time to wait for a partial embedding batch to fill.
     """
     global _instance
     _instance = QueueManager(
@@ -47,6 +51,8 @@ def init_queue_manager(
         mount_point=mount_point,
         max_concurrent_embedding=max_concurrent_embedding,
         max_concurrent_semantic=max_concurrent_semantic,
+        embedding_batch_size=embedding_batch_size,
+        embedding_batch_wait_ms=embedding_batch_wait_ms,
     )
     return _instance
 
@@ -76,6 +82,8 @@ class QueueManager:
         mount_point: str = "/queue",
         max_concurrent_embedding: int = 10,
         max_concurrent_semantic: int = 100,
+        embedding_batch_size: int = 1,
+        embedding_batch_wait_ms: int = 50,
     ):
         """Initialize QueueManager."""
         self._agfs = agfs
@@ -83,6 +91,8 @@ class QueueManager:
         self.mount_point = mount_point
         self._max_concurrent_embedding = max_concurrent_embedding
         self._max_concurrent_semantic = max_concurrent_semantic
+        self._embedding_batch_size = max(1, embedding_batch_size)
+        self._embedding_batch_wait = max(0, embedding_batch_wait_ms) / 1000.0
         self._queues: Dict[str, NamedQueue] = {}
         self._started = False
         self._queue_threads: Dict[str, threading.Thread] = {}
@@ -166,13 +176,24 @@ class QueueManager:
     ) -> None:
         """Worker loop for a single queue.
 
-        When max_concurrent > 1, items are fetched and processed in parallel
-        (up to max_concurrent at a time). Otherwise items are processed one by one.
+        The embedding queue groups items into batches when batching is enabled.
+        Otherwise, when max_concurrent > 1, items are fetched and processed in
+        parallel (up to max_concurrent at a time), or one by one.
         """
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
-            if max_concurrent > 1:
+            if queue.name == self.EMBEDDING and self._embedding_batch_size > 1:
+                loop.run_until_complete(
+                    self._worker_async_batched(
+                        queue,
+                        stop_event,
+                        max_concurrent,
+                        self._embedding_batch_size,
+                        self._embedding_batch_wait,
+                    )
+                )
+            elif max_concurrent > 1:
                 loop.run_until_complete(
                     self._worker_async_concurrent(queue, stop_event, max_concurrent)
                 )
@@ -245,6 +266,78 @@ class QueueManager:
         if active_tasks:
             await asyncio.gather(*active_tasks, return_exceptions=True)
 
+    async def _worker_async_batched(
+        self,
+        queue: NamedQueue,
+        stop_event: threading.Event,
+        max_concurrent: int,
+        batch_size: int,
+        batch_wait: float,
+    ) -> None:
+        """Batched worker: hands items to the handler in groups of up to batch_size.
+
+        A batch is dispatched once it is full, or batch_wait seconds after its
+        first item was dequeued. A Semaphore caps inflight batches at max_concurrent.
+        """
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(max_concurrent)
+        active_tasks: Set[asyncio.Task] = set()
+        batch: List[Dict[str, Any]] = []
+        deadline = 0.0
+
+        async def process_batch(items: List[Dict[str, Any]]) -> None:
+            async with sem:
+                try:
+                    await queue.process_dequeued_batch(items)
+                except Exception as e:
+                    # Handler did not report the batch; decrement in_progress manually.
+                    for data in items:
+                        queue._on_process_error(str(e), data)
+                    logger.error(f"[QueueManager] Batched worker error for {queue.name}: {e}")
+
+        def dispatch() -> None:
+            nonlocal batch
+            task = asyncio.create_task(process_batch(batch))
+            active_tasks.add(task)
+            logger.debug(
+                f"[QueueManager] Dispatched batch of {len(batch)} for {queue.name} "
+                f"(active={len(active_tasks)})"
+            )
+            batch = []
+
+        while not stop_event.is_set():
+            active_tasks = {t for t in active_tasks if not t.done()}
+
+            # Leave items in the queue while all batch slots are busy
+            if len(active_tasks) < max_concurrent and queue.has_dequeue_handler():
+                try:
+                    queue_size = await queue.size()
+                except Exception:
+                    queue_size = 0
+                for _ in range(min(queue_size, batch_size - len(batch))):
+                    data = await queue.dequeue_raw()
+                    if data is None:
+                        break
+                    queue._on_dequeue_start()
+                    if not batch:
+                        deadline = loop.time() + batch_wait
+                    batch.append(data)
+
+            if batch and (len(batch) >= batch_size or loop.time() >= deadline):
+                dispatch()
+                continue
+
+            wait = self._poll_interval
+            if batch:
+                wait = min(wait, max(0.0, deadline - loop.time()))
+            await asyncio.sleep(wait)
+
+        # Flush the partial batch and drain in-flight tasks on shutdown
+        if batch:
+            dispatch()
+        if active_tasks:
+            await asyncio.gather(*active_tasks, return_exceptions=True)
+
     def stop(self) -> None:
         """Stop QueueManager and release resources."""
         global _instance
@@ -0,0 +1,169 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Input hashes for generated semantic files.
+
+Every directory processed by the semantic queue gets a ``.semantic.json``
+manifest next to its ``.abstract.md``/``.overview.md``. It records, per file,
+the hash of the summary inputs (content digest plus prompt fingerprint) with
+the generated summary, and for the directory itself the hash of the overview
+inputs (file summaries plus children abstracts) with the resulting abstract.
+
+On a rerun a node whose input hash matches its manifest entry reuses the
+recorded result instead of calling the VLM, so only changed files and the
+directories above them are regenerated.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from openviking.server.identity import RequestContext
+from openviking.storage.async_agfs import run_agfs
+from openviking_cli.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_NAME = ".semantic.json"
+MANIFEST_VERSION = 1
+
+# Prompts whose output ends up in a file summary / directory overview.
+FILE_SUMMARY_PROMPTS = (
+    "semantic.code_summary",
+    "semantic.code_ast_summary",
+    "semantic.document_summary",
+    "semantic.file_summary",
+    "parsing.image_summary",
+)
+OVERVIEW_PROMPTS = ("semantic.overview_generation",)
+
+
+@dataclass
+class SemanticManifest:
+    """Recorded inputs and outputs of one directory's semantic generation."""
+
+    files: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    overview_hash: str = ""
+    abstract: str = ""
+
+    def cached_summary(self, name: str, input_hash: Optional[str]) -> Optional[str]:
+        """Return the recorded summary of *name* if its inputs are unchanged."""
+        if not input_hash:
+            return None
+        entry = self.files.get(name)
+        if entry and entry.get("hash") == input_hash:
+            return entry.get("summary", "")
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": MANIFEST_VERSION,
+            "overview_hash": self.overview_hash,
+            "abstract": self.abstract,
+            "files": self.files,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SemanticManifest":
+        if data.get("version") != MANIFEST_VERSION:
+            return cls()
+        return cls(
+            files=dict(data.get("files") or {}),
+            overview_hash=data.get("overview_hash", ""),
+            abstract=data.get("abstract", ""),
+        )
+
+
+async def load_manifest(viking_fs: Any, dir_uri: str, ctx: RequestContext) -> SemanticManifest:
+    """Read a directory's manifest; a missing or unreadable one is empty."""
+    try:
+        content = await viking_fs.read_file(f"{dir_uri}/{MANIFEST_NAME}", ctx=ctx)
+        return SemanticManifest.from_dict(json.loads(content))
+    except Exception:
+        return SemanticManifest()
+
+
+async def save_manifest(
+    viking_fs: Any, dir_uri: str, manifest: SemanticManifest, ctx: RequestContext
+) -> None:
+    try:
+        await viking_fs.write_file(
+            f"{dir_uri}/{MANIFEST_NAME}",
+            json.dumps(manifest.to_dict(), ensure_ascii=False),
+            ctx=ctx,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to write semantic manifest for {dir_uri}: {e}")
+
+
+def prompt_fingerprint(prompt_ids: tuple, *extra: Any) -> str:
+    """Fingerprint prompt template versions plus any other generation settings."""
+    from openviking.prompts import get_manager
+
+    manager = get_manager()
+    parts = []
+    for prompt_id in prompt_ids:
+        try:
+            parts.append(f"{prompt_id}@{manager.load_template(prompt_id).metadata.version}")
+        except Exception:
+            parts.append(f"{prompt_id}@?")
+    parts.extend(str(item) for item in extra)
+    return _sha256("\n".join(parts))
+
+
+def summary_fingerprint() -> str:
+    """Fingerprint of everything besides file content that shapes a file summary."""
+    from openviking_cli.utils.config import get_openviking_config
+
+    config = get_openviking_config()
+    return prompt_fingerprint(FILE_SUMMARY_PROMPTS, config.vlm.model, config.code.code_summary_mode)
+
+
+def overview_fingerprint() -> str:
+    """Fingerprint of everything besides the children that shapes an overview."""
+    from openviking_cli.utils.config import get_openviking_config
+
+    return prompt_fingerprint(OVERVIEW_PROMPTS, get_openviking_config().vlm.model)
+
+
+async def file_input_hash(
+    viking_fs: Any, file_uri: str, fingerprint: str, ctx: RequestContext
+) -> Optional[str]:
+    """Hash of a file summary's inputs, or None if the content cannot be read.
+
+    Uses the AGFS server-side digest so file content is not transferred; falls
+    back to hashing the bytes when the backend has no digest support.
+    """
+    try:
+        path = viking_fs._uri_to_path(file_uri, ctx=ctx)
+        result = await run_agfs(viking_fs.agfs.digest, path)
+        digest = result.get("digest") if isinstance(result, dict) else None
+        if digest:
+            return _sha256(f"{fingerprint}\n{digest}")
+    except Exception:
+        pass
+    try:
+        content = await viking_fs.read_file_bytes(file_uri, ctx=ctx)
+    except Exception:
+        return None
+    return _sha256(f"{fingerprint}\n{hashlib.sha256(content).hexdigest()}")
+
+
+def overview_input_hash(
+    fingerprint: str,
+    dir_name: str,
+    file_summaries: List[Dict[str, str]],
+    children_abstracts: List[Dict[str, str]],
+) -> str:
+    """Hash of a directory overview's inputs."""
+    payload = json.dumps(
+        [fingerprint, dir_name, file_summaries, children_abstracts],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return _sha256(payload)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
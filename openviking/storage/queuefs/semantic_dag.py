@@ -7,6 +7,15 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 from openviking.server.identity import RequestContext
+from openviking.storage.queuefs.semantic_cache import (
+    SemanticManifest,
+    file_input_hash,
+    load_manifest,
+    overview_fingerprint,
+    overview_input_hash,
+    save_manifest,
+    summary_fingerprint,
+)
 from openviking.storage.viking_fs import get_viking_fs
 from openviking_cli.utils import VikingURI
 from openviking_cli.utils.logger import get_logger
@@ -26,6 +35,8 @@ class DirNode:
     file_summaries: List[Optional[Dict[str, str]]]
     children_abstracts: List[Optional[Dict[str, str]]]
     pending: int
+    manifest: SemanticManifest = field(default_factory=SemanticManifest)
+    file_hashes: Dict[str, str] = field(default_factory=dict)
     dispatched: bool = False
     overview_scheduled: bool = False
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
@@ -37,6 +48,7 @@ class DagStats:
     pending_nodes: int = 0
     in_progress_nodes: int = 0
     done_nodes: int = 0
+    reused_nodes: int = 0
 
 
 class SemanticDagExecutor:
@@ -60,11 +72,23 @@ class SemanticDagExecutor:
         self._root_uri: Optional[str] = None
         self._root_done: Optional[asyncio.Event] = None
         self._stats = DagStats()
+        self._summary_fingerprint = ""
+        self._overview_fingerprint = ""
 
     async def run(self, root_uri: str) -> None:
-        """Run DAG execution starting from root_uri."""
+        """Run DAG execution starting from root_uri.
+
+        Files and directories whose inputs match their recorded hashes in
+        ``.semantic.json`` reuse the previous result, so only dirty nodes and
+        their ancestors call the VLM.
+        """
         self._root_uri = root_uri
         self._root_done = asyncio.Event()
+        try:
+            self._summary_fingerprint = summary_fingerprint()
+            self._overview_fingerprint = overview_fingerprint()
+        except Exception as e:
+            logger.warning(f"Failed to fingerprint semantic prompts, cache disabled: {e}")
         await self._dispatch_dir(root_uri, parent_uri=None)
         await self._root_done.wait()
 
@@ -76,7 +100,9 @@ class SemanticDagExecutor:
         self._parent[dir_uri] = parent_uri
 
         try:
-            children_dirs, file_paths = await self._list_dir(dir_uri)
+            (children_dirs, file_paths), manifest = await asyncio.gather(
+                self._list_dir(dir_uri), self._load_manifest(dir_uri)
+            )
             file_index = {path: idx for idx, path in enumerate(file_paths)}
             child_index = {path: idx for idx, path in enumerate(children_dirs)}
             pending = len(children_dirs) + len(file_paths)
@@ -91,6 +117,7 @@ class SemanticDagExecutor:
                 children_abstracts=[None] * len(children_dirs),
                 pending=pending,
                 dispatched=True,
+                manifest=manifest,
             )
             self._nodes[dir_uri] = node
             self._stats.total_nodes += 1
@@ -141,21 +168,43 @@ class SemanticDagExecutor:
 
         return children_dirs, file_paths
 
+    async def _load_manifest(self, dir_uri: str) -> SemanticManifest:
+        if not self._summary_fingerprint:
+            return SemanticManifest()
+        return await load_manifest(self._viking_fs, dir_uri, self._ctx)
+
     async def _file_summary_task(self, parent_uri: str, file_path: str) -> None:
-        """Generate file summary and notify parent completion."""
+        """Generate file summary (or reuse an unchanged one) and notify parent completion."""
         file_name = file_path.split("/")[-1]
+        input_hash: Optional[str] = None
         try:
-            summary_dict = await self._processor._generate_single_file_summary(
-                file_path, llm_sem=self._llm_sem, ctx=self._ctx
-            )
+            if self._summary_fingerprint:
+                input_hash = await file_input_hash(
+                    self._viking_fs, file_path, self._summary_fingerprint, self._ctx
+                )
+            node = self._nodes.get(parent_uri)
+            cached = node.manifest.cached_summary(file_name, input_hash) if node else None
+            if cached is not None:
+                self._stats.reused_nodes += 1
+                summary_dict = {"name": file_name, "summary": cached}
+            else:
+                summary_dict = await self._processor._generate_single_file_summary(
+                    file_path, llm_sem=self._llm_sem, ctx=self._ctx
+                )
         except Exception as e:
             logger.warning(f"Failed to generate summary for {file_path}: {e}")
             summary_dict = {"name": file_name, "summary": ""}
+            cached = None
+            input_hash = None
         finally:
             self._stats.done_nodes += 1
             self._stats.in_progress_nodes = max(0, self._stats.in_progress_nodes - 1)
 
-        await self._on_file_done(parent_uri, file_path, summary_dict)
+        await self._on_file_done(parent_uri, file_path, summary_dict, input_hash)
+
+        if cached is not None:
+            # Unchanged content: summary and vector record are already up to date.
+            return
 
         # Vectorize file as soon as summary is ready to avoid waiting for overview.
         try:
@@ -172,7 +221,11 @@ class SemanticDagExecutor:
             logger.error(f"Failed to schedule vectorization for {file_path}: {e}", exc_info=True)
 
     async def _on_file_done(
-        self, parent_uri: str, file_path: str, summary_dict: Dict[str, str]
+        self,
+        parent_uri: str,
+        file_path: str,
+        summary_dict: Dict[str, str],
+        input_hash: Optional[str] = None,
     ) -> None:
         node = self._nodes.get(parent_uri)
         if not node:
@@ -182,6 +235,8 @@ class SemanticDagExecutor:
             idx = node.file_index.get(file_path)
             if idx is not None:
                 node.file_summaries[idx] = summary_dict
+                if input_hash:
+                    node.file_hashes[file_path] = input_hash
             node.pending -= 1
             if node.pending == 0 and not node.overview_scheduled:
                 node.overview_scheduled = True
@@ -246,6 +301,26 @@ class SemanticDagExecutor:
             file_summaries = self._finalize_file_summaries(node)
             children_abstracts = self._finalize_children_abstracts(node)
 
+        manifest = self._build_manifest(node, file_summaries)
+        input_hash = ""
+        if self._overview_fingerprint:
+            input_hash = overview_input_hash(
+                self._overview_fingerprint,
+                dir_uri.split("/")[-1],
+                file_summaries,
+                children_abstracts,
+            )
+
+        if input_hash and input_hash == node.manifest.overview_hash:
+            # Nothing below this directory changed; keep the existing overview.
+            self._stats.reused_nodes += 1
+            manifest.overview_hash = input_hash
+            manifest.abstract = node.manifest.abstract
+            if manifest != node.manifest:
+                await save_manifest(self._viking_fs, dir_uri, manifest, self._ctx)
+            await self._finish_dir(dir_uri, manifest.abstract)
+            return
+
         try:
             async with self._llm_sem:
                 overview = await self._processor._generate_overview(
@@ -266,12 +341,35 @@ class SemanticDagExecutor:
             except Exception as e:
                 logger.error(f"Failed to vectorize directory {dir_uri}: {e}", exc_info=True)
 
+            if input_hash and overview != self._processor._default_overview(dir_uri):
+                manifest.overview_hash = input_hash
+                manifest.abstract = abstract
+            await save_manifest(self._viking_fs, dir_uri, manifest, self._ctx)
+
         except Exception as e:
             logger.error(f"Failed to generate overview for {dir_uri}: {e}", exc_info=True)
             abstract = ""
-        finally:
-            self._stats.done_nodes += 1
-            self._stats.in_progress_nodes = max(0, self._stats.in_progress_nodes - 1)
+
+        await self._finish_dir(dir_uri, abstract)
+
+    def _build_manifest(
+        self, node: DirNode, file_summaries: List[Dict[str, str]]
+    ) -> SemanticManifest:
+        """Manifest entries for the files of *node* whose inputs could be hashed."""
+        manifest = SemanticManifest()
+        for file_path, summary in zip(node.file_paths, file_summaries):
+            input_hash = node.file_hashes.get(file_path)
+            # Empty summaries come from an unavailable VLM or unreadable content; retry them.
+            if input_hash and summary["summary"]:
+                manifest.files[summary["name"]] = {
+                    "hash": input_hash,
+                    "summary": summary["summary"],
+                }
+        return manifest
+
+    async def _finish_dir(self, dir_uri: str, abstract: str) -> None:
+        self._stats.done_nodes += 1
+        self._stats.in_progress_nodes = max(0, self._stats.in_progress_nodes - 1)
 
         parent_uri = self._parent.get(dir_uri)
         if parent_uri is None:
@@ -287,6 +385,7 @@ class SemanticDagExecutor:
             pending_nodes=self._stats.pending_nodes,
             in_progress_nodes=self._stats.in_progress_nodes,
             done_nodes=self._stats.done_nodes,
+            reused_nodes=self._stats.reused_nodes,
         )
 
 
@@ -22,6 +22,15 @@ from openviking.parse.parsers.media.utils import (
 from openviking.prompts import render_prompt
 from openviking.server.identity import RequestContext, Role
 from openviking.storage.queuefs.named_queue import DequeueHandlerBase
+from openviking.storage.queuefs.semantic_cache import (
+    SemanticManifest,
+    file_input_hash,
+    load_manifest,
+    overview_fingerprint,
+    overview_input_hash,
+    save_manifest,
+    summary_fingerprint,
+)
 from openviking.storage.queuefs.semantic_dag import DagStats, SemanticDagExecutor
 from openviking.storage.queuefs.semantic_msg import SemanticMsg
 from openviking.storage.viking_fs import get_viking_fs
@@ -233,17 +242,47 @@ class SemanticProcessor(DequeueHandlerBase):
         children_uris: List[str],
         file_paths: List[str],
     ) -> None:
-        """Process single directory, generate .abstract.md and .overview.md."""
+        """Process single directory, generate .abstract.md and .overview.md.
+
+        Files and the overview whose inputs match the directory's
+        ``.semantic.json`` manifest are reused instead of regenerated.
+        """
         viking_fs = get_viking_fs()
+        try:
+            summary_fp, overview_fp = summary_fingerprint(), overview_fingerprint()
+            manifest = await load_manifest(viking_fs, uri, self._current_ctx)
+        except Exception as e:
+            logger.warning(f"Failed to fingerprint semantic prompts, cache disabled: {e}")
+            summary_fp, overview_fp, manifest = "", "", SemanticManifest()
+        new_manifest = SemanticManifest()
 
         # 1. Collect .abstract.md from subdirectories (already processed earlier)
         children_abstracts = await self._collect_children_abstracts(children_uris)
 
         # 2. Concurrently generate summaries for files in directory
         file_summaries = await self._generate_file_summaries(
-            file_paths, context_type=context_type, parent_uri=uri, enqueue_files=True
+            file_paths,
+            context_type=context_type,
+            parent_uri=uri,
+            enqueue_files=True,
+            fingerprint=summary_fp,
+            manifest=manifest,
+            new_manifest=new_manifest,
         )
 
+        input_hash = ""
+        if overview_fp:
+            input_hash = overview_input_hash(
+                overview_fp, uri.split("/")[-1], file_summaries, children_abstracts
+            )
+        if input_hash and input_hash == manifest.overview_hash:
+            new_manifest.overview_hash = input_hash
+            new_manifest.abstract = manifest.abstract
+            if new_manifest != manifest:
+                await save_manifest(viking_fs, uri, new_manifest, self._current_ctx)
+            logger.debug(f"Overview inputs unchanged, keeping overview and abstract for {uri}")
+            return
+
         # 3. Generate .overview.md (contains brief description)
         overview = await self._generate_overview(uri, file_summaries, children_abstracts)
 
@@ -262,6 +301,12 @@ class SemanticProcessor(DequeueHandlerBase):
         except Exception as e:
             logger.error(f"Failed to vectorize directory {uri}: {e}", exc_info=True)
 
+        # 7. Record inputs so an unchanged directory is skipped next time
+        if input_hash and overview != self._default_overview(uri):
+            new_manifest.overview_hash = input_hash
+            new_manifest.abstract = abstract
+        await save_manifest(viking_fs, uri, new_manifest, self._current_ctx)
+
     async def _collect_children_abstracts(self, children_uris: List[str]) -> List[Dict[str, str]]:
         """Collect .abstract.md from subdirectories."""
         viking_fs = get_viking_fs()
@@ -279,14 +324,38 @@ class SemanticProcessor(DequeueHandlerBase):
         context_type: Optional[str] = None,
         parent_uri: Optional[str] = None,
         enqueue_files: bool = False,
+        fingerprint: str = "",
+        manifest: Optional[SemanticManifest] = None,
+        new_manifest: Optional[SemanticManifest] = None,
     ) -> List[Dict[str, str]]:
-        """Concurrently generate file summaries."""
+        """Concurrently generate file summaries.
+
+        With a fingerprint, a file whose input hash matches its entry in
+        *manifest* keeps the recorded summary and is not re-vectorized. The
+        hashes of all summaries are recorded into *new_manifest*.
+        """
         if not file_paths:
             return []
+        viking_fs = get_viking_fs()
 
         async def generate_one_summary(file_path: str) -> Dict[str, str]:
-            summary = await self._generate_single_file_summary(file_path, ctx=self._current_ctx)
-            if enqueue_files and context_type and parent_uri:
+            file_name = file_path.split("/")[-1]
+            input_hash = None
+            if fingerprint:
+                input_hash = await file_input_hash(
+                    viking_fs, file_path, fingerprint, self._current_ctx
+                )
+            cached = manifest.cached_summary(file_name, input_hash) if manifest else None
+            if cached is not None:
+                summary = {"name": file_name, "summary": cached}
+            else:
+                summary = await self._generate_single_file_summary(file_path, ctx=self._current_ctx)
+            if new_manifest is not None and input_hash and summary.get("summary"):
+                new_manifest.files[file_name] = {
+                    "hash": input_hash,
+                    "summary": summary["summary"],
+                }
+            if cached is None and enqueue_files and context_type and parent_uri:
                 try:
                     await self._vectorize_single_file(
                         parent_uri=parent_uri,
@@ -461,7 +530,7 @@ class SemanticProcessor(DequeueHandlerBase):
 
         if not vlm.is_available():
             logger.warning("VLM not available, using default overview")
-            return f"# {dir_uri.split('/')[-1]}\n\nDirectory overview"
+            return self._default_overview(dir_uri)
 
         # Build file index mapping and summary string
         file_index_map = {}
@@ -502,7 +571,12 @@ class SemanticProcessor(DequeueHandlerBase):
 
         except Exception as e:
             logger.error(f"Failed to generate overview for {dir_uri}: {e}", exc_info=True)
-            return f"# {dir_uri.split('/')[-1]}\n\nDirectory overview"
+            return self._default_overview(dir_uri)
+
+    @staticmethod
+    def _default_overview(dir_uri: str) -> str:
+        """Placeholder overview used when the VLM cannot produce one."""
+        return f"# {dir_uri.split('/')[-1]}\n\nDirectory overview"
 
     async def _vectorize_directory_simple(
         self,
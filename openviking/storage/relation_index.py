@@ -0,0 +1,227 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Relation index for VikingFS.
+
+Relations are stored per directory in ``.relations.json``, which stays the
+source of truth. RelationIndex keeps the parsed tables in memory keyed by AGFS
+directory path, so that retrieval can resolve the relations of a whole result
+page with one batched lookup. It holds forward lookups only: a cache of some
+tables cannot answer which directories link to a URI. Tables written through VikingFS
+are updated in place (write-through); rm/mv of a tree and direct writes of a
+``.relations.json`` file invalidate the affected entries, and a TTL bounds
+staleness against writers in other processes.
+"""
+
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from openviking_cli.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from openviking.storage.viking_fs import RelationEntry
+
+logger = get_logger(__name__)
+
+RELATIONS_FILE = ".relations.json"
+
+
+@dataclass
+class RelationIndexStats:
+    """Counters of a RelationIndex."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    entries: List["RelationEntry"]
+    expires_at: float
+
+
+class RelationIndex:
+    """TTL + LRU index of relation tables keyed by directory path."""
+
+    def __init__(
+        self,
+        max_entries: int = 16384,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of indexed directories, 0 disables the index
+            ttl_seconds: Lifetime of an indexed table, 0 disables the index
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # dir path -> relation table (an empty table records "no relations")
+        self._tables: "OrderedDict[str, _Entry]" = OrderedDict()
+        # dir path -> token of the load in progress; invalidation drops it so
+        # that a load racing with a write is not indexed.
+        self._loading: Dict[str, object] = {}
+        self._stats = RelationIndexStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    async def get_many(
+        self,
+        dir_paths: Sequence[str],
+        loader: Callable[[str], Awaitable[Optional[List["RelationEntry"]]]],
+    ) -> Dict[str, List["RelationEntry"]]:
+        """Return the relation tables of ``dir_paths``, loading misses concurrently.
+
+        Args:
+            dir_paths: AGFS paths of the directories
+            loader: Reads the relation table of one directory from AGFS, or
+                returns None when it could not be read; such a table is
+                returned as empty but not indexed
+
+        Returns:
+            {dir_path: [RelationEntry, ...]} for every requested path
+        """
+        paths = list(dict.fromkeys(p.rstrip("/") for p in dir_paths))
+        if not self.enabled:
+            tables = await asyncio.gather(*(loader(p) for p in paths))
+            return {path: table or [] for path, table in zip(paths, tables)}
+
+        result: Dict[str, List["RelationEntry"]] = {}
+        missing: Dict[str, object] = {}
+        now = self._clock()
+        with self._lock:
+            for path in paths:
+                entry = self._tables.get(path)
+                if entry is not None:
+                    if entry.expires_at > now:
+                        self._tables.move_to_end(path)
+                        self._stats.hits += 1
+                        result[path] = list(entry.entries)
+                        continue
+                    self._remove_locked(path)
+                    self._stats.expirations += 1
+                self._stats.misses += 1
+                token = object()
+                self._loading[path] = token
+                missing[path] = token
+
+        if missing:
+            tables = await asyncio.gather(*(loader(p) for p in missing))
+            with self._lock:
+                for (path, token), table in zip(missing.items(), tables):
+                    result[path] = list(table or [])
+                    # An invalidation or write during the load dropped the token.
+                    if self._loading.get(path) is token:
+                        del self._loading[path]
+                        if table is not None:
+                            self._put_locked(path, table)
+        return result
+
+    def set(self, dir_path: str, entries: List["RelationEntry"]) -> None:
+        """Index the table just written to ``dir_path`` (write-through)."""
+        path = dir_path.rstrip("/")
+        with self._lock:
+            self._loading.pop(path, None)
+            if self.enabled:
+                self._put_locked(path, list(entries))
+            else:
+                self._remove_locked(path)
+
+    def invalidate(self, path: str, recursive: bool = False) -> int:
+        """Drop tables affected by a write to ``path``.
+
+        Args:
+            path: AGFS path that was written, moved or deleted. Writing a
+                ``.relations.json`` file drops the table of its directory.
+            recursive: Also drop tables of ``path`` and every directory below
+                it (rm/mv of a tree)
+
+        Returns:
+            Number of indexed tables removed
+        """
+        path = path.rstrip("/")
+        parent, _, name = path.rpartition("/")
+        if name != RELATIONS_FILE and not recursive:
+            return 0
+        with self._lock:
+            paths = set()
+            if name == RELATIONS_FILE:
+                paths.add(parent)
+            if recursive:
+                prefix = path + "/"
+                paths.update(
+                    p for p in (*self._tables, *self._loading) if p == path or p.startswith(prefix)
+                )
+            removed = 0
+            for p in paths:
+                self._loading.pop(p, None)
+                if self._remove_locked(p):
+                    removed += 1
+            self._stats.invalidations += removed
+        return removed
+
+    def _put_locked(self, path: str, entries: List["RelationEntry"]) -> None:
+        self._remove_locked(path)
+        self._tables[path] = _Entry(entries, self._clock() + self.ttl_seconds)
+        while len(self._tables) > self.max_entries:
+            oldest = next(iter(self._tables))
+            self._remove_locked(oldest)
+            self._stats.evictions += 1
+
+    def _remove_locked(self, path: str) -> bool:
+        return self._tables.pop(path, None) is not None
+
+    def get_stats(self) -> RelationIndexStats:
+        with self._lock:
+            stats = copy.copy(self._stats)
+            stats.entries = len(self._tables)
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+            self._loading.clear()
+
+
+# ========== Singleton Pattern ==========
+
+_instance: Optional[RelationIndex] = None
+_instance_lock = threading.Lock()
+
+
+def init_relation_index(max_entries: int = 16384, ttl_seconds: float = 60.0) -> RelationIndex:
+    """Initialize the process-wide relation index."""
+    global _instance
+    with _instance_lock:
+        _instance = RelationIndex(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        logger.info(f"[RelationIndex] Initialized (max_entries={max_entries}, ttl={ttl_seconds}s)")
+        return _instance
+
+
+def get_relation_index() -> RelationIndex:
+    """Get the process-wide relation index (disabled until init_relation_index())."""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = RelationIndex(max_entries=0)
+    return _instance
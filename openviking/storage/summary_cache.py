@@ -0,0 +1,221 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Directory summary cache for VikingFS.abstract/overview.
+
+``ls``/``tree`` in agent mode, ``read_batch`` and retrieval all read the same
+``.abstract.md``/``.overview.md`` files, each read costing a ``stat`` plus a
+``read`` against AGFS. Summaries are cached per AGFS directory path for a short
+TTL, and concurrent misses of the same summary share one in-flight load
+(single-flight). Writes of a summary file, and rm/mv of a tree, invalidate the
+affected entries.
+"""
+
+import asyncio
+import concurrent.futures
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from openviking_cli.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ABSTRACT = "abstract"
+OVERVIEW = "overview"
+
+_SUMMARY_FILES = {".abstract.md": ABSTRACT, ".overview.md": OVERVIEW}
+
+_Key = Tuple[str, str]
+
+
+@dataclass
+class SummaryCacheStats:
+    """Counters of a SummaryCache."""
+
+    hits: int = 0
+    misses: int = 0
+    # Misses that joined a load already in flight instead of reading AGFS.
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    value: str
+    expires_at: float
+
+
+class SummaryCache:
+    """TTL + LRU cache of directory summaries with single-flight loads."""
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of cached summaries, 0 disables the cache
+            ttl_seconds: Lifetime of a cached summary, 0 disables the cache
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_Key, _Entry]" = OrderedDict()
+        # Loads in progress. A concurrent.futures.Future so that callers on other
+        # event loops (e.g. the semantic queue thread) can join it as well.
+        self._in_flight: Dict[_Key, concurrent.futures.Future] = {}
+        self._stats = SummaryCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    async def get_or_load(
+        self, dir_path: str, kind: str, loader: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Return the cached summary, or load it once for all concurrent callers.
+
+        Args:
+            dir_path: AGFS path of the directory
+            kind: ABSTRACT or OVERVIEW
+            loader: Reads the summary from AGFS; its exceptions reach every
+                caller sharing the load and are not cached
+
+        Returns:
+            Summary text
+        """
+        if not self.enabled:
+            return await loader()
+
+        key = (dir_path.rstrip("/"), kind)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return entry.value
+                del self._entries[key]
+                self._stats.expirations += 1
+            self._stats.misses += 1
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = concurrent.futures.Future()
+                self._in_flight[key] = flight
+            else:
+                self._stats.coalesced += 1
+
+        if leader:
+            # The load outlives a cancelled leader so that followers still get it.
+            task = asyncio.ensure_future(loader())
+            task.add_done_callback(lambda t: self._finish(key, flight, t))
+            return await asyncio.shield(task)
+        return await asyncio.wrap_future(flight)
+
+    def _finish(self, key: _Key, flight: concurrent.futures.Future, task: asyncio.Task) -> None:
+        with self._lock:
+            # An invalidation during the load removed the flight: do not cache.
+            current = self._in_flight.get(key) is flight
+            if current:
+                del self._in_flight[key]
+            if current and not task.cancelled() and task.exception() is None:
+                self._entries[key] = _Entry(task.result(), self._clock() + self.ttl_seconds)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._stats.evictions += 1
+        if task.cancelled():
+            flight.cancel()
+        elif task.exception() is not None:
+            flight.set_exception(task.exception())
+        else:
+            flight.set_result(task.result())
+
+    def invalidate(self, path: str, recursive: bool = False) -> int:
+        """Drop summaries affected by a write to ``path``.
+
+        Args:
+            path: AGFS path that was written, moved or deleted. Writing a
+                ``.abstract.md``/``.overview.md`` file drops that summary.
+            recursive: Also drop summaries of ``path`` and every directory below
+                it (rm/mv of a tree)
+
+        Returns:
+            Number of cached entries removed
+        """
+        path = path.rstrip("/")
+        parent, _, name = path.rpartition("/")
+        kind = _SUMMARY_FILES.get(name)
+        if kind is None and not recursive:
+            return 0
+        with self._lock:
+            keys = set()
+            if kind is not None:
+                keys.add((parent, kind))
+            if recursive:
+                prefix = path + "/"
+                keys.update(
+                    key
+                    for key in (*self._entries, *self._in_flight)
+                    if key[0] == path or key[0].startswith(prefix)
+                )
+            removed = 0
+            for key in keys:
+                self._in_flight.pop(key, None)
+                if self._entries.pop(key, None) is not None:
+                    removed += 1
+            self._stats.invalidations += removed
+        return removed
+
+    def get_stats(self) -> SummaryCacheStats:
+        with self._lock:
+            stats = copy.copy(self._stats)
+            stats.entries = len(self._entries)
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._in_flight.clear()
+
+
+# ========== Singleton Pattern ==========
+
+_instance: Optional[SummaryCache] = None
+_instance_lock = threading.Lock()
+
+
+def init_summary_cache(max_entries: int = 4096, ttl_seconds: float = 5.0) -> SummaryCache:
+    """Initialize the process-wide directory summary cache."""
+    global _instance
+    with _instance_lock:
+        _instance = SummaryCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        logger.info(f"[SummaryCache] Initialized (max_entries={max_entries}, ttl={ttl_seconds}s)")
+        return _instance
+
+
+def get_summary_cache() -> SummaryCache:
+    """Get the process-wide summary cache (disabled until init_summary_cache())."""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = SummaryCache(max_entries=0)
+    return _instance
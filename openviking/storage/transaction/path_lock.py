@@ -12,6 +12,7 @@ from typing import List, Optional
 
 from pyagfs import AGFSClient
 
+from openviking.storage.async_agfs import AsyncAGFSClient
 from openviking.storage.transaction.transaction_record import TransactionRecord
 from openviking_cli.utils.logger import get_logger
 
@@ -35,6 +36,7 @@ class PathLock:
             agfs_client: AGFS client for file system operations
         """
         self._agfs = agfs_client
+        self._async_agfs = AsyncAGFSClient(agfs_client)
 
     def _get_lock_path(self, path: str) -> str:
         """Get lock file path for a directory.
@@ -75,7 +77,7 @@ class PathLock:
             True if locked by another transaction, False otherwise
         """
         try:
-            content = self._agfs.cat(lock_path)
+            content = await self._async_agfs.cat(lock_path)
             if isinstance(content, bytes):
                 lock_owner = content.decode("utf-8").strip()
             else:
@@ -92,7 +94,7 @@ class PathLock:
             lock_path: Lock file path
             transaction_id: Transaction ID to write to lock file
         """
-        self._agfs.write(lock_path, transaction_id.encode("utf-8"))
+        await self._async_agfs.write(lock_path, transaction_id.encode("utf-8"))
 
     async def _verify_lock_ownership(self, lock_path: str, transaction_id: str) -> bool:
         """Verify lock file is owned by current transaction.
@@ -105,7 +107,7 @@ class PathLock:
             True if lock is owned by current transaction, False otherwise
         """
         try:
-            content = self._agfs.cat(lock_path)
+            content = await self._async_agfs.cat(lock_path)
             if isinstance(content, bytes):
                 lock_owner = content.decode("utf-8").strip()
             else:
@@ -121,7 +123,7 @@ class PathLock:
             lock_path: Lock file path
         """
         try:
-            self._agfs.rm(lock_path)
+            await self._async_agfs.rm(lock_path)
         except Exception:
             # Lock file might not exist, ignore
             pass
@@ -151,7 +153,7 @@ class PathLock:
 
         # Step 1: Check if target directory exists
         try:
-            self._agfs.stat(path)
+            await self._async_agfs.stat(path)
         except Exception:
             logger.warning(f"Directory does not exist: {path}")
             return False
@@ -204,7 +206,7 @@ class PathLock:
         """
         subdirs = []
         try:
-            entries = self._agfs.ls(path)
+            entries = await self._async_agfs.ls(path)
             if isinstance(entries, list):
                 for entry in entries:
                     if isinstance(entry, dict) and entry.get("isDir"):
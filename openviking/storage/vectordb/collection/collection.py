@@ -52,6 +52,17 @@ class ICollection(ABC):
     ) -> SearchResult:
         raise NotImplementedError
 
+    def search_by_vector_batch(
+        self,
+        index_name: str,
+        queries: List[Dict[str, Any]],
+        output_fields: Optional[List[str]] = None,
+    ) -> List[SearchResult]:
+        return [
+            self.search_by_vector(index_name, output_fields=output_fields, **query)
+            for query in queries
+        ]
+
     @abstractmethod
     def search_by_keywords(
         self,
@@ -148,6 +159,12 @@ class ICollection(ABC):
     def delete_data(self, primary_keys: List[Any]):
         raise NotImplementedError
 
+    def delete_by_filter(self, index_name: str, filters: Dict[str, Any]) -> int:
+        raise NotImplementedError
+
+    def update_scalar_fields(self, updates: Dict[Any, Dict[str, Any]]) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     def delete_all_data(self):
         raise NotImplementedError
@@ -328,6 +345,31 @@ class Collection:
             index_name, dense_vector, limit, offset, filters, sparse_vector, output_fields
         )
 
+    def search_by_vector_batch(
+        self,
+        index_name: str,
+        queries: List[Dict[str, Any]],
+        output_fields: Optional[List[str]] = None,
+    ) -> List[SearchResult]:
+        """Perform several vector similarity searches on the specified index.
+
+        Local collections score all queries in one pass over the index data;
+        other backends run them one by one.
+
+        Args:
+            index_name (str): Name of the index to search against.
+            queries (List[Dict[str, Any]]): One dict per query with the keyword arguments
+                of search_by_vector() (dense_vector, limit, offset, filters, sparse_vector).
+            output_fields (Optional[List[str]]): List of field names to include in results.
+                If None, returns all fields. Defaults to None.
+
+        Returns:
+            List[SearchResult]: One result per query, in input order.
+        """
+        if self.__collection is None:
+            raise RuntimeError("Collection is closed")
+        return self.__collection.search_by_vector_batch(index_name, queries, output_fields)
+
     def search_by_keywords(
         self,
         index_name: str,
@@ -594,6 +636,38 @@ class Collection:
             raise RuntimeError("Collection is closed")
         return self.__collection.delete_data(primary_keys)
 
+    def delete_by_filter(self, index_name: str, filters: Dict[str, Any]) -> int:
+        """
+        Delete every data document matching a scalar filter in one batch.
+
+        Matching records are resolved through the index's scalar filter without
+        vector scoring or a result limit.
+
+        Args:
+            index_name (str): Name of the index used to evaluate the filter.
+            filters (Dict[str, Any]): Filter DSL, same format as in search methods.
+
+        Returns:
+            int: Number of deleted documents.
+        """
+        if self.__collection is None:
+            raise RuntimeError("Collection is closed")
+        return self.__collection.delete_by_filter(index_name, filters)
+
+    def update_scalar_fields(self, updates: Dict[Any, Dict[str, Any]]) -> int:
+        """
+        Set scalar fields of existing documents without re-writing their vectors.
+
+        Args:
+            updates (Dict[Any, Dict[str, Any]]): Primary key -> {field name: new value}.
+
+        Returns:
+            int: Number of updated documents.
+        """
+        if self.__collection is None:
+            raise RuntimeError("Collection is closed")
+        return self.__collection.update_scalar_fields(updates)
+
     def delete_all_data(self):
         """
         Delete all data documents from the collection.
@@ -5,9 +5,9 @@ import json
 import os
 import random
 import shutil
+import threading
 import time
-from itertools import zip_longest
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
@@ -25,7 +25,7 @@ from openviking.storage.vectordb.index.local_index import PersistentIndex, Volat
 from openviking.storage.vectordb.meta.collection_meta import CollectionMeta, create_collection_meta
 from openviking.storage.vectordb.meta.index_meta import create_index_meta
 from openviking.storage.vectordb.store.data import CandidateData, DeltaRecord
-from openviking.storage.vectordb.store.store import OpType
+from openviking.storage.vectordb.store.scalar_row import ScalarRowCodec
 from openviking.storage.vectordb.store.store_manager import StoreManager, create_store_manager
 from openviking.storage.vectordb.utils import validation
 from openviking.storage.vectordb.utils.config_utils import get_config_value
@@ -146,9 +146,14 @@ class LocalCollection(ICollection):
         )
 
         self.store_mgr: Optional[StoreManager] = store_mgr
+        # Serializes writes to the store and indexes: update_scalar_fields()
+        # reads, modifies and writes whole rows (possibly from a background
+        # thread) and must not interleave with upserts or deletes.
+        self._write_lock = threading.RLock()
         self.data_processor = DataProcessor(
             self.meta.fields_dict, collection_name=self.meta.collection_name
         )
+        self.scalar_codec = ScalarRowCodec(self.meta.fields_dict)
         self.vectorizer_adapter = None
         if meta.vectorize and vectorizer:
             self.vectorizer_adapter = VectorizerAdapter(vectorizer, meta.vectorize)
@@ -173,6 +178,7 @@ class LocalCollection(ICollection):
         self.data_processor = DataProcessor(
             self.meta.fields_dict, collection_name=self.meta.collection_name
         )
+        self.scalar_codec = ScalarRowCodec(self.meta.fields_dict)
 
     def get_meta_data(self):
         return self.meta.get_meta_data()
@@ -256,75 +262,127 @@ class LocalCollection(ICollection):
         sparse_vector: Optional[Dict[str, float]] = None,
         output_fields: Optional[List[str]] = None,
     ) -> SearchResult:
-        search_result = SearchResult()
         index = self.indexes.get(index_name)
         if not index:
-            return search_result
-
-        sparse_raw_terms = []
-        sparse_values = []
-        if sparse_vector and isinstance(sparse_vector, dict):
-            sparse_raw_terms = list(sparse_vector.keys())
-            sparse_values = list(sparse_vector.values())
+            return SearchResult()
 
+        sparse_raw_terms, sparse_values = self._split_sparse_vector(sparse_vector)
         # Request more results to handle offset
-        actual_limit = limit + offset
-        label_list, scores_list = index.search(
-            dense_vector or [], actual_limit, filters, sparse_raw_terms, sparse_values
+        hits = index.search(
+            dense_vector or [], limit + offset, filters, sparse_raw_terms, sparse_values
         )
+        return self._build_search_results([hits], [(limit, offset)], output_fields)[0]
 
-        # Apply offset by slicing the results
-        if offset > 0:
-            label_list = label_list[offset:]
-            scores_list = scores_list[offset:]
-
-        # Limit to requested size
-        if len(label_list) > limit:
-            label_list = label_list[:limit]
-            scores_list = scores_list[:limit]
-
-        pk_list = label_list
-        fields_list = []
-        if not output_fields:
-            output_fields = list(self.meta.fields_dict.keys())
-        if self.meta.primary_key or output_fields:
-            if not self.store_mgr:
-                raise RuntimeError("Store manager is not initialized")
-            cands_list = self.store_mgr.fetch_cands_data(label_list)
-
-            valid_indices = []
-            for i, cand in enumerate(cands_list):
-                if cand is not None:
-                    valid_indices.append(i)
-                else:
-                    logger.warning(
-                        f"Candidate data is None for label index {i} (label: {label_list[i] if i < len(label_list) else 'unknown'}), skipping."
-                    )
+    def search_by_vector_batch(
+        self,
+        index_name: str,
+        queries: List[Dict[str, Any]],
+        output_fields: Optional[List[str]] = None,
+    ) -> List[SearchResult]:
+        index = self.indexes.get(index_name)
+        if not index:
+            return [SearchResult() for _ in queries]
+
+        index_queries = []
+        windows = []
+        for query in queries:
+            limit = query.get("limit", 10)
+            offset = query.get("offset", 0)
+            sparse_raw_terms, sparse_values = self._split_sparse_vector(query.get("sparse_vector"))
+            index_queries.append(
+                {
+                    "query_vector": query.get("dense_vector") or [],
+                    "limit": limit + offset,
+                    "filters": query.get("filters"),
+                    "sparse_raw_terms": sparse_raw_terms,
+                    "sparse_values": sparse_values,
+                }
+            )
+            windows.append((limit, offset))
+        hits = index.search_batch(index_queries)
+        return self._build_search_results(hits, windows, output_fields)
+
+    @staticmethod
+    def _split_sparse_vector(
+        sparse_vector: Optional[Dict[str, float]],
+    ) -> Tuple[List[str], List[float]]:
+        if sparse_vector and isinstance(sparse_vector, dict):
+            return list(sparse_vector.keys()), list(sparse_vector.values())
+        return [], []
 
-            if len(valid_indices) < len(cands_list):
-                cands_list = [cands_list[i] for i in valid_indices]
-                pk_list = [pk_list[i] for i in valid_indices]
-                scores_list = [scores_list[i] for i in valid_indices]
+    def _build_search_results(
+        self,
+        hits: List[Tuple[List[int], List[float]]],
+        windows: List[Tuple[int, int]],
+        output_fields: Optional[List[str]],
+    ) -> List[SearchResult]:
+        """Turn index hits into SearchResults, fetching each stored row once.
 
-            cands_fields = [json.loads(cand.fields) for cand in cands_list]
+        Args:
+            hits: (labels, scores) per query, as returned by the index
+            windows: (limit, offset) per query
+            output_fields: Fields to project, None for all of them
+        """
+        pages = []
+        for (label_list, scores_list), (limit, offset) in zip(hits, windows):
+            # Apply offset and limit by slicing the results
+            pages.append(
+                (label_list[offset : offset + limit], scores_list[offset : offset + limit])
+            )
 
-            if self.meta.primary_key:
-                pk_list = [
-                    cands_field.get(self.meta.primary_key, "") for cands_field in cands_fields
-                ]
-            fields_list = [
-                {field: cands_field.get(field, None) for field in output_fields}
-                for cands_field in cands_fields
+        project_all = not output_fields
+        if project_all:
+            output_fields = list(self.meta.fields_dict.keys())
+        if not (self.meta.primary_key or output_fields):
+            return [
+                SearchResult(
+                    data=[
+                        SearchItemResult(id=label, score=score)
+                        for label, score in zip(label_list, scores_list)
+                    ]
+                )
+                for label_list, scores_list in pages
             ]
-            if self.meta.vector_key:
-                for i, cands in enumerate(cands_list):
-                    fields_list[i][self.meta.vector_key] = cands.vector
 
-        search_result.data = [
-            SearchItemResult(id=pk, fields=fields, score=score)
-            for pk, score, fields in zip_longest(pk_list, scores_list, fields_list)
-        ]
-        return search_result
+        if not self.store_mgr:
+            raise RuntimeError("Store manager is not initialized")
+        # Only decode what is projected; the vector is the bulk of a stored row.
+        vk = self.meta.vector_key
+        need_vector = bool(vk) and vk in output_fields
+        unique_labels = list(
+            dict.fromkeys(label for label_list, _ in pages for label in label_list)
+        )
+        cands_list = self.store_mgr.fetch_cands_columns(
+            unique_labels,
+            ["fields", "scalars", "vector"] if need_vector else ["fields", "scalars"],
+        )
+
+        names = None if project_all else list(output_fields)
+        if names is not None and self.meta.primary_key and self.meta.primary_key not in names:
+            names.append(self.meta.primary_key)
+        items: Dict[int, Tuple[Any, Dict[str, Any]]] = {}
+        for i, cand in enumerate(cands_list):
+            label = unique_labels[i]
+            if cand is None:
+                logger.warning(f"Candidate data is None for label {label}, skipping.")
+                continue
+            cands_field = self._decode_fields(cand["scalars"], cand["fields"], names)
+            pk = cands_field.get(self.meta.primary_key, "") if self.meta.primary_key else label
+            fields = {field: cands_field.get(field, None) for field in output_fields}
+            if need_vector:
+                fields[vk] = cand["vector"]
+            items[label] = (pk, fields)
+
+        results = []
+        for label_list, scores_list in pages:
+            data = []
+            for label, score in zip(label_list, scores_list):
+                item = items.get(label)
+                if item is not None:
+                    # Results share decoded rows; each one gets its own fields dict.
+                    data.append(SearchItemResult(id=item[0], fields=dict(item[1]), score=score))
+            results.append(SearchResult(data=data))
+        return results
 
     def search_by_id(
         self,
@@ -561,17 +619,19 @@ class LocalCollection(ICollection):
                         cands_list[i].sparse_raw_terms = list(sparse_dict.keys())
                         cands_list[i].sparse_values = list(sparse_dict.values())
             cands_list[i].fields = json.dumps(data)
+            cands_list[i].scalars = self.scalar_codec.encode(data)
             cands_list[i].expire_ns_ts = time.time_ns() + ttl * 1000000000 if ttl > 0 else 0
 
         if not self.store_mgr:
             raise RuntimeError("Store manager is not initialized")
-        need_record_delta = True if self.indexes.count() > 0 else False
-        delta_list = self.store_mgr.add_cands_data(cands_list, ttl, need_record_delta)
+        with self._write_lock:
+            need_record_delta = True if self.indexes.count() > 0 else False
+            delta_list = self.store_mgr.add_cands_data(cands_list, ttl, need_record_delta)
 
-        def upsert_to_index(name, index):
-            index.upsert_data(delta_list)
+            def upsert_to_index(name, index):
+                index.upsert_data(delta_list)
 
-        self.indexes.iterate(upsert_to_index)
+            self.indexes.iterate(upsert_to_index)
 
         if not self.vectorizer_adapter:
             for i, data in enumerate(data_list):
@@ -603,9 +663,10 @@ class LocalCollection(ICollection):
             if not cand_data:
                 raw_data_list.append(None)
                 continue
-            raw_data = json.loads(cand_data.fields)
+            raw_data = self._decode_fields(cand_data.scalars, cand_data.fields)
             if not self.vectorizer_adapter:
-                raw_data[vk] = list(cand_data.vector)
+                # Freshly decoded per fetch, so no defensive copy is needed
+                raw_data[vk] = cand_data.vector
                 if svk and cand_data.sparse_raw_terms and cand_data.sparse_values:
                     raw_data[svk] = dict(zip(cand_data.sparse_raw_terms, cand_data.sparse_values))
             raw_data = validation.fix_fields_data(raw_data, self.meta.fields_dict)
@@ -618,6 +679,76 @@ class LocalCollection(ICollection):
             result.items.append(DataItem(id=primary_keys[i], fields=item_data))
         return result
 
+    def update_scalar_fields(self, updates: Dict[Any, Dict[str, Any]]) -> int:
+        """Set scalar fields of existing records, keeping their vectors.
+
+        Unlike upsert_data(), records are not re-validated or re-vectorized:
+        the stored row is re-encoded with the new field values and only the
+        scalar index of each index is updated.
+
+        Args:
+            updates: Primary key -> {field name: new value}
+
+        Returns:
+            Number of records updated (missing primary keys are skipped)
+        """
+        if not updates:
+            return 0
+        if not self.store_mgr:
+            raise RuntimeError("Store manager is not initialized")
+        pk = self.meta.primary_key
+        for changes in updates.values():
+            for name in changes:
+                field_type = self.meta.fields_dict.get(name, {}).get("FieldType")
+                if name == pk or field_type is None or "vector" in str(field_type):
+                    raise ValueError(f"Not an updatable scalar field: {name}")
+
+        keys = list(updates)
+        labels_list = (
+            [str_to_uint64(str(key)) for key in keys]
+            if pk != AUTO_ID_KEY
+            else [int(key) for key in keys]
+        )
+        with self._write_lock:
+            columns = self.store_mgr.fetch_cands_columns(labels_list, ["fields", "scalars"])
+            store_updates = []
+            for key, label, stored in zip(keys, labels_list, columns):
+                if not stored:
+                    continue
+                data = self._decode_fields(stored["scalars"], stored["fields"])
+                changes = updates[key]
+                old = {name: data[name] for name in changes if data.get(name) is not None}
+                data.update(changes)
+                store_updates.append(
+                    (
+                        label,
+                        json.dumps(data),
+                        self.scalar_codec.encode(data),
+                        json.dumps(changes),
+                        json.dumps(old) if old else "",
+                    )
+                )
+            if not store_updates:
+                return 0
+
+            need_record_delta = True if self.indexes.count() > 0 else False
+            delta_list = self.store_mgr.update_cands_fields(store_updates, need_record_delta)
+
+            def update_index(name, index):
+                index.update_scalar_data(delta_list)
+
+            self.indexes.iterate(update_index)
+            return len(delta_list)
+
+    def _decode_fields(
+        self, scalars: bytes, fields: str, names: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Decode stored scalar fields, preferring the typed row over the JSON copy."""
+        decoded = self.scalar_codec.decode(scalars, names) if scalars else None
+        if decoded is not None:
+            return decoded
+        return json.loads(fields)
+
     def delete_data(self, primary_keys: List[Any]):
         pk = self.meta.primary_key
         labels_list = (
@@ -625,15 +756,28 @@ class LocalCollection(ICollection):
             if pk != AUTO_ID_KEY
             else [int(key) for key in primary_keys]
         )
+        self._delete_labels(labels_list)
+
+    def delete_by_filter(self, index_name: str, filters: Dict[str, Any]) -> int:
+        index = self.indexes.get(index_name)
+        if not index or not filters:
+            return 0
+        labels_list = index.select_labels(filters)
+        if labels_list:
+            self._delete_labels(labels_list)
+        return len(labels_list)
+
+    def _delete_labels(self, labels_list: List[int]):
         if not self.store_mgr:
             raise RuntimeError("Store manager is not initialized")
-        need_record_delta = True if self.indexes.count() > 0 else False
-        delta_list = self.store_mgr.delete_data(labels_list, need_record_delta)
+        with self._write_lock:
+            need_record_delta = True if self.indexes.count() > 0 else False
+            delta_list = self.store_mgr.delete_data(labels_list, need_record_delta)
 
-        def delete_from_index(name, index):
-            index.delete_data(delta_list)
+            def delete_from_index(name, index):
+                index.delete_data(delta_list)
 
-        self.indexes.iterate(delete_from_index)
+            self.indexes.iterate(delete_from_index)
 
     def delete_all_data(self):
         """Delete all data and rebuild indexes (thread-safe).
@@ -647,7 +791,7 @@ class LocalCollection(ICollection):
         Uses locks to ensure no concurrent read/write requests cause errors during the operation.
         """
         # Use get_all_with_lock() to ensure atomicity of the entire operation
-        with self.indexes.get_all_with_lock() as indexes_dict:
+        with self._write_lock, self.indexes.get_all_with_lock() as indexes_dict:
             # 1. Save metadata and names for all indexes
             indexes_metadata = []
             for index_name, index in indexes_dict.items():
@@ -960,23 +1104,20 @@ class PersistCollection(LocalCollection):
             if not self.store_mgr:
                 raise RuntimeError("Store manager is not initialized")
             delta_list = self.store_mgr.get_delta_data_after_ts(newest_version)
-            upsert_list: List[DeltaRecord] = []
-            delete_list: List[DeltaRecord] = []
+            # Replay consecutive records of the same type as one batch, in order.
+            replay = {
+                DeltaRecord.Type.UPSERT: index.upsert_data,
+                DeltaRecord.Type.DELETE: index.delete_data,
+                DeltaRecord.Type.UPDATE_SCALARS: index.update_scalar_data,
+            }
+            batch: List[DeltaRecord] = []
             for data in delta_list:
-                if data.type == OpType.PUT.value:
-                    if delete_list:
-                        index.delete_data(delete_list)
-                        delete_list = []
-                    upsert_list.append(data)
-                elif data.type == OpType.DEL.value:
-                    if upsert_list:
-                        index.upsert_data(upsert_list)
-                        upsert_list = []
-                    delete_list.append(data)
-            if upsert_list:
-                index.upsert_data(upsert_list)
-            if delete_list:
-                index.delete_data(delete_list)
+                if batch and batch[0].type != data.type:
+                    replay[batch[0].type](batch)
+                    batch = []
+                batch.append(data)
+            if batch:
+                replay[batch[0].type](batch)
             self.indexes.set(index_name, index)
 
     def _persist_all_indexes(self):
@@ -66,6 +66,21 @@ class IIndex(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def update_scalar_data(self, delta_list: List[DeltaRecord]):
+        """Update scalar fields of existing records without touching their vectors.
+
+        Args:
+            delta_list: List of delta records containing:
+                - label: Unique identifier of an existing record
+                - fields: JSON-encoded new values of the updated fields
+                - old_fields: JSON-encoded previous values of the same fields
+
+        Raises:
+            NotImplementedError: If not implemented by subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def delete_data(self, delta_list: List[DeltaRecord]):
         """Delete data records from the index.
@@ -127,6 +142,22 @@ class IIndex(ABC):
         """
         raise NotImplementedError
 
+    def search_batch(self, queries: List[Dict[str, Any]]) -> List[Tuple[List[int], List[float]]]:
+        """Perform several similarity searches at once.
+
+        The default implementation calls search() once per query; local
+        indexes score all queries in a single pass over the data.
+
+        Args:
+            queries: One dict per query holding the keyword arguments of
+                search() (query_vector, limit, filters, sparse_raw_terms,
+                sparse_values)
+
+        Returns:
+            One (labels, scores) tuple per query, in input order
+        """
+        return [self.search(**query) for query in queries]
+
     @abstractmethod
     def aggregate(
         self,
@@ -166,6 +197,24 @@ class IIndex(ABC):
         """
         raise NotImplementedError
 
+    def select_labels(self, filters: Dict[str, Any]) -> List[int]:
+        """Return the labels of all records matching a scalar filter.
+
+        Unlike search(), no vector scoring is done and the result is not
+        limited, which makes it suitable for bulk operations such as deleting
+        a whole URI subtree.
+
+        Args:
+            filters: Filter DSL, same format as in search()
+
+        Returns:
+            Labels of the matching records
+
+        Raises:
+            NotImplementedError: If not implemented by subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def update(
         self, scalar_index: Optional[Union[List[str], Dict[str, Any]]], description: Optional[str]
@@ -324,6 +373,21 @@ class Index:
             raise RuntimeError("Index is not initialized")
         self.__index.delete_data(delta_list)
 
+    def update_scalar_data(self, delta_list: List[DeltaRecord]):
+        """
+        Update scalar fields of existing entries, keeping their vectors.
+
+        Args:
+            delta_list: Records carrying label, fields and old_fields of the
+                updated scalar fields.
+
+        Raises:
+            RuntimeError: If the underlying index is not initialized.
+        """
+        if self.__index is None:
+            raise RuntimeError("Index is not initialized")
+        self.__index.update_scalar_data(delta_list)
+
     def search(
         self,
         query_vector: Optional[List[float]] = None,
@@ -367,6 +431,23 @@ class Index:
 
         return self.__index.search(query_vector, limit, filters, sparse_raw_terms, sparse_values)
 
+    def search_batch(self, queries: List[Dict[str, Any]]) -> List[Tuple[List[int], List[float]]]:
+        """
+        Perform several similarity searches at once.
+
+        Args:
+            queries: One dict per query with the keyword arguments of search().
+
+        Returns:
+            One (labels, scores) tuple per query, in input order.
+
+        Raises:
+            RuntimeError: If the underlying index is not initialized.
+        """
+        if self.__index is None:
+            raise RuntimeError("Index is not initialized")
+        return self.__index.search_batch(queries)
+
     def update(
         self,
         scalar_index: Optional[Union[List[str], Dict[str, Any]]],
@@ -480,3 +561,19 @@ class Index:
         if self.__index is None:
             raise RuntimeError("Index is not initialized")
         return self.__index.aggregate(filters)
+
+    def select_labels(self, filters: Dict[str, Any]) -> List[int]:
+        """Return the labels of all records matching a scalar filter.
+
+        Args:
+            filters: Filter DSL, same format as in search()
+
+        Returns:
+            Labels of the matching records
+
+        Raises:
+            RuntimeError: If the underlying index is not initialized.
+        """
+        if self.__index is None:
+            raise RuntimeError("Index is not initialized")
+        return self.__index.select_labels(filters)
@@ -1,12 +1,11 @@
 # Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 # SPDX-License-Identifier: Apache-2.0
 import json
-import math
 import os
 import shutil
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import openviking.storage.vectordb.engine as engine
 from openviking.storage.vectordb.index.index import IIndex
@@ -20,23 +19,19 @@ def normalize_vector(vector: List[float]) -> List[float]:
     """Perform L2 normalization on a vector.
 
     Args:
-        vector: Input vector
+        vector: Input vector (list or float32 buffer such as a NumPy array)
 
     Returns:
         Normalized vector
     """
-    if not vector:
+    if not _has_vector(vector):
         return vector
+    return engine.l2_normalize(vector)
 
-    # Calculate L2 norm
-    norm = math.sqrt(sum(x * x for x in vector))
 
-    # Avoid division by zero
-    if norm == 0:
-        return vector
-
-    # Normalize
-    return [x / norm for x in vector]
+def _has_vector(vector: Optional[Sequence[float]]) -> bool:
+    # len() rather than truthiness, which is ambiguous for NumPy arrays
+    return vector is not None and len(vector) > 0
 
 
 class IndexEngineProxy:
@@ -78,12 +73,45 @@ class IndexEngineProxy:
         if not self.index_engine:
             raise RuntimeError("Index engine not initialized")
 
+        req = self._make_search_request(
+            query_vector, limit, filters, sparse_raw_terms, sparse_values
+        )
+        search_result = self.index_engine.search(req)
+        labels = search_result.labels
+        scores = search_result.scores
+        return labels, scores
+
+    def search_batch(self, queries: List[Dict[str, Any]]) -> List[Tuple[List[int], List[float]]]:
+        """Run several searches in one engine call.
+
+        Args:
+            queries: One dict per query with the keyword arguments of search()
+
+        Returns:
+            (labels, scores) per query, in input order
+        """
+        if not self.index_engine:
+            raise RuntimeError("Index engine not initialized")
+
+        reqs = [self._make_search_request(**query) for query in queries]
+        return [
+            (search_result.labels, search_result.scores)
+            for search_result in self.index_engine.search_batch(reqs)
+        ]
+
+    def _make_search_request(
+        self,
+        query_vector: List[float],
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        sparse_raw_terms: Optional[List[str]] = None,
+        sparse_values: Optional[List[float]] = None,
+    ) -> engine.SearchRequest:
         req = engine.SearchRequest()
-        if query_vector:
-            # If normalization is enabled, normalize the query vector
-            if self.normalize_vector_flag:
-                query_vector = normalize_vector(query_vector)
-            req.query = query_vector
+        if _has_vector(query_vector):
+            # Float32 buffers are copied without going through Python floats;
+            # normalization, if enabled, happens natively.
+            req.set_query(query_vector, self.normalize_vector_flag)
         req.topk = limit
 
         if filters is None:
@@ -93,21 +121,54 @@ class IndexEngineProxy:
         if sparse_raw_terms and sparse_values:
             req.sparse_raw_terms = sparse_raw_terms
             req.sparse_values = sparse_values
+        return req
 
-        search_result = self.index_engine.search(req)
-        labels = search_result.labels
-        scores = search_result.scores
-        return labels, scores
+    def select_labels(self, filters: Dict[str, Any]) -> List[int]:
+        if not self.index_engine:
+            raise RuntimeError("Index engine not initialized")
+        return list(self.index_engine.select_labels(json.dumps(filters)))
 
     def add_data(self, cands_list: List[CandidateData]):
         if not self.index_engine:
             raise RuntimeError("Index engine not initialized")
+        self._add_records(cands_list, with_old_fields=False)
+
+    def upsert_data(self, delta_list: List[DeltaRecord]):
+        if not self.index_engine:
+            raise RuntimeError("Index engine not initialized")
+        self._add_records(delta_list, with_old_fields=True)
+
+    def _add_records(
+        self, records: Sequence[Union[CandidateData, DeltaRecord]], with_old_fields: bool
+    ) -> None:
+        """Add records to the engine.
+
+        When all records carry a dense vector of the same dimension, they are
+        added with a single add_vectors() call that packs (and normalizes) the
+        vectors natively. Otherwise an AddDataRequest is built per record.
+        """
+        dim = len(records[0].vector) if records and _has_vector(records[0].vector) else 0
+        if dim and all(_has_vector(data.vector) and len(data.vector) == dim for data in records):
+            has_sparse = any(data.sparse_raw_terms and data.sparse_values for data in records)
+            self.index_engine.add_vectors(
+                labels=[data.label for data in records],
+                vectors=[data.vector for data in records],
+                dim=dim,
+                fields_strs=[data.fields for data in records],
+                old_fields_strs=[data.old_fields for data in records] if with_old_fields else [],
+                sparse_raw_terms=(
+                    [data.sparse_raw_terms or [] for data in records] if has_sparse else []
+                ),
+                sparse_values=[data.sparse_values or [] for data in records] if has_sparse else [],
+                normalize=self.normalize_vector_flag,
+            )
+            return
 
-        add_req_list = [engine.AddDataRequest() for _ in range(len(cands_list))]
-        for i, data in enumerate(cands_list):
+        add_req_list = [engine.AddDataRequest() for _ in range(len(records))]
+        for i, data in enumerate(records):
             add_req_list[i].label = data.label
             # If normalization is enabled, normalize the vector
-            if self.normalize_vector_flag and data.vector:
+            if self.normalize_vector_flag and _has_vector(data.vector):
                 add_req_list[i].vector = normalize_vector(data.vector)
             else:
                 add_req_list[i].vector = data.vector
@@ -115,26 +176,20 @@ class IndexEngineProxy:
                 add_req_list[i].sparse_raw_terms = data.sparse_raw_terms
                 add_req_list[i].sparse_values = data.sparse_values
             add_req_list[i].fields_str = data.fields
+            if with_old_fields:
+                add_req_list[i].old_fields_str = data.old_fields
         self.index_engine.add_data(add_req_list)
 
-    def upsert_data(self, delta_list: List[DeltaRecord]):
+    def update_scalar_data(self, delta_list: List[DeltaRecord]):
         if not self.index_engine:
             raise RuntimeError("Index engine not initialized")
 
-        add_req_list = [engine.AddDataRequest() for _ in range(len(delta_list))]
+        update_req_list = [engine.AddDataRequest() for _ in range(len(delta_list))]
         for i, data in enumerate(delta_list):
-            add_req_list[i].label = data.label
-            # If normalization is enabled, normalize the vector
-            if self.normalize_vector_flag and data.vector:
-                add_req_list[i].vector = normalize_vector(data.vector)
-            else:
-                add_req_list[i].vector = data.vector
-            if data.sparse_raw_terms and data.sparse_values:
-                add_req_list[i].sparse_raw_terms = data.sparse_raw_terms
-                add_req_list[i].sparse_values = data.sparse_values
-            add_req_list[i].fields_str = data.fields
-            add_req_list[i].old_fields_str = data.old_fields
-        self.index_engine.add_data(add_req_list)
+            update_req_list[i].label = data.label
+            update_req_list[i].fields_str = data.fields
+            update_req_list[i].old_fields_str = data.old_fields
+        self.index_engine.update_scalar_data(update_req_list)
 
     def delete_data(self, delta_list: List[DeltaRecord]):
         if not self.index_engine:
@@ -236,6 +291,10 @@ class LocalIndex(IIndex):
         if self.engine_proxy:
             self.engine_proxy.upsert_data(self._convert_delta_list_for_index(delta_list))
 
+    def update_scalar_data(self, delta_list: List[DeltaRecord]):
+        if self.engine_proxy:
+            self.engine_proxy.update_scalar_data(self._convert_delta_list_for_index(delta_list))
+
     def delete_data(self, delta_list: List[DeltaRecord]):
         if self.engine_proxy:
             self.engine_proxy.delete_data(self._convert_delta_list_for_index(delta_list))
@@ -264,6 +323,40 @@ class LocalIndex(IIndex):
             )
         return [], []
 
+    def search_batch(self, queries: List[Dict[str, Any]]) -> List[Tuple[List[int], List[float]]]:
+        if not self.engine_proxy:
+            return [([], []) for _ in queries]
+        results: List[Tuple[List[int], List[float]]] = [([], []) for _ in queries]
+        positions = []
+        engine_queries = []
+        for i, query in enumerate(queries):
+            if query.get("query_vector") is None:
+                continue
+            filters = query.get("filters") or {}
+            if self.field_type_converter:
+                filters = self.field_type_converter.convert_filter_for_index(filters)
+            positions.append(i)
+            engine_queries.append(
+                {
+                    "query_vector": query["query_vector"],
+                    "limit": query.get("limit", 10),
+                    "filters": filters,
+                    "sparse_raw_terms": query.get("sparse_raw_terms") or [],
+                    "sparse_values": query.get("sparse_values") or [],
+                }
+            )
+        if engine_queries:
+            for i, hits in zip(positions, self.engine_proxy.search_batch(engine_queries)):
+                results[i] = hits
+        return results
+
+    def select_labels(self, filters: Dict[str, Any]) -> List[int]:
+        if not self.engine_proxy:
+            return []
+        if self.field_type_converter:
+            filters = self.field_type_converter.convert_filter_for_index(filters)
+        return self.engine_proxy.select_labels(filters)
+
     def aggregate(
         self,
         filters: Optional[Dict[str, Any]] = None,
@@ -339,7 +432,7 @@ class LocalIndex(IIndex):
         for data in delta_list:
             item = DeltaRecord(type=data.type)
             item.label = data.label
-            item.vector = list(data.vector) if data.vector else []
+            item.vector = data.vector if _has_vector(data.vector) else []
             item.sparse_raw_terms = list(data.sparse_raw_terms) if data.sparse_raw_terms else []
             item.sparse_values = list(data.sparse_values) if data.sparse_values else []
             item.fields = (
@@ -364,7 +457,7 @@ class LocalIndex(IIndex):
         for data in cands_list:
             item = CandidateData()
             item.label = data.label
-            item.vector = list(data.vector) if data.vector else []
+            item.vector = data.vector if _has_vector(data.vector) else []
             item.sparse_raw_terms = list(data.sparse_raw_terms) if data.sparse_raw_terms else []
             item.sparse_values = list(data.sparse_values) if data.sparse_values else []
             item.fields = (
@@ -441,9 +534,14 @@ class VolatileIndex(LocalIndex):
         When the amount of deleted data exceeds a threshold relative to current data,
         the index benefits from rebuilding to reclaim memory.
 
+        HNSW indexes are the exception: building the graph is expensive and the engine
+        already compacts deleted nodes itself.
+
         Returns:
-            bool: True indicates rebuild is recommended (always True for volatile indexes)
+            bool: True indicates rebuild is recommended (always True for volatile flat indexes)
         """
+        if self.meta and self.meta.inner_meta.get("VectorIndex", {}).get("IndexType") == "hnsw":
+            return False
         return True
 
     def get_newest_version(self) -> int:
@@ -94,12 +94,12 @@ class IndexMeta:
                 vector_index["Distance"] = user_distance
                 vector_index["NormalizeVector"] = False
             vector_index["Quant"] = inner_meta["VectorIndex"].get("Quant", "float")
-            if "hybrid" in inner_meta["VectorIndex"]["IndexType"]:
+            if "hybrid" in inner_meta["VectorIndex"]["IndexType"].lower():
                 vector_index["EnableSparse"] = True
                 vector_index["SearchWithSparseLogitAlpha"] = inner_meta["VectorIndex"].get(
                     "SearchWithSparseLogitAlpha", 0.5
                 )
-            if "flat" in inner_meta["VectorIndex"]["IndexType"]:
+            if "flat" in inner_meta["VectorIndex"]["IndexType"].lower():
                 vector_index["IndexType"] = "flat"
                 if "EnableSparse" in inner_meta["VectorIndex"]:
                     vector_index["EnableSparse"] = inner_meta["VectorIndex"]["EnableSparse"]
@@ -107,6 +107,19 @@ class IndexMeta:
                     vector_index["SearchWithSparseLogitAlpha"] = inner_meta["VectorIndex"][
                         "SearchWithSparseLogitAlpha"
                     ]
+            if "hnsw" in inner_meta["VectorIndex"]["IndexType"].lower():
+                vector_index["IndexType"] = "hnsw"
+                if "EnableSparse" in inner_meta["VectorIndex"]:
+                    vector_index["EnableSparse"] = inner_meta["VectorIndex"]["EnableSparse"]
+                if "SearchWithSparseLogitAlpha" in inner_meta["VectorIndex"]:
+                    vector_index["SearchWithSparseLogitAlpha"] = inner_meta["VectorIndex"][
+                        "SearchWithSparseLogitAlpha"
+                    ]
+                # Graph build/search parameters; the engine falls back to its
+                # defaults (M=16, EfConstruction=200, EfSearch=64) when absent.
+                for key in ("M", "EfConstruction", "EfSearch"):
+                    if key in inner_meta["VectorIndex"]:
+                        vector_index[key] = inner_meta["VectorIndex"][key]
 
             inner_meta["VectorIndex"] = vector_index
         inner_meta["CollectionName"] = collection_meta.collection_name
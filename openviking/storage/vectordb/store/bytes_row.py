@@ -270,6 +270,12 @@ class _PyBytesRow:
 
         return data_dict
 
+    def replace_fields(self, serialized_data, updates: Dict[str, Any]) -> bytes:
+        """Re-encode a row with the fields in ``updates`` replaced."""
+        row_data = self.deserialize(serialized_data)
+        row_data.update(updates)
+        return self.serialize(row_data)
+
 
 try:
     import openviking.storage.vectordb.engine as engine
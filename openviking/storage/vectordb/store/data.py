@@ -16,6 +16,8 @@ class CandidateData:
     sparse_values: List[float] = field(default_factory=list)
     fields: str = ""
     expire_ns_ts: int = 0
+    # Typed copy of fields (see ScalarRowCodec); empty for rows written before it existed.
+    scalars: bytes = b""
 
     def __str__(self):
         data_dict = {
@@ -25,6 +27,7 @@ class CandidateData:
             "sparse_values": self.sparse_values,
             "fields": self.fields,
             "expire_ns_ts": self.expire_ns_ts,
+            "scalars": self.scalars.hex(),
         }
         return json.dumps(data_dict)
 
@@ -38,6 +41,9 @@ class DeltaRecord:
     class Type:
         UPSERT = 0
         DELETE = 1
+        # Scalar fields changed, vector unchanged; fields/old_fields hold only
+        # the changed fields.
+        UPDATE_SCALARS = 2
 
     type: int = 0
     label: int = 0
@@ -0,0 +1,200 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Typed row encoding of the scalar fields of a collection record.
+
+The layout is derived from the collection schema and serialized with BytesRow,
+so readers can decode just the fields they project instead of parsing a JSON
+document per row. Values that have no typed column (None, type mismatches,
+nested objects, fields outside the schema) are kept in a small JSON side field.
+"""
+
+import json
+import struct
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from openviking.storage.vectordb.store.bytes_row import BytesRow, FieldType, Schema
+from openviking.storage.vectordb.utils.str_to_uint64 import str_to_uint64
+
+SCHEMA_KEY = "__schema__"
+PRESENT_KEY = "__present__"
+EXTRA_KEY = "__extra__"
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+_UINT16_MAX = 2**16 - 1
+
+
+def _is_int64(value: Any) -> bool:
+    return type(value) is int and _INT64_MIN <= value <= _INT64_MAX
+
+
+def _is_short_str(value: Any) -> bool:
+    return type(value) is str and len(value.encode("utf-8")) <= _UINT16_MAX
+
+
+def _encode_str(value: str) -> bytes:
+    return value.encode("utf-8")
+
+
+def _decode_str(value: bytes) -> str:
+    return value.decode("utf-8")
+
+
+def _encode_float(value: float) -> int:
+    # float32 fields keep full precision: the double is stored bit-cast into int64.
+    return struct.unpack("<q", struct.pack("<d", value))[0]
+
+
+def _decode_float(value: int) -> float:
+    return struct.unpack("<d", struct.pack("<q", value))[0]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@dataclass(frozen=True)
+class _ColumnType:
+    field_type: Any
+    accepts: Callable[[Any], bool]
+    encode: Callable[[Any], Any] = _identity
+    decode: Callable[[Any], Any] = _identity
+
+
+_STRING_COLUMN = _ColumnType(FieldType.binary, lambda v: type(v) is str, _encode_str, _decode_str)
+
+# Collection field type -> typed column. Types not listed here (vector,
+# sparse_vector, video) always go to the JSON side field.
+COLUMN_TYPES: Dict[str, _ColumnType] = {
+    "int64": _ColumnType(FieldType.int64, _is_int64),
+    "float32": _ColumnType(
+        FieldType.int64, lambda v: type(v) is float, _encode_float, _decode_float
+    ),
+    "bool": _ColumnType(FieldType.boolean, lambda v: type(v) is bool),
+    "string": _STRING_COLUMN,
+    "text": _STRING_COLUMN,
+    "path": _STRING_COLUMN,
+    "image": _STRING_COLUMN,
+    "date_time": _STRING_COLUMN,
+    "geo_point": _STRING_COLUMN,
+    "list<string>": _ColumnType(
+        FieldType.list_string,
+        lambda v: type(v) is list and len(v) <= _UINT16_MAX and all(map(_is_short_str, v)),
+        list,
+        list,
+    ),
+    "list<int64>": _ColumnType(
+        FieldType.list_int64,
+        lambda v: type(v) is list and len(v) <= _UINT16_MAX and all(map(_is_int64, v)),
+        list,
+        list,
+    ),
+}
+
+_HEADER_FIELDS = [
+    {"name": SCHEMA_KEY, "data_type": FieldType.uint64, "id": 0},
+    {"name": PRESENT_KEY, "data_type": FieldType.binary, "id": 1},
+    {"name": EXTRA_KEY, "data_type": FieldType.binary, "id": 2},
+]
+
+
+@dataclass(frozen=True)
+class _Column:
+    name: str
+    index: int
+    type: _ColumnType
+
+
+class ScalarRowCodec:
+    """Encode/decode the scalar fields of a collection as a typed BytesRow.
+
+    Every row carries a fingerprint of the column layout; decode() returns None
+    for rows written with another layout so callers can fall back to the JSON
+    copy of the fields.
+    """
+
+    def __init__(self, fields_dict: Dict[str, Any]):
+        """
+        Args:
+            fields_dict: Collection field definitions, FieldName -> field meta
+        """
+        columns: List[_Column] = []
+        for name, field_meta in fields_dict.items():
+            field_type = field_meta.get("FieldType")
+            if field_type in COLUMN_TYPES:
+                columns.append(_Column(name, len(columns), COLUMN_TYPES[field_type]))
+
+        layout = [[c.name, fields_dict[c.name]["FieldType"]] for c in columns]
+        self.fingerprint = str_to_uint64(json.dumps(layout))
+        self._columns: Dict[str, _Column] = {c.name: c for c in columns}
+        self._present_size = (len(columns) + 7) // 8
+        schema_fields = list(_HEADER_FIELDS)
+        for column in columns:
+            schema_fields.append(
+                {
+                    "name": column.name,
+                    "data_type": column.type.field_type,
+                    "id": len(_HEADER_FIELDS) + column.index,
+                }
+            )
+        self._bytes_row = BytesRow(Schema(schema_fields))
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """Serialize a record's scalar fields."""
+        row: Dict[str, Any] = {SCHEMA_KEY: self.fingerprint}
+        present = bytearray(self._present_size)
+        extra: Dict[str, Any] = {}
+        for name, value in data.items():
+            column = self._columns.get(name)
+            if column is not None and column.type.accepts(value):
+                row[name] = column.type.encode(value)
+                present[column.index >> 3] |= 1 << (column.index & 7)
+            else:
+                extra[name] = value
+        row[PRESENT_KEY] = bytes(present)
+        row[EXTRA_KEY] = json.dumps(extra).encode("utf-8") if extra else b""
+        return self._bytes_row.serialize(row)
+
+    def decode(
+        self, data: bytes, names: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Deserialize a record's scalar fields.
+
+        Args:
+            data: Bytes produced by encode()
+            names: Fields to decode, None decodes all of them. Fields absent
+                from the record are absent from the result.
+
+        Returns:
+            Field dict, or None if data was not written with this layout
+        """
+        bytes_row = self._bytes_row
+        if not data or bytes_row.deserialize_field(data, SCHEMA_KEY) != self.fingerprint:
+            return None
+
+        if names is None:
+            raw = bytes_row.deserialize(data)
+            present = raw[PRESENT_KEY]
+            extra_raw = raw[EXTRA_KEY]
+            result = {
+                column.name: column.type.decode(raw[column.name])
+                for column in self._columns.values()
+                if present[column.index >> 3] >> (column.index & 7) & 1
+            }
+            if extra_raw:
+                result.update(json.loads(extra_raw))
+            return result
+
+        present = bytes_row.deserialize_field(data, PRESENT_KEY)
+        extra_raw = bytes_row.deserialize_field(data, EXTRA_KEY)
+        extra = json.loads(extra_raw) if extra_raw else {}
+        result = {}
+        for name in names:
+            column = self._columns.get(name)
+            if column is not None and present[column.index >> 3] >> (column.index & 7) & 1:
+                result[name] = column.type.decode(bytes_row.deserialize_field(data, name))
+            elif name in extra:
+                result[name] = extra[name]
+        return result
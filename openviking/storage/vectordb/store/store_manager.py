@@ -1,7 +1,7 @@
 # Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 # SPDX-License-Identifier: Apache-2.0
 import time
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from openviking.storage.vectordb.store.data import CandidateData, DeltaRecord
 from openviking.storage.vectordb.store.local_store import create_store_engine_proxy
@@ -127,6 +127,69 @@ class StoreManager:
 
         return delta_list
 
+    def update_cands_fields(
+        self,
+        updates: List[Tuple[int, str, bytes, str, str]],
+        need_record_delta: bool = True,
+    ) -> List[DeltaRecord]:
+        """Replace the scalar fields of stored candidates, keeping their vectors.
+
+        The stored rows are re-encoded with only ``fields`` and ``scalars``
+        replaced; vectors are copied as raw bytes and never re-validated.
+        Callers hold the collection write lock across computing ``updates``
+        and this call, so no upsert can land in between and be reverted.
+
+        Args:
+            updates (List[Tuple[int, str, bytes, str, str]]): (label, fields JSON,
+                encoded scalars, changed fields JSON, previous values JSON) per
+                candidate. Labels that are not stored are skipped.
+            need_record_delta (bool): Whether to record delta changes.
+
+        Returns:
+            List[DeltaRecord]: UPDATE_SCALARS delta records of the updated labels.
+        """
+        bytes_list = self.storage.read(
+            [str(update[0]) for update in updates],
+            StoreManager.CandsTable,
+        )
+        keys: List[str] = []
+        rows: List[bytes] = []
+        delta_list: List[DeltaRecord] = []
+        for (label, fields, scalars, changed, old_changed), bytes_data in zip(updates, bytes_list):
+            if not bytes_data:
+                continue
+            keys.append(str(label))
+            rows.append(
+                CandidateData.bytes_row.replace_fields(
+                    bytes_data, {"fields": fields, "scalars": scalars}
+                )
+            )
+            delta_list.append(
+                DeltaRecord(
+                    type=DeltaRecord.Type.UPDATE_SCALARS,
+                    label=label,
+                    fields=changed,
+                    old_fields=old_changed,
+                )
+            )
+        if not rows:
+            return []
+
+        batch_op_list = []
+        if need_record_delta:
+            base_ts = time.time_ns()
+            batch_op_list.append(
+                BatchOp(
+                    StoreManager.DeltaTable,
+                    [OpType.PUT] * len(delta_list),
+                    [str(base_ts + i) for i in range(len(delta_list))],
+                    DeltaRecord.serialize_list(delta_list),
+                )
+            )
+        batch_op_list.append(BatchOp(StoreManager.CandsTable, [OpType.PUT] * len(rows), keys, rows))
+        self.storage.exec_sequence_batch_op(batch_op_list)
+        return delta_list
+
     def delete_data(
         self, label_list: List[int], need_record_delta: bool = True
     ) -> List[DeltaRecord]:
@@ -198,6 +261,35 @@ class StoreManager:
         ]
         return cands_list
 
+    def fetch_cands_columns(
+        self, label_list: List[int], columns: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Fetch selected CandidateData attributes by labels.
+
+        Only the named attributes are deserialized, so callers that do not need
+        e.g. the vector avoid decoding it.
+
+        Args:
+            label_list (List[int]): List of labels to fetch.
+            columns (List[str]): CandidateData attribute names to decode.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Attribute dicts, or None if not found.
+        """
+        bytes_list = self.storage.read(
+            [str(label) for label in label_list],
+            StoreManager.CandsTable,
+        )
+        bytes_row = CandidateData.bytes_row
+        return [
+            (
+                {column: bytes_row.deserialize_field(bytes_data, column) for column in columns}
+                if bytes_data
+                else None
+            )
+            for bytes_data in bytes_list
+        ]
+
     def get_all_cands_data(self) -> List[CandidateData]:
         """Get all candidate data from the store.
 
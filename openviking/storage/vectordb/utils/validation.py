@@ -182,13 +182,18 @@ class CollectionMetaConfig(BaseModel):
 class VectorIndexConfig(BaseModel):
     model_config = ConfigDict()
 
-    IndexType: Literal["flat", "flat_hybrid", "FLAT", "FLAT_HYBRID"]
+    IndexType: Literal[
+        "flat", "flat_hybrid", "hnsw", "hnsw_hybrid", "FLAT", "FLAT_HYBRID", "HNSW", "HNSW_HYBRID"
+    ]
     Distance: Optional[Literal["l2", "ip", "cosine", "L2", "IP", "COSINE"]] = None
     Quant: Optional[Literal["int8", "float", "fix16", "pq", "INT8", "FLOAT", "FIX16", "PQ"]] = None
     DiskannM: Optional[int] = None
     DiskannCef: Optional[int] = None
     PqCodeRatio: Optional[float] = None
     CacheRatio: Optional[float] = None
+    M: Optional[int] = Field(None, ge=2)
+    EfConstruction: Optional[int] = Field(None, ge=1)
+    EfSearch: Optional[int] = Field(None, ge=1)
     SearchWithSparseLogitAlpha: Optional[float] = None
     IndexWithSparseLogitAlpha: Optional[float] = None
     EnableSparse: Optional[bool] = None
@@ -207,7 +212,7 @@ class VectorIndexConfig(BaseModel):
     @field_validator("IndexType")
     @classmethod
     def validate_index_type(cls, v):
-        if v.lower() not in ["flat", "flat_hybrid"]:
+        if v.lower() not in ["flat", "flat_hybrid", "hnsw", "hnsw_hybrid"]:
             raise ValueError(f"invalid index type '{v}'")
         return v
 
@@ -295,6 +295,24 @@ class CollectionAdapter(ABC):
         coll.upsert_data(normalized)
         return ids
 
+    def update_fields(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """Set scalar fields of existing records by id.
+
+        The generic implementation rewrites the full records; backends that
+        can update scalar fields in place override it.
+
+        Returns:
+            Number of records updated
+        """
+        if not updates:
+            return 0
+        records = self.get(list(updates))
+        for record in records:
+            record.update(updates[record["id"]])
+        if records:
+            self.upsert(records)
+        return len(records)
+
     def get(self, ids: list[str]) -> list[Dict[str, Any]]:
         coll = self.get_collection()
         result = coll.fetch_data(ids)
@@ -360,6 +378,41 @@ class CollectionAdapter(ABC):
                 output_fields=output_fields,
             )
 
+        return self._records_from_search_result(result)
+
+    def query_batch(
+        self,
+        queries: list[Dict[str, Any]],
+        output_fields: Optional[list[str]] = None,
+    ) -> list[list[Dict[str, Any]]]:
+        """Run several vector queries together.
+
+        Args:
+            queries: One dict per query with the vector-search keyword arguments
+                of query(): query_vector, sparse_query_vector, filter, limit, offset
+            output_fields: Fields to return for every query
+
+        Returns:
+            Records per query, in input order, shaped like query() results
+        """
+        coll = self.get_collection()
+        results = coll.search_by_vector_batch(
+            index_name="default",
+            queries=[
+                {
+                    "dense_vector": query.get("query_vector"),
+                    "sparse_vector": query.get("sparse_query_vector"),
+                    "limit": query.get("limit", 10),
+                    "offset": query.get("offset", 0),
+                    "filters": self._compile_filter(query.get("filter")),
+                }
+                for query in queries
+            ],
+            output_fields=output_fields,
+        )
+        return [self._records_from_search_result(result) for result in results]
+
+    def _records_from_search_result(self, result: Any) -> list[Dict[str, Any]]:
         records: list[Dict[str, Any]] = []
         for item in result.data:
             record = dict(item.fields) if item.fields else {}
@@ -379,8 +432,7 @@ class CollectionAdapter(ABC):
         coll = self.get_collection()
         delete_ids = list(ids or [])
         if not delete_ids and filter is not None:
-            matched = self.query(filter=filter, limit=limit)
-            delete_ids = [record["id"] for record in matched if record.get("id")]
+            return self._delete_by_filter(filter, limit)
 
         if not delete_ids:
             return 0
@@ -388,6 +440,122 @@ class CollectionAdapter(ABC):
         coll.delete_data(delete_ids)
         return len(delete_ids)
 
+    def _delete_by_filter(self, filter: Dict[str, Any] | FilterExpr, limit: int) -> int:
+        """Delete every record matching filter, in batches of at most limit."""
+        deleted: set[str] = set()
+        while True:
+            matched = self.query(filter=filter, limit=limit, output_fields=["uri"])
+            # Stop when a batch brings nothing new, so a backend that lags in
+            # reflecting deletes cannot keep the loop spinning on the same ids.
+            delete_ids = [
+                record["id"]
+                for record in matched
+                if record.get("id") and record["id"] not in deleted
+            ]
+            if not delete_ids:
+                break
+            self.get_collection().delete_data(delete_ids)
+            deleted.update(delete_ids)
+            if len(matched) < limit:
+                break
+        return len(deleted)
+
+    def delete_subtree(
+        self,
+        uri_prefix: str,
+        *,
+        filter: Optional[Dict[str, Any] | FilterExpr] = None,
+        limit: int = 100000,
+    ) -> int:
+        """Delete ``uri_prefix`` and every record below it.
+
+        ``limit`` bounds each delete batch, not the size of the subtree.
+
+        Returns:
+            Number of records deleted
+        """
+        uri_prefix = uri_prefix.rstrip("/")
+        if not uri_prefix:
+            return 0
+        subtree = self._subtree_filter(uri_prefix)
+        expr = And([subtree, filter]) if filter is not None else subtree
+        return self.delete(filter=expr, limit=limit)
+
+    @staticmethod
+    def _subtree_filter(uri_prefix: str) -> FilterExpr:
+        """Records whose uri is uri_prefix or lies below it (segment-wise)."""
+        return Or([Eq("uri", uri_prefix), In("uri", [f"{uri_prefix}/"])])
+
+    def rename_uri_prefix(
+        self,
+        old_prefix: str,
+        new_prefix: str,
+        *,
+        filter: Optional[Dict[str, Any] | FilterExpr] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """Rewrite ``uri``/``parent_uri`` of every record in a subtree.
+
+        The subtree (``old_prefix`` itself and every URI below it) is selected
+        through the path index a batch at a time; each batch is re-written with
+        its stored vectors, so nothing is re-embedded, and drops out of the
+        subtree. A ``parent_uri`` outside the subtree (the parent of
+        ``old_prefix`` itself) is left unchanged.
+
+        Returns:
+            Number of records rewritten
+
+        Raises:
+            ValueError: If one prefix lies below the other; renamed records
+                would still be part of the subtree.
+        """
+        old_prefix = old_prefix.rstrip("/")
+        new_prefix = new_prefix.rstrip("/")
+        if not old_prefix or old_prefix == new_prefix:
+            return 0
+        if new_prefix.startswith(f"{old_prefix}/") or old_prefix.startswith(f"{new_prefix}/"):
+            raise ValueError(f"Cannot rename {old_prefix} to {new_prefix}: subtrees overlap")
+
+        subtree = self._subtree_filter(old_prefix)
+        expr = And([subtree, filter]) if filter is not None else subtree
+        renamed_ids: set[str] = set()
+        while True:
+            matched = self.query(filter=expr, limit=batch_size, output_fields=["uri"])
+            # Stop when a batch brings nothing new, so a backend that lags in
+            # reflecting the rewrites cannot keep the loop spinning.
+            ids = list(
+                dict.fromkeys(
+                    record["id"]
+                    for record in matched
+                    if record.get("id") and record["id"] not in renamed_ids
+                )
+            )
+            if not ids:
+                break
+            records = self.get(ids)
+            for record in records:
+                record["uri"] = self._replace_uri_prefix(
+                    record.get("uri", ""), old_prefix, new_prefix
+                )
+                if record.get("parent_uri"):
+                    record["parent_uri"] = self._replace_uri_prefix(
+                        record["parent_uri"], old_prefix, new_prefix
+                    )
+            if records:
+                self.upsert(records)
+            renamed_ids.update(ids)
+            if len(matched) < batch_size:
+                break
+        return len(renamed_ids)
+
+    @staticmethod
+    def _replace_uri_prefix(uri: str, old_prefix: str, new_prefix: str) -> str:
+        if uri == old_prefix:
+            return new_prefix
+        if uri.startswith(f"{old_prefix}/"):
+            return new_prefix + uri[len(old_prefix) :]
+        return uri
+
     @staticmethod
     def _coerce_int(value: Any) -> Optional[int]:
         if isinstance(value, bool):
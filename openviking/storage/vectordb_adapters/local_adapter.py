@@ -8,6 +8,7 @@ import os
 from pathlib import Path
 from typing import Any, Dict
 
+from openviking.storage.expr import FilterExpr
 from openviking.storage.vectordb.collection.collection import Collection
 from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
 
@@ -51,3 +52,13 @@ class LocalCollectionAdapter(CollectionAdapter):
         if collection_path:
             os.makedirs(collection_path, exist_ok=True)
         return get_or_create_local_collection(meta_data=meta, path=collection_path)
+
+    def update_fields(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        # Only the stored scalar row and the scalar index change; vectors are
+        # neither re-validated nor re-inserted.
+        return self.get_collection().update_scalar_fields(updates)
+
+    def _delete_by_filter(self, filter: Dict[str, Any] | FilterExpr, limit: int) -> int:
+        # Labels come straight from the scalar index (path prefixes through the
+        # DirIndex trie), so there is no vector search and no result limit.
+        return self.get_collection().delete_by_filter("default", self._compile_filter(filter))
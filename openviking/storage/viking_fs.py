@@ -22,9 +22,14 @@ from datetime import datetime
 from pathlib import PurePath
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+from pyagfs import FileHandle
 from pyagfs.exceptions import AGFSHTTPError
 
 from openviking.server.identity import RequestContext, Role
+from openviking.storage.async_agfs import AsyncAGFSClient, run_agfs
+from openviking.storage.query_cache import get_query_cache
+from openviking.storage.relation_index import get_relation_index
+from openviking.storage.summary_cache import ABSTRACT, OVERVIEW, get_summary_cache
 from openviking.utils.time_utils import format_simplified, get_current_timestamp, parse_iso_datetime
 from openviking_cli.session.user_id import UserIdentifier
 from openviking_cli.utils.logger import get_logger
@@ -36,6 +41,30 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+_APPEND_HANDLE_FLAGS = FileHandle.O_WRONLY | FileHandle.O_APPEND | FileHandle.O_CREATE
+
+
+def _handles_unsupported(error: Exception) -> bool:
+    """Whether an open_handle failure means the AGFS backend has no file handles."""
+    if isinstance(error, (AttributeError, NotImplementedError)):
+        return True
+    if type(error).__name__ == "AGFSNotSupportedError":
+        return True
+    message = str(error).lower()
+    return "not supported" in message or "not implemented" in message
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Whether an AGFS call failed because the path (or its parent) does not exist."""
+    if isinstance(error, FileNotFoundError):
+        return True
+    if isinstance(error, AGFSHTTPError) and error.status_code == 404:
+        return True
+    message = str(error).lower()
+    return any(
+        marker in message for marker in ("not found", "no such file or directory", "does not exist")
+    )
+
 
 # ========== Dataclass ==========
 
@@ -74,6 +103,7 @@ def init_viking_fs(
     vector_store: Optional["VikingVectorIndexBackend"] = None,
     timeout: int = 10,
     enable_recorder: bool = False,
+    search_frontier_batch_size: int = 1,
 ) -> "VikingFS":
     """Initialize VikingFS singleton.
 
@@ -84,6 +114,7 @@ def init_viking_fs(
         rerank_config: Rerank configuration
         vector_store: Vector store instance
         enable_recorder: Whether to enable IO recording
+        search_frontier_batch_size: Directories expanded per vector query in find/search
     """
     global _instance
 
@@ -92,6 +123,7 @@ def init_viking_fs(
         query_embedder=query_embedder,
         rerank_config=rerank_config,
         vector_store=vector_store,
+        search_frontier_batch_size=search_frontier_batch_size,
     )
 
     if enable_recorder:
@@ -156,6 +188,9 @@ class VikingFS:
     Supports two modes:
     - HTTP mode: Use AGFSClient to connect to AGFS server via HTTP
     - Binding mode: Use AGFSBindingClient to directly use AGFS implementation
+
+    AGFS clients are synchronous; every call is awaited through AsyncAGFSClient so it
+    runs on the shared AGFS I/O executor instead of blocking the event loop.
     """
 
     def __init__(
@@ -165,11 +200,15 @@ class VikingFS:
         rerank_config: Optional["RerankConfig"] = None,
         vector_store: Optional["VikingVectorIndexBackend"] = None,
         timeout: int = 10,
+        search_frontier_batch_size: int = 1,
     ):
         self.agfs = agfs
         self.query_embedder = query_embedder
         self.rerank_config = rerank_config
         self.vector_store = vector_store
+        self.search_frontier_batch_size = search_frontier_batch_size
+        # AGFS mounts (e.g. "local") whose backend cannot open append handles
+        self._no_append_handles: set = set()
         self._bound_ctx: contextvars.ContextVar[Optional[RequestContext]] = contextvars.ContextVar(
             "vikingfs_bound_ctx", default=None
         )
@@ -193,11 +232,28 @@ class VikingFS:
         finally:
             self._bound_ctx.reset(token)
 
+    @property
+    def agfs(self) -> Any:
+        """Underlying synchronous AGFS client."""
+        return self._agfs
+
+    @agfs.setter
+    def agfs(self, client: Any) -> None:
+        # Keep the async facade in sync when the client is swapped (e.g. by the IO recorder).
+        self._agfs = client
+        self._async_agfs = AsyncAGFSClient(client)
+
     def _ensure_access(self, uri: str, ctx: Optional[RequestContext]) -> None:
         real_ctx = self._ctx_or_default(ctx)
         if not self._is_accessible(uri, real_ctx):
             raise PermissionError(f"Access denied for {uri}")
 
+    @staticmethod
+    def _invalidate_caches(path: str, recursive: bool = False) -> None:
+        """Drop cached summaries and relation tables affected by a write to ``path``."""
+        get_summary_cache().invalidate(path, recursive=recursive)
+        get_relation_index().invalidate(path, recursive=recursive)
+
     # ========== AGFS Basic Commands ==========
 
     async def read(
@@ -210,7 +266,7 @@ class VikingFS:
         """Read file"""
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
-        result = self.agfs.read(path, offset, size)
+        result = await self._async_agfs.read(path, offset, size)
         if isinstance(result, bytes):
             return result
         elif result is not None and hasattr(result, "content"):
@@ -229,7 +285,9 @@ class VikingFS:
         path = self._uri_to_path(uri, ctx=ctx)
         if isinstance(data, str):
             data = data.encode("utf-8")
-        return self.agfs.write(path, data)
+        result = await self._async_agfs.write(path, data)
+        self._invalidate_caches(path)
+        return result
 
     async def mkdir(
         self,
@@ -251,7 +309,7 @@ class VikingFS:
             except Exception:
                 pass
 
-        self.agfs.mkdir(path)
+        await self._async_agfs.mkdir(path)
 
     async def rm(
         self, uri: str, recursive: bool = False, ctx: Optional[RequestContext] = None
@@ -264,10 +322,11 @@ class VikingFS:
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
         target_uri = self._path_to_uri(path, ctx=ctx)
-        uris_to_delete = await self._collect_uris(path, recursive, ctx=ctx)
-        uris_to_delete.append(target_uri)
-        result = self.agfs.rm(path, recursive=recursive)
-        await self._delete_from_vector_store(uris_to_delete, ctx=ctx)
+        result = await self._async_agfs.rm(path, recursive=recursive)
+        self._invalidate_caches(path, recursive=True)
+        # Records below target_uri are removed by prefix, no tree walk needed.
+        await self._delete_from_vector_store([target_uri], ctx=ctx)
+        get_query_cache().invalidate([target_uri], self._ctx_or_default(ctx).account_id)
         return result
 
     async def mv(
@@ -282,18 +341,24 @@ class VikingFS:
         old_path = self._uri_to_path(old_uri, ctx=ctx)
         new_path = self._uri_to_path(new_uri, ctx=ctx)
         target_uri = self._path_to_uri(old_path, ctx=ctx)
-        uris_to_move = await self._collect_uris(old_path, recursive=True, ctx=ctx)
-        uris_to_move.append(target_uri)
+        new_target_uri = self._path_to_uri(new_path, ctx=ctx)
 
         try:
-            result = self.agfs.mv(old_path, new_path)
-            await self._update_vector_store_uris(uris_to_move, old_uri, new_uri, ctx=ctx)
+            result = await self._async_agfs.mv(old_path, new_path)
+            await self._update_vector_store_uris(target_uri, new_target_uri, ctx=ctx)
             return result
         except AGFSHTTPError as e:
             if e.status_code == 404:
-                await self._delete_from_vector_store(uris_to_move, ctx=ctx)
+                # delete_uris() also removes records below target_uri.
+                await self._delete_from_vector_store([target_uri], ctx=ctx)
                 logger.info(f"[VikingFS] mv source not found, cleaned orphan index: {old_uri}")
             raise
+        finally:
+            get_query_cache().invalidate(
+                [target_uri, new_target_uri], self._ctx_or_default(ctx).account_id
+            )
+            self._invalidate_caches(old_path, recursive=True)
+            self._invalidate_caches(new_path, recursive=True)
 
     async def grep(
         self,
@@ -305,7 +370,7 @@ class VikingFS:
         """Content search by pattern or keywords."""
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
-        result = self.agfs.grep(path, pattern, True, case_insensitive)
+        result = await self._async_agfs.grep(path, pattern, True, case_insensitive)
         if result.get("matches", None) is None:
             result["matches"] = []
         new_matches = []
@@ -327,7 +392,7 @@ class VikingFS:
         """
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
-        return self.agfs.stat(path)
+        return await self._async_agfs.stat(path)
 
     async def glob(
         self,
@@ -430,7 +495,7 @@ class VikingFS:
         async def _walk(current_path: str, current_rel: str, current_depth: int):
             if len(all_entries) >= node_limit or current_depth > level_limit:
                 return
-            for entry in self._ls_entries(current_path):
+            for entry in await self._ls_entries(current_path):
                 if len(all_entries) >= node_limit:
                     break
                 name = entry.get("name", "")
@@ -471,7 +536,7 @@ class VikingFS:
         async def _walk(current_path: str, current_rel: str, current_depth: int):
             if len(all_entries) >= node_limit or current_depth > level_limit:
                 return
-            for entry in self._ls_entries(current_path):
+            for entry in await self._ls_entries(current_path):
                 if len(all_entries) >= node_limit:
                     break
                 name = entry.get("name", "")
@@ -511,12 +576,9 @@ class VikingFS:
         """Read directory's L0 summary (.abstract.md)."""
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
-        info = self.agfs.stat(path)
-        if not info.get("isDir"):
-            raise ValueError(f"{uri} is not a directory")
-        file_path = f"{path}/.abstract.md"
-        content = self.agfs.read(file_path)
-        return self._handle_agfs_content(content)
+        return await get_summary_cache().get_or_load(
+            path, ABSTRACT, lambda: self._read_summary(uri, path, ".abstract.md")
+        )
 
     async def overview(
         self,
@@ -526,11 +588,16 @@ class VikingFS:
         """Read directory's L1 overview (.overview.md)."""
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
-        info = self.agfs.stat(path)
+        return await get_summary_cache().get_or_load(
+            path, OVERVIEW, lambda: self._read_summary(uri, path, ".overview.md")
+        )
+
+    async def _read_summary(self, uri: str, path: str, filename: str) -> str:
+        """Read a summary file of the directory at AGFS ``path``."""
+        info = await self._async_agfs.stat(path)
         if not info.get("isDir"):
             raise ValueError(f"{uri} is not a directory")
-        file_path = f"{path}/.overview.md"
-        content = self.agfs.read(file_path)
+        content = await self._async_agfs.read(f"{path}/{filename}")
         return self._handle_agfs_content(content)
 
     async def relations(
@@ -592,10 +659,21 @@ class VikingFS:
         if not embedder:
             raise RuntimeError("Embedder not configured.")
 
+        real_ctx = self._ctx_or_default(ctx)
+        cache = get_query_cache()
+        cache_key = cache.make_key(
+            "find", real_ctx, query, target_uri, filter, limit, score_threshold
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = cache.generation
+
         retriever = HierarchicalRetriever(
             storage=storage,
             embedder=embedder,
             rerank_config=self.rerank_config,
+            frontier_batch_size=self.search_frontier_batch_size,
         )
 
         # Infer context_type (None = search all types)
@@ -610,7 +688,7 @@ class VikingFS:
 
         result = await retriever.retrieve(
             typed_query,
-            ctx=self._ctx_or_default(ctx),
+            ctx=real_ctx,
             limit=limit,
             score_threshold=score_threshold,
             scope_dsl=filter,
@@ -626,11 +704,13 @@ class VikingFS:
             elif ctx.context_type == ContextType.SKILL:
                 skills.append(ctx)
 
-        return FindResult(
+        find_result = FindResult(
             memories=memories,
             resources=resources,
             skills=skills,
         )
+        cache.put(cache_key, find_result, real_ctx.account_id, target_uri, generation)
+        return find_result
 
     async def search(
         self,
@@ -670,6 +750,23 @@ class VikingFS:
         if target_uri:
             self._ensure_access(target_uri, ctx)
 
+        real_ctx = self._ctx_or_default(ctx)
+        cache = get_query_cache()
+        cache_key = cache.make_key(
+            "search",
+            real_ctx,
+            query,
+            target_uri,
+            filter,
+            limit,
+            score_threshold,
+            extra=session_info,
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        generation = cache.generation
+
         # When target_uri exists: read abstract, infer context_type
         target_context_type: Optional[ContextType] = None
         target_abstract = ""
@@ -715,25 +812,24 @@ class VikingFS:
                     for ctx_type in [ContextType.MEMORY, ContextType.RESOURCE, ContextType.SKILL]
                 ]
 
-        # Concurrent execution
+        # One batched global search for all typed queries, then concurrent
+        # recursive searches
         storage = self._get_vector_store()
         embedder = self._get_embedder()
         retriever = HierarchicalRetriever(
             storage=storage,
             embedder=embedder,
             rerank_config=self.rerank_config,
+            frontier_batch_size=self.search_frontier_batch_size,
         )
 
-        async def _execute(tq: TypedQuery):
-            return await retriever.retrieve(
-                tq,
-                ctx=self._ctx_or_default(ctx),
-                limit=limit,
-                score_threshold=score_threshold,
-                scope_dsl=filter,
-            )
-
-        query_results = await asyncio.gather(*[_execute(tq) for tq in typed_queries])
+        query_results = await retriever.retrieve_many(
+            typed_queries,
+            ctx=real_ctx,
+            limit=limit,
+            score_threshold=score_threshold,
+            scope_dsl=filter,
+        )
 
         # Aggregate results to FindResult
         memories, resources, skills = [], [], []
@@ -746,13 +842,15 @@ class VikingFS:
                 elif ctx.context_type == ContextType.SKILL:
                     skills.append(ctx)
 
-        return FindResult(
+        find_result = FindResult(
             memories=memories,
             resources=resources,
             skills=skills,
             query_plan=query_plan,
             query_results=query_results,
         )
+        cache.put(cache_key, find_result, real_ctx.account_id, target_uri, generation)
+        return find_result
 
     # ========== Relation Management ==========
 
@@ -780,6 +878,7 @@ class VikingFS:
         entries.append(RelationEntry(id=link_id, uris=uris, reason=reason))
 
         await self._write_relation_table(from_path, entries)
+        get_query_cache().invalidate([from_uri], self._ctx_or_default(ctx).account_id)
         logger.info(f"[VikingFS] Created link: {from_uri} -> {uris}")
 
     async def unlink(
@@ -813,6 +912,7 @@ class VikingFS:
                 logger.info(f"[VikingFS] Removed empty entry: {entry_to_modify.id}")
 
             await self._write_relation_table(from_path, entries)
+            get_query_cache().invalidate([from_uri], self._ctx_or_default(ctx).account_id)
             logger.info(f"[VikingFS] Removed link: {from_uri} -> {uri}")
 
         except Exception as e:
@@ -825,7 +925,8 @@ class VikingFS:
         """Get relation table."""
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
-        return await self._read_relation_table(path)
+        tables = await get_relation_index().get_many([path], self._load_relation_table)
+        return tables[path.rstrip("/")]
 
     # ========== URI Conversion ==========
 
@@ -867,13 +968,13 @@ class VikingFS:
     _INTERNAL_DIRS = {"_system"}
     _ROOT_PATH = "/local"
 
-    def _ls_entries(self, path: str) -> List[Dict[str, Any]]:
+    async def _ls_entries(self, path: str) -> List[Dict[str, Any]]:
         """List directory entries, filtering out internal directories.
 
         At account root (/local/{account}), uses VALID_SCOPES whitelist.
         At other levels, uses _INTERNAL_DIRS blacklist.
         """
-        entries = self.agfs.ls(path)
+        entries = await self._async_agfs.ls(path)
         parts = [p for p in path.strip("/").split("/") if p]
         if len(parts) == 2 and parts[0] == "local":
             return [e for e in entries if e.get("name") in VikingURI.VALID_SCOPES]
@@ -1025,30 +1126,6 @@ class VikingFS:
 
     # ========== Vector Sync Helper Methods ==========
 
-    async def _collect_uris(
-        self, path: str, recursive: bool, ctx: Optional[RequestContext] = None
-    ) -> List[str]:
-        """Recursively collect all URIs (for rm/mv)."""
-        uris = []
-
-        async def _collect(p: str):
-            try:
-                for entry in self._ls_entries(p):
-                    name = entry.get("name", "")
-                    if name in [".", ".."]:
-                        continue
-                    full_path = f"{p}/{name}".replace("//", "/")
-                    if entry.get("isDir"):
-                        if recursive:
-                            await _collect(full_path)
-                    else:
-                        uris.append(self._path_to_uri(full_path, ctx=ctx))
-            except Exception:
-                pass
-
-        await _collect(path)
-        return uris
-
     async def _delete_from_vector_store(
         self, uris: List[str], ctx: Optional[RequestContext] = None
     ) -> None:
@@ -1070,51 +1147,26 @@ class VikingFS:
 
     async def _update_vector_store_uris(
         self,
-        uris: List[str],
-        old_base: str,
-        new_base: str,
+        old_uri: str,
+        new_uri: str,
         ctx: Optional[RequestContext] = None,
     ) -> None:
         """Update URIs in vector store (when moving files).
 
-        Preserves vector data, only updates uri and parent_uri fields, no need to regenerate embeddings.
+        Rewrites uri/parent_uri of every record under old_uri in one bulk
+        operation; vectors are kept, so no embeddings are regenerated.
         """
         vector_store = self._get_vector_store()
         if not vector_store:
             return
 
-        old_base_uri = self._path_to_uri(old_base, ctx=ctx)
-        new_base_uri = self._path_to_uri(new_base, ctx=ctx)
-
-        for uri in uris:
-            try:
-                records = await vector_store.get_context_by_uri(
-                    account_id=self._ctx_or_default(ctx).account_id,
-                    uri=uri,
-                    limit=1,
-                )
-
-                if not records or "id" not in records[0]:
-                    continue
-
-                record = records[0]
-
-                new_uri = uri.replace(old_base_uri, new_base_uri, 1)
-
-                old_parent_uri = record.get("parent_uri", "")
-                new_parent_uri = (
-                    old_parent_uri.replace(old_base_uri, new_base_uri, 1) if old_parent_uri else ""
-                )
-
-                await vector_store.update_uri_mapping(
-                    ctx=self._ctx_or_default(ctx),
-                    uri=uri,
-                    new_uri=new_uri,
-                    new_parent_uri=new_parent_uri,
-                )
-                logger.info(f"[VikingFS] Updated URI: {uri} -> {new_uri}")
-            except Exception as e:
-                logger.warning(f"[VikingFS] Failed to update {uri} in vector store: {e}")
+        try:
+            renamed = await vector_store.rename_uri_prefix(
+                self._ctx_or_default(ctx), old_uri, new_uri
+            )
+            logger.info(f"[VikingFS] Updated {renamed} URIs: {old_uri} -> {new_uri}")
+        except Exception as e:
+            logger.warning(f"[VikingFS] Failed to update {old_uri} in vector store: {e}")
 
     def _get_vector_store(self) -> Optional["VikingVectorIndexBackend"]:
         """Get vector store instance."""
@@ -1135,7 +1187,7 @@ class VikingFS:
         for i in range(1, len(parts)):
             parent = "/" + "/".join(parts[:i])
             try:
-                self.agfs.mkdir(parent)
+                await self._async_agfs.mkdir(parent)
             except Exception as e:
                 # Log the error but continue, as parent might already exist
                 # or we might be creating it in the next iteration
@@ -1145,16 +1197,19 @@ class VikingFS:
     # ========== Relation Table Internal Methods ==========
 
     async def _read_relation_table(self, dir_path: str) -> List[RelationEntry]:
-        """Read .relations.json."""
+        """Read .relations.json.
+
+        A missing file is an empty table; any other read or parse error is
+        raised, so that callers never rewrite a table they failed to read.
+        """
         table_path = f"{dir_path}/.relations.json"
         try:
-            content = self._handle_agfs_read(self.agfs.read(table_path))
+            content = self._handle_agfs_read(await self._async_agfs.read(table_path))
             data = json.loads(content.decode("utf-8"))
-        except FileNotFoundError:
-            return []
-        except Exception:
-            # logger.warning(f"[VikingFS] Failed to read relation table {table_path}: {e}")
-            return []
+        except Exception as e:
+            if _is_not_found(e):
+                return []
+            raise
 
         entries = []
         # Compatible with old format (nested) and new format (flat)
@@ -1170,6 +1225,14 @@ class VikingFS:
                         entries.append(RelationEntry.from_dict(entry_data))
         return entries
 
+    async def _load_relation_table(self, dir_path: str) -> Optional[List[RelationEntry]]:
+        """Relation index loader: None marks a table that could not be read."""
+        try:
+            return await self._read_relation_table(dir_path)
+        except Exception as e:
+            logger.warning(f"[VikingFS] Failed to read relation table of {dir_path}: {e}")
+            return None
+
     async def _write_relation_table(self, dir_path: str, entries: List[RelationEntry]) -> None:
         """Write .relations.json."""
         # Use flat list format
@@ -1179,7 +1242,8 @@ class VikingFS:
         table_path = f"{dir_path}/.relations.json"
         if isinstance(content, str):
             content = content.encode("utf-8")
-        self.agfs.write(table_path, content)
+        await self._async_agfs.write(table_path, content)
+        get_relation_index().set(dir_path, entries)
 
     # ========== Batch Read (backward compatible) ==========
 
@@ -1187,18 +1251,19 @@ class VikingFS:
         self, uris: List[str], level: str = "l0", ctx: Optional[RequestContext] = None
     ) -> Dict[str, str]:
         """Batch read content from multiple URIs."""
-        results = {}
-        for uri in uris:
+
+        async def read_one(uri: str) -> Optional[str]:
             try:
-                content = ""
                 if level == "l0":
-                    content = await self.abstract(uri, ctx=ctx)
-                elif level == "l1":
-                    content = await self.overview(uri, ctx=ctx)
-                results[uri] = content
+                    return await self.abstract(uri, ctx=ctx)
+                if level == "l1":
+                    return await self.overview(uri, ctx=ctx)
+                return ""
             except Exception:
-                pass
-        return results
+                return None
+
+        contents = await asyncio.gather(*(read_one(uri) for uri in uris))
+        return {uri: content for uri, content in zip(uris, contents) if content is not None}
 
     # ========== Other Preserved Methods ==========
 
@@ -1215,7 +1280,8 @@ class VikingFS:
 
         if isinstance(content, str):
             content = content.encode("utf-8")
-        self.agfs.write(path, content)
+        await self._async_agfs.write(path, content)
+        self._invalidate_caches(path)
 
     async def read_file(
         self,
@@ -1237,7 +1303,7 @@ class VikingFS:
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
         try:
-            content = self.agfs.read(path)
+            content = await self._async_agfs.read(path)
         except Exception as e:
             raise FileNotFoundError(f"Failed to read {uri}: {e}")
         text = self._handle_agfs_content(content)
@@ -1256,7 +1322,7 @@ class VikingFS:
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
         try:
-            return self._handle_agfs_read(self.agfs.read(path))
+            return self._handle_agfs_read(await self._async_agfs.read(path))
         except Exception as e:
             raise FileNotFoundError(f"Failed to read {uri}: {e}")
 
@@ -1270,7 +1336,8 @@ class VikingFS:
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
         await self._ensure_parent_dirs(path)
-        self.agfs.write(path, content)
+        await self._async_agfs.write(path, content)
+        self._invalidate_caches(path)
 
     async def append_file(
         self,
@@ -1278,25 +1345,73 @@ class VikingFS:
         content: str,
         ctx: Optional[RequestContext] = None,
     ) -> None:
-        """Append content to file."""
+        """Append content to file.
+
+        Writes through an AGFS ``O_APPEND`` file handle, so the cost of an append
+        depends on ``content`` only, not on the size of the file. Backends without
+        file handles fall back to read + rewrite.
+        """
         self._ensure_access(uri, ctx)
         path = self._uri_to_path(uri, ctx=ctx)
+        data = content.encode("utf-8")
 
         try:
-            existing = ""
-            try:
-                existing_bytes = self._handle_agfs_read(self.agfs.read(path))
-                existing = self._decode_bytes(existing_bytes)
-            except Exception:
-                pass
-
-            await self._ensure_parent_dirs(path)
-            self.agfs.write(path, (existing + content).encode("utf-8"))
+            if not await self._append_with_handle(path, data):
+                await self._append_by_rewrite(path, content)
+            self._invalidate_caches(path)
 
         except Exception as e:
             logger.error(f"[VikingFS] Failed to append to file {uri}: {e}")
             raise IOError(f"Failed to append to file {uri}: {e}")
 
+    async def _append_with_handle(self, path: str, data: bytes) -> bool:
+        """Append through an AGFS file handle. Returns False if handles cannot be used.
+
+        Only opening the handle is retried or answered with False; once the
+        handle is open the data may have landed, so later errors propagate
+        instead of appending the same content again.
+        """
+        mount = path.lstrip("/").split("/", 1)[0]
+        if mount in self._no_append_handles:
+            return False
+        try:
+            handle = await run_agfs(self.agfs.open_handle, path, flags=_APPEND_HANDLE_FLAGS)
+        except Exception as e:
+            if _handles_unsupported(e):
+                logger.info(f"[VikingFS] AGFS mount /{mount} has no file handles: {e}")
+                self._no_append_handles.add(mount)
+                return False
+            if not _is_not_found(e):
+                raise
+            # The parent directory is missing: create it and open once more.
+            await self._ensure_parent_dirs(path)
+            try:
+                handle = await run_agfs(self.agfs.open_handle, path, flags=_APPEND_HANDLE_FLAGS)
+            except Exception as e:
+                logger.debug(f"[VikingFS] Handle open of {path} failed, rewriting instead: {e}")
+                return False
+
+        try:
+            await run_agfs(handle.write, data)
+        finally:
+            try:
+                await run_agfs(handle.close)
+            except Exception as e:
+                # The data is written; the lease of the handle expires on its own.
+                logger.warning(f"[VikingFS] Failed to close append handle of {path}: {e}")
+        return True
+
+    async def _append_by_rewrite(self, path: str, content: str) -> None:
+        existing = ""
+        try:
+            existing_bytes = self._handle_agfs_read(await self._async_agfs.read(path))
+            existing = self._decode_bytes(existing_bytes)
+        except Exception:
+            pass
+
+        await self._ensure_parent_dirs(path)
+        await self._async_agfs.write(path, (existing + content).encode("utf-8"))
+
     async def ls(
         self,
         uri: str,
@@ -1339,7 +1454,7 @@ class VikingFS:
         path = self._uri_to_path(uri, ctx=ctx)
         real_ctx = self._ctx_or_default(ctx)
         try:
-            entries = self._ls_entries(path)
+            entries = await self._ls_entries(path)
         except Exception as e:
             raise FileNotFoundError(f"Failed to list {uri}: {e}")
         # basic info
@@ -1383,7 +1498,7 @@ class VikingFS:
         path = self._uri_to_path(uri, ctx=ctx)
         real_ctx = self._ctx_or_default(ctx)
         try:
-            entries = self._ls_entries(path)
+            entries = await self._ls_entries(path)
             # AGFS returns read-only structure, need to create new dict
             all_entries = []
             for entry in entries:
@@ -1413,10 +1528,12 @@ class VikingFS:
         self._ensure_access(to_uri, ctx)
         from_path = self._uri_to_path(from_uri, ctx=ctx)
         to_path = self._uri_to_path(to_uri, ctx=ctx)
-        content = self.agfs.read(from_path)
+        content = await self._async_agfs.read(from_path)
         await self._ensure_parent_dirs(to_path)
-        self.agfs.write(to_path, content)
-        self.agfs.rm(from_path)
+        await self._async_agfs.write(to_path, content)
+        await self._async_agfs.rm(from_path)
+        self._invalidate_caches(from_path)
+        self._invalidate_caches(to_path)
 
     # ========== Temp File Operations (backward compatible) ==========
 
@@ -1428,7 +1545,7 @@ class VikingFS:
         """Delete temp directory and its contents."""
         path = self._uri_to_path(temp_uri, ctx=ctx)
         try:
-            for entry in self._ls_entries(path):
+            for entry in await self._ls_entries(path):
                 name = entry.get("name", "")
                 if name in [".", ".."]:
                     continue
@@ -1436,10 +1553,12 @@ class VikingFS:
                 if entry.get("isDir"):
                     await self.delete_temp(f"{temp_uri}/{name}", ctx=ctx)
                 else:
-                    self.agfs.rm(entry_path)
-            self.agfs.rm(path)
+                    await self._async_agfs.rm(entry_path)
+            await self._async_agfs.rm(path)
         except Exception as e:
             logger.warning(f"[VikingFS] Failed to delete temp {temp_uri}: {e}")
+        finally:
+            self._invalidate_caches(path, recursive=True)
 
     async def get_relations(self, uri: str, ctx: Optional[RequestContext] = None) -> List[str]:
         """Get all related URIs (backward compatible)."""
@@ -1451,6 +1570,34 @@ class VikingFS:
                     all_uris.append(related)
         return all_uris
 
+    async def get_relations_many(
+        self, uris: List[str], ctx: Optional[RequestContext] = None
+    ) -> Dict[str, List[str]]:
+        """Get the related URIs of several URIs with one batched index lookup.
+
+        Returns:
+            {uri: [related_uri, ...]} for every requested URI; URIs the caller
+            cannot access map to an empty list.
+        """
+        real_ctx = self._ctx_or_default(ctx)
+        result: Dict[str, List[str]] = {}
+        paths: Dict[str, str] = {}
+        for uri in dict.fromkeys(uris):
+            result[uri] = []
+            if uri and self._is_accessible(uri, real_ctx):
+                paths[uri] = self._uri_to_path(uri, ctx=ctx).rstrip("/")
+        tables = await get_relation_index().get_many(
+            list(paths.values()), self._load_relation_table
+        )
+        for uri, path in paths.items():
+            result[uri] = [
+                related
+                for entry in tables[path]
+                for related in entry.uris
+                if self._is_accessible(related, real_ctx)
+            ]
+        return result
+
     async def get_relations_with_content(
         self,
         uri: str,
@@ -1498,7 +1645,7 @@ class VikingFS:
         try:
             await self._ensure_parent_dirs(path)
             try:
-                self.agfs.mkdir(path)
+                await self._async_agfs.mkdir(path)
             except Exception as e:
                 if "exist" not in str(e).lower():
                     raise
@@ -1507,15 +1654,17 @@ class VikingFS:
                 content_path = f"{path}/{content_filename}"
                 if isinstance(content, str):
                     content = content.encode("utf-8")
-                self.agfs.write(content_path, content)
+                await self._async_agfs.write(content_path, content)
 
             if abstract:
                 abstract_path = f"{path}/.abstract.md"
-                self.agfs.write(abstract_path, abstract.encode("utf-8"))
+                await self._async_agfs.write(abstract_path, abstract.encode("utf-8"))
+                self._invalidate_caches(abstract_path)
 
             if overview:
                 overview_path = f"{path}/.overview.md"
-                self.agfs.write(overview_path, overview.encode("utf-8"))
+                await self._async_agfs.write(overview_path, overview.encode("utf-8"))
+                self._invalidate_caches(overview_path)
 
         except Exception as e:
             logger.error(f"[VikingFS] Failed to write {uri}: {e}")
@@ -4,11 +4,14 @@
 
 from __future__ import annotations
 
+import threading
 import uuid
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
 
 from openviking.server.identity import RequestContext, Role
-from openviking.storage.expr import And, Eq, FilterExpr, In, Or, RawDSL
+from openviking.storage.active_count_buffer import ActiveCountBuffer, PendingCounts
+from openviking.storage.expr import And, Eq, FilterExpr, In, Or, RawDSL, filter_key
 from openviking.storage.vectordb.collection.collection import Collection
 from openviking.storage.vectordb.utils.logging_init import init_cpp_logging
 from openviking.storage.vectordb_adapters import CollectionAdapter, create_collection_adapter
@@ -23,6 +26,7 @@ class VikingVectorIndexBackend:
 
     DEFAULT_INDEX_NAME = "default"
     ALLOWED_CONTEXT_TYPES = {"resource", "skill", "memory"}
+    SCOPE_FILTER_CACHE_SIZE = 1024
 
     def __init__(self, config: Optional[VectorDBBackendConfig]):
         if config is None:
@@ -46,6 +50,13 @@ class VikingVectorIndexBackend:
 
         self._collection_config: Dict[str, Any] = {}
         self._meta_data_cache: Dict[str, Any] = {}
+        self._active_counts = ActiveCountBuffer(
+            self._flush_active_counts,
+            flush_interval=config.active_count_flush_interval,
+        )
+        # Compiled search scopes keyed by their inputs, see _build_scope_filter().
+        self._scope_filters: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._scope_filters_lock = threading.Lock()
 
     @property
     def collection_name(self) -> str:
@@ -159,6 +170,36 @@ class VikingVectorIndexBackend:
         ids = self._adapter.upsert(payload)
         return ids[0] if ids else ""
 
+    async def upsert_many(self, data: List[Dict[str, Any]]) -> List[str]:
+        """Upsert several records with a single collection write.
+
+        Records are validated the same way as in upsert(); a record with an
+        invalid context_type is skipped and gets "" at its position in the
+        returned id list.
+        """
+        ids = [""] * len(data)
+        payloads: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        for i, item in enumerate(data):
+            payload = dict(item)
+            context_type = payload.get("context_type")
+            if context_type and context_type not in self.ALLOWED_CONTEXT_TYPES:
+                logger.warning(
+                    "Invalid context_type: %s. Must be one of %s",
+                    context_type,
+                    sorted(self.ALLOWED_CONTEXT_TYPES),
+                )
+                continue
+            if not payload.get("id"):
+                payload["id"] = str(uuid.uuid4())
+            payloads.append(self._filter_known_fields(payload))
+            positions.append(i)
+
+        if payloads:
+            for i, record_id in zip(positions, self._adapter.upsert(payloads)):
+                ids[i] = record_id
+        return ids
+
     async def get(self, ids: List[str]) -> List[Dict[str, Any]]:
         try:
             return self._adapter.get(ids)
@@ -237,6 +278,25 @@ class VikingVectorIndexBackend:
             output_fields=output_fields,
         )
 
+    async def search_batch(
+        self,
+        queries: List[Dict[str, Any]],
+        output_fields: Optional[List[str]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several vector searches as one batch.
+
+        Each query dict takes the vector-search arguments of search()
+        (query_vector, sparse_query_vector, filter, limit, offset). The local
+        backend scores the whole batch in one pass over the index.
+        """
+        if not queries:
+            return []
+        try:
+            return self._adapter.query_batch(queries, output_fields=output_fields)
+        except Exception as e:
+            logger.error("Error batch querying collection %s: %s", self._collection_name, e)
+            return [[] for _ in queries]
+
     async def filter(
         self,
         filter: Dict[str, Any] | FilterExpr,
@@ -256,43 +316,13 @@ class VikingVectorIndexBackend:
         )
 
     async def remove_by_uri(self, uri: str) -> int:
+        """Remove the record of uri and, for directories, every record below it."""
         try:
-            target_records = await self.filter(
-                {"op": "must", "field": "uri", "conds": [uri]},
-                limit=10,
-            )
-            if not target_records:
-                return 0
-
-            total_deleted = 0
-            if any(r.get("level") in [0, 1] for r in target_records):
-                total_deleted += await self._remove_descendants(parent_uri=uri)
-
-            ids = [r.get("id") for r in target_records if r.get("id")]
-            if ids:
-                total_deleted += await self.delete(ids)
-            return total_deleted
+            return self._adapter.delete_subtree(uri)
         except Exception as e:
             logger.error("Error removing URI %s: %s", uri, e)
             return 0
 
-    async def _remove_descendants(self, parent_uri: str) -> int:
-        total_deleted = 0
-        children = await self.filter(
-            {"op": "must", "field": "parent_uri", "conds": [parent_uri]},
-            limit=100000,
-        )
-        for child in children:
-            child_uri = child.get("uri")
-            level = child.get("level", 2)
-            if level in [0, 1] and child_uri:
-                total_deleted += await self._remove_descendants(parent_uri=child_uri)
-            child_id = child.get("id")
-            if child_id:
-                await self.delete([child_id])
-                total_deleted += 1
-        return total_deleted
-
     # =========================================================================
     # Semantic Context Operations (Tenant-Aware)
     # =========================================================================
@@ -351,6 +381,46 @@ class VikingVectorIndexBackend:
             limit=limit,
         )
 
+    async def search_global_roots_batch_in_tenant(
+        self,
+        ctx: RequestContext,
+        queries: List[Dict[str, Any]],
+        extra_filter: Optional[FilterExpr | Dict[str, Any]] = None,
+        limit: int = 10,
+    ) -> List[List[Dict[str, Any]]]:
+        """search_global_roots_in_tenant for several queries in one batch.
+
+        Each query dict holds query_vector, sparse_query_vector, context_type
+        and target_directories. Queries without a dense vector get no results,
+        as with search_global_roots_in_tenant.
+        """
+        batch = []
+        positions = []
+        for i, query in enumerate(queries):
+            if not query.get("query_vector"):
+                continue
+            positions.append(i)
+            batch.append(
+                {
+                    "query_vector": query["query_vector"],
+                    "sparse_query_vector": query.get("sparse_query_vector"),
+                    "filter": self._merge_filters(
+                        self._build_scope_filter(
+                            ctx=ctx,
+                            context_type=query.get("context_type"),
+                            target_directories=query.get("target_directories"),
+                            extra_filter=extra_filter,
+                        ),
+                        In("level", [0, 1]),
+                    ),
+                    "limit": limit,
+                }
+            )
+        results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        for i, records in zip(positions, await self.search_batch(batch)):
+            results[i] = records
+        return results
+
     async def search_children_in_tenant(
         self,
         ctx: RequestContext,
@@ -378,6 +448,84 @@ class VikingVectorIndexBackend:
             limit=limit,
         )
 
+    async def search_children_many_in_tenant(
+        self,
+        ctx: RequestContext,
+        parent_uris: List[str],
+        query_vector: Optional[List[float]],
+        sparse_query_vector: Optional[Dict[str, float]] = None,
+        context_type: Optional[str] = None,
+        target_directories: Optional[List[str]] = None,
+        extra_filter: Optional[FilterExpr | Dict[str, Any]] = None,
+        limit: int = 10,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search under several parent directories with one vector query.
+
+        Returns, for every parent, the same records search_children_in_tenant
+        would return for it. A single query limited to ``limit * len(parent_uris)``
+        is split per parent; only when that limit truncated the results are the
+        parents left with fewer than ``limit`` records queried again on their own.
+        """
+        if len(parent_uris) <= 1:
+            return {
+                uri: await self.search_children_in_tenant(
+                    ctx=ctx,
+                    parent_uri=uri,
+                    query_vector=query_vector,
+                    sparse_query_vector=sparse_query_vector,
+                    context_type=context_type,
+                    target_directories=target_directories,
+                    extra_filter=extra_filter,
+                    limit=limit,
+                )
+                for uri in parent_uris
+            }
+
+        batch_limit = limit * len(parent_uris)
+        merged_filter = self._merge_filters(
+            In("parent_uri", list(parent_uris)),
+            self._build_scope_filter(
+                ctx=ctx,
+                context_type=context_type,
+                target_directories=target_directories,
+                extra_filter=extra_filter,
+            ),
+        )
+        results = await self.search(
+            query_vector=query_vector,
+            sparse_query_vector=sparse_query_vector,
+            filter=merged_filter,
+            limit=batch_limit,
+        )
+
+        # parent_uri is a path field: a parent matches records anywhere below it.
+        grouped: Dict[str, List[Dict[str, Any]]] = {uri: [] for uri in parent_uris}
+        for record in results:
+            record_parent = record.get("parent_uri", "")
+            for uri in parent_uris:
+                if len(grouped[uri]) < limit and self._is_under(record_parent, uri):
+                    grouped[uri].append(dict(record))
+
+        if len(results) >= batch_limit:
+            for uri in parent_uris:
+                if len(grouped[uri]) < limit:
+                    grouped[uri] = await self.search_children_in_tenant(
+                        ctx=ctx,
+                        parent_uri=uri,
+                        query_vector=query_vector,
+                        sparse_query_vector=sparse_query_vector,
+                        context_type=context_type,
+                        target_directories=target_directories,
+                        extra_filter=extra_filter,
+                        limit=limit,
+                    )
+        return grouped
+
+    @staticmethod
+    def _is_under(path: str, prefix: str) -> bool:
+        prefix = prefix.rstrip("/")
+        return path == prefix or path.startswith(prefix + "/")
+
     async def search_similar_memories(
         self,
         account_id: str,
@@ -419,18 +567,34 @@ class VikingVectorIndexBackend:
 
     async def delete_uris(self, ctx: RequestContext, uris: List[str]) -> None:
         for uri in uris:
-            conds: List[FilterExpr] = [
-                Eq("account_id", ctx.account_id),
-                Or([Eq("uri", uri), In("uri", [f"{uri}/"])]),
-            ]
-            if ctx.role == Role.USER and uri.startswith(("viking://user/", "viking://agent/")):
-                owner_space = (
-                    ctx.user.user_space_name()
-                    if uri.startswith("viking://user/")
-                    else ctx.user.agent_space_name()
-                )
-                conds.append(Eq("owner_space", owner_space))
-            self._adapter.delete(filter=And(conds))
+            await self.delete_subtree(ctx, uri)
+
+    async def delete_subtree(self, ctx: RequestContext, uri_prefix: str) -> int:
+        """Delete the record of uri_prefix and every record below it in one batch.
+
+        Matching records are resolved through the uri path index, so removing a
+        large tree needs neither a filesystem walk nor one delete per URI.
+        Scoped to the caller's account (and owner space for USER role on
+        user/agent URIs).
+
+        Returns:
+            Number of records deleted
+        """
+        return self._adapter.delete_subtree(
+            uri_prefix, filter=self._write_scope_filter(ctx, uri_prefix)
+        )
+
+    @staticmethod
+    def _write_scope_filter(ctx: RequestContext, uri: str) -> FilterExpr:
+        conds: List[FilterExpr] = [Eq("account_id", ctx.account_id)]
+        if ctx.role == Role.USER and uri.startswith(("viking://user/", "viking://agent/")):
+            owner_space = (
+                ctx.user.user_space_name()
+                if uri.startswith("viking://user/")
+                else ctx.user.agent_space_name()
+            )
+            conds.append(Eq("owner_space", owner_space))
+        return And(conds)
 
     async def update_uri_mapping(
         self,
@@ -448,17 +612,67 @@ class VikingVectorIndexBackend:
         updated = {**records[0], "uri": new_uri, "parent_uri": new_parent_uri}
         return bool(await self.upsert(updated))
 
+    async def rename_uri_prefix(self, ctx: RequestContext, old_uri: str, new_uri: str) -> int:
+        """Move every record under ``old_uri`` to ``new_uri`` in one bulk rewrite.
+
+        Only uri/parent_uri change; vectors are kept, so nothing is re-embedded.
+        Scoped to the caller's account (and owner space for USER role on
+        user/agent URIs), like delete_uris().
+
+        Returns:
+            Number of records rewritten
+        """
+        try:
+            return self._adapter.rename_uri_prefix(
+                old_uri, new_uri, filter=self._write_scope_filter(ctx, old_uri)
+            )
+        except Exception as e:
+            logger.error("Error renaming URI prefix %s -> %s: %s", old_uri, new_uri, e)
+            return 0
+
     async def increment_active_count(self, ctx: RequestContext, uris: List[str]) -> int:
-        updated = 0
-        for uri in uris:
-            records = await self.get_context_by_uri(account_id=ctx.account_id, uri=uri, limit=1)
-            if not records:
-                continue
-            record = records[0]
-            current = int(record.get("active_count", 0) or 0)
-            record["active_count"] = current + 1
-            if await self.upsert(record):
-                updated += 1
+        """Increment active_count of the records of ``uris`` (write-behind).
+
+        Increments are buffered and coalesced per URI, then written by a
+        periodic batched scalar update (see flush_active_counts()).
+
+        Returns:
+            Number of distinct URIs queued
+        """
+        return self._active_counts.add(ctx.account_id, uris)
+
+    async def flush_active_counts(self) -> int:
+        """Write buffered active_count increments now.
+
+        Returns:
+            Number of records updated
+        """
+        return self._active_counts.flush()
+
+    def _flush_active_counts(self, pending: PendingCounts, batch_size: int = 500) -> int:
+        by_account: Dict[str, Dict[str, int]] = {}
+        for (account_id, uri), delta in pending.items():
+            by_account.setdefault(account_id, {})[uri] = delta
+
+        updates: Dict[str, Dict[str, Any]] = {}
+        for account_id, deltas in by_account.items():
+            uris = list(deltas)
+            for start in range(0, len(uris), batch_size):
+                chunk = uris[start : start + batch_size]
+                records = self._adapter.query(
+                    filter=And(
+                        [Eq("account_id", account_id), Or([Eq("uri", uri) for uri in chunk])]
+                    ),
+                    limit=len(chunk) * 4,
+                    output_fields=["uri", "active_count"],
+                )
+                for record in records:
+                    if record.get("id") and record.get("uri") in deltas:
+                        current = int(record.get("active_count", 0) or 0)
+                        updates[record["id"]] = {"active_count": current + deltas[record["uri"]]}
+
+        updated = self._adapter.update_fields(updates) if updates else 0
+        logger.debug("Flushed active_count of %d URIs (%d records)", len(pending), updated)
         return updated
 
     def _build_scope_filter(
@@ -467,6 +681,58 @@ class VikingVectorIndexBackend:
         context_type: Optional[str],
         target_directories: Optional[List[str]],
         extra_filter: Optional[FilterExpr | Dict[str, Any]],
+    ) -> Optional[FilterExpr]:
+        """Build the tenant/type/directory scope of a search.
+
+        The scope is compiled once per distinct set of inputs and returned as
+        RawDSL, so the many searches of one hierarchical retrieval reuse the
+        same compiled filter (and the engine can memoize its bitmap).
+        """
+        key = self._scope_filter_key(ctx, context_type, target_directories, extra_filter)
+        if key is not None:
+            with self._scope_filters_lock:
+                compiled = self._scope_filters.get(key)
+                if compiled is not None:
+                    self._scope_filters.move_to_end(key)
+            if compiled is not None:
+                return RawDSL(compiled) if compiled else None
+
+        scope = self._compose_scope_filter(ctx, context_type, target_directories, extra_filter)
+        if key is None:
+            return scope
+        compiled = self._adapter.compile_filter(scope) if scope else {}
+        with self._scope_filters_lock:
+            self._scope_filters[key] = compiled
+            while len(self._scope_filters) > self.SCOPE_FILTER_CACHE_SIZE:
+                self._scope_filters.popitem(last=False)
+        return RawDSL(compiled) if compiled else None
+
+    @staticmethod
+    def _scope_filter_key(
+        ctx: RequestContext,
+        context_type: Optional[str],
+        target_directories: Optional[List[str]],
+        extra_filter: Optional[FilterExpr | Dict[str, Any]],
+    ) -> Optional[Hashable]:
+        extra_key = filter_key(extra_filter) if extra_filter else None
+        if extra_filter and extra_key is None:
+            return None
+        return (
+            ctx.role,
+            ctx.account_id,
+            ctx.user.user_id,
+            ctx.user.agent_id,
+            context_type,
+            tuple(target_directories or ()),
+            extra_key,
+        )
+
+    def _compose_scope_filter(
+        self,
+        ctx: RequestContext,
+        context_type: Optional[str],
+        target_directories: Optional[List[str]],
+        extra_filter: Optional[FilterExpr | Dict[str, Any]],
     ) -> Optional[FilterExpr]:
         filters: List[FilterExpr] = []
         if context_type:
@@ -547,6 +813,7 @@ class VikingVectorIndexBackend:
 
     async def close(self) -> None:
         try:
+            self._active_counts.close()
             self._adapter.close()
             self._collection_config = {}
             self._meta_data_cache = {}
@@ -71,9 +71,13 @@ class SyncOpenViking:
         """
         return run_async(self._async_client.add_message(session_id, role, content, parts))
 
-    def commit_session(self, session_id: str) -> Dict[str, Any]:
+    def commit_session(self, session_id: str, wait: bool = False) -> Dict[str, Any]:
         """Commit a session (archive and extract memories)."""
-        return run_async(self._async_client.commit_session(session_id))
+        return run_async(self._async_client.commit_session(session_id, wait=wait))
+
+    def get_commit_job(self, session_id: str, job_id: str) -> Dict[str, Any]:
+        """Get the status and result of a background commit job."""
+        return run_async(self._async_client.get_commit_job(session_id, job_id))
 
     def add_resource(
         self,
@@ -65,6 +65,16 @@ def create_agfs_client(agfs_config: Any) -> Any:
         url = getattr(agfs_config, "url", "http://localhost:8080")
         timeout = getattr(agfs_config, "timeout", 10)
         client = AGFSClient(api_base_url=url, timeout=timeout)
+
+        # Calls are issued concurrently from the AGFS I/O executor; size the
+        # connection pool to match so connections are reused, not discarded.
+        max_io_workers = getattr(agfs_config, "max_io_workers", None)
+        if max_io_workers and hasattr(client, "session"):
+            from requests.adapters import HTTPAdapter
+
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_io_workers)
+            client.session.mount("http://", adapter)
+            client.session.mount("https://", adapter)
         logger.info(f"[AGFSUtils] Created AGFSClient at {url}")
         return client
 
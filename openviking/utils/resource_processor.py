@@ -78,6 +78,7 @@ class ResourceProcessor:
         scope: str = "resources",
         user: Optional[str] = None,
         target: Optional[str] = None,
+        incremental: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -87,6 +88,10 @@ class ResourceProcessor:
         1. Parse source (writes to temp directory)
         2. TreeBuilder moves to AGFS
         3. SemanticQueue generates L0/L1 and vectorizes asynchronously
+
+        With ``incremental=True``, re-importing a resource that already exists
+        at the destination updates it in place and only re-processes the
+        changed parts (see ``TreeBuilder.finalize_from_temp``).
         """
         result = {
             "status": "success",
@@ -156,6 +161,7 @@ class ResourceProcessor:
                     base_uri=located_uri,
                     source_path=parse_result.source_path,
                     source_format=parse_result.source_format,
+                    incremental=incremental,
                 )
         except Exception as e:
             result["status"] = "error"
@@ -173,4 +179,6 @@ class ResourceProcessor:
         # Check media strategy
 
         result["root_uri"] = context_tree._root_uri
+        if context_tree.sync_stats is not None:
+            result["sync"] = context_tree.sync_stats
         return result
@@ -27,6 +27,12 @@ def observer_vlm_command(ctx: typer.Context) -> None:
     run(ctx, lambda client: client.observer.vlm)
 
 
+@observer_app.command("cache")
+def observer_cache_command(ctx: typer.Context) -> None:
+    """Get query and embedding cache hit rates."""
+    run(ctx, lambda client: client.observer.cache)
+
+
 @observer_app.command("system")
 def observer_system_command(ctx: typer.Context) -> None:
     """Get overall system status."""
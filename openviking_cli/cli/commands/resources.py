@@ -37,6 +37,11 @@ def register(app: typer.Typer) -> None:
         no_directly_upload_media: bool = typer.Option(
             False, "--no-directly-upload-media", help="Do not directly upload media files"
         ),
+        incremental: bool = typer.Option(
+            False,
+            "--incremental",
+            help="Update an existing resource in place, re-processing only changed files",
+        ),
     ) -> None:
         """Add resources into OpenViking."""
         # Validate path: if it's a local path, check if it exists
@@ -105,6 +110,7 @@ def register(app: typer.Typer) -> None:
                 include=include,
                 exclude=exclude,
                 directly_upload_media=not no_directly_upload_media,
+                incremental=incremental,
             ),
         )
 
@@ -205,8 +205,17 @@ class BaseClient(ABC):
         ...
 
     @abstractmethod
-    async def commit_session(self, session_id: str) -> Dict[str, Any]:
-        """Commit a session (archive and extract memories)."""
+    async def commit_session(self, session_id: str, wait: bool = False) -> Dict[str, Any]:
+        """Commit a session (archive and extract memories).
+
+        Unless ``wait`` is set, memories are extracted by a background job whose
+        ``job_id`` is returned; poll it with get_commit_job().
+        """
+        ...
+
+    @abstractmethod
+    async def get_commit_job(self, session_id: str, job_id: str) -> Dict[str, Any]:
+        """Get the status and result of a background commit job."""
         ...
 
     @abstractmethod
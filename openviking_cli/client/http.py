@@ -83,6 +83,10 @@ class _HTTPObserver:
         """Fetch VLM status asynchronously."""
         return await self._client._get_vlm_status()
 
+    async def _fetch_cache_status(self) -> Dict[str, Any]:
+        """Fetch cache status asynchronously."""
+        return await self._client._get_cache_status()
+
     async def _fetch_system_status(self) -> Dict[str, Any]:
         """Fetch system status asynchronously."""
         return await self._client._get_system_status()
@@ -102,6 +106,11 @@ class _HTTPObserver:
         """Get VLM status (sync wrapper)."""
         return run_async(self._fetch_vlm_status())
 
+    @property
+    def cache(self) -> Dict[str, Any]:
+        """Get cache status (sync wrapper)."""
+        return run_async(self._fetch_cache_status())
+
     @property
     def system(self) -> Dict[str, Any]:
         """Get system overall status (sync wrapper)."""
@@ -288,6 +297,7 @@ class AsyncHTTPClient(BaseClient):
         include: Optional[str] = None,
         exclude: Optional[str] = None,
         directly_upload_media: bool = True,
+        incremental: bool = False,
     ) -> Dict[str, Any]:
         """Add resource to OpenViking."""
         request_data = {
@@ -301,6 +311,7 @@ class AsyncHTTPClient(BaseClient):
             "include": include,
             "exclude": exclude,
             "directly_upload_media": directly_upload_media,
+            "incremental": incremental,
         }
 
         path_obj = Path(path)
@@ -619,9 +630,20 @@ class AsyncHTTPClient(BaseClient):
         response = await self._http.delete(f"/api/v1/sessions/{session_id}")
         self._handle_response(response)
 
-    async def commit_session(self, session_id: str) -> Dict[str, Any]:
-        """Commit a session (archive and extract memories)."""
-        response = await self._http.post(f"/api/v1/sessions/{session_id}/commit")
+    async def commit_session(self, session_id: str, wait: bool = False) -> Dict[str, Any]:
+        """Commit a session (archive and extract memories).
+
+        Unless ``wait`` is set, memories are extracted by a background job whose
+        ``job_id`` is returned; poll it with get_commit_job().
+        """
+        response = await self._http.post(
+            f"/api/v1/sessions/{session_id}/commit", json={"wait": wait}
+        )
+        return self._handle_response(response)
+
+    async def get_commit_job(self, session_id: str, job_id: str) -> Dict[str, Any]:
+        """Get the status and result of a background commit job."""
+        response = await self._http.get(f"/api/v1/sessions/{session_id}/commit/{job_id}")
         return self._handle_response(response)
 
     async def add_message(
@@ -724,6 +746,11 @@ class AsyncHTTPClient(BaseClient):
         response = await self._http.get("/api/v1/observer/vlm")
         return self._handle_response(response)
 
+    async def _get_cache_status(self) -> Dict[str, Any]:
+        """Get cache status (internal for _HTTPObserver)."""
+        response = await self._http.get("/api/v1/observer/cache")
+        return self._handle_response(response)
+
     async def _get_system_status(self) -> Dict[str, Any]:
         """Get system overall status (internal for _HTTPObserver)."""
         response = await self._http.get("/api/v1/observer/system")
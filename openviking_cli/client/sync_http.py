@@ -105,9 +105,13 @@ class SyncHTTPClient:
         """
         return run_async(self._async_client.add_message(session_id, role, content, parts))
 
-    def commit_session(self, session_id: str) -> Dict[str, Any]:
+    def commit_session(self, session_id: str, wait: bool = False) -> Dict[str, Any]:
         """Commit a session (archive and extract memories)."""
-        return run_async(self._async_client.commit_session(session_id))
+        return run_async(self._async_client.commit_session(session_id, wait=wait))
+
+    def get_commit_job(self, session_id: str, job_id: str) -> Dict[str, Any]:
+        """Get the status and result of a background commit job."""
+        return run_async(self._async_client.get_commit_job(session_id, job_id))
 
     # ============= Resource =============
 
@@ -124,6 +128,7 @@ class SyncHTTPClient:
         include: Optional[str] = None,
         exclude: Optional[str] = None,
         directly_upload_media: bool = True,
+        incremental: bool = False,
     ) -> Dict[str, Any]:
         """Add resource to OpenViking."""
         return run_async(
@@ -139,6 +144,7 @@ class SyncHTTPClient:
                 include,
                 exclude,
                 directly_upload_media,
+                incremental,
             )
         )
 
@@ -97,6 +97,12 @@ class AGFSConfig(BaseModel):
 
     retry_times: int = Field(default=3, description="AGFS retry times on failure")
 
+    max_io_workers: int = Field(
+        default=16,
+        description="Size of the thread pool that runs blocking AGFS calls off the event loop. "
+        "Bounds the number of in-flight AGFS requests per process.",
+    )
+
     use_ssl: bool = Field(
         default=True,
         description="Enable/Disable SSL (HTTPS) for AGFS service. Set to False for local testing without HTTPS.",
@@ -88,6 +88,26 @@ class EmbeddingModelConfig(BaseModel):
         return self
 
 
+class EmbeddingCacheConfig(BaseModel):
+    """Configuration for the content-addressed embedding cache"""
+
+    enabled: bool = Field(
+        default=True, description="Reuse embeddings of identical text for the same model"
+    )
+    memory_max_mb: int = Field(
+        default=64, ge=0, description="Size limit of the in-memory LRU tier in MB (0 disables it)"
+    )
+    disk_max_mb: int = Field(
+        default=512, ge=0, description="Size limit of the on-disk SQLite tier in MB (0 disables it)"
+    )
+    path: Optional[str] = Field(
+        default=None,
+        description="SQLite file of the disk tier, defaults to <workspace>/embedding_cache.db",
+    )
+
+    model_config = {"extra": "forbid"}
+
+
 class EmbeddingConfig(BaseModel):
     """
     Embedding configuration, supports OpenAI or VolcEngine compatible APIs.
@@ -107,6 +127,19 @@ class EmbeddingConfig(BaseModel):
     max_concurrent: int = Field(
         default=10, description="Maximum number of concurrent embedding requests"
     )
+    batch_size: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum number of queued texts embedded in one request (1 disables batching)",
+    )
+    batch_wait_ms: int = Field(
+        default=50,
+        ge=0,
+        description="Maximum time in milliseconds to wait for a partial embedding batch to fill",
+    )
+    cache: EmbeddingCacheConfig = Field(
+        default_factory=EmbeddingCacheConfig, description="Embedding cache configuration"
+    )
 
     model_config = {"extra": "forbid"}
 
@@ -245,12 +278,24 @@ class EmbeddingConfig(BaseModel):
     def get_embedder(self):
         """Get embedder instance based on configuration.
 
+        When the embedding cache is enabled the embedder is wrapped in a
+        CachedEmbedder backed by the process-wide embedding cache.
+
         Returns:
             Embedder instance (Dense, Sparse, Hybrid, or Composite)
 
         Raises:
             ValueError: If configuration is invalid or unsupported
         """
+        from openviking.models.embedder.cache import CachedEmbedder
+
+        embedder = self._build_embedder()
+        if self.cache.enabled:
+            return CachedEmbedder(embedder)
+        return embedder
+
+    def _build_embedder(self):
+        """Create the provider embedder(s) described by this configuration."""
         from openviking.models.embedder import CompositeHybridEmbedder
 
         if self.hybrid:
@@ -102,6 +102,90 @@ class OpenVikingConfig(BaseModel):
 
     default_search_limit: int = Field(default=3, description="Default number of results to return")
 
+    search_frontier_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of top frontier directories expanded together with one vector query "
+            "during hierarchical retrieval (1 = one directory per query)"
+        ),
+    )
+
+    summary_cache_max_entries: int = Field(
+        default=4096,
+        ge=0,
+        description="Maximum number of cached directory abstracts/overviews (0 disables the cache)",
+    )
+
+    summary_cache_ttl_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="Lifetime of a cached directory abstract/overview in seconds (0 disables the cache)",
+    )
+
+    relation_index_max_entries: int = Field(
+        default=16384,
+        ge=0,
+        description="Maximum number of directory relation tables kept in memory (0 disables the index)",
+    )
+
+    relation_index_ttl_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        description="Lifetime of an indexed relation table in seconds (0 disables the index)",
+    )
+
+    session_cache_max_entries: int = Field(
+        default=256,
+        ge=0,
+        description="Maximum number of loaded sessions kept in memory (0 disables the cache)",
+    )
+
+    session_commit_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Background workers extracting memories of asynchronous session commits",
+    )
+
+    session_commit_max_pending: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum number of queued or running session commit jobs",
+    )
+
+    memory_extraction_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of memory candidates deduplicated and written concurrently",
+    )
+
+    parse_max_workers: int = Field(
+        default=4,
+        ge=0,
+        description=(
+            "Worker processes for CPU-bound document conversion (PDF, Office, EPUB, HTML); "
+            "0 runs conversions on a thread instead"
+        ),
+    )
+
+    parse_directory_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Files of a directory parsed or uploaded at the same time",
+    )
+
+    query_cache_max_entries: int = Field(
+        default=1024,
+        ge=0,
+        description="Maximum number of cached find/search results (0 disables the query cache)",
+    )
+
+    query_cache_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="Lifetime of a cached find/search result in seconds (0 disables the query cache)",
+    )
+
     enable_memory_decay: bool = Field(default=True, description="Enable automatic memory decay")
 
     memory_decay_check_interval: int = Field(
@@ -136,9 +136,12 @@ class PDFConfig(ParserConfig):
         mineru_api_key: MinerU API authentication key
         mineru_timeout: MinerU request timeout in seconds
         mineru_params: Additional MinerU API parameters
+        local_pages_per_shard: Pages extracted per process-pool task by the
+            local strategy
     """
 
     strategy: str = "auto"  # "local" | "mineru" | "auto"
+    local_pages_per_shard: int = 16
 
     # MinerU API configuration
     mineru_endpoint: Optional[str] = None  # API endpoint URL
@@ -169,6 +172,9 @@ class PDFConfig(ParserConfig):
         if self.mineru_timeout <= 0:
             raise ValueError("mineru_timeout must be positive")
 
+        if self.local_pages_per_shard <= 0:
+            raise ValueError("local_pages_per_shard must be positive")
+
 
 @dataclass
 class CodeHostingConfig(ParserConfig):
@@ -88,6 +88,15 @@ class VectorDBBackendConfig(BaseModel):
         ),
     )
 
+    active_count_flush_interval: float = Field(
+        default=5.0,
+        ge=0.0,
+        description=(
+            "Seconds between batched writes of buffered active_count increments; "
+            "0 writes every increment immediately"
+        ),
+    )
+
     volcengine: Optional[VolcengineConfig] = Field(
         default_factory=lambda: VolcengineConfig(),
         description="Volcengine VikingDB configuration for 'volcengine' type",
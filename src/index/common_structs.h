@@ -36,6 +36,8 @@ struct SearchResult {
   std::vector<uint64_t> labels;
   std::vector<float> scores;
   std::string extra_json;
+  // 0 on success, otherwise the error code of the failed search.
+  int32_t status = 0;
 };
 
 struct FetchDataResult {
@@ -1,6 +1,7 @@
 // Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 // SPDX-License-Identifier: Apache-2.0
 #include "index/detail/index_manager_impl.h"
+#include <algorithm>
 #include <stdexcept>
 #include <memory>
 #include <chrono>
@@ -51,6 +52,10 @@ void IndexManagerImpl::init_from_json(const JsonDoc& json) {
     auto bf_meta = std::dynamic_pointer_cast<BruteForceMeta>(
         manager_meta_->vector_index_meta);
     vector_index_ = std::make_shared<BruteForceIndex>(bf_meta);
+  } else if (manager_meta_->vector_index_type == "hnsw") {
+    auto hnsw_meta =
+        std::dynamic_pointer_cast<HnswMeta>(manager_meta_->vector_index_meta);
+    vector_index_ = std::make_shared<HnswIndex>(hnsw_meta);
   } else {
     SPDLOG_ERROR("IndexManagerImpl::init_from_json not support index_type={}",
                  manager_meta_->vector_index_type);
@@ -85,6 +90,10 @@ void IndexManagerImpl::load_from_path(const std::filesystem::path& dir) {
     auto bf_meta = std::dynamic_pointer_cast<BruteForceMeta>(
         manager_meta_->vector_index_meta);
     vector_index_ = std::make_shared<BruteForceIndex>(bf_meta);
+  } else if (manager_meta_->vector_index_type == "hnsw") {
+    auto hnsw_meta =
+        std::dynamic_pointer_cast<HnswMeta>(manager_meta_->vector_index_meta);
+    vector_index_ = std::make_shared<HnswIndex>(hnsw_meta);
   } else {
     SPDLOG_ERROR("IndexLoader::load not support index_type={}",
                  manager_meta_->vector_index_type);
@@ -135,6 +144,38 @@ void IndexManagerImpl::register_label_offset_converter_() {
       });
 }
 
+// Record the memoization keys of a top-level "and" filter (see
+// SearchContext::conjunct_keys). Conjuncts map one-to-one to the conds of the
+// parsed AndOp, since parsing fails as a whole if any of them is invalid.
+void collect_conjunct_keys(const JsonDoc& dsl_filter_query,
+                           SearchContext& ctx) {
+  if (!ctx.filter_op || ctx.filter_op->op_name() != "and") {
+    return;
+  }
+  auto and_op = std::static_pointer_cast<LogicOpBase>(ctx.filter_op);
+  if (and_op->ignore_empty_condition()) {
+    return;
+  }
+  const JsonValue& filter = dsl_filter_query.HasMember("filter")
+                                ? dsl_filter_query["filter"]
+                                : dsl_filter_query;
+  const JsonValue& conds = filter["conds"];
+  if (conds.Size() != and_op->conds().size()) {
+    return;
+  }
+  bool has_logic_conjunct = false;
+  std::vector<std::string> keys(conds.Size());
+  for (rapidjson::SizeType i = 0; i < conds.Size(); ++i) {
+    if (!and_op->conds()[i]->is_leaf_op()) {
+      keys[i] = json_stringify(conds[i]);
+      has_logic_conjunct = true;
+    }
+  }
+  if (has_logic_conjunct) {
+    ctx.conjunct_keys = std::move(keys);
+  }
+}
+
 int parse_dsl_query(const std::string& dsl_filter_query_str,
                     SearchContext& ctx) {
   if (dsl_filter_query_str.empty()) {
@@ -152,6 +193,7 @@ int parse_dsl_query(const std::string& dsl_filter_query_str,
   }
   if (has_filter) {
     ctx.filter_op = parse_filter_json_doc_outter(dsl_filter_query);
+    collect_conjunct_keys(dsl_filter_query, ctx);
   }
   if (has_sorter) {
     ctx.sorter_op = parse_sorter_json_doc_outter(dsl_filter_query);
@@ -203,16 +245,194 @@ int IndexManagerImpl::search(const SearchRequest& req, SearchResult& result) {
   return ret;
 }
 
+int IndexManagerImpl::search_batch(const std::vector<SearchRequest>& reqs,
+                                   std::vector<SearchResult>& results) {
+  auto start = std::chrono::high_resolution_clock::now();
+  results.assign(reqs.size(), SearchResult());
+
+  std::vector<SearchContext> contexts(reqs.size());
+  for (size_t i = 0; i < reqs.size(); ++i) {
+    if (int ret = parse_dsl_query(reqs[i].dsl, contexts[i]); ret != 0) {
+      SPDLOG_ERROR("IndexManagerImpl::search_batch [{}] scalar index search fail",
+                   reqs[i].dsl);
+      return ret;
+    }
+  }
+
+  std::shared_lock<std::shared_mutex> lock(rw_mutex_);
+
+  // Bitmaps must outlive the batched recall that points into them.
+  std::vector<BitmapPtr> bitmaps(reqs.size());
+  std::vector<size_t> recall_positions;
+  std::vector<VectorRecallRequest> recall_requests;
+  for (size_t i = 0; i < reqs.size(); ++i) {
+    const auto& req = reqs[i];
+    auto& ctx = contexts[i];
+    if (ctx.filter_op) {
+      bitmaps[i] = calculate_filter_bitmap(ctx, req.dsl);
+      if (!bitmaps[i]) {
+        // Same as search(): the query fails, without failing the others.
+        SPDLOG_DEBUG(
+            "IndexManagerImpl::search_batch calculate_filter_bitmap returned "
+            "null");
+        results[i].status = -1;
+        continue;
+      }
+    }
+    if (ctx.sorter_op) {
+      if (int ret = handle_sorter_query(ctx, bitmaps[i], results[i], req.dsl);
+          ret != 0) {
+        return ret;
+      }
+    } else if (!req.query.empty()) {
+      recall_positions.push_back(i);
+      recall_requests.push_back(VectorRecallRequest{
+          .dense_vector = req.query.data(),
+          .topk = req.topk,
+          .bitmap = bitmaps[i].get(),
+          .sparse_terms =
+              req.sparse_raw_terms.empty() ? nullptr : &req.sparse_raw_terms,
+          .sparse_values =
+              req.sparse_values.empty() ? nullptr : &req.sparse_values});
+    }
+  }
+
+  if (!recall_requests.empty()) {
+    std::vector<VectorRecallResult> recall_results;
+    int ret = vector_index_->recall_batch(recall_requests, recall_results);
+    if (ret != 0) {
+      SPDLOG_ERROR(
+          "IndexManagerImpl::search_batch vector recall failed, ret={}", ret);
+      return ret;
+    }
+    for (size_t j = 0; j < recall_positions.size(); ++j) {
+      auto& result = results[recall_positions[j]];
+      std::swap(result.labels, recall_results[j].labels);
+      std::swap(result.scores, recall_results[j].scores);
+    }
+  }
+
+  auto end = std::chrono::high_resolution_clock::now();
+  auto duration =
+      std::chrono::duration_cast<std::chrono::microseconds>(end - start)
+          .count();
+  SPDLOG_DEBUG(
+      "IndexManagerImpl::search_batch finish, batch size: {}, vector "
+      "queries: {}, cost: {}us",
+      reqs.size(), recall_requests.size(), duration);
+  return 0;
+}
+
+int IndexManagerImpl::select_labels(const std::string& dsl,
+                                    std::vector<uint64_t>& labels) {
+  SearchContext ctx;
+  if (int ret = parse_dsl_query(dsl, ctx); ret != 0) {
+    SPDLOG_ERROR("IndexManagerImpl::select_labels [{}] parse dsl fail", dsl);
+    return ret;
+  }
+  if (!ctx.filter_op) {
+    SPDLOG_ERROR("IndexManagerImpl::select_labels [{}] requires a filter", dsl);
+    return -1;
+  }
+
+  std::shared_lock<std::shared_mutex> lock(rw_mutex_);
+  // Path prefixes are resolved through the DirIndex trie while the bitmap is
+  // built, so a subtree costs one bitmap union regardless of its size.
+  BitmapPtr bitmap = calculate_filter_bitmap(ctx, dsl);
+  if (!bitmap) {
+    return 0;
+  }
+  std::vector<uint32_t> offsets;
+  bitmap->get_set_list(offsets);
+  labels.reserve(labels.size() + offsets.size());
+  for (auto offset : offsets) {
+    labels.push_back(vector_index_->get_label_by_offset(offset));
+  }
+  return 0;
+}
+
 BitmapPtr IndexManagerImpl::calculate_filter_bitmap(const SearchContext& ctx,
                                                     const std::string& dsl) {
-  auto bitmap = ctx.filter_op->calc_bitmap(scalar_index_->get_field_sets(),
-                                           nullptr, ctx.filter_op->op_name());
+  auto bitmap =
+      ctx.conjunct_keys.empty()
+          ? ctx.filter_op->calc_bitmap(scalar_index_->get_field_sets(), nullptr,
+                                       ctx.filter_op->op_name())
+          : calculate_conjunction_bitmap(ctx);
   if (!bitmap) {
     SPDLOG_DEBUG("ScalarIndex::search [{}] calc_bitmap fail", dsl);
   }
   return bitmap;
 }
 
+BitmapPtr IndexManagerImpl::calculate_conjunction_bitmap(
+    const SearchContext& ctx) {
+  auto field_sets = scalar_index_->get_field_sets();
+  const auto& conds =
+      std::static_pointer_cast<LogicOpBase>(ctx.filter_op)->conds();
+  // Start from a copy of the memoized conjuncts (the scope), then intersect
+  // the per-search ones (e.g. parent_uri) into it.
+  BitmapPtr pres;
+  for (size_t i = 0; i < conds.size(); ++i) {
+    if (ctx.conjunct_keys[i].empty()) {
+      continue;
+    }
+    BitmapPtr cached = memoized_filter_bitmap(ctx.conjunct_keys[i], conds[i]);
+    if (!cached) {
+      return nullptr;
+    }
+    if (!pres) {
+      pres = std::make_shared<Bitmap>(*cached);
+    } else {
+      pres->Intersect(cached.get());
+    }
+  }
+  for (size_t i = 0; i < conds.size(); ++i) {
+    if (!ctx.conjunct_keys[i].empty()) {
+      continue;
+    }
+    pres = conds[i]->calc_bitmap(field_sets, pres, "and");
+    if (!pres) {
+      return nullptr;
+    }
+  }
+  return pres;
+}
+
+BitmapPtr IndexManagerImpl::memoized_filter_bitmap(const std::string& key,
+                                                   const FilterOpBasePtr& op) {
+  {
+    std::lock_guard<std::mutex> guard(filter_cache_mutex_);
+    auto it = filter_bitmap_cache_.find(key);
+    if (it != filter_bitmap_cache_.end()) {
+      it->second.last_used = ++filter_cache_tick_;
+      return it->second.bitmap;
+    }
+  }
+  // Callers hold rw_mutex_ shared, so the scalar index cannot change while the
+  // bitmap is computed; failures are not memoized.
+  BitmapPtr bitmap =
+      op->calc_bitmap(scalar_index_->get_field_sets(), nullptr, op->op_name());
+  if (!bitmap) {
+    return nullptr;
+  }
+  std::lock_guard<std::mutex> guard(filter_cache_mutex_);
+  filter_bitmap_cache_[key] = {bitmap, ++filter_cache_tick_};
+  if (filter_bitmap_cache_.size() > kMaxMemoizedFilterBitmaps) {
+    auto oldest = std::min_element(
+        filter_bitmap_cache_.begin(), filter_bitmap_cache_.end(),
+        [](const auto& a, const auto& b) {
+          return a.second.last_used < b.second.last_used;
+        });
+    filter_bitmap_cache_.erase(oldest);
+  }
+  return bitmap;
+}
+
+void IndexManagerImpl::clear_filter_bitmap_cache() {
+  std::lock_guard<std::mutex> guard(filter_cache_mutex_);
+  filter_bitmap_cache_.clear();
+}
+
 int IndexManagerImpl::handle_sorter_query(const SearchContext& ctx,
                                           const BitmapPtr& bitmap,
                                           SearchResult& result,
@@ -295,6 +515,7 @@ int IndexManagerImpl::add_data(const std::vector<AddDataRequest>& data_list) {
 
   bool has_update = false;
   std::unique_lock<std::shared_mutex> lock(rw_mutex_);
+  clear_filter_bitmap_cache();
   for (size_t i = 0; i < data_list.size(); ++i) {
     const auto& data = data_list[i];
     FloatValSparseDatapointLowLevel sparse_datapoint(&data.sparse_raw_terms,
@@ -328,6 +549,51 @@ int IndexManagerImpl::add_data(const std::vector<AddDataRequest>& data_list) {
   return 0;
 }
 
+int IndexManagerImpl::update_scalar_data(
+    const std::vector<AddDataRequest>& data_list) {
+  auto start = std::chrono::high_resolution_clock::now();
+  std::vector<FieldsDict> parsed_fields_list(data_list.size());
+  std::vector<FieldsDict> parsed_old_fields_list(data_list.size());
+
+  for (size_t i = 0; i < data_list.size(); ++i) {
+    if (!data_list[i].fields_str.empty()) {
+      parsed_fields_list[i].parse_from_json(data_list[i].fields_str);
+    }
+    if (!data_list[i].old_fields_str.empty()) {
+      parsed_old_fields_list[i].parse_from_json(data_list[i].old_fields_str);
+    }
+  }
+
+  bool has_update = false;
+  std::unique_lock<std::shared_mutex> lock(rw_mutex_);
+  clear_filter_bitmap_cache();
+  for (size_t i = 0; i < data_list.size(); ++i) {
+    int offset = vector_index_->get_offset_by_label(data_list[i].label);
+    if (offset < 0) {
+      SPDLOG_DEBUG("IndexManagerImpl::update_scalar_data label={} not found",
+                   data_list[i].label);
+      continue;
+    }
+    has_update = true;
+    scalar_index_->add_row_data(offset, parsed_fields_list[i],
+                                parsed_old_fields_list[i]);
+  }
+  if (has_update) {
+    auto duration = std::chrono::system_clock::now().time_since_epoch();
+    manager_meta_->update_timestamp =
+        std::chrono::duration_cast<std::chrono::nanoseconds>(duration).count();
+  }
+
+  auto end = std::chrono::high_resolution_clock::now();
+  auto duration_us =
+      std::chrono::duration_cast<std::chrono::microseconds>(end - start)
+          .count();
+  SPDLOG_DEBUG(
+      "IndexManagerImpl::update_scalar_data finish, batch size: {}, cost: {}us",
+      data_list.size(), duration_us);
+  return 0;
+}
+
 int IndexManagerImpl::delete_data(
     const std::vector<DeleteDataRequest>& data_list) {
   auto start = std::chrono::high_resolution_clock::now();
@@ -340,6 +606,7 @@ int IndexManagerImpl::delete_data(
 
   bool has_update = false;
   std::unique_lock<std::shared_mutex> lock(rw_mutex_);
+  clear_filter_bitmap_cache();
   for (size_t i = 0; i < data_list.size(); ++i) {
     const auto& data = data_list[i];
     int offset = vector_index_->get_offset_by_label(data.label);
@@ -10,7 +10,9 @@
 #include "index/detail/search_context.h"
 #include "index/detail/scalar/bitmap_holder/bitmap.h"
 
+#include <mutex>
 #include <shared_mutex>
+#include <unordered_map>
 #include <filesystem>
 #include <memory>
 #include <stdio.h>
@@ -29,10 +31,18 @@ class IndexManagerImpl : public IndexManager {
 
   int search(const SearchRequest& req, SearchResult& result) override;
 
+  int search_batch(const std::vector<SearchRequest>& reqs,
+                   std::vector<SearchResult>& results) override;
+
+  int select_labels(const std::string& dsl,
+                    std::vector<uint64_t>& labels) override;
+
   int add_data(const std::vector<AddDataRequest>& data_list) override;
 
   int delete_data(const std::vector<DeleteDataRequest>& data_list) override;
 
+  int update_scalar_data(const std::vector<AddDataRequest>& data_list) override;
+
   int64_t dump(const std::string& dir) override;
 
   int get_state(StateResult& state_result) override;
@@ -46,6 +56,15 @@ class IndexManagerImpl : public IndexManager {
   BitmapPtr calculate_filter_bitmap(const SearchContext& ctx,
                                     const std::string& dsl);
 
+  // Bitmap of a top-level "and" filter whose scope conjuncts are memoized.
+  BitmapPtr calculate_conjunction_bitmap(const SearchContext& ctx);
+
+  BitmapPtr memoized_filter_bitmap(const std::string& key,
+                                   const FilterOpBasePtr& op);
+
+  // Must be called with rw_mutex_ held exclusively, whenever data changes.
+  void clear_filter_bitmap_cache();
+
   int handle_sorter_query(const SearchContext& ctx, const BitmapPtr& bitmap,
                           SearchResult& result, const std::string& dsl);
 
@@ -59,6 +78,17 @@ class IndexManagerImpl : public IndexManager {
   std::shared_ptr<ManagerMeta> manager_meta_;
   std::shared_ptr<ScalarIndex> scalar_index_;
   std::shared_ptr<VectorIndexAdapter> vector_index_;
+
+  struct MemoizedBitmap {
+    BitmapPtr bitmap;
+    uint64_t last_used = 0;
+  };
+  static constexpr size_t kMaxMemoizedFilterBitmaps = 64;
+  // Bitmaps of filter conjuncts keyed by their source JSON, shared by
+  // concurrent searches and cleared on every add/update/delete.
+  std::mutex filter_cache_mutex_;
+  std::unordered_map<std::string, MemoizedBitmap> filter_bitmap_cache_;
+  uint64_t filter_cache_tick_ = 0;
 };
 
 }  // namespace vectordb
\ No newline at end of file
@@ -0,0 +1,58 @@
+// Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+// SPDX-License-Identifier: Apache-2.0
+#pragma once
+#include <string>
+#include <memory>
+#include "spdlog/spdlog.h"
+#include "index/detail/meta/vector_index_meta.h"
+
+namespace vectordb {
+
+// Graph (HNSW) index parameters on top of the common vector index meta.
+//   M:              max neighbours per node on upper layers (2*M on layer 0)
+//   EfConstruction: candidate list size while inserting
+//   EfSearch:       candidate list size while searching (raised to topk)
+class HnswMeta : public VectorIndexMeta {
+ public:
+  uint64_t m = 16;
+  uint64_t ef_construction = 200;
+  uint64_t ef_search = 64;
+
+  int init_from_json(const JsonValue& json) override {
+    if (VectorIndexMeta::init_from_json(json) != 0) {
+      return -1;
+    }
+    if (json.HasMember("M")) {
+      m = json["M"].GetUint64();
+    }
+    if (json.HasMember("EfConstruction")) {
+      ef_construction = json["EfConstruction"].GetUint64();
+    }
+    if (json.HasMember("EfSearch")) {
+      ef_search = json["EfSearch"].GetUint64();
+    }
+    if (m < 2 || ef_construction == 0 || ef_search == 0) {
+      SPDLOG_ERROR(
+          "HnswMeta::init_from_json invalid params M={}, EfConstruction={}, "
+          "EfSearch={}",
+          m, ef_construction, ef_search);
+      return -1;
+    }
+    return 0;
+  }
+
+  int save_to_json(JsonPrettyWriter& writer) override {
+    VectorIndexMeta::save_to_json(writer);
+    writer.Key("M");
+    writer.Uint64(m);
+    writer.Key("EfConstruction");
+    writer.Uint64(ef_construction);
+    writer.Key("EfSearch");
+    writer.Uint64(ef_search);
+    return 0;
+  }
+};
+
+using HnswMetaPtr = std::shared_ptr<HnswMeta>;
+
+}  // namespace vectordb
@@ -10,6 +10,7 @@
 
 #include "index/detail/meta/scalar_index_meta.h"
 #include "index/detail/meta/bruteforce_meta.h"
+#include "index/detail/meta/hnsw_meta.h"
 
 namespace vectordb {
 class ManagerMeta {
@@ -100,6 +101,13 @@ class ManagerMeta {
                 "ManagerMeta::init_from_json bf_meta_ init_from_json failed");
             return -1;
           }
+        } else if (vector_index_type == "hnsw") {
+          vector_index_meta = std::make_shared<HnswMeta>();
+          if (vector_index_meta->init_from_json(vector_index)) {
+            SPDLOG_ERROR(
+                "ManagerMeta::init_from_json hnsw_meta init_from_json failed");
+            return -1;
+          }
         } else {
           SPDLOG_ERROR("ManagerMeta::init_from_json not support index_type={}",
                        vector_index_type.c_str());
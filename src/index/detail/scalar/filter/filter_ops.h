@@ -87,6 +87,12 @@ class LogicOpBase : public FilterOpBase {
     return false;
   }
   virtual JsonDocPtr get_json_doc();
+  const std::vector<FilterOpBasePtr>& conds() const {
+    return logic_conds_;
+  }
+  bool ignore_empty_condition() const {
+    return ignore_empty_condition_;
+  }
   void set_ignore_empty_condition(bool ignore_empty_condition) {
     if (op_name() != "and") {
       return;
@@ -3,6 +3,8 @@
 #pragma once
 
 #include <functional>
+#include <string>
+#include <vector>
 #include "index/detail/scalar/filter/filter_ops.h"
 #include "index/detail/scalar/filter/sort_ops.h"
 
@@ -11,6 +13,10 @@ namespace vectordb {
 struct SearchContext {
   FilterOpBasePtr filter_op;
   SorterOpBasePtr sorter_op;
+  // One key per conjunct of a top-level "and" filter: the source JSON of
+  // conjuncts that are logic ops themselves (e.g. the tenant scope), whose
+  // bitmaps are memoized; empty for conjuncts evaluated on every search.
+  std::vector<std::string> conjunct_keys;
 };
 
 }  // namespace vectordb
@@ -10,6 +10,7 @@
 #include <algorithm>
 #include <memory>
 #include <cstring>
+#include <queue>
 #include <stdexcept>
 
 #include "index/detail/vector/common/vector_base.h"
@@ -27,6 +28,14 @@ namespace vectordb {
 
 const std::string kFlatIndexFileName = "index_flat.data";
 
+// One query of a batched search_knn_batch() call.
+struct KnnQuery {
+  const void* query_data = nullptr;
+  size_t k = 0;
+  const Bitmap* filter_bitmap = nullptr;
+  FloatValSparseDatapointLowLevel* sparse = nullptr;
+};
+
 class BruteforceSearch {
  public:
   explicit BruteforceSearch(std::shared_ptr<BruteForceMeta> meta)
@@ -194,12 +203,25 @@ class BruteforceSearch {
 
     auto query_sparse_view = transform_sparse_query(sparse);
 
+    // Hybrid queries need the sparse score of every scanned row. Evaluated
+    // through the term postings this is one pass over the query terms'
+    // postings instead of one sparse merge per row.
+    std::vector<float> sparse_scores;
+    const std::vector<float>* sparse_scores_ptr = nullptr;
+    if (query_sparse_view && meta_->search_with_sparse_logit_alpha > 0.0f) {
+      size_t scanned = filter_bitmap ? filter_bitmap->nbit() : current_count_;
+      if (sparse_index_->prefer_postings(*query_sparse_view, scanned)) {
+        sparse_index_->sparse_head_output_all(*query_sparse_view,
+                                              sparse_scores);
+        sparse_scores_ptr = &sparse_scores;
+      }
+    }
+
     std::vector<char> encoded_query(vector_byte_size_);
     quantizer_->encode(static_cast<const float*>(query_data), meta_->dimension,
                        encoded_query.data());
 
-    using ResultPair = std::pair<float, uint64_t>;
-    std::priority_queue<ResultPair, std::vector<ResultPair>, std::greater<ResultPair>> pq;
+    ResultQueue pq;
 
     auto dist_func = space_->get_metric_function();
     void* dist_params = space_->get_metric_params();
@@ -209,7 +231,8 @@ class BruteforceSearch {
         char* ptr = data_buffer_ + (i * element_byte_size_);
 
         float dist = compute_score(encoded_query.data(), ptr, query_sparse_view,
-                                   i, dist_func, dist_params);
+                                   i, dist_func, dist_params,
+                                   sparse_scores_ptr);
 
         uint64_t label;
         std::memcpy(&label, ptr + vector_byte_size_, sizeof(uint64_t));
@@ -239,7 +262,8 @@ class BruteforceSearch {
         char* ptr = data_buffer_ + (idx * element_byte_size_);
 
         float dist = compute_score(encoded_query.data(), ptr, query_sparse_view,
-                                   idx, dist_func, dist_params);
+                                   idx, dist_func, dist_params,
+                                   sparse_scores_ptr);
 
         uint64_t label;
         std::memcpy(&label, ptr + vector_byte_size_, sizeof(uint64_t));
@@ -253,15 +277,113 @@ class BruteforceSearch {
       }
     }
 
-    size_t result_size = pq.size();
-    labels.resize(result_size);
-    scores.resize(result_size);
+    drain_results(pq, labels, scores);
+  }
 
-    for (int i = static_cast<int>(result_size) - 1; i >= 0; --i) {
-      const auto& top = pq.top();
-      scores[i] = top.first;
-      labels[i] = top.second;
-      pq.pop();
+  // Answer several queries with one pass over the rows.
+  //
+  // Rows are visited in cache-sized blocks and every query is scored against
+  // a block before the next one is loaded, so the data is streamed from
+  // memory once per batch instead of once per query. Queries whose filter
+  // keeps only a small share of the rows are cheaper through the set bits of
+  // their bitmap and are answered by search_knn() on their own.
+  void search_knn_batch(const std::vector<KnnQuery>& queries,
+                        std::vector<std::vector<uint64_t>>& labels,
+                        std::vector<std::vector<float>>& scores) const {
+    labels.assign(queries.size(), {});
+    scores.assign(queries.size(), {});
+    if (current_count_ == 0) {
+      return;
+    }
+
+    struct ScanQuery {
+      size_t pos = 0;
+      size_t k = 0;
+      std::vector<char> encoded_query;
+      std::shared_ptr<SparseDatapointView> sparse_view;
+      std::vector<float> sparse_scores;
+      bool has_sparse_scores = false;
+      // Rows admitted by the filter, indexed by row; empty when unfiltered.
+      std::vector<uint8_t> admitted;
+      ResultQueue pq;
+    };
+    std::vector<ScanQuery> scan;
+    scan.reserve(queries.size());
+    for (size_t q = 0; q < queries.size(); ++q) {
+      const auto& query = queries[q];
+      if (!query.query_data || query.k == 0) {
+        continue;
+      }
+      const Bitmap* bitmap = query.filter_bitmap;
+      if (bitmap && (bitmap->empty() ||
+                     bitmap->nbit() * kBatchScanMinFilterRatio <
+                         current_count_)) {
+        search_knn(query.query_data, query.k, bitmap, query.sparse, labels[q],
+                   scores[q]);
+        continue;
+      }
+
+      ScanQuery sq;
+      sq.pos = q;
+      sq.k = query.k;
+      sq.encoded_query.resize(vector_byte_size_);
+      quantizer_->encode(static_cast<const float*>(query.query_data),
+                         meta_->dimension, sq.encoded_query.data());
+      size_t scanned = current_count_;
+      if (bitmap) {
+        sq.admitted.assign(current_count_, 0);
+        std::vector<uint32_t> offsets;
+        bitmap->get_set_list(offsets);
+        for (uint32_t offset : offsets) {
+          auto it = offset_map_.find(offset);
+          if (it != offset_map_.end()) {
+            sq.admitted[it->second] = 1;
+          }
+        }
+        scanned = offsets.size();
+      }
+      sq.sparse_view = transform_sparse_query(query.sparse);
+      if (sq.sparse_view && meta_->search_with_sparse_logit_alpha > 0.0f &&
+          sparse_index_->prefer_postings(*sq.sparse_view, scanned)) {
+        sparse_index_->sparse_head_output_all(*sq.sparse_view,
+                                              sq.sparse_scores);
+        sq.has_sparse_scores = true;
+      }
+      scan.push_back(std::move(sq));
+    }
+    if (scan.empty()) {
+      return;
+    }
+
+    auto dist_func = space_->get_metric_function();
+    void* dist_params = space_->get_metric_params();
+    size_t block_rows =
+        std::max<size_t>(1, kBatchScanBlockBytes / element_byte_size_);
+    for (size_t begin = 0; begin < current_count_; begin += block_rows) {
+      size_t end = std::min(current_count_, begin + block_rows);
+      for (auto& sq : scan) {
+        for (size_t i = begin; i < end; ++i) {
+          if (!sq.admitted.empty() && !sq.admitted[i]) {
+            continue;
+          }
+          char* ptr = data_buffer_ + (i * element_byte_size_);
+          float dist =
+              compute_score(sq.encoded_query.data(), ptr, sq.sparse_view, i,
+                            dist_func, dist_params,
+                            sq.has_sparse_scores ? &sq.sparse_scores : nullptr);
+          if (sq.pq.size() < sq.k || dist > sq.pq.top().first) {
+            uint64_t label;
+            std::memcpy(&label, ptr + vector_byte_size_, sizeof(uint64_t));
+            if (sq.pq.size() == sq.k) {
+              sq.pq.pop();
+            }
+            sq.pq.emplace(dist, label);
+          }
+        }
+      }
+    }
+    for (auto& sq : scan) {
+      drain_results(sq.pq, labels[sq.pos], scores[sq.pos]);
     }
   }
 
@@ -348,6 +470,31 @@ class BruteforceSearch {
   }
 
  private:
+  using ResultPair = std::pair<float, uint64_t>;
+  // Min-heap on the score: the top is the worst of the current top-k.
+  using ResultQueue = std::priority_queue<ResultPair, std::vector<ResultPair>,
+                                          std::greater<ResultPair>>;
+
+  // A filter keeping fewer than 1/kBatchScanMinFilterRatio of the rows is
+  // answered from its bitmap instead of joining a batched scan.
+  static constexpr size_t kBatchScanMinFilterRatio = 8;
+  // Rows scored by every query of a batch before moving on (sized for L2).
+  static constexpr size_t kBatchScanBlockBytes = 256 * 1024;
+
+  static void drain_results(ResultQueue& pq, std::vector<uint64_t>& labels,
+                            std::vector<float>& scores) {
+    size_t result_size = pq.size();
+    labels.resize(result_size);
+    scores.resize(result_size);
+
+    for (int i = static_cast<int>(result_size) - 1; i >= 0; --i) {
+      const auto& top = pq.top();
+      scores[i] = top.first;
+      labels[i] = top.second;
+      pq.pop();
+    }
+  }
+
   void setup_metric() {
     reverse_query_score_ = (meta_->distance_type == "l2");
     if (meta_->quantization_type == "int8") {
@@ -413,8 +560,8 @@ class BruteforceSearch {
   float compute_score(
       const void* encoded_query, const char* data_ptr,
       const std::shared_ptr<SparseDatapointView>& query_sparse_view,
-      size_t idx, MetricFunc<float> dist_func,
-      void* dist_params) const {
+      size_t idx, MetricFunc<float> dist_func, void* dist_params,
+      const std::vector<float>* sparse_scores = nullptr) const {
     float dense_raw = dist_func(encoded_query, data_ptr, dist_params);
     float dense_score =
         reverse_query_score_ ? (1.0f - dense_raw) : dense_raw;
@@ -423,7 +570,9 @@ class BruteforceSearch {
       return dense_score;
     }
     float sparse_raw =
-        sparse_index_->sparse_head_output(*query_sparse_view, idx);
+        sparse_scores
+            ? (*sparse_scores)[idx]
+            : sparse_index_->sparse_head_output(*query_sparse_view, idx);
     float sparse_score =
         reverse_query_score_ ? (1.0f - sparse_raw) : sparse_raw;
     float alpha = meta_->search_with_sparse_logit_alpha;
@@ -0,0 +1,796 @@
+// Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+// SPDX-License-Identifier: Apache-2.0
+#pragma once
+
+#include <vector>
+#include <string>
+#include <fstream>
+#include <unordered_map>
+#include <unordered_set>
+#include <filesystem>
+#include <algorithm>
+#include <memory>
+#include <mutex>
+#include <queue>
+#include <random>
+#include <cmath>
+#include <cstring>
+#include <limits>
+#include <stdexcept>
+
+#include "index/detail/vector/common/vector_base.h"
+#include "index/detail/meta/hnsw_meta.h"
+#include "index/detail/search_context.h"
+#include "index/detail/vector/sparse_retrieval/sparse_data_holder.h"
+#include "index/detail/vector/common/quantizer.h"
+#include "index/detail/vector/common/space_int8.h"
+#include "index/detail/vector/common/space_l2.h"
+#include "index/detail/vector/common/space_ip.h"
+#include "index/detail/scalar/bitmap_holder/bitmap.h"
+#include "spdlog/spdlog.h"
+
+namespace vectordb {
+
+const std::string kHnswIndexFileName = "index_hnsw.data";
+
+// Hierarchical navigable small world graph over quantized vectors.
+//
+// Nodes are append-only: deleting or updating a label tombstones its node,
+// and the graph is compacted once tombstones outnumber live nodes. Each label
+// keeps a stable logical offset across updates so the scalar index (which is
+// keyed by offset) never has to be rewritten.
+//
+// Scores follow BruteforceSearch: higher is better, l2 is reported as 1-dist,
+// and sparse logits are fused into the final ranking of graph candidates.
+class HnswSearch {
+ public:
+  explicit HnswSearch(std::shared_ptr<HnswMeta> meta) : meta_(meta) {
+    m_ = meta_->m;
+    max_m0_ = meta_->m * 2;
+    level_mult_ = 1.0 / std::log(static_cast<double>(m_));
+
+    setup_metric();
+    quantizer_ = createQuantizer(meta_->quantization_type, meta_->distance_type,
+                                 meta_->dimension);
+    vector_byte_size_ = quantizer_->get_encoded_size();
+
+    size_t reserve_count = meta_->max_element_count;
+    vectors_.reserve(reserve_count * vector_byte_size_);
+    links0_.reserve(reserve_count * (max_m0_ + 1));
+
+    if (meta_->enable_sparse) {
+      sparse_index_ = std::make_unique<SparseDataHolder>();
+      bool use_l2 = (meta_->distance_type == "l2");
+      sparse_index_->set_params(meta_->index_with_sparse_logit_alpha,
+                                meta_->search_with_sparse_logit_alpha, use_l2);
+      sparse_index_->set_max_elements(meta_->max_element_count);
+      sparse_index_->init_empty_data();
+    }
+  }
+
+  void add_point(const void* vector, uint64_t label,
+                 FloatValSparseDatapointLowLevel* sparse_data = nullptr) {
+    std::shared_ptr<SparseDatapoint> sparse_dp;
+    if (sparse_index_ && sparse_data) {
+      if (sparse_index_->make_sparse_point_by_low_level(sparse_data,
+                                                        &sparse_dp) != 0) {
+        throw std::runtime_error("Sparse data conversion failed");
+      }
+    }
+
+    std::vector<char> encoded(vector_byte_size_);
+    uint32_t logical_offset;
+    auto it = label_map_.find(label);
+    if (it != label_map_.end()) {
+      uint32_t old_node = it->second;
+      logical_offset = offsets_[old_node];
+      if (vector) {
+        quantizer_->encode(static_cast<const float*>(vector), meta_->dimension,
+                           encoded.data());
+      } else {
+        std::memcpy(encoded.data(), node_vector(old_node), vector_byte_size_);
+      }
+      if (sparse_index_ && !sparse_dp) {
+        sparse_dp = sparse_index_->get_row(old_node);
+      }
+      tombstone(old_node);
+    } else {
+      if (!vector) {
+        throw std::runtime_error("HnswSearch: null vector for new label");
+      }
+      quantizer_->encode(static_cast<const float*>(vector), meta_->dimension,
+                         encoded.data());
+      logical_offset = static_cast<uint32_t>(next_logical_offset_++);
+    }
+
+    insert_node(encoded.data(), label, logical_offset, sparse_dp);
+    maybe_compact();
+  }
+
+  void remove_point(uint64_t label) {
+    auto it = label_map_.find(label);
+    if (it == label_map_.end())
+      return;
+    uint32_t node = it->second;
+    label_map_.erase(it);
+    offset_map_.erase(offsets_[node]);
+    tombstone(node);
+    maybe_compact();
+  }
+
+  void search_knn(const void* query_data, size_t k, const Bitmap* filter_bitmap,
+                  FloatValSparseDatapointLowLevel* sparse,
+                  std::vector<uint64_t>& labels,
+                  std::vector<float>& scores) const {
+    labels.clear();
+    scores.clear();
+    if (!query_data || k == 0 || label_map_.empty() ||
+        (filter_bitmap && filter_bitmap->empty())) {
+      return;
+    }
+
+    auto query_sparse_view = transform_sparse_query(sparse);
+
+    std::vector<char> encoded_query(vector_byte_size_);
+    quantizer_->encode(static_cast<const float*>(query_data), meta_->dimension,
+                       encoded_query.data());
+
+    size_t ef = std::max<size_t>(meta_->ef_search, k);
+    std::vector<std::pair<float, uint32_t>> candidates;
+
+    // A selective filter leaves too few reachable nodes for the graph walk to
+    // find; scanning the allowed offsets directly is both exact and cheaper.
+    bool scan_filter = false;
+    if (filter_bitmap) {
+      size_t allowed = filter_bitmap->nbit();
+      scan_filter = allowed <= ef ||
+                    allowed * kFilterScanRatio <= label_map_.size();
+    }
+
+    if (scan_filter) {
+      std::vector<uint32_t> offsets;
+      filter_bitmap->get_set_list(offsets);
+      candidates.reserve(offsets.size());
+      for (uint32_t offset : offsets) {
+        auto it = offset_map_.find(offset);
+        if (it == offset_map_.end()) {
+          continue;
+        }
+        candidates.emplace_back(0.0f, it->second);
+      }
+    } else {
+      uint32_t ep = entry_point_;
+      float ep_score = dense_score(encoded_query.data(), node_vector(ep));
+      for (int level = max_level_; level > 0; --level) {
+        greedy_step(encoded_query.data(), level, ep, ep_score);
+      }
+      candidates =
+          search_layer(encoded_query.data(), ep, ef, 0, filter_bitmap, true);
+      add_sparse_candidates(query_sparse_view, k, filter_bitmap, candidates);
+    }
+
+    // Final ranking uses the same fused dense/sparse score as the flat index.
+    using ResultPair = std::pair<float, uint64_t>;
+    std::priority_queue<ResultPair, std::vector<ResultPair>,
+                        std::greater<ResultPair>>
+        pq;
+    for (const auto& cand : candidates) {
+      uint32_t node = cand.second;
+      float score =
+          compute_score(encoded_query.data(), node, query_sparse_view);
+      if (pq.size() < k) {
+        pq.emplace(score, labels_[node]);
+      } else if (score > pq.top().first) {
+        pq.pop();
+        pq.emplace(score, labels_[node]);
+      }
+    }
+
+    size_t result_size = pq.size();
+    labels.resize(result_size);
+    scores.resize(result_size);
+    for (int i = static_cast<int>(result_size) - 1; i >= 0; --i) {
+      const auto& top = pq.top();
+      scores[i] = top.first;
+      labels[i] = top.second;
+      pq.pop();
+    }
+  }
+
+  void save(const std::filesystem::path& dir) {
+    if (meta_) {
+      meta_->element_count = label_map_.size();
+      meta_->max_element_count =
+          std::max<uint64_t>(meta_->max_element_count, node_count());
+    }
+    std::string path = (dir / kHnswIndexFileName).string();
+    std::ofstream out(path, std::ios::binary);
+    if (!out)
+      throw std::runtime_error("Failed to open hnsw index file for write");
+
+    size_t count = node_count();
+    write_binary(out, kHnswFormatVersion);
+    write_binary(out, vector_byte_size_);
+    write_binary(out, m_);
+    write_binary(out, count);
+    write_binary(out, entry_point_);
+    write_binary(out, max_level_);
+    write_binary(out, next_logical_offset_);
+
+    out.write(vectors_.data(), count * vector_byte_size_);
+    out.write(reinterpret_cast<const char*>(labels_.data()),
+              count * sizeof(uint64_t));
+    out.write(reinterpret_cast<const char*>(offsets_.data()),
+              count * sizeof(uint32_t));
+    out.write(reinterpret_cast<const char*>(levels_.data()),
+              count * sizeof(int32_t));
+    out.write(reinterpret_cast<const char*>(deleted_.data()),
+              count * sizeof(uint8_t));
+    out.write(reinterpret_cast<const char*>(links0_.data()),
+              links0_.size() * sizeof(uint32_t));
+    for (size_t i = 0; i < count; ++i) {
+      const auto& upper = upper_links_[i];
+      write_binary(out, upper.size());
+      out.write(reinterpret_cast<const char*>(upper.data()),
+                upper.size() * sizeof(uint32_t));
+    }
+
+    if (sparse_index_) {
+      size_t dummy;
+      sparse_index_->save_data(dir, dummy);
+    }
+  }
+
+  void load(const std::filesystem::path& dir) {
+    std::string path = (dir / kHnswIndexFileName).string();
+    std::ifstream in(path, std::ios::binary);
+    if (!in)
+      throw std::runtime_error("Failed to open index file");
+
+    uint32_t version;
+    size_t loaded_vec_size, loaded_m, count;
+    read_binary(in, version);
+    read_binary(in, loaded_vec_size);
+    read_binary(in, loaded_m);
+    if (version != kHnswFormatVersion) {
+      throw std::runtime_error("Unsupported hnsw index format version");
+    }
+    if (loaded_vec_size != vector_byte_size_ || loaded_m != m_) {
+      throw std::runtime_error("HNSW layout mismatch");
+    }
+    read_binary(in, count);
+    read_binary(in, entry_point_);
+    read_binary(in, max_level_);
+    read_binary(in, next_logical_offset_);
+
+    vectors_.resize(count * vector_byte_size_);
+    labels_.resize(count);
+    offsets_.resize(count);
+    levels_.resize(count);
+    deleted_.resize(count);
+    links0_.resize(count * (max_m0_ + 1));
+    upper_links_.assign(count, {});
+
+    in.read(vectors_.data(), count * vector_byte_size_);
+    in.read(reinterpret_cast<char*>(labels_.data()), count * sizeof(uint64_t));
+    in.read(reinterpret_cast<char*>(offsets_.data()), count * sizeof(uint32_t));
+    in.read(reinterpret_cast<char*>(levels_.data()), count * sizeof(int32_t));
+    in.read(reinterpret_cast<char*>(deleted_.data()), count * sizeof(uint8_t));
+    in.read(reinterpret_cast<char*>(links0_.data()),
+            links0_.size() * sizeof(uint32_t));
+    for (size_t i = 0; i < count; ++i) {
+      size_t upper_size;
+      read_binary(in, upper_size);
+      upper_links_[i].resize(upper_size);
+      in.read(reinterpret_cast<char*>(upper_links_[i].data()),
+              upper_size * sizeof(uint32_t));
+    }
+    if (!in) {
+      throw std::runtime_error("Truncated hnsw index file");
+    }
+
+    rebuild_maps();
+
+    if (sparse_index_) {
+      sparse_index_->load_data(dir);
+    }
+  }
+
+  uint64_t get_data_num() const {
+    return label_map_.size();
+  }
+
+  int get_offset_by_label(uint64_t label) {
+    auto it = label_map_.find(label);
+    if (it != label_map_.end()) {
+      return offsets_[it->second];
+    }
+    return -1;
+  }
+
+  uint64_t get_label_by_offset(int offset) {
+    auto it = offset_map_.find(offset);
+    if (it != offset_map_.end()) {
+      return labels_[it->second];
+    }
+    return -1;
+  }
+
+ private:
+  static constexpr uint32_t kHnswFormatVersion = 1;
+  static constexpr uint32_t kInvalidNode =
+      std::numeric_limits<uint32_t>::max();
+  // Filters matching fewer than 1/kFilterScanRatio of the live rows are
+  // answered by scanning the bitmap instead of walking the graph.
+  static constexpr size_t kFilterScanRatio = 20;
+  // Do not bother compacting tiny graphs.
+  static constexpr size_t kMinCompactTombstones = 64;
+
+  using ScoredNode = std::pair<float, uint32_t>;
+
+  // Per-query visited marks, pooled so concurrent searches do not allocate
+  // an O(n) buffer each time.
+  struct VisitedList {
+    std::vector<uint16_t> marks;
+    uint16_t tag = 0;
+
+    void reset(size_t n) {
+      if (marks.size() < n) {
+        marks.resize(n, 0);
+      }
+      if (++tag == 0) {
+        std::fill(marks.begin(), marks.end(), 0);
+        tag = 1;
+      }
+    }
+    bool visit(uint32_t node) {
+      if (marks[node] == tag)
+        return false;
+      marks[node] = tag;
+      return true;
+    }
+  };
+
+  std::unique_ptr<VisitedList> acquire_visited(size_t n) const {
+    std::unique_ptr<VisitedList> visited;
+    {
+      std::lock_guard<std::mutex> guard(visited_mutex_);
+      if (!visited_pool_.empty()) {
+        visited = std::move(visited_pool_.back());
+        visited_pool_.pop_back();
+      }
+    }
+    if (!visited) {
+      visited = std::make_unique<VisitedList>();
+    }
+    visited->reset(n);
+    return visited;
+  }
+
+  void release_visited(std::unique_ptr<VisitedList> visited) const {
+    std::lock_guard<std::mutex> guard(visited_mutex_);
+    visited_pool_.push_back(std::move(visited));
+  }
+
+  size_t node_count() const {
+    return labels_.size();
+  }
+
+  const char* node_vector(uint32_t node) const {
+    return vectors_.data() + static_cast<size_t>(node) * vector_byte_size_;
+  }
+
+  uint32_t* links(uint32_t node, int level) {
+    if (level == 0) {
+      return links0_.data() + static_cast<size_t>(node) * (max_m0_ + 1);
+    }
+    return upper_links_[node].data() + (level - 1) * (m_ + 1);
+  }
+
+  const uint32_t* links(uint32_t node, int level) const {
+    return const_cast<HnswSearch*>(this)->links(node, level);
+  }
+
+  size_t max_links(int level) const {
+    return level == 0 ? max_m0_ : m_;
+  }
+
+  bool accepted(uint32_t node, const Bitmap* filter_bitmap) const {
+    if (deleted_[node])
+      return false;
+    return !filter_bitmap || filter_bitmap->Isset(offsets_[node]);
+  }
+
+  float dense_score(const char* a, const char* b) const {
+    float raw = dist_func_(a, b, dist_params_);
+    return reverse_query_score_ ? (1.0f - raw) : raw;
+  }
+
+  int random_level() {
+    std::uniform_real_distribution<double> dist(0.0, 1.0);
+    double r = -std::log(std::max(dist(level_rng_), 1e-12)) * level_mult_;
+    return static_cast<int>(r);
+  }
+
+  void greedy_step(const char* query, int level, uint32_t& ep,
+                   float& ep_score) const {
+    bool changed = true;
+    while (changed) {
+      changed = false;
+      const uint32_t* ll = links(ep, level);
+      uint32_t size = ll[0];
+      for (uint32_t i = 1; i <= size; ++i) {
+        uint32_t cand = ll[i];
+        float score = dense_score(query, node_vector(cand));
+        if (score > ep_score) {
+          ep_score = score;
+          ep = cand;
+          changed = true;
+        }
+      }
+    }
+  }
+
+  // Best-first search on one layer. Every reachable node is used for
+  // navigation, but only nodes passing `accepted` (live and, when
+  // `apply_filter`, inside the bitmap) enter the result set. Results are
+  // returned best first.
+  std::vector<ScoredNode> search_layer(const char* query, uint32_t ep,
+                                       size_t ef, int level,
+                                       const Bitmap* filter_bitmap,
+                                       bool apply_filter) const {
+    auto visited = acquire_visited(node_count());
+
+    std::priority_queue<ScoredNode> candidates;  // max-heap on score
+    std::priority_queue<ScoredNode, std::vector<ScoredNode>,
+                        std::greater<ScoredNode>>
+        results;  // min-heap on score
+
+    float ep_score = dense_score(query, node_vector(ep));
+    visited->visit(ep);
+    candidates.emplace(ep_score, ep);
+    if (!apply_filter || accepted(ep, filter_bitmap)) {
+      results.emplace(ep_score, ep);
+    }
+
+    while (!candidates.empty()) {
+      auto current = candidates.top();
+      if (results.size() >= ef && current.first < results.top().first) {
+        break;
+      }
+      candidates.pop();
+
+      const uint32_t* ll = links(current.second, level);
+      uint32_t size = ll[0];
+      for (uint32_t i = 1; i <= size; ++i) {
+        uint32_t cand = ll[i];
+        if (!visited->visit(cand))
+          continue;
+        float score = dense_score(query, node_vector(cand));
+        if (results.size() < ef || score > results.top().first) {
+          candidates.emplace(score, cand);
+          if (!apply_filter || accepted(cand, filter_bitmap)) {
+            results.emplace(score, cand);
+            if (results.size() > ef) {
+              results.pop();
+            }
+          }
+        }
+      }
+    }
+    release_visited(std::move(visited));
+
+    std::vector<ScoredNode> out(results.size());
+    for (int i = static_cast<int>(out.size()) - 1; i >= 0; --i) {
+      out[i] = results.top();
+      results.pop();
+    }
+    return out;
+  }
+
+  // Neighbour selection heuristic from the HNSW paper: keep a candidate only
+  // if it is closer to the base node than to every neighbour already kept.
+  // `candidates` must be sorted best first.
+  std::vector<uint32_t> select_neighbors(
+      const std::vector<ScoredNode>& candidates, size_t max_count) const {
+    std::vector<uint32_t> selected;
+    selected.reserve(max_count);
+    for (const auto& cand : candidates) {
+      if (selected.size() >= max_count)
+        break;
+      bool keep = true;
+      for (uint32_t chosen : selected) {
+        if (dense_score(node_vector(cand.second), node_vector(chosen)) >
+            cand.first) {
+          keep = false;
+          break;
+        }
+      }
+      if (keep) {
+        selected.push_back(cand.second);
+      }
+    }
+    return selected;
+  }
+
+  void connect(uint32_t node, uint32_t neighbor, int level) {
+    uint32_t* ll = links(neighbor, level);
+    uint32_t size = ll[0];
+    size_t limit = max_links(level);
+    if (size < limit) {
+      ll[size + 1] = node;
+      ll[0] = size + 1;
+      return;
+    }
+
+    const char* base = node_vector(neighbor);
+    std::vector<ScoredNode> cands;
+    cands.reserve(size + 1);
+    cands.emplace_back(dense_score(base, node_vector(node)), node);
+    for (uint32_t i = 1; i <= size; ++i) {
+      cands.emplace_back(dense_score(base, node_vector(ll[i])), ll[i]);
+    }
+    std::sort(cands.begin(), cands.end(), std::greater<ScoredNode>());
+    auto kept = select_neighbors(cands, limit);
+    ll[0] = static_cast<uint32_t>(kept.size());
+    std::copy(kept.begin(), kept.end(), ll + 1);
+  }
+
+  void insert_node(const char* encoded, uint64_t label, uint32_t logical_offset,
+                   const std::shared_ptr<SparseDatapoint>& sparse_dp) {
+    uint32_t node = static_cast<uint32_t>(node_count());
+    int level = random_level();
+
+    vectors_.insert(vectors_.end(), encoded, encoded + vector_byte_size_);
+    labels_.push_back(label);
+    offsets_.push_back(logical_offset);
+    levels_.push_back(level);
+    deleted_.push_back(0);
+    links0_.resize(links0_.size() + max_m0_ + 1, 0);
+    upper_links_.emplace_back(static_cast<size_t>(level) * (m_ + 1), 0);
+
+    if (sparse_index_) {
+      auto dp = sparse_dp ? sparse_dp
+                          : std::make_shared<SparseDatapoint>(
+                                std::vector<IndexT>(), std::vector<float>());
+      if (sparse_index_->append_low_level_sparse(dp) != 0) {
+        throw std::runtime_error("Failed to append sparse data");
+      }
+    }
+
+    label_map_[label] = node;
+    offset_map_[logical_offset] = node;
+
+    if (entry_point_ == kInvalidNode) {
+      entry_point_ = node;
+      max_level_ = level;
+      return;
+    }
+
+    const char* query = node_vector(node);
+    uint32_t ep = entry_point_;
+    float ep_score = dense_score(query, node_vector(ep));
+    for (int l = max_level_; l > level; --l) {
+      greedy_step(query, l, ep, ep_score);
+    }
+    for (int l = std::min(level, max_level_); l >= 0; --l) {
+      auto found =
+          search_layer(query, ep, meta_->ef_construction, l, nullptr, false);
+      auto neighbors = select_neighbors(found, m_);
+      uint32_t* ll = links(node, l);
+      ll[0] = static_cast<uint32_t>(neighbors.size());
+      std::copy(neighbors.begin(), neighbors.end(), ll + 1);
+      for (uint32_t neighbor : neighbors) {
+        connect(node, neighbor, l);
+      }
+      if (!found.empty()) {
+        ep = found.front().second;
+      }
+    }
+
+    if (level > max_level_) {
+      entry_point_ = node;
+      max_level_ = level;
+    }
+  }
+
+  void tombstone(uint32_t node) {
+    if (!deleted_[node]) {
+      deleted_[node] = 1;
+      ++deleted_count_;
+    }
+  }
+
+  // Rebuild the graph from live nodes once tombstones dominate, so deleted
+  // nodes stop costing memory and traversal time. Labels keep their offsets.
+  void maybe_compact() {
+    if (deleted_count_ < kMinCompactTombstones ||
+        deleted_count_ <= label_map_.size()) {
+      return;
+    }
+    SPDLOG_DEBUG("HnswSearch::compact live={}, tombstones={}",
+                 label_map_.size(), deleted_count_);
+
+    std::vector<char> old_vectors;
+    std::vector<uint64_t> old_labels;
+    std::vector<uint32_t> old_offsets;
+    std::vector<uint8_t> old_deleted;
+    old_vectors.swap(vectors_);
+    old_labels.swap(labels_);
+    old_offsets.swap(offsets_);
+    old_deleted.swap(deleted_);
+
+    // Sparse rows are copied out and re-appended in node order. The holder is
+    // kept (not recreated) so its term dictionary stays valid for the rows.
+    std::vector<std::shared_ptr<SparseDatapoint>> live_sparse;
+    if (sparse_index_) {
+      for (size_t i = 0; i < old_labels.size(); ++i) {
+        if (!old_deleted[i]) {
+          live_sparse.push_back(sparse_index_->get_row(i));
+        }
+      }
+      while (sparse_index_->rows() > 0) {
+        sparse_index_->pop_back();
+      }
+    }
+
+    levels_.clear();
+    links0_.clear();
+    upper_links_.clear();
+    label_map_.clear();
+    offset_map_.clear();
+    entry_point_ = kInvalidNode;
+    max_level_ = -1;
+    deleted_count_ = 0;
+
+    size_t live_idx = 0;
+    for (size_t i = 0; i < old_labels.size(); ++i) {
+      if (old_deleted[i])
+        continue;
+      std::shared_ptr<SparseDatapoint> sparse_dp;
+      if (sparse_index_) {
+        sparse_dp = live_sparse[live_idx];
+      }
+      insert_node(old_vectors.data() + i * vector_byte_size_, old_labels[i],
+                  old_offsets[i], sparse_dp);
+      ++live_idx;
+    }
+  }
+
+  void rebuild_maps() {
+    label_map_.clear();
+    offset_map_.clear();
+    deleted_count_ = 0;
+    uint32_t max_offset = 0;
+    for (size_t i = 0; i < node_count(); ++i) {
+      uint32_t off = offsets_[i];
+      if (off > max_offset) {
+        max_offset = off;
+      }
+      if (deleted_[i]) {
+        ++deleted_count_;
+        continue;
+      }
+      label_map_[labels_[i]] = static_cast<uint32_t>(i);
+      offset_map_[off] = static_cast<uint32_t>(i);
+    }
+    if (node_count() > 0 && next_logical_offset_ <= max_offset) {
+      next_logical_offset_ = max_offset + 1;
+    }
+  }
+
+  void setup_metric() {
+    reverse_query_score_ = (meta_->distance_type == "l2");
+    if (meta_->quantization_type == "int8") {
+      if (meta_->distance_type == "l2")
+        space_ = std::make_unique<L2SpaceInt8>(meta_->dimension);
+      else
+        space_ = std::make_unique<InnerProductSpaceInt8>(meta_->dimension);
+    } else {
+      if (meta_->distance_type == "l2")
+        space_ = std::make_unique<L2Space>(meta_->dimension);
+      else
+        space_ = std::make_unique<InnerProductSpace>(meta_->dimension);
+    }
+    dist_func_ = space_->get_metric_function();
+    dist_params_ = space_->get_metric_params();
+  }
+
+  // The graph is built on dense vectors only, so rows that match the query
+  // mostly through its sparse terms may never be reached. Add the sparse top-k
+  // (MaxScore over the term postings, honouring the filter) to the
+  // candidates; all of them are then ranked by the fused score.
+  void add_sparse_candidates(
+      const std::shared_ptr<SparseDatapointView>& query_sparse_view, size_t k,
+      const Bitmap* filter_bitmap,
+      std::vector<std::pair<float, uint32_t>>& candidates) const {
+    if (!query_sparse_view || meta_->search_with_sparse_logit_alpha <= 0.0f) {
+      return;
+    }
+    auto accept = [this, filter_bitmap](DocID node) {
+      return node < node_count() && !deleted_[node] &&
+             (!filter_bitmap || filter_bitmap->Isset(offsets_[node]));
+    };
+    std::vector<std::pair<float, DocID>> sparse_top;
+    if (!sparse_index_->sparse_head_topk(*query_sparse_view, k, accept,
+                                         sparse_top)) {
+      return;
+    }
+    std::unordered_set<uint32_t> seen;
+    seen.reserve(candidates.size());
+    for (const auto& cand : candidates) {
+      seen.insert(cand.second);
+    }
+    for (const auto& hit : sparse_top) {
+      uint32_t node = static_cast<uint32_t>(hit.second);
+      if (seen.insert(node).second) {
+        candidates.emplace_back(0.0f, node);
+      }
+    }
+  }
+
+  std::shared_ptr<SparseDatapointView> transform_sparse_query(
+      const FloatValSparseDatapointLowLevel* sparse) const {
+    if (!meta_->search_with_sparse_logit_alpha || !sparse || !sparse_index_) {
+      return nullptr;
+    }
+    std::shared_ptr<SparseDatapointView> view;
+    sparse_index_->make_sparse_view_by_low_level(sparse, &view);
+    return view;
+  }
+
+  float compute_score(
+      const char* encoded_query, uint32_t node,
+      const std::shared_ptr<SparseDatapointView>& query_sparse_view) const {
+    float dense = dense_score(encoded_query, node_vector(node));
+    if (!sparse_index_ || !query_sparse_view ||
+        meta_->search_with_sparse_logit_alpha <= 0.0f) {
+      return dense;
+    }
+    float sparse_raw =
+        sparse_index_->sparse_head_output(*query_sparse_view, node);
+    float sparse_score =
+        reverse_query_score_ ? (1.0f - sparse_raw) : sparse_raw;
+    float alpha = meta_->search_with_sparse_logit_alpha;
+    return dense * (1.0f - alpha) + sparse_score * alpha;
+  }
+
+  std::shared_ptr<HnswMeta> meta_;
+  size_t m_ = 16;
+  size_t max_m0_ = 32;
+  double level_mult_ = 0.0;
+  size_t vector_byte_size_ = 0;
+
+  // Node storage, indexed by internal node id.
+  std::vector<char> vectors_;
+  std::vector<uint64_t> labels_;
+  std::vector<uint32_t> offsets_;
+  std::vector<int32_t> levels_;
+  std::vector<uint8_t> deleted_;
+  // Layer 0 adjacency: [count, id * max_m0_] per node.
+  std::vector<uint32_t> links0_;
+  // Upper layers: `levels_[n]` blocks of [count, id * m_] per node.
+  std::vector<std::vector<uint32_t>> upper_links_;
+
+  uint32_t entry_point_ = kInvalidNode;
+  int32_t max_level_ = -1;
+  size_t deleted_count_ = 0;
+  uint64_t next_logical_offset_ = 0;
+
+  std::unordered_map<uint64_t, uint32_t> label_map_;
+  std::unordered_map<uint32_t, uint32_t> offset_map_;
+
+  std::unique_ptr<VectorSpace<float>> space_;
+  MetricFunc<float> dist_func_ = nullptr;
+  void* dist_params_ = nullptr;
+  std::unique_ptr<VectorQuantizer> quantizer_;
+  std::unique_ptr<SparseDataHolder> sparse_index_;
+  bool reverse_query_score_ = false;
+  // Fixed seed keeps graph layout reproducible for a given insert order.
+  std::mt19937 level_rng_{100};
+
+  mutable std::mutex visited_mutex_;
+  mutable std::vector<std::unique_ptr<VisitedList>> visited_pool_;
+};
+
+}  // namespace vectordb
@@ -52,6 +52,7 @@ class SparseDataHolder {
     index_with_sparse_bias_alpha_ =
         index_with_sparse_bias_ ? 0.5 : 0.0;  // Default equal weight addition
     search_with_sparse_bias_alpha_ = search_with_sparse_bias_ ? 0.5 : 0.0;
+    search_use_l2_ = search_use_l2;
     if (search_use_l2) {
       sparse_logit_func_ = &SparseDataHolder::sparse_head_squared_l2_logit;
     } else {
@@ -68,6 +69,7 @@ class SparseDataHolder {
         (search_with_sparse_bias_alpha != 0.0 ? true : false);  // For compatibility
     index_with_sparse_bias_alpha_ = index_with_sparse_bias_alpha;
     search_with_sparse_bias_alpha_ = search_with_sparse_bias_alpha;
+    search_use_l2_ = search_use_l2;
     if (search_use_l2) {
       sparse_logit_func_ = &SparseDataHolder::sparse_head_squared_l2_logit;
     } else {
@@ -150,6 +152,39 @@ class SparseDataHolder {
     return sparse_holder_.sparse_dot_product_reduce(x, docid);
   }
 
+  // sparse_head_output(x, docid) for every row, through the term postings.
+  void sparse_head_output_all(const SparseDatapointView& x,
+                              std::vector<float>& scores) const {
+    if (search_use_l2_) {
+      sparse_holder_.sparse_squared_l2_all(x, scores);
+    } else {
+      sparse_holder_.sparse_dot_product_all(x, scores);
+    }
+  }
+
+  // Whether sparse_head_output_all() visits fewer entries than scoring
+  // `candidates` rows one by one.
+  bool prefer_postings(const SparseDatapointView& x, size_t candidates) const {
+    size_t rows = sparse_holder_.rows();
+    if (rows == 0) {
+      return false;
+    }
+    size_t per_row = sparse_holder_.entries() / rows + x.nonzero_entries();
+    return sparse_holder_.posting_count(x) < candidates * per_row;
+  }
+
+  // Top-k rows by sparse dot product among the rows `accept` admits, best
+  // first. Only meaningful for the dot product head (higher is better).
+  bool sparse_head_topk(const SparseDatapointView& x, size_t k,
+                        const std::function<bool(DocID)>& accept,
+                        std::vector<std::pair<float, DocID>>& result) {
+    if (search_use_l2_) {
+      return false;
+    }
+    sparse_holder_.sparse_dot_product_topk(x, k, accept, result);
+    return true;
+  }
+
   size_t rows() {
     return sparse_holder_.rows();
   }
@@ -249,6 +284,7 @@ class SparseDataHolder {
   bool search_with_sparse_bias_ = false;
   float index_with_sparse_bias_alpha_ = 0.0;
   float search_with_sparse_bias_alpha_ = 0.0;
+  bool search_use_l2_ = false;
 
   sparse_logit_func sparse_logit_func_;
   SparseRowIndex sparse_holder_;
@@ -0,0 +1,220 @@
+// Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+// SPDX-License-Identifier: Apache-2.0
+#include "index/detail/vector/sparse_retrieval/sparse_inverted_index.h"
+
+#include <algorithm>
+#include <limits>
+
+namespace vectordb {
+
+namespace {
+
+// Stale postings are purged once there are at least this many and they
+// outnumber the live ones.
+constexpr size_t kMinCompactStalePostings = 4096;
+
+}  // namespace
+
+void SparseInvertedIndex::clear() {
+  postings_.clear();
+  max_values_.clear();
+  min_values_.clear();
+  generations_.clear();
+  row_sizes_.clear();
+  squared_norms_.clear();
+  live_postings_ = 0;
+  stale_postings_ = 0;
+}
+
+void SparseInvertedIndex::drop_row(DocID doc) {
+  live_postings_ -= row_sizes_[doc];
+  stale_postings_ += row_sizes_[doc];
+  row_sizes_[doc] = 0;
+  squared_norms_[doc] = 0.0f;
+  ++generations_[doc];
+}
+
+void SparseInvertedIndex::set_row(DocID doc, const SparseDatapointView& row) {
+  if (doc >= generations_.size()) {
+    generations_.resize(doc + 1, 0);
+    row_sizes_.resize(doc + 1, 0);
+    squared_norms_.resize(doc + 1, 0.0f);
+  } else {
+    drop_row(doc);
+  }
+
+  const uint32_t generation = generations_[doc];
+  const IndexT* indices = row.indices();
+  const float* values = row.values();
+  size_t nnz = row.nonzero_entries();
+  float norm = 0.0f;
+  for (size_t i = 0; i < nnz; ++i) {
+    IndexT term = indices[i];
+    float value = values[i];
+    if (term >= postings_.size()) {
+      postings_.resize(term + 1);
+      max_values_.resize(term + 1, 0.0f);
+      min_values_.resize(term + 1, 0.0f);
+    }
+    postings_[term].push_back(
+        Posting{static_cast<uint32_t>(doc), generation, value});
+    max_values_[term] = std::max(max_values_[term], value);
+    min_values_[term] = std::min(min_values_[term], value);
+    norm += value * value;
+  }
+  row_sizes_[doc] = static_cast<uint32_t>(nnz);
+  squared_norms_[doc] = norm;
+  live_postings_ += nnz;
+}
+
+void SparseInvertedIndex::remove_row(DocID doc) {
+  if (doc < generations_.size()) {
+    drop_row(doc);
+  }
+}
+
+bool SparseInvertedIndex::need_compact() const {
+  return stale_postings_ >= kMinCompactStalePostings &&
+         stale_postings_ > live_postings_;
+}
+
+void SparseInvertedIndex::compact(
+    size_t rows, const std::function<SparseDatapointView(DocID)>& row_of) {
+  clear();
+  for (DocID doc = 0; doc < rows; ++doc) {
+    set_row(doc, row_of(doc));
+  }
+}
+
+size_t SparseInvertedIndex::posting_count(
+    const SparseDatapointView& query) const {
+  size_t count = 0;
+  for (size_t i = 0; i < query.nonzero_entries(); ++i) {
+    IndexT term = query.indices()[i];
+    if (term < postings_.size()) {
+      count += postings_[term].size();
+    }
+  }
+  return count;
+}
+
+void SparseInvertedIndex::dot_product_all(const SparseDatapointView& query,
+                                          size_t rows,
+                                          std::vector<float>& scores) const {
+  scores.assign(rows, 0.0f);
+  for (size_t i = 0; i < query.nonzero_entries(); ++i) {
+    IndexT term = query.indices()[i];
+    if (term >= postings_.size()) {
+      continue;
+    }
+    float weight = query.values()[i];
+    for (const auto& posting : postings_[term]) {
+      if (posting.doc < rows && is_live(posting)) {
+        scores[posting.doc] += weight * posting.value;
+      }
+    }
+  }
+}
+
+void SparseInvertedIndex::dot_product_topk(
+    const SparseDatapointView& query, size_t k,
+    const std::function<bool(DocID)>& accept,
+    const std::function<float(DocID)>& exact_score,
+    std::vector<ScoredDoc>& result) const {
+  result.clear();
+  if (k == 0) {
+    return;
+  }
+
+  struct QueryTerm {
+    IndexT term;
+    float weight;
+    float upper_bound;
+  };
+  std::vector<QueryTerm> terms;
+  bool prunable = true;
+  for (size_t i = 0; i < query.nonzero_entries(); ++i) {
+    IndexT term = query.indices()[i];
+    if (term >= postings_.size() || postings_[term].empty()) {
+      continue;
+    }
+    float weight = query.values()[i];
+    float hi = weight * max_values_[term];
+    float lo = weight * min_values_[term];
+    if (std::min(hi, lo) < 0.0f) {
+      prunable = false;
+    }
+    terms.push_back(QueryTerm{term, weight, std::max({hi, lo, 0.0f})});
+  }
+  if (terms.empty()) {
+    return;
+  }
+  std::sort(terms.begin(), terms.end(),
+            [](const QueryTerm& a, const QueryTerm& b) {
+              return a.upper_bound > b.upper_bound;
+            });
+  // remaining_bound[j]: best score the terms j.. can still add to any row.
+  std::vector<float> remaining_bound(terms.size() + 1, 0.0f);
+  for (size_t j = terms.size(); j-- > 0;) {
+    remaining_bound[j] = remaining_bound[j + 1] + terms[j].upper_bound;
+  }
+
+  // 0 = unseen, 1 = candidate, 2 = rejected by `accept`.
+  std::vector<uint8_t> state(generations_.size(), 0);
+  std::vector<float> acc(generations_.size(), 0.0f);
+  std::vector<uint32_t> candidates;
+  std::vector<float> kth_buffer;
+  float threshold = -std::numeric_limits<float>::infinity();
+
+  size_t evaluated = 0;
+  for (; evaluated < terms.size(); ++evaluated) {
+    if (prunable && candidates.size() >= k &&
+        remaining_bound[evaluated] < threshold) {
+      break;
+    }
+    const auto& qt = terms[evaluated];
+    for (const auto& posting : postings_[qt.term]) {
+      if (!is_live(posting)) {
+        continue;
+      }
+      uint8_t& s = state[posting.doc];
+      if (s == 0) {
+        s = accept(posting.doc) ? 1 : 2;
+        if (s == 1) {
+          candidates.push_back(posting.doc);
+        }
+      }
+      if (s == 1) {
+        acc[posting.doc] += qt.weight * posting.value;
+      }
+    }
+    if (prunable && candidates.size() >= k) {
+      // Partial sums are lower bounds of the final scores.
+      kth_buffer.clear();
+      for (uint32_t doc : candidates) {
+        kth_buffer.push_back(acc[doc]);
+      }
+      std::nth_element(kth_buffer.begin(), kth_buffer.begin() + (k - 1),
+                       kth_buffer.end(), std::greater<float>());
+      threshold = kth_buffer[k - 1];
+    }
+  }
+
+  bool complete = evaluated == terms.size();
+  result.reserve(candidates.size());
+  for (uint32_t doc : candidates) {
+    if (complete) {
+      result.emplace_back(acc[doc], doc);
+    } else if (acc[doc] + remaining_bound[evaluated] >= threshold) {
+      result.emplace_back(exact_score(doc), doc);
+    }
+  }
+  size_t top = std::min(k, result.size());
+  std::partial_sort(result.begin(), result.begin() + top, result.end(),
+                    [](const ScoredDoc& a, const ScoredDoc& b) {
+                      return a.first > b.first;
+                    });
+  result.resize(top);
+}
+
+}  // namespace vectordb
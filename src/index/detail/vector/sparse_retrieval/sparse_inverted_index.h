@@ -0,0 +1,90 @@
+// Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+// SPDX-License-Identifier: Apache-2.0
+#pragma once
+#include <cstdint>
+#include <functional>
+#include <utility>
+#include <vector>
+
+#include "index/detail/vector/sparse_retrieval/sparse_datapoint.h"
+
+namespace vectordb {
+
+// Term-posting view of the rows held by a SparseRowIndex.
+//
+// Rows are identified by their position in the row index. Rewriting or
+// dropping a row bumps its generation instead of editing posting lists, so
+// row swaps done by the dense indexes stay O(nnz); postings of an older
+// generation are skipped at query time and purged once they outnumber the
+// live ones (see need_compact()).
+class SparseInvertedIndex {
+ public:
+  using DocID = size_t;
+  using ScoredDoc = std::pair<float, DocID>;
+
+  void clear();
+
+  // (Re)index row `doc` with its sorted, de-duplicated entries.
+  void set_row(DocID doc, const SparseDatapointView& row);
+
+  // Forget row `doc`, e.g. after it was popped from the row index.
+  void remove_row(DocID doc);
+
+  bool need_compact() const;
+
+  // Rebuild the postings from the `rows` live rows returned by `row_of`.
+  void compact(size_t rows,
+               const std::function<SparseDatapointView(DocID)>& row_of);
+
+  // Number of postings a full evaluation of `query` would visit.
+  size_t posting_count(const SparseDatapointView& query) const;
+
+  float squared_norm(DocID doc) const {
+    return doc < squared_norms_.size() ? squared_norms_[doc] : 0.0f;
+  }
+
+  // scores[doc] = dot(query, row doc) for doc in [0, rows).
+  void dot_product_all(const SparseDatapointView& query, size_t rows,
+                       std::vector<float>& scores) const;
+
+  // Top-k rows by dot(query, row) among the rows `accept` admits, best first.
+  //
+  // MaxScore-style pruning: query terms are evaluated term-at-a-time in
+  // decreasing order of their score upper bound. Once the bounds of the
+  // remaining terms cannot lift an unseen row above the current k-th score,
+  // no new candidates are admitted and the surviving ones are completed with
+  // `exact_score` (a forward-index lookup). Pruning needs every contribution
+  // to be non-negative; otherwise all terms are evaluated.
+  void dot_product_topk(const SparseDatapointView& query, size_t k,
+                        const std::function<bool(DocID)>& accept,
+                        const std::function<float(DocID)>& exact_score,
+                        std::vector<ScoredDoc>& result) const;
+
+ private:
+  struct Posting {
+    uint32_t doc;
+    uint32_t generation;
+    float value;
+  };
+
+  bool is_live(const Posting& p) const {
+    return generations_[p.doc] == p.generation;
+  }
+
+  void drop_row(DocID doc);
+
+  std::vector<std::vector<Posting>> postings_;
+  // Per-term bounds of the posted values; kept across updates, so they are
+  // upper bounds that tighten again on compact().
+  std::vector<float> max_values_;
+  std::vector<float> min_values_;
+  // Per-row state.
+  std::vector<uint32_t> generations_;
+  std::vector<uint32_t> row_sizes_;
+  std::vector<float> squared_norms_;
+
+  size_t live_postings_ = 0;
+  size_t stale_postings_ = 0;
+};
+
+}  // namespace vectordb
@@ -83,6 +83,7 @@ int SparseRowIndex::load_data(const std::filesystem::path& load_dir,
   }
 
   sparse_dataset_ = std::make_shared<SparseDataset>();
+  inverted_index_.clear();
   uint64_t rows;
   uint64_t cols;
   uint64_t avg_entries;
@@ -153,6 +154,7 @@ int SparseRowIndex::load_data(const std::filesystem::path& load_dir,
 
 int SparseRowIndex::init_empty_data(size_t max_elements) {
   sparse_dataset_ = std::make_shared<SparseDataset>();
+  inverted_index_.clear();
   max_elements_ = max_elements;
   size_t term_index_buffer = std::max(size_t(100000), index_term_.size() * 2);
   index_term_.reserve(term_index_buffer);
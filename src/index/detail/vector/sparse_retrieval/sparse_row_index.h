@@ -6,6 +6,7 @@
 #include "index/detail/vector/sparse_retrieval/sparse_dataset.h"
 #include "index/detail/vector/sparse_retrieval/sparse_datapoint.h"
 #include "index/detail/vector/sparse_retrieval/sparse_distance_measure.h"
+#include "index/detail/vector/sparse_retrieval/sparse_inverted_index.h"
 #include <unordered_map>
 #include <filesystem>
 #include <thread>
@@ -29,6 +30,7 @@ class SparseRowIndex {
     index_term_.clear();
     term_index_.clear();
     sparse_dataset_->clear();
+    inverted_index_.clear();
     finish_populate_terms_ = false;
     return 0;
   }
@@ -54,6 +56,10 @@ class SparseRowIndex {
     return sparse_dataset_->size();
   }
 
+  size_t entries() const {
+    return sparse_dataset_->entries();
+  }
+
   ValueT sparse_dot_product_reduce(const SparseDatapointView& x,
                                    const DocID docid) {
     const SparseDatapointView& doc_ts = sparse_dataset_->get_view(docid);
@@ -70,12 +76,48 @@ class SparseRowIndex {
         sparse_dist_measure::SquaredL2ReduceOne());
   }
 
+  // Row-wise scores of x against every row, evaluated through the term
+  // postings instead of one merge per row.
+  void sparse_dot_product_all(const SparseDatapointView& x,
+                              std::vector<ValueT>& scores) const {
+    inverted_index_.dot_product_all(x, rows(), scores);
+  }
+
+  void sparse_squared_l2_all(const SparseDatapointView& x,
+                             std::vector<ValueT>& scores) const {
+    inverted_index_.dot_product_all(x, rows(), scores);
+    ValueT x_norm = 0;
+    for (size_t i = 0; i < x.nonzero_entries(); ++i) {
+      x_norm += x.values()[i] * x.values()[i];
+    }
+    for (DocID i = 0; i < scores.size(); ++i) {
+      scores[i] = x_norm + inverted_index_.squared_norm(i) - 2 * scores[i];
+    }
+  }
+
+  // Postings visited by the *_all() evaluations of x.
+  size_t posting_count(const SparseDatapointView& x) const {
+    return inverted_index_.posting_count(x);
+  }
+
+  void sparse_dot_product_topk(
+      const SparseDatapointView& x, size_t k,
+      const std::function<bool(DocID)>& accept,
+      std::vector<SparseInvertedIndex::ScoredDoc>& result) {
+    inverted_index_.dot_product_topk(
+        x, k, accept,
+        [this, &x](DocID docid) { return sparse_dot_product_reduce(x, docid); },
+        result);
+  }
+
   int append(const std::vector<IndexT>& indices,
              const std::vector<ValueT>& values) {
     int ret = sparse_dataset_->append(indices, values);
     if (ret) {
       SPDLOG_ERROR("SparseRowIndex append failed, with ret={}", ret);
+      return ret;
     }
+    index_row(rows() - 1);
     return ret;
   }
 
@@ -83,7 +125,9 @@ class SparseRowIndex {
     int ret = sparse_dataset_->append(dp);
     if (ret) {
       SPDLOG_ERROR("SparseRowIndex append failed, with ret={}", ret);
+      return ret;
     }
+    index_row(rows() - 1);
     return ret;
   }
 
@@ -91,7 +135,9 @@ class SparseRowIndex {
     int ret = sparse_dataset_->update(idx, dp);
     if (ret) {
       SPDLOG_ERROR("SparseRowIndex append failed, with ret={}", ret);
+      return ret;
     }
+    index_row(idx);
     return ret;
   }
 
@@ -104,7 +150,13 @@ class SparseRowIndex {
   }
 
   int pop_back() {
-    return sparse_dataset_->pop_back();
+    size_t n = rows();
+    int ret = sparse_dataset_->pop_back();
+    if (!ret && n > 0) {
+      inverted_index_.remove_row(n - 1);
+      maybe_compact_postings();
+    }
+    return ret;
   }
 
   int append_term_vals(const std::vector<TermKey>& terms,
@@ -117,11 +169,25 @@ class SparseRowIndex {
                      std::vector<ValueT>& mutable_values);
 
  protected:
+  void index_row(DocID docid) {
+    inverted_index_.set_row(docid, sparse_dataset_->get_view(docid));
+    maybe_compact_postings();
+  }
+
+  void maybe_compact_postings() {
+    if (inverted_index_.need_compact()) {
+      inverted_index_.compact(rows(), [this](DocID docid) {
+        return sparse_dataset_->get_view(docid);
+      });
+    }
+  }
+
   bool finish_populate_terms_ = false;
   std::vector<TermKey> index_term_;
   std::unordered_map<TermKey, IndexT> term_index_;
   std::shared_ptr<SparseDataset>
       sparse_dataset_;  // only support ValueT type for now
+  SparseInvertedIndex inverted_index_;
   size_t max_elements_;
 
   size_t base_elements_;
@@ -7,6 +7,7 @@
 #include <memory>
 #include <filesystem>
 #include "index/detail/vector/common/bruteforce.h"
+#include "index/detail/vector/common/hnsw.h"
 #include "index/detail/search_context.h"
 #include "index/detail/vector/vector_recall.h"
 
@@ -23,6 +24,18 @@ class VectorIndexAdapter {
   virtual int recall(const VectorRecallRequest& request,
                      VectorRecallResult& result) = 0;
 
+  // Answer several recall requests; results[i] belongs to requests[i].
+  virtual int recall_batch(const std::vector<VectorRecallRequest>& requests,
+                           std::vector<VectorRecallResult>& results) {
+    results.assign(requests.size(), VectorRecallResult());
+    for (size_t i = 0; i < requests.size(); ++i) {
+      if (int ret = recall(requests[i], results[i]); ret != 0) {
+        return ret;
+      }
+    }
+    return 0;
+  }
+
   virtual int stream_add_data(uint64_t label, const float* ebd_vec,
                               FloatValSparseDatapointLowLevel* sparse) = 0;
 
@@ -67,6 +80,34 @@ class BruteForceIndex : public VectorIndexAdapter {
     return 0;
   }
 
+  // All requests share one scan of the flat data.
+  int recall_batch(const std::vector<VectorRecallRequest>& requests,
+                   std::vector<VectorRecallResult>& results) override {
+    std::vector<FloatValSparseDatapointLowLevel> sparse_datapoints;
+    sparse_datapoints.reserve(requests.size());
+    std::vector<KnnQuery> queries(requests.size());
+    for (size_t i = 0; i < requests.size(); ++i) {
+      const auto& request = requests[i];
+      sparse_datapoints.emplace_back(request.sparse_terms,
+                                     request.sparse_values);
+      queries[i].query_data = request.dense_vector;
+      queries[i].k = request.topk;
+      queries[i].filter_bitmap = request.bitmap;
+      queries[i].sparse = (request.sparse_terms && request.sparse_values)
+                              ? &sparse_datapoints.back()
+                              : nullptr;
+    }
+    std::vector<std::vector<uint64_t>> labels;
+    std::vector<std::vector<float>> scores;
+    index_->search_knn_batch(queries, labels, scores);
+    results.resize(requests.size());
+    for (size_t i = 0; i < requests.size(); ++i) {
+      std::swap(results[i].labels, labels[i]);
+      std::swap(results[i].scores, scores[i]);
+    }
+    return 0;
+  }
+
   virtual int stream_add_data(uint64_t label, const float* ebd_vec,
                               FloatValSparseDatapointLowLevel* sparse) {
     index_->add_point(ebd_vec, label, sparse);
@@ -109,4 +150,70 @@ class BruteForceIndex : public VectorIndexAdapter {
   std::shared_ptr<BruteforceSearch> index_;
 };
 
+class HnswIndex : public VectorIndexAdapter {
+ public:
+  HnswIndex(std::shared_ptr<HnswMeta> meta)
+      : meta_(meta), index_(std::make_shared<HnswSearch>(meta)) {
+  }
+
+  ~HnswIndex() = default;
+
+  std::string type() const override {
+    return "HnswIndex";
+  }
+
+  int recall(const VectorRecallRequest& request,
+             VectorRecallResult& result) override {
+    FloatValSparseDatapointLowLevel sparse_datapoint(request.sparse_terms,
+                                                     request.sparse_values);
+    FloatValSparseDatapointLowLevel* sparse_ptr =
+        (request.sparse_terms && request.sparse_values) ? &sparse_datapoint
+                                                        : nullptr;
+    index_->search_knn(request.dense_vector, request.topk, request.bitmap,
+                       sparse_ptr, result.labels, result.scores);
+    return 0;
+  }
+
+  virtual int stream_add_data(uint64_t label, const float* ebd_vec,
+                              FloatValSparseDatapointLowLevel* sparse) {
+    index_->add_point(ebd_vec, label, sparse);
+    return 0;
+  }
+
+  virtual int stream_delete_data(uint64_t label) {
+    index_->remove_point(label);
+    return 0;
+  }
+
+  virtual int load(const std::filesystem::path& dir) override {
+    index_->load(dir);
+    return 0;
+  }
+
+  virtual int dump(const std::filesystem::path& dir) {
+    index_->save(dir);
+    return 0;
+  }
+
+  virtual uint64_t get_embedding_dim() override {
+    return meta_->dimension;
+  }
+
+  virtual uint64_t get_data_num() override {
+    return index_->get_data_num();
+  }
+
+  virtual int get_offset_by_label(const uint64_t& label) {
+    return index_->get_offset_by_label(label);
+  }
+
+  virtual uint64_t get_label_by_offset(const int& offset) {
+    return index_->get_label_by_offset(offset);
+  }
+
+ private:
+  std::shared_ptr<HnswMeta> meta_;
+  std::shared_ptr<HnswSearch> index_;
+};
+
 }  // namespace vectordb
\ No newline at end of file
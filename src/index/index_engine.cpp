@@ -12,11 +12,33 @@ IndexEngine::IndexEngine(const std::string& path_or_json) {
 
 SearchResult IndexEngine::search(const SearchRequest& req) {
   SearchResult result;
-  impl_->search(req, result);
+  result.status = impl_->search(req, result);
   result.result_num = result.labels.size();
   return result;
 }
 
+std::vector<SearchResult> IndexEngine::search_batch(
+    const std::vector<SearchRequest>& reqs) {
+  std::vector<SearchResult> results;
+  int ret = impl_->search_batch(reqs, results);
+  results.resize(reqs.size());
+  for (auto& result : results) {
+    if (ret != 0) {
+      // The batch as a whole failed: no query has a usable result.
+      result = SearchResult();
+      result.status = ret;
+    }
+    result.result_num = result.labels.size();
+  }
+  return results;
+}
+
+std::vector<uint64_t> IndexEngine::select_labels(const std::string& dsl) {
+  std::vector<uint64_t> labels;
+  impl_->select_labels(dsl, labels);
+  return labels;
+}
+
 int IndexEngine::add_data(const std::vector<AddDataRequest>& data_list) {
   return impl_->add_data(data_list);
 }
@@ -25,6 +47,11 @@ int IndexEngine::delete_data(const std::vector<DeleteDataRequest>& data_list) {
   return impl_->delete_data(data_list);
 }
 
+int IndexEngine::update_scalar_data(
+    const std::vector<AddDataRequest>& data_list) {
+  return impl_->update_scalar_data(data_list);
+}
+
 int64_t IndexEngine::dump(const std::string& dir) {
   return impl_->dump(dir);
 }
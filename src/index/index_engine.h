@@ -22,8 +22,14 @@ class IndexEngine {
 
   int delete_data(const std::vector<DeleteDataRequest>& data_list);
 
+  int update_scalar_data(const std::vector<AddDataRequest>& data_list);
+
   SearchResult search(const SearchRequest& req);
 
+  std::vector<SearchResult> search_batch(const std::vector<SearchRequest>& reqs);
+
+  std::vector<uint64_t> select_labels(const std::string& dsl);
+
   int64_t dump(const std::string& dir);
 
   StateResult get_state();
@@ -14,10 +14,26 @@ class IndexManager {
 
   virtual int search(const SearchRequest& req, SearchResult& result) = 0;
 
+  // Answer several requests under one read lock; vector requests are scored
+  // together where the index supports it. results[i] belongs to reqs[i]; a
+  // request that fails on its own (e.g. its filter cannot be evaluated) sets
+  // results[i].status, as search() would return it, and the others proceed.
+  virtual int search_batch(const std::vector<SearchRequest>& reqs,
+                           std::vector<SearchResult>& results) = 0;
+
+  // Labels of every row matching the filter in dsl, without vector scoring.
+  virtual int select_labels(const std::string& dsl,
+                            std::vector<uint64_t>& labels) = 0;
+
   virtual int add_data(const std::vector<AddDataRequest>& data_list) = 0;
 
   virtual int delete_data(const std::vector<DeleteDataRequest>& data_list) = 0;
 
+  // Replace the scalar fields of existing rows (fields_str/old_fields_str of
+  // each request); vectors are left untouched and unknown labels are skipped.
+  virtual int update_scalar_data(
+      const std::vector<AddDataRequest>& data_list) = 0;
+
   virtual int64_t dump(const std::string& dir) = 0;
 
   virtual int get_state(StateResult& state_result) = 0;
@@ -5,7 +5,10 @@
 
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <cmath>
 #include <cstring>
+#include <string>
+#include <vector>
 #include "store/bytes_row.h"
 
 namespace py = pybind11;
@@ -274,3 +277,133 @@ inline py::object value_to_py(const vdb::Value& val) {
 
   return py::none();
 }
+
+// View of a C-contiguous float32 buffer (NumPy array, array.array('f'),
+// memoryview, ...) as `rows` vectors of `dim` floats. Holds the buffer for the
+// lifetime of the view, so the data can be read with the GIL released; the
+// view itself must be destroyed with the GIL held.
+struct PyFloatRows {
+  py::buffer_info info;
+  const float* data = nullptr;
+  size_t rows = 0;
+  size_t dim = 0;
+};
+
+inline bool is_float32_buffer(const py::buffer_info& info) {
+  // "<f" is the native layout on the little-endian hosts we build for.
+  return info.itemsize == sizeof(float) &&
+         (info.format == "f" || info.format == "=f" || info.format == "<f");
+}
+
+// A 2-D buffer is rows x dim; a 1-D buffer is split into rows of `dim`, or is
+// a single vector when dim is 0.
+inline PyFloatRows float_rows(const py::buffer& buffer, size_t dim) {
+  PyFloatRows rows;
+  rows.info = buffer.request();
+  const auto& info = rows.info;
+  if (!is_float32_buffer(info)) {
+    throw py::type_error("expected a float32 buffer, got format '" +
+                         info.format + "'");
+  }
+  if (info.ndim != 1 && info.ndim != 2) {
+    throw py::value_error("expected a 1-D or 2-D float32 buffer");
+  }
+  py::ssize_t expected_stride = sizeof(float);
+  for (py::ssize_t i = info.ndim - 1; i >= 0; --i) {
+    if (info.shape[i] > 1 && info.strides[i] != expected_stride) {
+      throw py::value_error("expected a C-contiguous float32 buffer");
+    }
+    expected_stride *= info.shape[i];
+  }
+
+  const size_t total = static_cast<size_t>(info.size);
+  if (info.ndim == 2) {
+    rows.rows = static_cast<size_t>(info.shape[0]);
+    rows.dim = static_cast<size_t>(info.shape[1]);
+    if (dim != 0 && dim != rows.dim) {
+      throw py::value_error("vector dimension " + std::to_string(rows.dim) +
+                            " does not match dim " + std::to_string(dim));
+    }
+  } else if (dim != 0) {
+    if (total % dim != 0) {
+      throw py::value_error("buffer of " + std::to_string(total) +
+                            " floats is not a multiple of dim " +
+                            std::to_string(dim));
+    }
+    rows.rows = total / dim;
+    rows.dim = dim;
+  } else {
+    rows.rows = total > 0 ? 1 : 0;
+    rows.dim = total;
+  }
+  rows.data = static_cast<const float*>(info.ptr);
+  return rows;
+}
+
+// One vector from a float32 buffer (copied with a single memcpy) or from any
+// sequence of numbers.
+inline std::vector<float> py_to_float_vector(const py::handle& obj) {
+  if (PyObject_CheckBuffer(obj.ptr())) {
+    auto buffer = py::reinterpret_borrow<py::buffer>(obj);
+    py::buffer_info info = buffer.request();
+    if (is_float32_buffer(info) && info.ndim == 1) {
+      PyFloatRows rows = float_rows(buffer, 0);
+      return std::vector<float>(rows.data, rows.data + rows.dim);
+    }
+  }
+  return obj.cast<std::vector<float>>();
+}
+
+// Copy `dim` floats of one row (float32 buffer or sequence of numbers) to
+// `dest`. Float sequences are read directly rather than through the generic
+// per-element caster.
+inline void copy_float_row(const py::handle& row, size_t dim, float* dest) {
+  if (PyObject_CheckBuffer(row.ptr())) {
+    auto buffer = py::reinterpret_borrow<py::buffer>(row);
+    py::buffer_info info = buffer.request();
+    if (is_float32_buffer(info) && info.ndim == 1) {
+      PyFloatRows rows = float_rows(buffer, 0);
+      if (rows.dim != dim) {
+        throw py::value_error("vector dimension " + std::to_string(rows.dim) +
+                              " does not match dim " + std::to_string(dim));
+      }
+      std::memcpy(dest, rows.data, dim * sizeof(float));
+      return;
+    }
+  }
+  py::object seq = py::reinterpret_steal<py::object>(
+      PySequence_Fast(row.ptr(), "vector must be a sequence of numbers"));
+  if (!seq) {
+    throw py::error_already_set();
+  }
+  if (static_cast<size_t>(PySequence_Fast_GET_SIZE(seq.ptr())) != dim) {
+    throw py::value_error(
+        "vector dimension " +
+        std::to_string(PySequence_Fast_GET_SIZE(seq.ptr())) +
+        " does not match dim " + std::to_string(dim));
+  }
+  PyObject** items = PySequence_Fast_ITEMS(seq.ptr());
+  for (size_t i = 0; i < dim; ++i) {
+    double value = PyFloat_CheckExact(items[i]) ? PyFloat_AS_DOUBLE(items[i])
+                                                : PyFloat_AsDouble(items[i]);
+    if (value == -1.0 && PyErr_Occurred()) {
+      throw py::error_already_set();
+    }
+    dest[i] = static_cast<float>(value);
+  }
+}
+
+inline void l2_normalize(float* vector, size_t dim) {
+  double sum = 0.0;
+  for (size_t i = 0; i < dim; ++i) {
+    sum += static_cast<double>(vector[i]) * vector[i];
+  }
+  // Avoid division by zero
+  if (sum == 0.0) {
+    return;
+  }
+  const double inv_norm = 1.0 / std::sqrt(sum);
+  for (size_t i = 0; i < dim; ++i) {
+    vector[i] = static_cast<float>(vector[i] * inv_norm);
+  }
+}
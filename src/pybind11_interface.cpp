@@ -17,6 +17,15 @@ namespace vdb = vectordb;
 
 PYBIND11_MODULE(engine, m) {
   m.def("init_logging", &vdb::init_logging, "Initialize logging");
+  m.def(
+      "l2_normalize",
+      [](const py::object& vector) {
+        std::vector<float> normalized = py_to_float_vector(vector);
+        l2_normalize(normalized.data(), normalized.size());
+        return normalized;
+      },
+      py::arg("vector"),
+      "L2-normalized copy of a vector (float32 buffer or sequence)");
 
   py::enum_<vdb::FieldType>(m, "FieldType")
       .value("int64", vdb::FieldType::INT64)
@@ -136,6 +145,35 @@ PYBIND11_MODULE(engine, m) {
              }
              return res_dict;
            })
+      .def("replace_fields",
+           [](vdb::BytesRow& self, const std::string& data,
+              const py::dict& updates) {
+             // Re-encode a row with some string/binary fields replaced; the
+             // other fields (e.g. vectors) are copied without going through
+             // Python objects.
+             const auto& schema = self.get_schema();
+             std::vector<vdb::Value> row;
+             for (const auto& meta : schema.get_field_order()) {
+               if (updates.contains(meta.name.c_str())) {
+                 if (meta.data_type != vdb::FieldType::STRING &&
+                     meta.data_type != vdb::FieldType::BINARY) {
+                   throw py::type_error("replace_fields only supports string "
+                                        "and binary fields: " +
+                                        meta.name);
+                 }
+                 row.emplace_back(
+                     updates[meta.name.c_str()].cast<std::string>());
+               } else {
+                 row.push_back(self.deserialize_field(data, meta.name));
+               }
+             }
+             std::string serialized;
+             {
+               pybind11::gil_scoped_release release;
+               serialized = self.serialize(row);
+             }
+             return py::bytes(serialized);
+           })
       .def("deserialize_field",
            [](vdb::BytesRow& self, const std::string& data,
               const std::string& field_name) -> py::object {
@@ -181,6 +219,17 @@ PYBIND11_MODULE(engine, m) {
       .def_readwrite("sparse_values", &vdb::SearchRequest::sparse_values)
       .def_readwrite("topk", &vdb::SearchRequest::topk)
       .def_readwrite("dsl", &vdb::SearchRequest::dsl)
+      .def(
+          "set_query",
+          [](vdb::SearchRequest& self, const py::object& vector,
+             bool normalize) {
+            self.query = py_to_float_vector(vector);
+            if (normalize) {
+              l2_normalize(self.query.data(), self.query.size());
+            }
+          },
+          py::arg("vector"), py::arg("normalize") = false,
+          "set the query from a float32 buffer or sequence")
       .def("__repr__", [](const vdb::SearchRequest& p) {
         return "<SearchRequest query=" + std::to_string(p.query.size()) +
                ", topk=" + std::to_string(p.topk) + ">";
@@ -192,6 +241,7 @@ PYBIND11_MODULE(engine, m) {
       .def_readwrite("labels", &vdb::SearchResult::labels)
       .def_readwrite("scores", &vdb::SearchResult::scores)
       .def_readwrite("extra_json", &vdb::SearchResult::extra_json)
+      .def_readwrite("status", &vdb::SearchResult::status)
       .def("__repr__", [](const vdb::SearchResult& p) {
         return "<SearchResult result_num=" + std::to_string(p.result_num) +
                ", labels=" + std::to_string(p.labels.size()) +
@@ -226,6 +276,86 @@ PYBIND11_MODULE(engine, m) {
             return self.add_data(data_list);
           },
           "add data to index")
+      .def(
+          "add_vectors",
+          [](vdb::IndexEngine& self, const std::vector<uint64_t>& labels,
+             const py::object& vectors, size_t dim,
+             std::vector<std::string> fields_strs,
+             std::vector<std::string> old_fields_strs,
+             std::vector<std::vector<std::string>> sparse_raw_terms,
+             std::vector<std::vector<float>> sparse_values, bool normalize) {
+            // Bulk add without an AddDataRequest object per row: `vectors` is
+            // either one float32 buffer of shape (n, dim), read in place, or a
+            // sequence of n rows that is packed natively.
+            const size_t n = labels.size();
+            if (dim == 0) {
+              throw py::value_error("dim must be positive");
+            }
+            if (fields_strs.size() != n ||
+                (!old_fields_strs.empty() && old_fields_strs.size() != n) ||
+                sparse_raw_terms.size() != sparse_values.size() ||
+                (!sparse_raw_terms.empty() && sparse_raw_terms.size() != n)) {
+              throw py::value_error(
+                  "fields_strs must have one entry per label; "
+                  "old_fields_strs and sparse vectors must be empty or have "
+                  "one entry per label");
+            }
+
+            PyFloatRows rows;
+            std::vector<float> packed;
+            const float* data = nullptr;
+            if (PyObject_CheckBuffer(vectors.ptr())) {
+              rows = float_rows(py::reinterpret_borrow<py::buffer>(vectors),
+                                dim);
+              if (rows.rows != n) {
+                throw py::value_error(
+                    "vectors must have one row per label");
+              }
+              data = rows.data;
+            } else {
+              py::sequence seq = vectors.cast<py::sequence>();
+              if (seq.size() != n) {
+                throw py::value_error(
+                    "vectors must have one row per label");
+              }
+              packed.resize(n * dim);
+              for (size_t i = 0; i < n; ++i) {
+                copy_float_row(seq[i], dim, packed.data() + i * dim);
+              }
+              data = packed.data();
+            }
+
+            int ret = 0;
+            {
+              pybind11::gil_scoped_release release;
+              std::vector<vdb::AddDataRequest> data_list(n);
+              for (size_t i = 0; i < n; ++i) {
+                auto& req = data_list[i];
+                req.label = labels[i];
+                const float* row = data + i * dim;
+                req.vector.assign(row, row + dim);
+                if (normalize) {
+                  l2_normalize(req.vector.data(), dim);
+                }
+                req.fields_str = std::move(fields_strs[i]);
+                if (!old_fields_strs.empty()) {
+                  req.old_fields_str = std::move(old_fields_strs[i]);
+                }
+                if (!sparse_raw_terms.empty() && !sparse_raw_terms[i].empty() &&
+                    !sparse_values[i].empty()) {
+                  req.sparse_raw_terms = std::move(sparse_raw_terms[i]);
+                  req.sparse_values = std::move(sparse_values[i]);
+                }
+              }
+              ret = self.add_data(data_list);
+            }
+            return ret;
+          },
+          py::arg("labels"), py::arg("vectors"), py::arg("dim"),
+          py::arg("fields_strs"), py::arg("old_fields_strs"),
+          py::arg("sparse_raw_terms"), py::arg("sparse_values"),
+          py::arg("normalize") = false,
+          "add rows whose dense vectors share one dimension")
       .def(
           "delete_data",
           [](vdb::IndexEngine& self,
@@ -234,6 +364,14 @@ PYBIND11_MODULE(engine, m) {
             return self.delete_data(data_list);
           },
           "delete data from index")
+      .def(
+          "update_scalar_data",
+          [](vdb::IndexEngine& self,
+             const std::vector<vdb::AddDataRequest>& data_list) {
+            pybind11::gil_scoped_release release;
+            return self.update_scalar_data(data_list);
+          },
+          "update scalar fields of existing rows, keeping their vectors")
       .def(
           "search",
           [](vdb::IndexEngine& self, const vdb::SearchRequest& req) {
@@ -241,6 +379,21 @@ PYBIND11_MODULE(engine, m) {
             return self.search(req);
           },
           "search")
+      .def(
+          "search_batch",
+          [](vdb::IndexEngine& self,
+             const std::vector<vdb::SearchRequest>& reqs) {
+            pybind11::gil_scoped_release release;
+            return self.search_batch(reqs);
+          },
+          "search several requests, scoring vector queries in one pass")
+      .def(
+          "select_labels",
+          [](vdb::IndexEngine& self, const std::string& dsl) {
+            pybind11::gil_scoped_release release;
+            return self.select_labels(dsl);
+          },
+          "labels of all rows matching a filter dsl")
       .def(
           "dump",
           [](vdb::IndexEngine& self, const std::string& dir) {
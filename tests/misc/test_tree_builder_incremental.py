@@ -0,0 +1,181 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for incremental re-import in TreeBuilder.finalize_from_temp."""
+
+import hashlib
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from openviking.parse.tree_builder import TreeBuilder
+from openviking.server.identity import RequestContext, Role
+from openviking_cli.session.user_id import UserIdentifier
+
+
+class _FakeAGFS:
+    def __init__(self, files, dirs):
+        self.files = files
+        self.dirs = dirs
+        self.digest_calls = 0
+
+    def mv(self, src, dst):
+        for path in [p for p in self.files if p == src or p.startswith(src + "/")]:
+            self.files[dst + path[len(src) :]] = self.files.pop(path)
+        for path in [d for d in self.dirs if d == src or d.startswith(src + "/")]:
+            self.dirs.discard(path)
+            self.dirs.add(dst + path[len(src) :])
+
+    def rm(self, path, recursive=False):
+        self.files.pop(path, None)
+        for p in [p for p in self.files if p.startswith(path + "/")]:
+            del self.files[p]
+        self.dirs = {d for d in self.dirs if d != path and not d.startswith(path + "/")}
+
+    def digest(self, path, algorithm="xxh3"):
+        self.digest_calls += 1
+        return {"digest": hashlib.md5(self.files[path].encode()).hexdigest()}
+
+
+class _FakeVikingFS:
+    """Path-based in-memory tree; URIs map to paths by dropping the scheme."""
+
+    def __init__(self, files):
+        self.agfs = _FakeAGFS({}, set())
+        for path, content in files.items():
+            self._add_file(path, content)
+        self.deleted_uris = []
+
+    def _add_file(self, path, content):
+        self.agfs.files[path] = content
+        parts = path.strip("/").split("/")
+        for i in range(1, len(parts)):
+            self.agfs.dirs.add("/" + "/".join(parts[:i]))
+
+    def _uri_to_path(self, uri, ctx=None):
+        return "/" + uri[len("viking://") :]
+
+    async def _ls_entries(self, path):
+        entries = []
+        for f, content in self.agfs.files.items():
+            if f.rsplit("/", 1)[0] == path:
+                entries.append({"name": f.rsplit("/", 1)[1], "isDir": False, "size": len(content)})
+        for d in self.agfs.dirs:
+            if d.rsplit("/", 1)[0] == path:
+                entries.append({"name": d.rsplit("/", 1)[1], "isDir": True})
+        return entries
+
+    async def ls(self, uri, ctx=None):
+        return await self._ls_entries(self._uri_to_path(uri))
+
+    async def stat(self, uri, ctx=None):
+        path = self._uri_to_path(uri)
+        if path in self.agfs.dirs:
+            return {"isDir": True}
+        raise FileNotFoundError(uri)
+
+    async def rm(self, uri, recursive=False, ctx=None):
+        path = self._uri_to_path(uri)
+        self.deleted_uris.append(uri)
+        self.agfs.rm(path, recursive=recursive)
+
+    async def delete_temp(self, uri, ctx=None):
+        self.agfs.rm(self._uri_to_path(uri), recursive=True)
+
+
+EXISTING = {
+    "/resources/proj/README.md": "readme",
+    "/resources/proj/.abstract.md": "abstract",
+    "/resources/proj/.overview.md": "overview",
+    "/resources/proj/src/a.py": "a = 1",
+    "/resources/proj/src/b.py": "b = 1",
+    "/resources/proj/src/.abstract.md": "abstract",
+    "/resources/proj/old/x.md": "x",
+    "/resources/proj/docs/guide.md": "guide",
+}
+
+
+def _ctx():
+    return RequestContext(user=UserIdentifier("acc", "user", "agent"), role=Role.ROOT)
+
+
+async def _finalize(fs, temp_files, incremental=True):
+    for path, content in temp_files.items():
+        fs._add_file(f"/temp/t1/proj/{path}", content)
+    builder = TreeBuilder()
+    enqueued = []
+
+    async def _enqueue(uri, context_type, ctx, recursive=True):
+        enqueued.append((uri, recursive))
+
+    with (
+        patch("openviking.parse.tree_builder.get_viking_fs", return_value=fs),
+        patch.object(builder, "_enqueue_semantic_generation", AsyncMock(side_effect=_enqueue)),
+    ):
+        tree = await builder.finalize_from_temp(
+            "viking://temp/t1",
+            ctx=_ctx(),
+            scope="resources",
+            base_uri=None,
+            incremental=incremental,
+        )
+    return tree, enqueued
+
+
+class TestIncrementalFinalize:
+    @pytest.mark.asyncio
+    async def test_only_changes_are_applied(self):
+        fs = _FakeVikingFS(EXISTING)
+        tree, enqueued = await _finalize(
+            fs,
+            {
+                "README.md": "readme",
+                "src/a.py": "a = 2",  # changed, same size
+                "src/b.py": "b = 1",
+                "src/c.py": "c = 1",  # added
+                "docs/guide.md": "guide",
+                "new/pkg/n.md": "n",  # new subtree
+            },
+        )
+
+        assert tree._root_uri == "viking://resources/proj"
+        assert tree.sync_stats == {"added": 2, "updated": 1, "deleted": 1, "unchanged": 3}
+        files = fs.agfs.files
+        assert files["/resources/proj/src/a.py"] == "a = 2"
+        assert files["/resources/proj/src/c.py"] == "c = 1"
+        assert files["/resources/proj/new/pkg/n.md"] == "n"
+        assert "/resources/proj/old/x.md" not in files
+        assert "/resources/proj/old" not in fs.agfs.dirs
+        # Generated summaries of untouched parts survive, the temp tree is gone.
+        assert files["/resources/proj/src/.abstract.md"] == "abstract"
+        assert not any(p.startswith("/temp/") for p in files)
+        assert fs.deleted_uris == ["viking://resources/proj/old"]
+
+        # New subtree recursively, then dirty dirs bottom-up; docs/ is untouched.
+        assert enqueued == [
+            ("viking://resources/proj/new", True),
+            ("viking://resources/proj/src", False),
+            ("viking://resources/proj", False),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_tree_enqueues_nothing(self):
+        fs = _FakeVikingFS(EXISTING)
+        sources = {
+            path[len("/resources/proj/") :]: content
+            for path, content in EXISTING.items()
+            if not path.rsplit("/", 1)[1].startswith(".")
+        }
+        tree, enqueued = await _finalize(fs, sources)
+
+        assert tree.sync_stats == {"added": 0, "updated": 0, "deleted": 0, "unchanged": 5}
+        assert enqueued == []
+        assert fs.agfs.digest_calls == 10
+
+    @pytest.mark.asyncio
+    async def test_without_incremental_creates_copy(self):
+        fs = _FakeVikingFS(EXISTING)
+        tree, enqueued = await _finalize(fs, {"README.md": "readme"}, incremental=False)
+
+        assert tree._root_uri == "viking://resources/proj_1"
+        assert tree.sync_stats is None
+        assert enqueued == [("viking://resources/proj_1", True)]
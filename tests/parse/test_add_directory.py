@@ -15,7 +15,7 @@ Verifies that:
 
 from pathlib import Path
 from typing import Any, Dict, List
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -768,3 +768,124 @@ class TestDirectlyUploadMedia:
         assert mock_image.parse.call_count == 2
         mock_audio.parse.assert_called_once()
         mock_video.parse.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Tests: concurrent processing
+# ---------------------------------------------------------------------------
+
+
+class _SlowParser(BaseParser):
+    """Writes ``<stem>/<stem>.md`` to a fresh temp; earlier files finish last."""
+
+    def __init__(self, fake_fs: FakeVikingFS, delays: Dict[str, float]):
+        self._fs = fake_fs
+        self._delays = delays
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def supported_extensions(self) -> List[str]:
+        return [".md", ".markdown"]
+
+    async def parse(self, source, instruction: str = "", **kwargs):
+        import asyncio
+
+        path = Path(source)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self._delays[path.name])
+        self.in_flight -= 1
+
+        temp = self._fs.create_temp_uri()
+        await self._fs.write_file(f"{temp}/{path.stem}/{path.stem}.md", path.name)
+        result = create_parse_result(
+            root=ResourceNode(type=NodeType.ROOT),
+            source_path=str(path),
+            source_format="markdown",
+            parser_name="SlowParser",
+            parse_time=0.0,
+        )
+        result.temp_dir_path = temp
+        return result
+
+    async def parse_content(self, content, source_path=None, instruction: str = "", **kwargs):
+        raise NotImplementedError
+
+
+class TestConcurrentProcessing:
+    """Files are processed concurrently but merged deterministically."""
+
+    @staticmethod
+    async def _parse(tmp_path: Path, fake_fs: FakeVikingFS, **kwargs):
+        names = sorted(p.name for p in tmp_path.iterdir() if p.suffix in {".md", ".markdown"})
+        # The first files in scan order are the slowest to parse.
+        delays = {name: 0.01 * (len(names) - i) for i, name in enumerate(names)}
+        slow = _SlowParser(fake_fs, delays)
+        with patch.object(BaseParser, "_get_viking_fs", return_value=fake_fs):
+            parser = DirectoryParser()
+            with patch.object(
+                parser,
+                "_assign_parser",
+                side_effect=lambda cf, registry: (
+                    slow if cf.path.suffix in {".md", ".markdown"} else None
+                ),
+            ):
+                result = await parser.parse(str(tmp_path), **kwargs)
+        return result, slow
+
+    @pytest.fixture
+    def tmp_docs(self, tmp_path: Path) -> Path:
+        for i in range(6):
+            (tmp_path / f"doc{i}.md").write_text(f"# {i}", encoding="utf-8")
+        # Both parse to ``same/same.md``: the later file in scan order wins.
+        (tmp_path / "same.md").write_text("# md", encoding="utf-8")
+        (tmp_path / "same.markdown").write_text("# markdown", encoding="utf-8")
+        (tmp_path / "main.py").write_text("print(1)", encoding="utf-8")
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, tmp_docs: Path, fake_fs) -> None:
+        result, slow = await self._parse(tmp_docs, fake_fs, max_concurrency=3)
+
+        assert slow.max_in_flight == 3
+        assert result.meta["file_count"] == 9
+        assert result.meta["failed_files"] == []
+
+    @pytest.mark.asyncio
+    async def test_concurrency_defaults_to_config(self, tmp_docs: Path, fake_fs) -> None:
+        config = MagicMock(parse_directory_concurrency=2)
+        with patch("openviking.parse.parsers.directory.get_openviking_config", return_value=config):
+            result, slow = await self._parse(tmp_docs, fake_fs)
+
+        assert slow.max_in_flight == 2
+        assert result.meta["file_count"] == 9
+
+    @pytest.mark.asyncio
+    async def test_output_matches_sequential_run(self, tmp_docs: Path) -> None:
+        sequential_fs, concurrent_fs = FakeVikingFS(), FakeVikingFS()
+        sequential, slow = await self._parse(tmp_docs, sequential_fs, max_concurrency=1)
+        assert slow.max_in_flight == 1
+        concurrent, _ = await self._parse(tmp_docs, concurrent_fs, max_concurrency=8)
+
+        def tree(fs: FakeVikingFS, result) -> Dict[str, bytes]:
+            prefix = result.temp_dir_path + "/"
+            return {k[len(prefix) :]: v for k, v in fs.files.items() if k.startswith(prefix)}
+
+        assert concurrent.meta["processed_files"] == sequential.meta["processed_files"]
+        assert tree(concurrent_fs, concurrent) == tree(sequential_fs, sequential)
+        assert len(tree(concurrent_fs, concurrent)) == 8
+
+    @pytest.mark.asyncio
+    async def test_progress_reported_per_file(self, tmp_docs: Path, fake_fs) -> None:
+        progress = []
+        result, _ = await self._parse(
+            tmp_docs,
+            fake_fs,
+            max_concurrency=4,
+            progress_callback=lambda done, total, path, ok: progress.append((done, total, ok)),
+        )
+
+        total = result.meta["total_processable"]
+        assert [done for done, _, _ in progress] == list(range(1, total + 1))
+        assert all(t == total and ok for _, t, ok in progress)
@@ -0,0 +1,118 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the CPU-bound parse process pool."""
+
+import os
+import pickle
+import threading
+from pathlib import Path
+
+import pytest
+
+from openviking.parse import process_pool
+from openviking.parse.parsers.html import HTMLParser
+from openviking.parse.parsers.word import WordParser
+
+
+def _pid_and_thread(_: int) -> tuple:
+    return os.getpid(), threading.get_ident()
+
+
+def _fail(message: str) -> None:
+    raise ValueError(message)
+
+
+def _fail_with_pickle_message(_: int) -> None:
+    raise TypeError(f"cannot pickle the document in process {os.getpid()}")
+
+
+@pytest.fixture(scope="module")
+def pool():
+    # Spawning workers is slow; share one pool across the module.
+    process_pool.init_parse_executor(2)
+    yield
+    process_pool.init_parse_executor(process_pool.DEFAULT_MAX_PARSE_WORKERS)
+
+
+@pytest.mark.asyncio
+async def test_runs_in_worker_process(pool) -> None:
+    pid, _ = await process_pool.run_in_parse_pool(_pid_and_thread, 1)
+    assert pid != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_callable_errors_propagate(pool) -> None:
+    with pytest.raises(ValueError, match="broken document"):
+        await process_pool.run_in_parse_pool(_fail, "broken document")
+
+
+@pytest.mark.asyncio
+async def test_worker_error_mentioning_pickle_is_not_rerun(pool) -> None:
+    with pytest.raises(TypeError, match="cannot pickle") as excinfo:
+        await process_pool.run_in_parse_pool(_fail_with_pickle_message, 1)
+    # Raised by the worker, not by a fallback run on a thread.
+    assert str(os.getpid()) not in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_unpicklable_call_falls_back_to_thread(pool) -> None:
+    lock = threading.Lock()
+    pid, thread = await process_pool.run_in_parse_pool(lambda _: _pid_and_thread(0), lock)
+    assert pid == os.getpid()
+    assert thread != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_parser_conversion_runs_in_pool(pool, tmp_path: Path) -> None:
+    import docx
+
+    doc = docx.Document()
+    doc.add_heading("Quarterly report", level=1)
+    doc.add_paragraph("Revenue grew.")
+    docx_path = tmp_path / "report.docx"
+    doc.save(str(docx_path))
+
+    parser = WordParser()
+    markdown = await process_pool.run_in_parse_pool(parser._convert_file, docx_path)
+
+    assert markdown == parser._convert_file(docx_path)
+    assert "Quarterly report" in markdown
+
+
+def test_html_parser_pickles_without_cached_modules() -> None:
+    parser = HTMLParser()
+    parser._get_markdownify()  # cached module must not block shipping to the pool
+
+    clone = pickle.loads(pickle.dumps(parser))
+
+    assert clone.timeout == parser.timeout
+    assert getattr(clone, "_markdownify", None) is None
+
+
+@pytest.mark.asyncio
+async def test_disabled_pool_uses_thread() -> None:
+    process_pool.init_parse_executor(0)
+    try:
+        assert process_pool.get_parse_executor() is None
+        pid, thread = await process_pool.run_in_parse_pool(_pid_and_thread, 1)
+    finally:
+        process_pool.init_parse_executor(process_pool.DEFAULT_MAX_PARSE_WORKERS)
+    assert pid == os.getpid()
+    assert thread != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_stops_pool_and_next_call_restarts_it() -> None:
+    process_pool.init_parse_executor(1)
+    try:
+        executor = process_pool.get_parse_executor()
+        await process_pool.run_in_parse_pool(_pid_and_thread, 1)
+        process_pool.shutdown_parse_executor()
+        assert process_pool._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(_pid_and_thread, 1)
+
+        pid, _ = await process_pool.run_in_parse_pool(_pid_and_thread, 1)
+        assert pid != os.getpid()
+    finally:
+        process_pool.init_parse_executor(process_pool.DEFAULT_MAX_PARSE_WORKERS)
@@ -0,0 +1,103 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for sharded local PDF extraction."""
+
+import re
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from openviking.parse import process_pool
+from openviking.parse.parsers.pdf import PDFParser
+from openviking_cli.utils.config.parser_config import PDFConfig
+from openviking_cli.utils.storage import StoragePath
+
+
+def _make_pdf(texts: List[str]) -> bytes:
+    """Build a minimal PDF with one line of Helvetica text per page."""
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for text in texts:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Contents {len(objects)} 0 R /Resources << /Font << /F1 3 0 R >> >> >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{obj}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return bytes(out)
+
+
+@pytest.fixture
+def pdf_path(tmp_path: Path) -> Path:
+    path = tmp_path / "report.pdf"
+    path.write_bytes(_make_pdf([f"Section {i} body" for i in range(1, 8)]))
+    return path
+
+
+@pytest.fixture
+def thread_pool():
+    process_pool.init_parse_executor(0)
+    yield
+    process_pool.init_parse_executor(process_pool.DEFAULT_MAX_PARSE_WORKERS)
+
+
+async def _convert(pdf_path: Path, pages_per_shard: int):
+    parser = PDFParser(PDFConfig(strategy="local", local_pages_per_shard=pages_per_shard))
+    return await parser._convert_local(pdf_path, storage=StoragePath(pdf_path.parent))
+
+
+@pytest.mark.asyncio
+async def test_shards_are_reassembled_in_page_order(pdf_path: Path, thread_pool) -> None:
+    markdown, meta = await _convert(pdf_path, pages_per_shard=2)
+
+    assert re.findall(r"<!-- Page (\d+) -->", markdown) == [str(i) for i in range(1, 8)]
+    assert "Section 7 body" in markdown
+    assert meta["total_pages"] == 7
+    assert meta["pages_processed"] == 7
+    assert len(meta["page_times"]) == 7
+    assert meta["extraction_time"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_shard_size_does_not_change_output(pdf_path: Path, thread_pool) -> None:
+    sharded, _ = await _convert(pdf_path, pages_per_shard=3)
+    whole, _ = await _convert(pdf_path, pages_per_shard=100)
+
+    assert sharded == whole
+
+
+@pytest.mark.asyncio
+async def test_pages_extracted_in_worker_processes(pdf_path: Path) -> None:
+    process_pool.init_parse_executor(2)
+    try:
+        markdown, meta = await _convert(pdf_path, pages_per_shard=3)
+    finally:
+        process_pool.init_parse_executor(process_pool.DEFAULT_MAX_PARSE_WORKERS)
+
+    assert re.findall(r"<!-- Page (\d+) -->", markdown) == [str(i) for i in range(1, 8)]
+    assert meta["pages_processed"] == 7
+
+
+def test_invalid_shard_size_rejected() -> None:
+    with pytest.raises(ValueError, match="local_pages_per_shard"):
+        PDFParser(PDFConfig(strategy="local", local_pages_per_shard=0))
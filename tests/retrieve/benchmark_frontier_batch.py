@@ -0,0 +1,153 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""Query latency and vector calls of hierarchical retrieval per frontier batch size.
+
+Builds a local collection shaped like an imported resource tree (directory
+L0/L1 records plus L2 files) and runs the same queries through
+HierarchicalRetriever with different ``frontier_batch_size`` values. Reports
+mean/p99 latency, vector queries per retrieval and agreement with the
+one-directory-at-a-time results.
+
+    python tests/retrieve/benchmark_frontier_batch.py --fanout 6 --depth 3 --batch 1,4,8,16
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from openviking.retrieve.hierarchical_retriever import HierarchicalRetriever
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.collection_schemas import CollectionSchemas
+from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
+from openviking_cli.retrieve.types import ContextType, TypedQuery
+from openviking_cli.session.user_id import UserIdentifier
+from openviking_cli.utils.config.vectordb_config import VectorDBBackendConfig
+
+ROOT = "viking://resources"
+
+
+class CountingBackend(VikingVectorIndexBackend):
+    def __init__(self, config):
+        super().__init__(config)
+        self.query_calls = 0
+
+    async def query(self, *args, **kwargs):
+        self.query_calls += 1
+        return await super().query(*args, **kwargs)
+
+
+class BenchRetriever(HierarchicalRetriever):
+    async def _convert_to_matched_contexts(self, candidates, ctx):
+        # Skip relation lookups in VikingFS; only the vector search is measured.
+        return candidates
+
+
+class QueryEmbedder:
+    def __init__(self, vectors):
+        self._vectors = iter(vectors)
+
+    def embed(self, text):
+        from openviking.models.embedder.base import EmbedResult
+
+        return EmbedResult(dense_vector=next(self._vectors))
+
+
+def percentile(data, pct):
+    ordered = sorted(data)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def build_records(fanout, depth, files, dim, rng):
+    records = []
+
+    def vec():
+        return [rng.gauss(0, 1) for _ in range(dim)]
+
+    def add(uri, parent, level):
+        records.append(
+            {
+                "id": str(len(records)),
+                "uri": uri,
+                "parent_uri": parent,
+                "level": level,
+                "context_type": "resource",
+                "account_id": "acc",
+                "owner_space": "",
+                "abstract": uri,
+                "vector": vec(),
+            }
+        )
+
+    def walk(dir_uri, level):
+        add(f"{dir_uri}/.abstract.md", dir_uri, 0)
+        add(f"{dir_uri}/.overview.md", dir_uri, 1)
+        for i in range(files):
+            add(f"{dir_uri}/file{i}.md", dir_uri, 2)
+        if level < depth:
+            for c in range(fanout):
+                walk(f"{dir_uri}/dir{c}", level + 1)
+
+    for c in range(fanout):
+        walk(f"{ROOT}/dir{c}", 1)
+    return records
+
+
+async def run(args):
+    rng = random.Random(42)
+    backend = CountingBackend(
+        VectorDBBackendConfig(backend="local", path=None, dimension=args.dim, name="context")
+    )
+    await backend.create_collection(
+        "context", CollectionSchemas.context_collection("context", args.dim)
+    )
+    records = build_records(args.fanout, args.depth, args.files, args.dim, rng)
+    for start in range(0, len(records), 1000):
+        await backend.upsert_many(records[start : start + 1000])
+    print(f"Indexed {len(records)} records (fanout={args.fanout}, depth={args.depth})")
+
+    queries = [[rng.gauss(0, 1) for _ in range(args.dim)] for _ in range(args.queries)]
+    ctx = RequestContext(user=UserIdentifier("acc", "user", "agent"), role=Role.USER)
+    baseline = None
+
+    print(f"{'batch':>6} {'mean ms':>9} {'p99 ms':>9} {'calls/query':>12} {'same top-k':>11}")
+    for batch_size in [int(b) for b in args.batch.split(",")]:
+        retriever = BenchRetriever(
+            storage=backend,
+            embedder=QueryEmbedder(queries),
+            rerank_config=None,
+            frontier_batch_size=batch_size,
+        )
+        latencies, results = [], []
+        backend.query_calls = 0
+        for _ in queries:
+            typed = TypedQuery(query="q", context_type=ContextType.RESOURCE, intent="")
+            start = time.perf_counter()
+            result = await retriever.retrieve(typed, ctx=ctx, limit=args.limit)
+            latencies.append((time.perf_counter() - start) * 1000)
+            results.append([c["uri"] for c in result.matched_contexts])
+        if baseline is None:
+            baseline = results
+        same = sum(a == b for a, b in zip(results, baseline)) / len(results)
+        print(
+            f"{batch_size:>6} {sum(latencies) / len(latencies):>9.2f} "
+            f"{percentile(latencies, 99):>9.2f} {backend.query_calls / len(queries):>12.1f} "
+            f"{same:>11.0%}"
+        )
+    await backend.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frontier batch size benchmark")
+    parser.add_argument("--fanout", type=int, default=6, help="Subdirectories per directory")
+    parser.add_argument("--depth", type=int, default=3, help="Directory depth")
+    parser.add_argument("--files", type=int, default=5, help="Files per directory")
+    parser.add_argument("--dim", type=int, default=64, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=100, help="Number of queries")
+    parser.add_argument("--limit", type=int, default=5, help="Results per query")
+    parser.add_argument("--batch", type=str, default="1,4,8,16", help="Batch sizes to compare")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
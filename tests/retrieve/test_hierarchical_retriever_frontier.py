@@ -0,0 +1,97 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Batched frontier expansion in HierarchicalRetriever."""
+
+import pytest
+
+from openviking.retrieve.hierarchical_retriever import HierarchicalRetriever
+from openviking.server.identity import RequestContext, Role
+from openviking_cli.session.user_id import UserIdentifier
+
+ROOT = "viking://resources"
+
+
+def _build_tree():
+    """Eight directories under ROOT, each with three files and one subdirectory."""
+    children = {ROOT: []}
+    for d in range(8):
+        dir_uri = f"{ROOT}/d{d}"
+        children[ROOT].append({"uri": dir_uri, "level": 1, "_score": 0.3 + d * 0.05})
+        children[dir_uri] = [
+            {"uri": f"{dir_uri}/f{i}.md", "level": 2, "_score": 0.2 + ((d * 7 + i) % 10) / 20}
+            for i in range(3)
+        ]
+        sub_uri = f"{dir_uri}/sub"
+        children[dir_uri].append({"uri": sub_uri, "level": 1, "_score": 0.25 + d * 0.02})
+        children[sub_uri] = [{"uri": f"{sub_uri}/g.md", "level": 2, "_score": 0.1 + d * 0.09}]
+    return children
+
+
+class TreeStorage:
+    def __init__(self):
+        self.collection_name = "context"
+        self.children = _build_tree()
+        self.single_calls = []
+        self.batch_calls = []
+
+    async def collection_exists_bound(self) -> bool:
+        return True
+
+    async def search_global_roots_in_tenant(self, ctx, **kwargs):
+        return []
+
+    def _results(self, parent_uri, limit):
+        return [dict(r) for r in self.children.get(parent_uri, [])][:limit]
+
+    async def search_children_in_tenant(self, ctx, parent_uri, limit=10, **kwargs):
+        self.single_calls.append(parent_uri)
+        return self._results(parent_uri, limit)
+
+    async def search_children_many_in_tenant(self, ctx, parent_uris, limit=10, **kwargs):
+        self.batch_calls.append(list(parent_uris))
+        return {uri: self._results(uri, limit) for uri in parent_uris}
+
+
+async def _retrieve(frontier_batch_size, limit=5):
+    storage = TreeStorage()
+    retriever = HierarchicalRetriever(
+        storage=storage,
+        embedder=None,
+        rerank_config=None,
+        frontier_batch_size=frontier_batch_size,
+    )
+    ctx = RequestContext(user=UserIdentifier("acc1", "user1", "agent1"), role=Role.USER)
+    candidates = await retriever._recursive_search(
+        query="q",
+        ctx=ctx,
+        query_vector=None,
+        sparse_query_vector=None,
+        starting_points=[(ROOT, 0.0)],
+        limit=limit,
+        mode="quick",
+        context_type="resource",
+    )
+    return storage, [(c["uri"], round(c["_final_score"], 6)) for c in candidates]
+
+
+@pytest.mark.asyncio
+async def test_default_expands_one_directory_per_query():
+    storage, _ = await _retrieve(frontier_batch_size=None)
+    assert storage.batch_calls == []
+    assert storage.single_calls[0] == ROOT
+    assert len(storage.single_calls) == len(set(storage.single_calls))
+
+
+@pytest.mark.asyncio
+async def test_batched_frontier_keeps_results_with_fewer_queries():
+    sequential, expected = await _retrieve(frontier_batch_size=1)
+    batched, actual = await _retrieve(frontier_batch_size=4)
+
+    assert actual == expected
+    batched_queries = len(batched.single_calls) + len(batched.batch_calls)
+    assert batched_queries < len(sequential.single_calls)
+    assert all(len(call) <= 4 for call in batched.batch_calls)
+    # Every directory is still expanded at most once.
+    expanded = batched.single_calls + [uri for call in batched.batch_calls for uri in call]
+    assert len(expanded) == len(set(expanded))
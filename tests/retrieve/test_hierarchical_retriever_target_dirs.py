@@ -17,6 +17,7 @@ class DummyStorage:
     def __init__(self) -> None:
         self.collection_name = "context"
         self.global_search_calls = []
+        self.global_batch_calls = []
         self.child_search_calls = []
 
     async def collection_exists_bound(self) -> bool:
@@ -45,6 +46,14 @@ class DummyStorage:
         )
         return []
 
+    async def search_global_roots_batch_in_tenant(
+        self, ctx, queries, extra_filter=None, limit: int = 10
+    ):
+        self.global_batch_calls.append(
+            {"ctx": ctx, "queries": queries, "extra_filter": extra_filter, "limit": limit}
+        )
+        return [[] for _ in queries]
+
     async def search_children_in_tenant(
         self,
         ctx,
@@ -93,3 +102,33 @@ async def test_retrieve_honors_target_directories_scope_filter():
     assert storage.child_search_calls
     assert storage.child_search_calls[0]["target_directories"] == [target_uri]
     assert storage.child_search_calls[0]["parent_uri"] == target_uri
+
+
+@pytest.mark.asyncio
+async def test_retrieve_many_batches_global_search():
+    target_uri = "viking://resources/foo"
+    storage = DummyStorage()
+    retriever = HierarchicalRetriever(storage=storage, embedder=None, rerank_config=None)
+    ctx = RequestContext(user=UserIdentifier("acc1", "user1", "agent1"), role=Role.USER)
+    queries = [
+        TypedQuery(query="a", context_type=ContextType.RESOURCE, intent=""),
+        TypedQuery(query="b", context_type=ContextType.MEMORY, intent=""),
+        TypedQuery(
+            query="c",
+            context_type=ContextType.RESOURCE,
+            intent="",
+            target_directories=[target_uri],
+        ),
+    ]
+
+    results = await retriever.retrieve_many(queries, ctx=ctx, limit=3, scope_dsl={"op": "and"})
+
+    assert [r.query for r in results] == queries
+    assert results[2].searched_directories == [target_uri]
+    assert storage.global_search_calls == []
+    assert len(storage.global_batch_calls) == 1
+    batch = storage.global_batch_calls[0]
+    assert [q["context_type"] for q in batch["queries"]] == ["resource", "memory", "resource"]
+    assert batch["queries"][2]["target_directories"] == [target_uri]
+    assert batch["extra_filter"] == {"op": "and"}
+    assert batch["limit"] == retriever.GLOBAL_SEARCH_TOPK
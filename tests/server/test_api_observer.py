@@ -41,6 +41,17 @@ async def test_observer_vlm(client: httpx.AsyncClient):
     assert "is_healthy" in result
 
 
+async def test_observer_cache(client: httpx.AsyncClient):
+    """GET /api/v1/observer/cache should return cache hit rates."""
+    resp = await client.get("/api/v1/observer/cache")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["status"] == "ok"
+    result = body["result"]
+    assert result["name"] == "cache"
+    assert "Hit Rate" in result["status"]
+
+
 async def test_observer_system(client: httpx.AsyncClient):
     """GET /api/v1/observer/system should return full system status."""
     resp = await client.get("/api/v1/observer/system")
@@ -145,6 +145,49 @@ async def test_compress_session(client: httpx.AsyncClient):
     assert resp.json()["status"] == "ok"
 
 
+async def test_commit_session_returns_pollable_job(client: httpx.AsyncClient):
+    create_resp = await client.post("/api/v1/sessions", json={})
+    session_id = create_resp.json()["result"]["session_id"]
+    await client.post(
+        f"/api/v1/sessions/{session_id}/messages",
+        json={"role": "user", "content": "Hello"},
+    )
+
+    resp = await client.post(f"/api/v1/sessions/{session_id}/commit")
+    assert resp.status_code == 200
+    result = resp.json()["result"]
+    assert result["status"] == "accepted"
+    assert result["archived"] is True
+
+    job_resp = await client.get(f"/api/v1/sessions/{session_id}/commit/{result['job_id']}")
+    assert job_resp.status_code == 200
+    assert job_resp.json()["result"]["job_id"] == result["job_id"]
+
+    missing = await client.get(f"/api/v1/sessions/{session_id}/commit/nonexistent")
+    assert missing.status_code == 404
+
+
+async def test_commit_with_full_job_queue_keeps_messages(client: httpx.AsyncClient, service):
+    create_resp = await client.post("/api/v1/sessions", json={})
+    session_id = create_resp.json()["result"]["session_id"]
+    await client.post(
+        f"/api/v1/sessions/{session_id}/messages",
+        json={"role": "user", "content": "Hello"},
+    )
+    jobs = service.sessions._commit_jobs
+    held = [jobs.reserve("other", ("acc", "user")) for _ in range(jobs.max_pending)]
+
+    resp = await client.post(f"/api/v1/sessions/{session_id}/commit")
+    assert resp.status_code == 503
+
+    for job in held:
+        jobs.release(job)
+    assert jobs.pending_count() == 0
+    # Nothing was archived, so the next commit still archives the message
+    resp = await client.post(f"/api/v1/sessions/{session_id}/commit")
+    assert resp.json()["result"]["archived"] is True
+
+
 async def test_extract_session_jsonable_regression(client: httpx.AsyncClient, service, monkeypatch):
     """Regression: extract endpoint should serialize internal objects."""
 
@@ -0,0 +1,130 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Background commit job tests"""
+
+import threading
+
+import pytest
+
+from openviking.server.identity import RequestContext, Role
+from openviking.session import Session
+from openviking.session.commit_jobs import CommitJobManager, CommitJobStatus
+from openviking_cli.exceptions import UnavailableError
+from openviking_cli.session.user_id import UserIdentifier
+
+OWNER = ("acc", "alice")
+
+
+class TestCommitJobManager:
+    def test_job_result_and_failure_are_recorded(self):
+        manager = CommitJobManager(max_workers=2)
+        ok = manager.submit("s1", OWNER, lambda: {"memories_extracted": 2})
+
+        def fail():
+            raise RuntimeError("LLM unavailable")
+
+        failed = manager.submit("s1", OWNER, fail)
+
+        assert ok.wait(5) and failed.wait(5)
+
+        assert ok.status == CommitJobStatus.COMPLETED
+        assert ok.to_dict()["result"] == {"memories_extracted": 2}
+        assert failed.status == CommitJobStatus.FAILED
+        assert failed.error == "LLM unavailable"
+        assert manager.pending_count() == 0
+
+    def test_full_queue_rejects_new_jobs(self):
+        manager = CommitJobManager(max_workers=1, max_pending=2)
+        release = threading.Event()
+        running = manager.submit("s1", OWNER, lambda: release.wait(5) and {})
+        queued = manager.submit("s2", OWNER, lambda: {})
+
+        with pytest.raises(UnavailableError):
+            manager.submit("s3", OWNER, lambda: {})
+
+        assert running.wait(0.05) is False
+        release.set()
+        assert running.wait(5) and queued.wait(5)
+        assert queued.status == CommitJobStatus.COMPLETED
+        assert manager.pending_count() == 0
+
+    def test_shutdown_cancels_queued_jobs(self):
+        manager = CommitJobManager(max_workers=1)
+        release = threading.Event()
+        running = manager.submit("s1", OWNER, lambda: release.wait(5) and {})
+        queued = manager.submit("s2", OWNER, lambda: {})
+
+        threading.Timer(0.1, release.set).start()
+        manager.shutdown()
+
+        assert running.status == CommitJobStatus.COMPLETED
+        assert queued.status == CommitJobStatus.FAILED
+        assert queued.error == "cancelled: service shut down"
+
+    def test_jobs_are_visible_to_their_owner_only(self):
+        manager = CommitJobManager()
+        job = manager.submit("s1", OWNER, lambda: {})
+
+        assert job.wait(5)
+        assert manager.get(job.job_id, OWNER) is job
+        assert manager.get(job.job_id, ("acc", "bob")) is None
+        assert manager.get("unknown", OWNER) is None
+
+    def test_finished_jobs_are_pruned(self):
+        manager = CommitJobManager(max_finished=2)
+        jobs = [manager.submit("s1", OWNER, lambda: {}) for _ in range(4)]
+        assert all(job.wait(5) for job in jobs)
+        manager.submit("s1", OWNER, lambda: {}).wait(5)
+
+        assert manager.get(jobs[0].job_id, OWNER) is None
+        assert manager.get(jobs[-1].job_id, OWNER) is not None
+
+    def test_reserved_slot_counts_until_started_or_released(self):
+        manager = CommitJobManager(max_pending=1)
+        job = manager.reserve("s1", OWNER)
+
+        with pytest.raises(UnavailableError):
+            manager.submit("s2", OWNER, lambda: {})
+
+        manager.release(job)
+        assert manager.pending_count() == 0
+        assert manager.get(job.job_id, OWNER) is None
+
+        job = manager.reserve("s1", OWNER)
+        manager.start(job, lambda: {"memories_extracted": 1})
+        assert job.wait(5)
+        assert job.result == {"memories_extracted": 1}
+        assert manager.pending_count() == 0
+
+
+class FakeCompressor:
+    def __init__(self):
+        self.calls = []
+
+    async def extract_long_term_memories(self, messages, user, session_id, ctx):
+        self.calls.append((user, ctx))
+        return ["memory"] * len(messages)
+
+
+class TestFinishCommit:
+    def test_finish_commit_works_on_a_snapshot(self):
+        compressor = FakeCompressor()
+        session = Session(viking_fs=None, session_compressor=compressor)
+        user, ctx = session.user, session.ctx
+        session.used(contexts=["viking://resources/a"])
+        snapshot = session.commit_snapshot()
+
+        # The session keeps changing while the job runs
+        session.used(contexts=["viking://resources/b"])
+        session.user = UserIdentifier("acc", "other", "agent")
+        session.ctx = RequestContext(user=session.user, role=Role.USER)
+        result = session.finish_commit(["m1", "m2"], {}, snapshot)
+
+        assert compressor.calls == [(user, ctx)]
+        assert result["memories_extracted"] == 2
+        assert result["stats"]["contexts_used"] == 1
+        assert session.stats.memories_extracted == 0
+        session.record_commit(result)
+        assert session.stats.memories_extracted == 2
+        assert session.stats.contexts_used == 2
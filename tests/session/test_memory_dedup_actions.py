@@ -1,6 +1,7 @@
 # Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,7 +9,7 @@ import pytest
 from openviking.core.context import Context
 from openviking.message import Message
 from openviking.server.identity import RequestContext, Role
-from openviking.session.compressor import SessionCompressor
+from openviking.session.compressor import ExtractionStats, SessionCompressor
 from openviking.session.memory_deduplicator import (
     DedupDecision,
     DedupResult,
@@ -556,3 +557,85 @@ class TestSessionCompressorDedupActions:
         assert [m.uri for m in memories] == [new_memory.uri]
         assert call_order == ["delete", "create"]
         vikingdb.delete_uris.assert_awaited_once_with(_make_ctx(), [target.uri])
+
+
+@pytest.mark.asyncio
+class TestSessionCompressorConcurrency:
+    @staticmethod
+    def _compressor(candidates, max_concurrency=4):
+        vikingdb = MagicMock()
+        vikingdb.get_embedder.return_value = None
+        compressor = SessionCompressor(vikingdb=vikingdb, max_concurrency=max_concurrency)
+        compressor.extractor.extract = AsyncMock(return_value=candidates)
+        compressor._index_memory = AsyncMock(return_value=True)
+        return compressor
+
+    @staticmethod
+    def _candidates(abstracts):
+        candidates = []
+        for abstract in abstracts:
+            candidate = _make_candidate()
+            candidate.abstract = abstract
+            candidates.append(candidate)
+        return candidates
+
+    async def _run(self, compressor, stats=None):
+        with patch("openviking.session.compressor.get_viking_fs", return_value=MagicMock()):
+            return await compressor.extract_long_term_memories(
+                [Message.create_user("test message")],
+                user=_make_user(),
+                session_id="session_test",
+                ctx=_make_ctx(),
+                stats=stats,
+            )
+
+    def _track_dedup(self, compressor, delays=None):
+        state = {"active": 0, "peak": 0, "order": []}
+
+        async def deduplicate(candidate):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep((delays or {}).get(candidate.abstract, 0.01))
+            state["order"].append(candidate.abstract)
+            state["active"] -= 1
+            return DedupResult(
+                decision=DedupDecision.CREATE,
+                candidate=candidate,
+                similar_memories=[],
+                actions=[],
+            )
+
+        async def create_memory(candidate, *_args, **_kwargs):
+            return _make_existing(candidate.abstract.split(":")[0] + ".md")
+
+        compressor.deduplicator.deduplicate = deduplicate
+        compressor.extractor.create_memory = AsyncMock(side_effect=create_memory)
+        return state
+
+    async def test_independent_candidates_run_concurrently_in_bounded_batches(self):
+        candidates = self._candidates([f"facet{i}: value" for i in range(6)])
+        compressor = self._compressor(candidates, max_concurrency=3)
+        state = self._track_dedup(compressor)
+        stats = ExtractionStats()
+
+        memories = await self._run(compressor, stats)
+
+        assert state["peak"] == 3
+        # Results keep candidate order regardless of completion order
+        assert [m.uri.rsplit("/", 1)[-1] for m in memories] == [f"facet{i}.md" for i in range(6)]
+        assert stats.created == 6
+        assert stats.dedup_seconds > stats.total_seconds > 0
+        assert stats.extract_seconds >= 0 and stats.index_seconds >= 0
+
+    async def test_candidates_of_same_facet_are_serialized(self):
+        candidates = self._candidates(["food: likes tea", "food: dislikes coffee", "music: jazz"])
+        compressor = self._compressor(candidates)
+        state = self._track_dedup(compressor, delays={"food: likes tea": 0.05})
+
+        await self._run(compressor)
+
+        assert state["peak"] == 2
+        # The second "food" candidate waits for the first even though it is faster
+        assert state["order"].index("food: likes tea") < state["order"].index(
+            "food: dislikes coffee"
+        )
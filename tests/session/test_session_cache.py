@@ -0,0 +1,121 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""SessionService in-memory session cache tests"""
+
+import asyncio
+
+from openviking.message import TextPart
+from openviking.server.identity import RequestContext, Role
+from openviking.service.session_service import SessionService
+from openviking_cli.session.user_id import UserIdentifier
+
+
+class FakeVikingFS:
+    """Stores files in a dict and counts full reads and appends."""
+
+    def __init__(self):
+        self.files = {}
+        self.reads = 0
+        self.appends = 0
+
+    async def read_file(self, uri, ctx=None):
+        self.reads += 1
+        if uri not in self.files:
+            raise FileNotFoundError(uri)
+        return self.files[uri]
+
+    async def append_file(self, uri, content, ctx=None):
+        self.appends += 1
+        await asyncio.sleep(0)
+        self.files[uri] = self.files.get(uri, "") + content
+
+    async def ls(self, uri, ctx=None):
+        return []
+
+    async def stat(self, uri, ctx=None):
+        if not any(path.startswith(uri + "/") for path in self.files):
+            raise FileNotFoundError(uri)
+        return {"isDir": True}
+
+    async def rm(self, uri, recursive=False, ctx=None):
+        self.files = {k: v for k, v in self.files.items() if not k.startswith(uri + "/")}
+
+
+def make_service(max_cached_sessions=256):
+    fs = FakeVikingFS()
+    return SessionService(viking_fs=fs, max_cached_sessions=max_cached_sessions), fs
+
+
+def make_ctx(user_id="alice", agent_id="agent", role=Role.USER):
+    return RequestContext(user=UserIdentifier("acc", user_id, agent_id), role=role)
+
+
+async def add(service, ctx, session_id, text):
+    async with service.locked(ctx, session_id) as session:
+        session.add_message("user", [TextPart(text)])
+        return len(session.messages)
+
+
+class TestSessionCache:
+    async def test_hot_session_is_read_once(self):
+        service, fs = make_service()
+        ctx = make_ctx()
+
+        counts = [await add(service, ctx, "s1", f"message {i}") for i in range(5)]
+
+        assert counts == [1, 2, 3, 4, 5]
+        assert fs.reads == 1
+        assert fs.appends == 5
+
+    async def test_concurrent_writers_are_serialized(self):
+        service, fs = make_service()
+        ctx = make_ctx()
+
+        counts = await asyncio.gather(*(add(service, ctx, "s1", f"m{i}") for i in range(10)))
+
+        assert sorted(counts) == list(range(1, 11))
+        assert len(fs.files["viking://session/alice/s1/messages.jsonl"].splitlines()) == 10
+
+    async def test_evicted_session_reloads_from_storage(self):
+        service, fs = make_service(max_cached_sessions=1)
+        ctx = make_ctx()
+        await add(service, ctx, "s1", "first")
+        await add(service, ctx, "s2", "other")
+        assert service.cached_session_count() == 1
+
+        session = await service.load(ctx, "s1")
+
+        assert [m.content for m in session.messages] == ["first"]
+        assert session._stats.total_turns == 1
+
+    async def test_sessions_are_scoped_per_user_and_dropped_on_delete(self):
+        service, fs = make_service()
+        alice, bob = make_ctx("alice"), make_ctx("bob")
+        await add(service, alice, "s1", "from alice")
+
+        assert (await service.load(bob, "s1")).messages == []
+        assert service.session(alice, "s1") is service.session(alice, "s1")
+
+        await service.delete("s1", alice)
+        assert (await service.load(alice, "s1")).messages == []
+
+    async def test_each_identity_keeps_its_own_context(self):
+        service, fs = make_service()
+        agent_a = make_ctx(agent_id="a")
+        agent_b = make_ctx(agent_id="b")
+        root = make_ctx(agent_id="a", role=Role.ROOT)
+
+        session_a = service.session(agent_a, "s1")
+        session_b = service.session(agent_b, "s1")
+        session_root = service.session(root, "s1")
+
+        assert len({id(session_a), id(session_b), id(session_root)}) == 3
+        assert service.session(agent_a, "s1") is session_a
+        # Checking out under another identity never rewrites a cached context.
+        assert session_a.ctx is agent_a and session_a.user is agent_a.user
+        assert session_b.ctx is agent_b and session_root.ctx is root
+
+        await add(service, agent_a, "s1", "hello")
+        await service.delete("s1", agent_b)
+        assert service.cached_session_count() == 0
@@ -74,7 +74,7 @@ class TestCommit:
         result = session.commit()
 
         assert result.get("status") == "committed"
-        assert "active_count_updated" in result
+        assert "active_count_queued" in result
 
     async def test_active_count_incremented_after_commit(self, client_with_resource_sync: tuple):
         """Regression test: active_count must actually increment after commit.
@@ -112,9 +112,10 @@ class TestCommit:
         session.add_message("assistant", [TextPart("Answer")])
         result = session.commit()
 
-        assert result.get("active_count_updated") == 1
+        assert result.get("active_count_queued") == 1
 
-        # Verify the count actually changed in storage
+        # Increments are buffered; flush them, then verify the count changed in storage
+        await vikingdb.flush_active_counts()
         records_after = await vikingdb.get_context_by_uri(
             account_id="default",
             uri=uri,
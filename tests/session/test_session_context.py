@@ -66,3 +66,75 @@ class TestGetContextForSearch:
         context = await session.get_context_for_search(query="test")
 
         assert isinstance(context, dict)
+
+
+class ArchiveFS:
+    """In-memory VikingFS holding session archives; counts overview reads."""
+
+    def __init__(self):
+        self.files = {}
+        self.overview_reads = 0
+
+    async def write_file(self, uri, content, ctx=None):
+        self.files[uri] = content
+
+    async def read_file(self, uri, ctx=None):
+        if uri.endswith("/.overview.md"):
+            self.overview_reads += 1
+        return self.files[uri]
+
+    async def ls(self, uri, ctx=None):
+        names = {
+            path[len(uri) + 1 :].split("/", 1)[0]
+            for path in self.files
+            if path.startswith(uri + "/")
+        }
+        return [{"name": name} for name in sorted(names)]
+
+
+class TestArchiveOverviewIndex:
+    """Archive overviews are read once and then served from memory"""
+
+    def _session(self, fs, overviews):
+        session = Session(viking_fs=fs, session_id="archive_index_test")
+        for index, overview in enumerate(overviews, start=1):
+            session._write_archive(index, [], abstract="", overview=overview)
+        session._compression.compression_index = len(overviews)
+        return session
+
+    async def test_ranks_by_relevance_then_recency(self):
+        fs = ArchiveFS()
+        session = self._session(
+            fs, ["deploy deploy notes", "unrelated", "deploy notes", "more unrelated"]
+        )
+
+        context = await session.get_context_for_search(query="Deploy", max_archives=3)
+
+        assert context["summaries"] == ["deploy deploy notes", "deploy notes", "more unrelated"]
+
+    async def test_new_archives_do_not_reread_history(self):
+        fs = ArchiveFS()
+        session = self._session(fs, ["first topic", "second topic"])
+
+        await session.get_context_for_search(query="topic")
+        assert fs.overview_reads == 2
+
+        session._compression.compression_index = 3
+        session._write_archive(3, [], abstract="", overview="third topic")
+        context = await session.get_context_for_search(query="third", max_archives=1)
+
+        assert context["summaries"] == ["third topic"]
+        assert fs.overview_reads == 2
+
+    async def test_archives_written_elsewhere_are_picked_up(self):
+        fs = ArchiveFS()
+        session = self._session(fs, ["first topic"])
+        await session.get_context_for_search(query="topic")
+
+        other = Session(viking_fs=fs, session_id="archive_index_test")
+        other._write_archive(2, [], abstract="", overview="second topic")
+        session._compression.compression_index = 2
+
+        context = await session.get_context_for_search(query="second", max_archives=1)
+
+        assert context["summaries"] == ["second topic"]
@@ -5,6 +5,7 @@
 
 from openviking.message import ContextPart, TextPart, ToolPart
 from openviking.session import Session
+from openviking.storage.viking_fs import get_viking_fs
 
 
 class TestAddMessage:
@@ -105,3 +106,24 @@ class TestUpdateToolPart:
         # Verify tool status updated
         msg = next((m for m in session.messages if m.id == message_id), None)
         assert msg is not None
+
+    async def test_update_tool_survives_reload(self, session_with_tool_call):
+        """Test tool updates appended to messages.jsonl replace the message on load"""
+        session, message_id, tool_id = session_with_tool_call
+        session.add_message("user", [TextPart("Thanks")])
+
+        session.update_tool_part(
+            message_id=message_id,
+            tool_id=tool_id,
+            output="done",
+            status="completed",
+        )
+
+        reloaded = Session(
+            viking_fs=get_viking_fs(), user=session.user, session_id=session.session_id
+        )
+        await reloaded.load()
+
+        assert [m.id for m in reloaded.messages] == [m.id for m in session.messages]
+        msg = next(m for m in reloaded.messages if m.id == message_id)
+        assert msg.find_tool_part(tool_id).tool_status == "completed"
@@ -0,0 +1,114 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""Vector index cost of moving a large directory tree.
+
+Compares the per-URI rewrite (get_context_by_uri + update_uri_mapping for
+every file, as VikingFS.mv used to do) with the bulk rename_uri_prefix() on a
+local collection.
+
+    python tests/storage/benchmark_mv_rename.py --files 20000 --fanout 50
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.collection_schemas import CollectionSchemas
+from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
+from openviking_cli.session.user_id import UserIdentifier
+from openviking_cli.utils.config.vectordb_config import VectorDBBackendConfig
+
+
+def build_records(root, files, fanout, dim, rng):
+    records = []
+
+    def add(uri, parent, level):
+        records.append(
+            {
+                "id": str(len(records)),
+                "uri": uri,
+                "parent_uri": parent,
+                "level": level,
+                "context_type": "resource",
+                "account_id": "acc",
+                "owner_space": "",
+                "abstract": uri,
+                "vector": [rng.random() for _ in range(dim)],
+            }
+        )
+
+    dirs = [f"{root}/dir{d}" for d in range(max(1, files // fanout))]
+    for dir_uri in [root] + dirs:
+        add(f"{dir_uri}/.abstract.md", dir_uri, 0)
+        add(f"{dir_uri}/.overview.md", dir_uri, 1)
+    for i in range(files):
+        dir_uri = dirs[i % len(dirs)]
+        add(f"{dir_uri}/file{i}.md", dir_uri, 2)
+    return records
+
+
+async def make_backend(records, dim):
+    backend = VikingVectorIndexBackend(
+        VectorDBBackendConfig(backend="local", path=None, dimension=dim, name="context")
+    )
+    await backend.create_collection("context", CollectionSchemas.context_collection("context", dim))
+    for start in range(0, len(records), 1000):
+        await backend.upsert_many(records[start : start + 1000])
+    return backend
+
+
+async def per_uri_rename(backend, ctx, records, old_root, new_root):
+    for record in records:
+        uri = record["uri"]
+        found = await backend.get_context_by_uri(account_id=ctx.account_id, uri=uri, limit=1)
+        if not found:
+            continue
+        await backend.update_uri_mapping(
+            ctx=ctx,
+            uri=uri,
+            new_uri=uri.replace(old_root, new_root, 1),
+            new_parent_uri=found[0]["parent_uri"].replace(old_root, new_root, 1),
+        )
+
+
+async def run(args):
+    rng = random.Random(0)
+    old_root, new_root = "viking://resources/big", "viking://resources/moved"
+    records = build_records(old_root, args.files, args.fanout, args.dim, rng)
+    ctx = RequestContext(user=UserIdentifier("acc", "user", "agent"), role=Role.ROOT)
+    print(f"Moving {len(records)} records ({args.files} files)")
+
+    backend = await make_backend(records, args.dim)
+    start = time.perf_counter()
+    renamed = await backend.rename_uri_prefix(ctx, old_root, new_root)
+    bulk = time.perf_counter() - start
+    moved = await backend.count({"op": "must", "field": "uri", "conds": [new_root]})
+    await backend.close()
+    print(f"bulk rename_uri_prefix: {bulk:8.2f}s  ({renamed} rewritten, {moved} under new root)")
+
+    if args.skip_per_uri:
+        return
+    backend = await make_backend(records, args.dim)
+    start = time.perf_counter()
+    await per_uri_rename(backend, ctx, records, old_root, new_root)
+    per_uri = time.perf_counter() - start
+    await backend.close()
+    print(f"per-URI rewrite:        {per_uri:8.2f}s  ({3 * len(records)} vector store calls)")
+    print(f"speedup:                {per_uri / bulk:8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk URI rename benchmark")
+    parser.add_argument("--files", type=int, default=5000, help="Files in the moved tree")
+    parser.add_argument("--fanout", type=int, default=50, help="Files per directory")
+    parser.add_argument("--dim", type=int, default=128, help="Vector dimension")
+    parser.add_argument(
+        "--skip-per-uri", action="store_true", help="Only run the bulk rename (large trees)"
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
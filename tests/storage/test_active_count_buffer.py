@@ -0,0 +1,140 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+
+import pytest
+
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.active_count_buffer import ActiveCountBuffer
+from openviking.storage.collection_schemas import CollectionSchemas
+from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
+from openviking_cli.session.user_id import UserIdentifier
+from openviking_cli.utils.config.vectordb_config import VectorDBBackendConfig
+
+DIM = 4
+ROOT = "viking://resources"
+
+
+class TestActiveCountBuffer:
+    def test_increments_are_coalesced_until_flush(self):
+        batches = []
+        buffer = ActiveCountBuffer(lambda pending: batches.append(dict(pending)) or 0, 60)
+
+        assert buffer.add("acc", ["a", "b", "a"]) == 2
+        buffer.add("acc", ["a"])
+        buffer.add("other", ["a"])
+
+        assert batches == []
+        assert buffer.pending_count() == 3
+        buffer.flush()
+        assert batches == [{("acc", "a"): 2, ("acc", "b"): 1, ("other", "a"): 1}]
+        assert buffer.pending_count() == 0
+        buffer.close()
+
+    def test_failed_flush_keeps_increments(self):
+        calls = []
+
+        def flush(pending):
+            calls.append(dict(pending))
+            if len(calls) == 1:
+                raise RuntimeError("storage down")
+            return len(pending)
+
+        buffer = ActiveCountBuffer(flush, flush_interval=60)
+        buffer.add("acc", ["a"])
+        assert buffer.flush() == 0
+        buffer.add("acc", ["a"])
+
+        assert buffer.flush() == 1
+        assert calls[-1] == {("acc", "a"): 2}
+        buffer.close()
+
+    def test_background_and_size_triggered_flushes(self):
+        flushed = threading.Event()
+        buffer = ActiveCountBuffer(lambda pending: flushed.set() or 0, flush_interval=0.05)
+        buffer.add("acc", ["a"])
+        assert flushed.wait(5)
+        buffer.close()
+
+        batches = []
+        buffer = ActiveCountBuffer(
+            lambda pending: batches.append(len(pending)) or 0, flush_interval=60, max_pending=2
+        )
+        buffer.add("acc", ["a"])
+        buffer.add("acc", ["b"])
+        assert batches == [2]
+        buffer.close()
+
+
+def _record(record_id, uri, active_count=0, account_id="acc"):
+    return {
+        "id": record_id,
+        "uri": uri,
+        "parent_uri": ROOT,
+        "level": 2,
+        "context_type": "resource",
+        "account_id": account_id,
+        "owner_space": "",
+        "abstract": record_id,
+        "active_count": active_count,
+        "vector": [float(len(record_id)), 1.0, 0.5, 0.25],
+    }
+
+
+@pytest.fixture
+async def backend():
+    storage = VikingVectorIndexBackend(
+        VectorDBBackendConfig(
+            backend="local",
+            path=None,
+            dimension=DIM,
+            name="context",
+            active_count_flush_interval=60,
+        )
+    )
+    await storage.create_collection("context", CollectionSchemas.context_collection("context", DIM))
+    await storage.upsert_many(
+        [
+            _record("a", f"{ROOT}/a.md", active_count=3),
+            _record("b", f"{ROOT}/b.md"),
+            _record("other", f"{ROOT}/a.md", account_id="other"),
+        ]
+    )
+    yield storage
+    await storage.close()
+
+
+async def test_backend_flushes_buffered_increments_in_one_update(backend):
+    ctx = RequestContext(user=UserIdentifier("acc", "user", "agent"), role=Role.USER)
+    before = {r["id"]: r for r in await backend.get(["a", "b"])}
+
+    assert await backend.increment_active_count(ctx, [f"{ROOT}/a.md", f"{ROOT}/b.md"]) == 2
+    await backend.increment_active_count(ctx, [f"{ROOT}/a.md", f"{ROOT}/missing.md"])
+    unchanged = {r["id"]: r["active_count"] for r in await backend.get(["a", "b"])}
+    assert unchanged == {"a": 3, "b": 0}
+
+    assert await backend.flush_active_counts() == 2
+
+    after = {r["id"]: r for r in await backend.get(["a", "b", "other"])}
+    assert after["a"]["active_count"] == 5
+    assert after["b"]["active_count"] == 1
+    assert after["other"]["active_count"] == 0
+    assert after["a"]["vector"] == before["a"]["vector"]
+    hot = await backend.filter(
+        {"op": "range", "field": "active_count", "gte": 5}, output_fields=["uri"]
+    )
+    assert [r["id"] for r in hot] == ["a"]
+
+
+async def test_close_flushes_pending_increments(backend):
+    ctx = RequestContext(user=UserIdentifier("acc", "user", "agent"), role=Role.USER)
+    await backend.increment_active_count(ctx, [f"{ROOT}/b.md"])
+
+    adapter = backend._adapter
+    closed = []
+    adapter.close = lambda: closed.append(True)
+    await backend.close()
+
+    assert closed == [True]
+    assert (await backend.get(["b"]))[0]["active_count"] == 1
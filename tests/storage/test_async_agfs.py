@@ -0,0 +1,96 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the async AGFS transport and VikingFS offloading."""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+from openviking.storage.async_agfs import AsyncAGFSClient, init_agfs_executor
+from openviking.storage.viking_fs import VikingFS
+
+
+class _SlowAGFS:
+    """Synchronous AGFS stand-in that blocks like a slow HTTP request."""
+
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.threads = []
+        self.name = "slow"
+
+    def ls(self, path):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        return [{"name": "a.md", "isDir": False}]
+
+    def read(self, path, offset=0, size=-1):
+        self.threads.append(threading.current_thread().name)
+        return b"content"
+
+
+def _make_viking_fs(agfs) -> VikingFS:
+    fs = VikingFS.__new__(VikingFS)
+    fs.agfs = agfs
+    fs.query_embedder = None
+    fs.vector_store = None
+    fs._bound_ctx = contextvars.ContextVar("vikingfs_bound_ctx", default=None)
+    return fs
+
+
+async def test_calls_run_on_agfs_executor():
+    init_agfs_executor(4)
+    agfs = _SlowAGFS(delay=0)
+    client = AsyncAGFSClient(agfs)
+
+    assert await client.read("/local/x") == b"content"
+    assert client.name == "slow"
+    assert agfs.threads and agfs.threads[0].startswith("agfs-io")
+
+
+async def test_slow_agfs_call_does_not_block_event_loop():
+    init_agfs_executor(4)
+    fs = _make_viking_fs(_SlowAGFS(delay=0.3))
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        entries = await fs.ls("viking://resources")
+    finally:
+        task.cancel()
+
+    assert [e["name"] for e in entries] == ["a.md"]
+    # The loop kept running while ls was blocked in AGFS.
+    assert ticks >= 5
+
+
+async def test_concurrent_calls_are_bounded_by_executor():
+    init_agfs_executor(2)
+    agfs = _SlowAGFS(delay=0.1)
+    client = AsyncAGFSClient(agfs)
+
+    start = time.monotonic()
+    await asyncio.gather(*[client.ls("/local") for _ in range(4)])
+    elapsed = time.monotonic() - start
+
+    # Four 100ms calls on two workers take two rounds.
+    assert elapsed >= 0.18
+    init_agfs_executor()
+
+
+async def test_swapping_agfs_client_rebinds_async_facade():
+    fs = _make_viking_fs(_SlowAGFS(delay=0))
+    replacement = _SlowAGFS(delay=0)
+    fs.agfs = replacement
+
+    await fs.read("viking://resources/a.md")
+
+    assert replacement.threads
@@ -0,0 +1,94 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.collection_schemas import CollectionSchemas
+from openviking.storage.expr import Eq
+from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
+from openviking_cli.session.user_id import UserIdentifier
+from openviking_cli.utils.config.vectordb_config import VectorDBBackendConfig
+
+DIM = 4
+ROOT = "viking://resources"
+USER = UserIdentifier("acc", "user", "agent")
+
+
+def _record(record_id, vector, level, context_type="resource", account_id="acc", owner_space=""):
+    return {
+        "id": record_id,
+        "uri": f"{ROOT}/{record_id}",
+        "parent_uri": ROOT,
+        "level": level,
+        "context_type": context_type,
+        "account_id": account_id,
+        "owner_space": owner_space,
+        "abstract": record_id,
+        "vector": vector,
+    }
+
+
+@pytest.fixture
+async def backend():
+    storage = VikingVectorIndexBackend(
+        VectorDBBackendConfig(backend="local", path=None, dimension=DIM, name="context")
+    )
+    await storage.create_collection("context", CollectionSchemas.context_collection("context", DIM))
+    await storage.upsert_many(
+        [
+            _record("r0", [1.0, 0.0, 0.0, 0.0], 0),
+            _record("r1", [0.0, 1.0, 0.0, 0.0], 1),
+            _record("r2", [0.7, 0.7, 0.0, 0.0], 2),
+            _record("m0", [0.0, 0.0, 1.0, 0.0], 1, "memory", owner_space=USER.user_space_name()),
+            _record("m1", [0.0, 0.6, 0.8, 0.0], 0, "memory", owner_space=USER.user_space_name()),
+            _record("x0", [1.0, 0.0, 0.0, 0.0], 0, account_id="other"),
+        ]
+    )
+    yield storage
+    await storage.close()
+
+
+def _ids(records):
+    return [(r["id"], round(r["_score"], 5)) for r in records]
+
+
+async def test_search_batch_matches_single_searches(backend):
+    queries = [
+        {"query_vector": [1.0, 0.0, 0.0, 0.0], "limit": 3},
+        {"query_vector": [0.0, 0.0, 1.0, 0.0], "filter": Eq("context_type", "memory")},
+        {"query_vector": [0.5, 0.5, 0.5, 0.5], "limit": 2, "offset": 1},
+    ]
+
+    batch = await backend.search_batch(queries)
+
+    assert len(batch) == len(queries)
+    for query, records in zip(queries, batch):
+        assert _ids(records) == _ids(await backend.search(**query))
+    assert {r["id"] for r in batch[1]} == {"m0", "m1"}
+    assert await backend.search_batch([]) == []
+
+
+async def test_global_roots_batch_matches_single_searches(backend):
+    ctx = RequestContext(user=USER, role=Role.USER)
+    queries = [
+        {"query_vector": [1.0, 0.0, 0.0, 0.0], "context_type": "resource"},
+        {"query_vector": [0.0, 0.6, 0.8, 0.0], "context_type": "memory"},
+        {"query_vector": [0.7, 0.7, 0.0, 0.0], "target_directories": [ROOT]},
+        {"query_vector": None, "context_type": "resource"},
+    ]
+
+    batch = await backend.search_global_roots_batch_in_tenant(ctx, queries, limit=3)
+
+    for query, records in zip(queries, batch):
+        single = await backend.search_global_roots_in_tenant(
+            ctx,
+            query_vector=query["query_vector"],
+            context_type=query.get("context_type"),
+            target_directories=query.get("target_directories"),
+            limit=3,
+        )
+        assert _ids(records) == _ids(single)
+    # Only levels 0/1 of the caller's account are global roots.
+    assert {r["id"] for r in batch[0]} == {"r0", "r1"}
+    assert batch[3] == []
@@ -0,0 +1,92 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.collection_schemas import CollectionSchemas
+from openviking.storage.vectordb_adapters.base import CollectionAdapter
+from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
+from openviking_cli.session.user_id import UserIdentifier
+from openviking_cli.utils.config.vectordb_config import VectorDBBackendConfig
+
+DIM = 4
+ROOT = "viking://resources"
+IDS = ["dir", "file", "subdir", "subfile", "sibling", "other"]
+
+
+def _record(record_id, uri, parent_uri, level=2, account_id="acc"):
+    return {
+        "id": record_id,
+        "uri": uri,
+        "parent_uri": parent_uri,
+        "level": level,
+        "context_type": "resource",
+        "account_id": account_id,
+        "owner_space": "",
+        "abstract": record_id,
+        "vector": [float(len(record_id)), 1.0, 0.5, 0.25],
+    }
+
+
+@pytest.fixture
+async def backend():
+    storage = VikingVectorIndexBackend(
+        VectorDBBackendConfig(backend="local", path=None, dimension=DIM, name="context")
+    )
+    await storage.create_collection("context", CollectionSchemas.context_collection("context", DIM))
+    await storage.upsert_many(
+        [
+            _record("dir", f"{ROOT}/a/.abstract.md", f"{ROOT}/a", level=0),
+            _record("file", f"{ROOT}/a/f.md", f"{ROOT}/a"),
+            _record("subdir", f"{ROOT}/a/sub/.overview.md", f"{ROOT}/a/sub", level=1),
+            _record("subfile", f"{ROOT}/a/sub/g.md", f"{ROOT}/a/sub"),
+            _record("sibling", f"{ROOT}/ab/f.md", f"{ROOT}/ab"),
+            _record("other", f"{ROOT}/a/f.md", f"{ROOT}/a", account_id="other"),
+        ]
+    )
+    yield storage
+    await storage.close()
+
+
+async def _remaining(storage):
+    return {r["id"] for r in await storage.get(IDS)}
+
+
+async def test_delete_subtree_removes_tree_in_one_batch(backend):
+    ctx = RequestContext(user=UserIdentifier("acc", "user", "agent"), role=Role.ROOT)
+
+    deleted = await backend.delete_subtree(ctx, f"{ROOT}/a")
+
+    assert deleted == 4
+    # Prefix match is segment-wise, and other accounts are untouched.
+    assert await _remaining(backend) == {"sibling", "other"}
+    assert await backend.count() == 2
+
+
+async def test_delete_subtree_single_file(backend):
+    ctx = RequestContext(user=UserIdentifier("acc", "user", "agent"), role=Role.ROOT)
+
+    deleted = await backend.delete_subtree(ctx, f"{ROOT}/a/sub/g.md")
+
+    assert deleted == 1
+    assert "subfile" not in await _remaining(backend)
+    assert await backend.delete_subtree(ctx, f"{ROOT}/missing") == 0
+
+
+async def test_remove_by_uri_removes_descendants(backend):
+    deleted = await backend.remove_by_uri(f"{ROOT}/a/sub")
+
+    assert deleted == 2
+    assert await _remaining(backend) == {"dir", "file", "sibling", "other"}
+
+
+async def test_query_based_delete_pages_past_the_batch_limit(backend):
+    adapter = backend._adapter
+    subtree = adapter._subtree_filter(f"{ROOT}/a")
+
+    # The generic adapter path (used by remote backends) deletes in batches.
+    deleted = CollectionAdapter._delete_by_filter(adapter, subtree, 2)
+
+    assert deleted == 5
+    assert await _remaining(backend) == {"sibling"}
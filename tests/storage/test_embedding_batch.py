@@ -0,0 +1,168 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+import threading
+
+from openviking.models.embedder.base import EmbedResult
+from openviking.storage.collection_schemas import TextEmbeddingHandler
+from openviking.storage.errors import CollectionNotFoundError
+from openviking.storage.queuefs.embedding_msg import EmbeddingMsg
+from openviking.storage.queuefs.queue_manager import QueueManager
+
+DIM = 4
+
+
+class _FakeEmbedder:
+    def __init__(self, fail_batch=False):
+        self.fail_batch = fail_batch
+        self.batch_calls = []
+        self.single_calls = []
+
+    def _vector(self, text):
+        if text == "bad-dim":
+            return [0.0] * (DIM + 1)
+        return [float(len(text))] * DIM
+
+    def embed(self, text):
+        self.single_calls.append(text)
+        if text == "boom":
+            raise RuntimeError("provider rejected input")
+        return EmbedResult(dense_vector=self._vector(text))
+
+    def embed_batch(self, texts):
+        self.batch_calls.append(list(texts))
+        if self.fail_batch:
+            raise RuntimeError("provider rejected batch")
+        return [EmbedResult(dense_vector=self._vector(text)) for text in texts]
+
+
+class _FakeVikingDB:
+    def __init__(self, error=None, is_closing=False):
+        self.error = error
+        self.is_closing = is_closing
+        self.upsert_calls = []
+
+    async def upsert_many(self, records):
+        self.upsert_calls.append(records)
+        if self.error:
+            raise self.error
+        return [record["id"] for record in records]
+
+
+def _make_handler(embedder, vikingdb):
+    handler = TextEmbeddingHandler.__new__(TextEmbeddingHandler)
+    handler._vikingdb = vikingdb
+    handler._embedder = embedder
+    handler._collection_name = "context"
+    handler._vector_dim = DIM
+    counters = {"success": 0, "errors": []}
+    handler.set_callbacks(
+        on_success=lambda: counters.__setitem__("success", counters["success"] + 1),
+        on_error=lambda msg, data: counters["errors"].append(msg),
+    )
+    return handler, counters
+
+
+def _message(text, uri):
+    msg = EmbeddingMsg(message=text, context_data={"uri": uri, "account_id": "acc"})
+    return {"data": json.dumps(msg.to_dict())}
+
+
+async def test_batch_uses_one_embed_call_and_one_upsert():
+    embedder = _FakeEmbedder()
+    vikingdb = _FakeVikingDB()
+    handler, counters = _make_handler(embedder, vikingdb)
+    batch = [_message(f"text {i}", f"viking://resources/{i}") for i in range(5)]
+    batch.append(_message("bad-dim", "viking://resources/bad"))
+    batch.append({"data": "not json"})
+
+    await handler.on_dequeue_batch(batch)
+
+    assert len(embedder.batch_calls) == 1
+    assert embedder.single_calls == []
+    assert len(vikingdb.upsert_calls) == 1
+    records = vikingdb.upsert_calls[0]
+    assert [r["uri"] for r in records] == [f"viking://resources/{i}" for i in range(5)]
+    assert all(len(r["vector"]) == DIM for r in records)
+    assert len({r["id"] for r in records}) == 5
+    assert counters["success"] == 5
+    assert len(counters["errors"]) == 2
+    assert "dimension mismatch" in counters["errors"][1]
+
+
+async def test_batch_failure_falls_back_to_single_embedding():
+    embedder = _FakeEmbedder(fail_batch=True)
+    vikingdb = _FakeVikingDB()
+    handler, counters = _make_handler(embedder, vikingdb)
+    batch = [_message(text, f"viking://resources/{text}") for text in ("a", "boom", "c")]
+
+    await handler.on_dequeue_batch(batch)
+
+    assert sorted(embedder.single_calls) == ["a", "boom", "c"]
+    assert [r["uri"] for r in vikingdb.upsert_calls[0]] == [
+        "viking://resources/a",
+        "viking://resources/c",
+    ]
+    assert counters["success"] == 2
+    assert counters["errors"] == ["provider rejected input"]
+
+
+async def test_bulk_write_failure_reports_every_message():
+    handler, counters = _make_handler(_FakeEmbedder(), _FakeVikingDB(error=RuntimeError("down")))
+    await handler.on_dequeue_batch([_message("x", "viking://a"), _message("y", "viking://b")])
+    assert counters["success"] == 0
+    assert counters["errors"] == ["down", "down"]
+
+    closing = _FakeVikingDB(error=CollectionNotFoundError("gone"), is_closing=True)
+    handler, counters = _make_handler(_FakeEmbedder(), closing)
+    await handler.on_dequeue_batch([_message("x", "viking://a"), _message("y", "viking://b")])
+    assert counters["success"] == 2
+    assert counters["errors"] == []
+
+
+class _FakeQueue:
+    name = QueueManager.EMBEDDING
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.batches = []
+        self.in_progress = 0
+
+    def has_dequeue_handler(self):
+        return True
+
+    async def size(self):
+        return len(self.items)
+
+    async def dequeue_raw(self):
+        return self.items.pop(0) if self.items else None
+
+    def _on_dequeue_start(self):
+        self.in_progress += 1
+
+    async def process_dequeued_batch(self, data_list):
+        self.batches.append(list(data_list))
+        self.in_progress -= len(data_list)
+
+
+async def test_worker_groups_queue_items_into_batches():
+    manager = QueueManager(agfs=None, embedding_batch_size=4, embedding_batch_wait_ms=10)
+    manager._poll_interval = 0.01
+    queue = _FakeQueue(range(10))
+    stop_event = threading.Event()
+
+    worker = asyncio.create_task(
+        manager._worker_async_batched(queue, stop_event, 2, batch_size=4, batch_wait=0.01)
+    )
+    for _ in range(100):
+        if sum(len(b) for b in queue.batches) == 10:
+            break
+        await asyncio.sleep(0.01)
+    stop_event.set()
+    await worker
+
+    assert [len(b) for b in queue.batches] == [4, 4, 2]
+    assert [item for b in queue.batches for item in b] == list(range(10))
+    assert queue.in_progress == 0
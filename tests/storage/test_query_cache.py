@@ -0,0 +1,107 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the find/search query result cache."""
+
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.query_cache import QueryResultCache
+from openviking_cli.session.user_id import UserIdentifier
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _ctx(account="acc", user="alice"):
+    return RequestContext(user=UserIdentifier(account, user, "agent"), role=Role.USER)
+
+
+def test_key_normalizes_query_and_separates_identities():
+    key = QueryResultCache.make_key
+    assert key("find", _ctx(), "hello  world ", "viking://resources/a/") == key(
+        "find", _ctx(), "hello world", "viking://resources/a"
+    )
+    assert key("find", _ctx(), "q", filter={"a": 1, "b": 2}) == key(
+        "find", _ctx(), "q", filter={"b": 2, "a": 1}
+    )
+    assert key("find", _ctx(), "q") != key("find", _ctx(user="bob"), "q")
+    assert key("find", _ctx(), "q") != key("find", _ctx(account="other"), "q")
+    assert key("find", _ctx(), "q", limit=5) != key("find", _ctx(), "q", limit=10)
+
+
+def test_ttl_and_lru_eviction():
+    clock = FakeClock()
+    cache = QueryResultCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.put("a", ["a"], "acc")
+    cache.put("b", ["b"], "acc")
+    assert cache.get("a") == ["a"]
+    cache.put("c", ["c"], "acc")  # evicts "b", the least recently used
+
+    assert cache.get("b") is None
+    assert cache.get("a") == ["a"]
+    clock.now = 11
+    assert cache.get("a") is None
+
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.expirations) == (2, 2, 1, 1)
+    assert stats.entries == 1
+
+
+def test_cached_results_are_copies():
+    cache = QueryResultCache()
+    result = {"uris": ["x"]}
+    cache.put("k", result, "acc")
+    result["uris"].append("y")
+    cache.get("k")["uris"].append("z")
+    assert cache.get("k") == {"uris": ["x"]}
+
+
+def test_invalidation_by_uri_prefix_and_account():
+    cache = QueryResultCache()
+    cache.put("global", 1, "acc")
+    cache.put("docs", 2, "acc", target_uri="viking://resources/docs")
+    cache.put("docs2", 3, "acc", target_uri="viking://resources/docs2")
+    cache.put("other", 4, "other", target_uri="viking://resources/docs")
+
+    removed = cache.invalidate(["viking://resources/docs/a.md"], "acc")
+
+    assert removed == 2
+    assert cache.get("global") is None
+    assert cache.get("docs") is None
+    assert cache.get("docs2") == 3
+    assert cache.get("other") == 4
+    # Removing a parent directory covers queries scoped below it.
+    assert cache.invalidate(["viking://resources"], "other") == 1
+
+
+def test_put_skipped_after_concurrent_invalidation():
+    cache = QueryResultCache()
+    generation = cache.generation
+    cache.invalidate(["viking://resources/a"], "acc")
+    cache.put("k", "stale", "acc", generation=generation)
+    assert cache.get("k") is None
+
+
+def test_invalidation_of_another_account_keeps_put():
+    cache = QueryResultCache()
+    generation = cache.generation
+    cache.invalidate(["viking://resources/a"], "other")
+    cache.put("k", "fresh", "acc", generation=generation)
+    assert cache.get("k") == "fresh"
+
+    generation = cache.generation
+    cache.invalidate(["viking://resources/a"])
+    cache.put("k2", "stale", "acc", generation=generation)
+    assert cache.get("k2") is None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = QueryResultCache(max_entries=0)
+    cache.put("k", 1, "acc")
+    assert not cache.enabled
+    assert cache.get("k") is None
+    assert cache.get_stats().misses == 0
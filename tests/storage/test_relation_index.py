@@ -0,0 +1,210 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the relation index of VikingFS and batched relation lookups."""
+
+import asyncio
+import json
+
+import pytest
+
+from openviking.retrieve.hierarchical_retriever import HierarchicalRetriever
+from openviking.server.identity import RequestContext, Role
+from openviking.storage import relation_index as relation_index_module
+from openviking.storage.relation_index import RelationIndex
+from openviking.storage.viking_fs import RelationEntry, VikingFS
+from openviking_cli.session.user_id import UserIdentifier
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TableLoader:
+    def __init__(self, tables, delay=0.01):
+        self.tables = tables
+        self.delay = delay
+        self.calls = []
+
+    async def __call__(self, path):
+        self.calls.append(path)
+        await asyncio.sleep(self.delay)
+        return list(self.tables.get(path, []))
+
+
+def _entry(*uris, link_id="link_1"):
+    return RelationEntry(id=link_id, uris=list(uris))
+
+
+@pytest.mark.asyncio
+async def test_batched_lookup_loads_misses_once():
+    index = RelationIndex()
+    loader = TableLoader({"/local/a": [_entry("viking://x", "viking://y")]})
+
+    tables = await index.get_many(["/local/a", "/local/b", "/local/a/"], loader)
+    again = await index.get_many(["/local/a", "/local/b"], loader)
+
+    assert sorted(loader.calls) == ["/local/a", "/local/b"]
+    assert [e.uris for e in tables["/local/a"]] == [["viking://x", "viking://y"]]
+    assert tables["/local/b"] == [] and again["/local/b"] == []
+    assert [e.uris for e in again["/local/a"]] == [["viking://x", "viking://y"]]
+    stats = index.get_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_write_through_invalidation_and_expiry():
+    clock = FakeClock()
+    index = RelationIndex(ttl_seconds=10, clock=clock)
+    loader = TableLoader({"/local/r/a": [_entry("viking://x")]})
+    await index.get_many(["/local/r/a"], loader)
+
+    index.set("/local/r/a", [_entry("viking://z")])
+    tables = await index.get_many(["/local/r/a"], loader)
+    assert [e.uris for e in tables["/local/r/a"]] == [["viking://z"]]
+
+    assert index.invalidate("/local/r/a/.abstract.md") == 0
+    assert index.invalidate("/local/r/a/.relations.json") == 1
+    await index.get_many(["/local/r/a"], loader)
+    assert index.invalidate("/local/r", recursive=True) == 1
+
+    await index.get_many(["/local/r/a"], loader)
+    clock.now = 11
+    await index.get_many(["/local/r/a"], loader)
+    assert len(loader.calls) == 4
+    assert index.get_stats().expirations == 1
+
+
+@pytest.mark.asyncio
+async def test_load_racing_with_write_keeps_the_written_table():
+    index = RelationIndex(max_entries=1)
+    loader = TableLoader({"/local/a": [_entry("viking://old")]}, delay=0.05)
+
+    load = asyncio.ensure_future(index.get_many(["/local/a"], loader))
+    await asyncio.sleep(0.01)
+    index.set("/local/a", [_entry("viking://new")])
+    assert [e.uris for e in (await load)["/local/a"]] == [["viking://old"]]
+    tables = await index.get_many(["/local/a"], loader)
+    assert [e.uris for e in tables["/local/a"]] == [["viking://new"]]
+    assert len(loader.calls) == 1
+
+    await index.get_many(["/local/b"], loader)
+    assert index.get_stats().evictions == 1
+
+
+class FakeAGFS:
+    """Synchronous AGFS client holding files in memory and counting reads."""
+
+    def __init__(self, files=None):
+        self.files = dict(files or {})
+        self.reads = []
+
+    def read(self, path, offset=0, size=-1):
+        self.reads.append(path)
+        if isinstance(self.files.get(path), Exception):
+            raise self.files[path]
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        return self.files[path]
+
+    def write(self, path, data):
+        self.files[path] = data
+        return path
+
+    def stat(self, path):
+        return {"name": path.rsplit("/", 1)[-1], "isDir": True}
+
+    def rm(self, path, recursive=False):
+        for key in [k for k in self.files if k == path or k.startswith(path + "/")]:
+            del self.files[key]
+
+
+@pytest.fixture
+def relation_index():
+    index = relation_index_module.init_relation_index()
+    yield index
+    relation_index_module._instance = None
+
+
+@pytest.mark.asyncio
+async def test_viking_fs_relations_use_index_and_stay_consistent(relation_index):
+    table = [{"id": "link_1", "uris": ["viking://resources/b"], "reason": "", "created_at": ""}]
+    agfs = FakeAGFS({"/local/default/resources/a/.relations.json": json.dumps(table).encode()})
+    fs = VikingFS(agfs=agfs)
+    a, c = "viking://resources/a", "viking://resources/c"
+
+    related = await fs.get_relations_many([a, c, a])
+    assert related == {a: ["viking://resources/b"], c: []}
+    assert len(agfs.reads) == 2
+
+    await fs.link(c, [a], reason="see also")
+    reads = len(agfs.reads)
+    assert await fs.get_relations(c) == [a]
+    assert (await fs.get_relations_many([a, c]))[c] == [a]
+    assert len(agfs.reads) == reads
+
+    await fs.unlink(c, a)
+    assert await fs.get_relations(c) == []
+
+    await fs.rm(a, recursive=True)
+    assert await fs.get_relations(a) == []
+
+
+@pytest.mark.asyncio
+async def test_unreadable_table_is_not_indexed_or_overwritten(relation_index):
+    table_path = "/local/default/resources/a/.relations.json"
+    agfs = FakeAGFS({table_path: RuntimeError("connection reset")})
+    fs = VikingFS(agfs=agfs)
+    a = "viking://resources/a"
+
+    assert await fs.get_relations(a) == []
+    assert (await fs.get_relations_many([a]))[a] == []
+    assert len(agfs.reads) == 2
+    assert relation_index.get_stats().entries == 0
+
+    # A write must not replace a table it could not read.
+    with pytest.raises(RuntimeError):
+        await fs.link(a, ["viking://resources/b"])
+    assert isinstance(agfs.files[table_path], RuntimeError)
+
+    agfs.files[table_path] = json.dumps([]).encode()
+    assert await fs.get_relations(a) == []
+    assert relation_index.get_stats().entries == 1
+
+
+class FakeRelationFS:
+    def __init__(self):
+        self.calls = []
+
+    async def get_relations_many(self, uris, ctx=None):
+        self.calls.append(("relations", list(uris)))
+        return {uri: [f"{uri}/rel{i}" for i in range(7)] for uri in uris}
+
+    async def read_batch(self, uris, level="l0", ctx=None):
+        self.calls.append(("read_batch", list(uris)))
+        return {uri: f"abstract of {uri}" for uri in uris if not uri.endswith("rel0")}
+
+
+@pytest.mark.asyncio
+async def test_retriever_enriches_a_page_with_one_lookup_and_one_read(monkeypatch):
+    fake_fs = FakeRelationFS()
+    monkeypatch.setattr("openviking.retrieve.hierarchical_retriever.get_viking_fs", lambda: fake_fs)
+    retriever = HierarchicalRetriever(storage=None, embedder=None)
+    ctx = RequestContext(user=UserIdentifier.the_default_user(), role=Role.ROOT)
+    candidates = [
+        {"uri": f"viking://resources/d{i}", "context_type": "resource", "_score": 1.0 - i / 100}
+        for i in range(20)
+    ]
+
+    results = await retriever._convert_to_matched_contexts(candidates, ctx)
+
+    assert [kind for kind, _ in fake_fs.calls] == ["relations", "read_batch"]
+    assert len(fake_fs.calls[1][1]) == 20 * HierarchicalRetriever.MAX_RELATIONS
+    first = next(r for r in results if r.uri == "viking://resources/d0")
+    assert [r.uri for r in first.relations] == [
+        f"viking://resources/d0/rel{i}" for i in range(1, HierarchicalRetriever.MAX_RELATIONS)
+    ]
@@ -0,0 +1,99 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.collection_schemas import CollectionSchemas
+from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
+from openviking_cli.session.user_id import UserIdentifier
+from openviking_cli.utils.config.vectordb_config import VectorDBBackendConfig
+
+DIM = 4
+ROOT = "viking://resources"
+
+
+def _record(record_id, uri, parent_uri, level=2, account_id="acc"):
+    return {
+        "id": record_id,
+        "uri": uri,
+        "parent_uri": parent_uri,
+        "level": level,
+        "context_type": "resource",
+        "account_id": account_id,
+        "owner_space": "",
+        "abstract": record_id,
+        "vector": [float(len(record_id)), 1.0, 0.5, 0.25],
+    }
+
+
+@pytest.fixture
+async def backend():
+    storage = VikingVectorIndexBackend(
+        VectorDBBackendConfig(backend="local", path=None, dimension=DIM, name="context")
+    )
+    await storage.create_collection("context", CollectionSchemas.context_collection("context", DIM))
+    await storage.upsert_many(
+        [
+            _record("dir", f"{ROOT}/a/.abstract.md", f"{ROOT}/a", level=0),
+            _record("file", f"{ROOT}/a/f.md", f"{ROOT}/a"),
+            _record("subdir", f"{ROOT}/a/sub/.overview.md", f"{ROOT}/a/sub", level=1),
+            _record("subfile", f"{ROOT}/a/sub/g.md", f"{ROOT}/a/sub"),
+            _record("sibling", f"{ROOT}/ab/f.md", f"{ROOT}/ab"),
+            _record("other", f"{ROOT}/a/f.md", f"{ROOT}/a", account_id="other"),
+        ]
+    )
+    yield storage
+    await storage.close()
+
+
+async def test_rename_rewrites_subtree_in_one_pass(backend):
+    ctx = RequestContext(user=UserIdentifier("acc", "user", "agent"), role=Role.ROOT)
+    before = {r["id"]: r for r in await backend.get(["dir", "file", "subdir", "subfile"])}
+
+    renamed = await backend.rename_uri_prefix(ctx, f"{ROOT}/a", f"{ROOT}/moved/b")
+
+    assert renamed == 4
+    after = {r["id"]: r for r in await backend.get(list(before) + ["sibling", "other"])}
+    assert after["dir"]["uri"] == f"{ROOT}/moved/b/.abstract.md"
+    assert after["dir"]["parent_uri"] == f"{ROOT}/moved/b"
+    assert after["subfile"]["uri"] == f"{ROOT}/moved/b/sub/g.md"
+    assert after["subfile"]["parent_uri"] == f"{ROOT}/moved/b/sub"
+    for record_id, record in before.items():
+        assert after[record_id]["vector"] == pytest.approx(record["vector"])
+        assert after[record_id]["abstract"] == record["abstract"]
+    # Prefix match is segment-wise, and other accounts are untouched.
+    assert after["sibling"]["uri"] == f"{ROOT}/ab/f.md"
+    assert after["other"]["uri"] == f"{ROOT}/a/f.md"
+
+
+async def test_rename_single_file_keeps_outside_parent(backend):
+    ctx = RequestContext(user=UserIdentifier("acc", "user", "agent"), role=Role.ROOT)
+
+    renamed = await backend.rename_uri_prefix(ctx, f"{ROOT}/a/f.md", f"{ROOT}/a/renamed.md")
+
+    assert renamed == 1
+    (record,) = await backend.get(["file"])
+    assert record["uri"] == f"{ROOT}/a/renamed.md"
+    assert record["parent_uri"] == f"{ROOT}/a"
+
+
+async def test_rename_pages_through_large_subtree(backend):
+    adapter = backend._adapter
+
+    assert adapter.rename_uri_prefix(f"{ROOT}/a", f"{ROOT}/moved", batch_size=2) == 5
+
+    records = await backend.get(["dir", "file", "subdir", "subfile", "other", "sibling"])
+    uris = sorted(r["uri"] for r in records)
+    assert uris == sorted(
+        [
+            f"{ROOT}/moved/.abstract.md",
+            f"{ROOT}/moved/f.md",
+            f"{ROOT}/moved/sub/.overview.md",
+            f"{ROOT}/moved/sub/g.md",
+            f"{ROOT}/moved/f.md",
+            f"{ROOT}/ab/f.md",
+        ]
+    )
+    with pytest.raises(ValueError):
+        adapter.rename_uri_prefix(f"{ROOT}/moved", f"{ROOT}/moved/inner")
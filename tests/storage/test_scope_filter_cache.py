@@ -0,0 +1,116 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import pytest
+
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.collection_schemas import CollectionSchemas
+from openviking.storage.expr import Eq
+from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
+from openviking_cli.session.user_id import UserIdentifier
+from openviking_cli.utils.config.vectordb_config import VectorDBBackendConfig
+
+DIM = 8
+DIRS = ["a", "a/b", "c"]
+
+
+@pytest.fixture
+async def backend():
+    rng = random.Random(3)
+    storage = VikingVectorIndexBackend(
+        VectorDBBackendConfig(backend="local", path=None, dimension=DIM, name="context")
+    )
+    await storage.create_collection("context", CollectionSchemas.context_collection("context", DIM))
+    records = []
+    for d in DIRS:
+        for i in range(3):
+            records.append(
+                {
+                    "id": f"{d}-{i}",
+                    "uri": f"viking://resources/{d}/f{i}.md",
+                    "parent_uri": f"viking://resources/{d}",
+                    "level": 2,
+                    "context_type": "resource",
+                    "account_id": "acc",
+                    "owner_space": "",
+                    "abstract": f"{d} {i}",
+                    "vector": [rng.random() for _ in range(DIM)],
+                }
+            )
+    await storage.upsert_many(records)
+    yield storage
+    await storage.close()
+
+
+@pytest.fixture
+def compose_calls(backend, monkeypatch):
+    calls = []
+    compose = backend._compose_scope_filter
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return compose(*args, **kwargs)
+
+    monkeypatch.setattr(backend, "_compose_scope_filter", counting)
+    return calls
+
+
+def _ctx(user="user", role=Role.ROOT):
+    return RequestContext(user=UserIdentifier("acc", user, "agent"), role=role)
+
+
+def _uris(records):
+    return sorted(r["uri"] for r in records)
+
+
+async def test_repeated_scope_is_compiled_once(backend, compose_calls):
+    query = [0.5] * DIM
+    dirs = ["viking://resources/a"]
+
+    first = await backend.search_in_tenant(
+        _ctx(), query, context_type="resource", target_directories=dirs, limit=20
+    )
+    for parent in DIRS:
+        children = await backend.search_children_in_tenant(
+            _ctx(), f"viking://resources/{parent}", query, context_type="resource", limit=20
+        )
+        assert children
+    again = await backend.search_in_tenant(
+        _ctx(), query, context_type="resource", target_directories=list(dirs), limit=20
+    )
+
+    assert _uris(first) == sorted(
+        f"viking://resources/{d}/f{i}.md" for d in ("a", "a/b") for i in range(3)
+    )
+    assert _uris(again) == _uris(first)
+    # One scope for the target directories and one for the children searches
+    assert len(compose_calls) == 2
+
+
+def test_scope_key_separates_inputs(backend):
+    build = backend._build_scope_filter
+    base = build(_ctx(), "resource", ["viking://resources/a"], None)
+
+    assert build(_ctx(), "resource", ["viking://resources/a"], None).payload is base.payload
+    assert build(_ctx(), "resource", ["viking://resources/a"], {"op": "must"}) is not None
+    assert len(backend._scope_filters) == 2
+    for variant in (
+        build(_ctx(user="other"), "resource", ["viking://resources/a"], None),
+        build(_ctx(role=Role.USER), "resource", ["viking://resources/a"], None),
+        build(_ctx(), "memory", ["viking://resources/a"], None),
+        build(_ctx(), "resource", ["viking://resources/c"], None),
+        build(_ctx(), "resource", ["viking://resources/a"], Eq("level", 2)),
+    ):
+        assert variant.payload is not base.payload
+    assert len(backend._scope_filters) == 7
+    assert build(_ctx(), None, None, None) is None
+
+
+def test_unhashable_extra_filter_is_not_cached(backend):
+    extra = {"op": "must", "field": "level", "conds": {2}}
+    scope = backend._build_scope_filter(_ctx(), "resource", None, extra)
+
+    assert scope is not None
+    assert len(backend._scope_filters) == 0
@@ -0,0 +1,69 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import pytest
+
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.collection_schemas import CollectionSchemas
+from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
+from openviking_cli.session.user_id import UserIdentifier
+from openviking_cli.utils.config.vectordb_config import VectorDBBackendConfig
+
+DIM = 8
+DIRS = ["a", "a/b", "c", "cc", "d"]
+FILES_PER_DIR = 4
+
+
+@pytest.fixture
+async def backend():
+    rng = random.Random(7)
+    storage = VikingVectorIndexBackend(
+        VectorDBBackendConfig(backend="local", path=None, dimension=DIM, name="context")
+    )
+    await storage.create_collection("context", CollectionSchemas.context_collection("context", DIM))
+    records = []
+    for d in DIRS:
+        for i in range(FILES_PER_DIR):
+            records.append(
+                {
+                    "id": f"{d}-{i}",
+                    "uri": f"viking://resources/{d}/f{i}.md",
+                    "parent_uri": f"viking://resources/{d}",
+                    "level": 2,
+                    "context_type": "resource",
+                    "account_id": "acc",
+                    "owner_space": "",
+                    "abstract": f"{d} {i}",
+                    "vector": [rng.random() for _ in range(DIM)],
+                }
+            )
+    await storage.upsert_many(records)
+    yield storage
+    await storage.close()
+
+
+def _uris(records):
+    return [r["uri"] for r in records]
+
+
+@pytest.mark.parametrize("limit", [2, 20])
+async def test_batched_children_match_per_parent_search(backend, limit):
+    ctx = RequestContext(user=UserIdentifier("acc", "user", "agent"), role=Role.ROOT)
+    query = [random.Random(1).random() for _ in range(DIM)]
+    parents = [f"viking://resources/{d}" for d in ("a", "c", "d")]
+
+    batched = await backend.search_children_many_in_tenant(
+        ctx, parents, query, context_type="resource", limit=limit
+    )
+
+    for parent in parents:
+        expected = await backend.search_children_in_tenant(
+            ctx, parent, query, context_type="resource", limit=limit
+        )
+        assert _uris(batched[parent]) == _uris(expected)
+    # "c" must not pick up records of its sibling "cc"; "a" includes "a/b".
+    assert all("/cc/" not in uri for uri in _uris(batched["viking://resources/c"]))
+    if limit == 20:
+        assert len(batched["viking://resources/a"]) == 2 * FILES_PER_DIR
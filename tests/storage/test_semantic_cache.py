@@ -0,0 +1,166 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.queuefs.semantic_cache import MANIFEST_NAME
+from openviking.storage.queuefs.semantic_dag import SemanticDagExecutor
+from openviking.storage.queuefs.semantic_processor import SemanticProcessor
+from openviking_cli.session.user_id import UserIdentifier
+
+ROOT = "viking://resources/root"
+
+
+class _FakeVikingFS:
+    """Flat {uri: content} store; directories are implied by file URIs."""
+
+    def __init__(self, files):
+        self.files = dict(files)
+
+    async def ls(self, uri, ctx=None):
+        names = {}
+        for path in self.files:
+            if path.startswith(uri + "/"):
+                rest = path[len(uri) + 1 :]
+                names[rest.split("/")[0]] = "/" in rest
+        return [{"name": name, "isDir": is_dir} for name, is_dir in names.items()]
+
+    async def read_file(self, uri, ctx=None):
+        if uri not in self.files:
+            raise FileNotFoundError(uri)
+        return self.files[uri]
+
+    async def read_file_bytes(self, uri, ctx=None):
+        return (await self.read_file(uri)).encode("utf-8")
+
+    async def write_file(self, uri, content, ctx=None):
+        self.files[uri] = content
+
+    async def abstract(self, uri, ctx=None):
+        return self.files.get(f"{uri}/.abstract.md", "")
+
+
+class _CountingProcessor(SemanticProcessor):
+    def __init__(self, fs):
+        super().__init__(max_concurrent_llm=4)
+        self._fs = fs
+        self.summarized = []
+        self.overviews = []
+        self.vectorized = []
+
+    async def _generate_single_file_summary(self, file_path, llm_sem=None, ctx=None):
+        self.summarized.append(file_path)
+        return {"name": file_path.split("/")[-1], "summary": f"about {self._fs.files[file_path]}"}
+
+    async def _generate_overview(self, dir_uri, file_summaries, children_abstracts):
+        self.overviews.append(dir_uri)
+        parts = [s["summary"] for s in file_summaries] + [c["abstract"] for c in children_abstracts]
+        return f"# {dir_uri.split('/')[-1]}\n\n{' + '.join(parts)}"
+
+    async def _vectorize_directory_simple(self, uri, context_type, abstract, overview, ctx=None):
+        self.vectorized.append(uri)
+
+    async def _vectorize_single_file(
+        self, parent_uri, context_type, file_path, summary_dict, ctx=None
+    ):
+        self.vectorized.append(file_path)
+
+    def reset(self):
+        self.summarized, self.overviews, self.vectorized = [], [], []
+
+
+@pytest.fixture
+def fs(monkeypatch):
+    fake_fs = _FakeVikingFS(
+        {
+            f"{ROOT}/a.txt": "a",
+            f"{ROOT}/b.txt": "b",
+            f"{ROOT}/child/c.txt": "c",
+            f"{ROOT}/other/d.txt": "d",
+        }
+    )
+    for module in ("semantic_dag", "semantic_processor"):
+        prefix = f"openviking.storage.queuefs.{module}"
+        monkeypatch.setattr(f"{prefix}.get_viking_fs", lambda: fake_fs)
+        monkeypatch.setattr(f"{prefix}.summary_fingerprint", lambda: "summary-v1")
+        monkeypatch.setattr(f"{prefix}.overview_fingerprint", lambda: "overview-v1")
+    return fake_fs
+
+
+def _ctx():
+    return RequestContext(user=UserIdentifier("acc1", "user1", "agent1"), role=Role.ROOT)
+
+
+async def _run_dag(processor):
+    executor = SemanticDagExecutor(
+        processor=processor, context_type="resource", max_concurrent_llm=4, ctx=_ctx()
+    )
+    await executor.run(ROOT)
+    return executor.get_stats()
+
+
+async def test_dag_regenerates_only_dirty_nodes(fs):
+    processor = _CountingProcessor(fs)
+    await _run_dag(processor)
+    assert len(processor.summarized) == 4
+    assert len(processor.overviews) == 3
+    manifest = json.loads(fs.files[f"{ROOT}/child/{MANIFEST_NAME}"])
+    assert manifest["files"]["c.txt"]["summary"] == "about c"
+
+    processor.reset()
+    stats = await _run_dag(processor)
+    assert processor.summarized == []
+    assert processor.overviews == []
+    assert processor.vectorized == []
+    assert stats.reused_nodes == stats.total_nodes == 7
+
+    processor.reset()
+    fs.files[f"{ROOT}/child/c.txt"] = "c2"
+    await _run_dag(processor)
+    assert processor.summarized == [f"{ROOT}/child/c.txt"]
+    assert processor.overviews == [f"{ROOT}/child", ROOT]
+    assert sorted(processor.vectorized) == sorted([f"{ROOT}/child/c.txt", f"{ROOT}/child", ROOT])
+    assert "about c2" in fs.files[f"{ROOT}/.overview.md"]
+
+
+async def test_prompt_change_invalidates_summaries(fs, monkeypatch):
+    processor = _CountingProcessor(fs)
+    await _run_dag(processor)
+
+    processor.reset()
+    monkeypatch.setattr(
+        "openviking.storage.queuefs.semantic_dag.summary_fingerprint", lambda: "summary-v2"
+    )
+    await _run_dag(processor)
+    assert len(processor.summarized) == 4
+    # Same summaries come back, so the overviews stay valid.
+    assert processor.overviews == []
+
+
+async def test_single_directory_reuses_unchanged_files(fs):
+    processor = _CountingProcessor(fs)
+    await _run_dag(processor)
+
+    processor.reset()
+    fs.files[f"{ROOT}/b.txt"] = "b2"
+    await processor._process_single_directory(
+        uri=ROOT,
+        context_type="resource",
+        children_uris=[f"{ROOT}/child", f"{ROOT}/other"],
+        file_paths=[f"{ROOT}/a.txt", f"{ROOT}/b.txt"],
+    )
+    assert processor.summarized == [f"{ROOT}/b.txt"]
+    assert processor.overviews == [ROOT]
+
+    processor.reset()
+    await processor._process_single_directory(
+        uri=ROOT,
+        context_type="resource",
+        children_uris=[f"{ROOT}/child", f"{ROOT}/other"],
+        file_paths=[f"{ROOT}/a.txt", f"{ROOT}/b.txt"],
+    )
+    assert processor.summarized == []
+    assert processor.overviews == []
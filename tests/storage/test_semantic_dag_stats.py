@@ -34,6 +34,10 @@ class _FakeProcessor:
     def _extract_abstract_from_overview(self, overview):
         return "abstract"
 
+    @staticmethod
+    def _default_overview(dir_uri):
+        return "default overview"
+
     async def _vectorize_directory_simple(self, uri, context_type, abstract, overview, ctx=None):
         self.vectorized_dirs.append(uri)
 
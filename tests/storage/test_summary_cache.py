@@ -0,0 +1,182 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the directory summary cache of VikingFS.abstract/overview."""
+
+import asyncio
+
+import pytest
+
+from openviking.storage import summary_cache as summary_cache_module
+from openviking.storage.summary_cache import ABSTRACT, OVERVIEW, SummaryCache
+from openviking.storage.viking_fs import VikingFS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoader:
+    def __init__(self, value="summary", delay=0.01):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    cache = SummaryCache()
+    loader = CountingLoader()
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("/local/a/d", ABSTRACT, loader) for _ in range(8))
+    )
+
+    assert results == ["summary"] * 8
+    assert loader.calls == 1
+    assert await cache.get_or_load("/local/a/d", ABSTRACT, loader) == "summary"
+    assert loader.calls == 1
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.coalesced, stats.entries) == (1, 8, 7, 1)
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_and_kinds_are_separate():
+    clock = FakeClock()
+    cache = SummaryCache(ttl_seconds=5, clock=clock)
+    abstract, overview = CountingLoader("L0"), CountingLoader("L1")
+
+    assert await cache.get_or_load("/local/a/d", ABSTRACT, abstract) == "L0"
+    assert await cache.get_or_load("/local/a/d", OVERVIEW, overview) == "L1"
+    clock.now = 6
+    assert await cache.get_or_load("/local/a/d", ABSTRACT, abstract) == "L0"
+
+    assert (abstract.calls, overview.calls) == (2, 1)
+    assert cache.get_stats().expirations == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller_and_are_not_cached():
+    cache = SummaryCache()
+    loader = CountingLoader(FileNotFoundError("no .abstract.md"))
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("/local/a/d", ABSTRACT, loader) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, FileNotFoundError) for r in results)
+    assert loader.calls == 1
+    loader.value = "ready"
+    assert await cache.get_or_load("/local/a/d", ABSTRACT, loader) == "ready"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_fail_the_others():
+    cache = SummaryCache()
+    loader = CountingLoader(delay=0.05)
+    leader = asyncio.ensure_future(cache.get_or_load("/local/a/d", ABSTRACT, loader))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(cache.get_or_load("/local/a/d", ABSTRACT, loader))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "summary"
+    assert leader.cancelled()
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_by_summary_file_and_tree():
+    cache = SummaryCache()
+    for path in ("/local/a/d", "/local/a/d/sub", "/local/a/other"):
+        await cache.get_or_load(path, ABSTRACT, CountingLoader())
+        await cache.get_or_load(path, OVERVIEW, CountingLoader())
+
+    assert cache.invalidate("/local/a/d/content.md") == 0
+    assert cache.invalidate("/local/a/d/.overview.md") == 1
+    assert cache.invalidate("/local/a/d", recursive=True) == 3
+    assert cache.get_stats().entries == 2
+
+
+@pytest.mark.asyncio
+async def test_load_in_flight_during_invalidation_is_not_cached():
+    cache = SummaryCache()
+    stale = CountingLoader("stale", delay=0.05)
+    load = asyncio.ensure_future(cache.get_or_load("/local/a/d", ABSTRACT, stale))
+    await asyncio.sleep(0.01)
+    cache.invalidate("/local/a/d/.abstract.md")
+    # A caller arriving after the write starts a fresh load.
+    fresh = CountingLoader("fresh")
+    assert await cache.get_or_load("/local/a/d", ABSTRACT, fresh) == "fresh"
+
+    assert await load == "stale"
+    assert await cache.get_or_load("/local/a/d", ABSTRACT, CountingLoader("unused")) == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_loads():
+    cache = SummaryCache(max_entries=0)
+    loader = CountingLoader()
+    await cache.get_or_load("/local/a/d", ABSTRACT, loader)
+    await cache.get_or_load("/local/a/d", ABSTRACT, loader)
+    assert loader.calls == 2
+
+
+class FakeAGFS:
+    """Synchronous AGFS client holding files in memory and counting calls."""
+
+    def __init__(self, files):
+        self.files = dict(files)
+        self.calls = {"stat": 0, "read": 0}
+
+    def stat(self, path):
+        self.calls["stat"] += 1
+        return {"name": path.rsplit("/", 1)[-1], "isDir": True}
+
+    def read(self, path, offset=0, size=-1):
+        self.calls["read"] += 1
+        return self.files[path]
+
+    def write(self, path, data):
+        self.files[path] = data
+        return path
+
+    def mkdir(self, path):
+        return None
+
+
+@pytest.fixture
+def summary_cache():
+    cache = summary_cache_module.init_summary_cache()
+    yield cache
+    summary_cache_module._instance = None
+
+
+@pytest.mark.asyncio
+async def test_viking_fs_reads_coalesce_and_writes_invalidate(summary_cache):
+    agfs = FakeAGFS({"/local/default/resources/doc/.abstract.md": b"old abstract"})
+    fs = VikingFS(agfs=agfs)
+    uri = "viking://resources/doc"
+
+    results = await asyncio.gather(*(fs.abstract(uri) for _ in range(5)))
+    batch = await fs.read_batch([uri, uri, "viking://resources/missing"])
+
+    assert results == ["old abstract"] * 5
+    assert batch == {uri: "old abstract"}
+    assert agfs.calls["read"] == 2  # doc once, the missing directory once
+
+    await fs.write_file(f"{uri}/.abstract.md", "new abstract")
+    assert await fs.abstract(uri) == "new abstract"
+    assert agfs.calls["read"] == 3
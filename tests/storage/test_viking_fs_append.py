@@ -0,0 +1,152 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for VikingFS.append_file through AGFS append handles."""
+
+import pytest
+from pyagfs import FileHandle
+
+from openviking.storage.viking_fs import VikingFS
+
+LOG_URI = "viking://session/s1/messages.jsonl"
+LOG_PATH = "/local/default/session/s1/messages.jsonl"
+
+
+class FakeHandle:
+    def __init__(self, agfs, path):
+        self._agfs = agfs
+        self._path = path
+
+    def write(self, data):
+        self._agfs.files[self._path] = self._agfs.files.get(self._path, b"") + data
+        return len(data)
+
+    def close(self):
+        self._agfs.open_handles -= 1
+
+
+class FakeAGFS:
+    """Synchronous AGFS client over a dict that counts the bytes it moves."""
+
+    def __init__(self, dirs=("/local/default/session/s1",)):
+        self.files = {}
+        self.dirs = set(dirs)
+        self.bytes_read = 0
+        self.open_handles = 0
+        self.handle_flags = []
+
+    def read(self, path, offset=0, size=-1):
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        self.bytes_read += len(self.files[path])
+        return self.files[path]
+
+    def write(self, path, data):
+        self.files[path] = data
+        return "OK"
+
+    def mkdir(self, path):
+        self.dirs.add(path)
+
+    def open_handle(self, path, flags=0, mode=0o644, lease=60):
+        if path.rsplit("/", 1)[0] not in self.dirs:
+            raise RuntimeError(f"parent directory does not exist: {path}")
+        self.open_handles += 1
+        self.handle_flags.append(flags)
+        return FakeHandle(self, path)
+
+
+class FlakyHandle(FakeHandle):
+    """Writes the data, then fails like a timed out or dropped connection."""
+
+    def __init__(self, agfs, path, fail_on):
+        super().__init__(agfs, path)
+        self._fail_on = fail_on
+
+    def write(self, data):
+        written = super().write(data)
+        if self._fail_on == "write":
+            raise RuntimeError("read timed out")
+        return written
+
+    def close(self):
+        super().close()
+        if self._fail_on == "close":
+            raise RuntimeError("handle close failed")
+
+
+class FlakyAGFS(FakeAGFS):
+    def __init__(self, fail_on):
+        super().__init__()
+        self.fail_on = fail_on
+
+    def open_handle(self, path, flags=0, mode=0o644, lease=60):
+        if self.fail_on == "open":
+            raise RuntimeError("connection reset")
+        super().open_handle(path, flags, mode, lease)
+        return FlakyHandle(self, path, self.fail_on)
+
+
+class NoHandleAGFS(FakeAGFS):
+    def open_handle(self, path, flags=0, mode=0o644, lease=60):
+        raise RuntimeError("openhandle not supported: " + path)
+
+
+@pytest.mark.asyncio
+async def test_append_writes_through_handle_without_reading():
+    agfs = FakeAGFS()
+    fs = VikingFS(agfs=agfs)
+
+    for i in range(50):
+        await fs.append_file(LOG_URI, f'{{"turn": {i}}}\n')
+
+    assert agfs.files[LOG_PATH].decode().splitlines()[-1] == '{"turn": 49}'
+    assert agfs.bytes_read == 0
+    assert agfs.open_handles == 0
+    assert set(agfs.handle_flags) == {
+        FileHandle.O_WRONLY | FileHandle.O_APPEND | FileHandle.O_CREATE
+    }
+
+
+@pytest.mark.asyncio
+async def test_append_creates_missing_parent_directories():
+    agfs = FakeAGFS(dirs=())
+    fs = VikingFS(agfs=agfs)
+
+    await fs.append_file(LOG_URI, "line\n")
+
+    assert agfs.files[LOG_PATH] == b"line\n"
+    assert "/local/default/session/s1" in agfs.dirs
+
+
+@pytest.mark.asyncio
+async def test_backend_without_handles_falls_back_to_rewrite():
+    agfs = NoHandleAGFS()
+    fs = VikingFS(agfs=agfs)
+
+    await fs.append_file(LOG_URI, "a\n")
+    await fs.append_file(LOG_URI, "b\n")
+
+    assert agfs.files[LOG_PATH] == b"a\nb\n"
+    assert fs._no_append_handles == {"local"}
+
+
+@pytest.mark.asyncio
+async def test_append_is_never_repeated_after_the_handle_opened():
+    agfs = FlakyAGFS("write")
+    fs = VikingFS(agfs=agfs)
+    with pytest.raises(IOError):
+        await fs.append_file(LOG_URI, "once\n")
+    assert agfs.files[LOG_PATH] == b"once\n"
+
+    agfs = FlakyAGFS("close")
+    fs = VikingFS(agfs=agfs)
+    await fs.append_file(LOG_URI, "once\n")
+    assert agfs.files[LOG_PATH] == b"once\n"
+
+    # An open error other than a missing path neither retries nor rewrites.
+    agfs = FlakyAGFS("open")
+    fs = VikingFS(agfs=agfs)
+    with pytest.raises(IOError):
+        await fs.append_file(LOG_URI, "once\n")
+    assert LOG_PATH not in agfs.files
@@ -0,0 +1,121 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the content-addressed embedding cache"""
+
+from openviking.models.embedder import (
+    CachedEmbedder,
+    DenseEmbedderBase,
+    EmbeddingCache,
+    EmbedResult,
+)
+
+
+class _CountingEmbedder(DenseEmbedderBase):
+    def __init__(self, model_name="test-model", dimension=8):
+        super().__init__(model_name)
+        self.dimension = dimension
+        self.embedded = []
+        self.batch_calls = 0
+
+    def embed(self, text):
+        self.embedded.append(text)
+        return EmbedResult(dense_vector=[len(text) + i / 10 for i in range(self.dimension)])
+
+    def embed_batch(self, texts):
+        self.batch_calls += 1
+        return [self.embed(text) for text in texts]
+
+    def get_dimension(self):
+        return self.dimension
+
+
+class TestEmbeddingCache:
+    def test_repeated_text_is_embedded_once(self):
+        inner = _CountingEmbedder()
+        embedder = CachedEmbedder(inner, EmbeddingCache())
+
+        first = embedder.embed("hello")
+        second = embedder.embed("hello")
+
+        assert first.dense_vector == second.dense_vector
+        assert inner.embedded == ["hello"]
+        stats = embedder.cache.get_stats()
+        assert (stats.memory_hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_batch_embeds_only_distinct_misses(self):
+        inner = _CountingEmbedder()
+        embedder = CachedEmbedder(inner, EmbeddingCache())
+        embedder.embed("a")
+
+        results = embedder.embed_batch(["a", "bb", "bb", "ccc"])
+
+        assert inner.batch_calls == 1
+        assert inner.embedded == ["a", "bb", "ccc"]
+        assert [r.dense_vector[0] for r in results] == [1, 2, 2, 3]
+
+    def test_key_includes_model_and_dimension(self):
+        cache = EmbeddingCache()
+        small = _CountingEmbedder(dimension=4)
+        large = _CountingEmbedder(dimension=8)
+        other = _CountingEmbedder(model_name="other-model", dimension=4)
+        for inner in (small, large, other):
+            CachedEmbedder(inner, cache).embed("same text")
+        assert [len(e.embedded) for e in (small, large, other)] == [1, 1, 1]
+
+    def test_key_includes_provider_options_and_endpoint(self):
+        cache = EmbeddingCache()
+        variants = []
+        for attr, value in (
+            ("task", "retrieval.query"),
+            ("task", "retrieval.passage"),
+            ("input_type", "text"),
+            ("api_base", "https://other.example.com/v1"),
+        ):
+            inner = _CountingEmbedder()
+            setattr(inner, attr, value)
+            variants.append(inner)
+        twin = _CountingEmbedder()
+        twin.task = "retrieval.query"
+        for inner in variants + [twin]:
+            CachedEmbedder(inner, cache).embed("same text")
+
+        assert [len(e.embedded) for e in variants] == [1, 1, 1, 1]
+        assert twin.embedded == []
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        path = str(tmp_path / "embedding_cache.db")
+        cache = EmbeddingCache(path=path)
+        sparse = EmbedResult(dense_vector=[0.1, 0.2], sparse_vector={"term": 0.5})
+        cache.put("k", sparse)
+        cache.close()
+
+        reopened = EmbeddingCache(path=path)
+        result = reopened.get("k")
+        assert result.dense_vector == [0.1, 0.2]
+        assert result.sparse_vector == {"term": 0.5}
+        stats = reopened.get_stats()
+        assert (stats.disk_hits, stats.disk_entries) == (1, 1)
+
+        # Promoted to memory on the first disk hit.
+        reopened.get("k")
+        assert reopened.get_stats().memory_hits == 1
+
+    def test_eviction_by_size(self, tmp_path):
+        entry_bytes = 8 * 8
+        cache = EmbeddingCache(
+            path=str(tmp_path / "embedding_cache.db"),
+            memory_max_bytes=entry_bytes * 2,
+            disk_max_bytes=entry_bytes * 4,
+        )
+        for i in range(10):
+            cache.put(f"k{i}", EmbedResult(dense_vector=[float(i)] * 8))
+
+        stats = cache.get_stats()
+        assert stats.memory_entries == 2
+        assert stats.memory_bytes <= entry_bytes * 2
+        assert stats.disk_bytes <= entry_bytes * 4
+        assert stats.evictions > 0
+        # The most recent entries are kept, the oldest ones are gone.
+        assert cache.get("k9").dense_vector == [9.0] * 8
+        assert cache.get("k0") is None
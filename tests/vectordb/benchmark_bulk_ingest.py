@@ -0,0 +1,89 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""Bulk add through one add_vectors() call against an AddDataRequest per row.
+
+python tests/vectordb/benchmark_bulk_ingest.py --rows 100000 --dim 128 --normalize
+"""
+
+import argparse
+import json
+import random
+import time
+
+import openviking.storage.vectordb.engine as engine
+
+from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
+from openviking.storage.vectordb.index.local_index import IndexEngineProxy, normalize_vector
+from openviking.storage.vectordb.store.data import CandidateData
+
+
+def index_config(rows, dim):
+    collection = get_or_create_local_collection(
+        meta_data={
+            "CollectionName": "benchmark_bulk_ingest",
+            "Fields": [
+                {"FieldName": "id", "FieldType": "int64", "IsPrimaryKey": True},
+                {"FieldName": "vector", "FieldType": "vector", "Dim": dim},
+                {"FieldName": "bucket", "FieldType": "int64"},
+            ],
+        }
+    )
+    collection.create_index(
+        "default",
+        {
+            "IndexName": "default",
+            "VectorIndex": {"IndexType": "flat", "Distance": "ip"},
+            "ScalarIndex": ["bucket"],
+        },
+    )
+    config = collection._Collection__collection.indexes.get("default").meta.get_build_index_dict()
+    collection.drop()
+    config["VectorIndex"]["ElementCount"] = 0
+    config["VectorIndex"]["MaxElementCount"] = rows
+    return json.dumps(config)
+
+
+def add_per_request(proxy, cands):
+    reqs = [engine.AddDataRequest() for _ in cands]
+    for req, data in zip(reqs, cands):
+        req.label = data.label
+        req.vector = normalize_vector(data.vector) if proxy.normalize_vector_flag else data.vector
+        req.fields_str = data.fields
+    proxy.index_engine.add_data(reqs)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--normalize", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    cands = [
+        CandidateData(
+            label=i + 1,
+            vector=[rng.random() for _ in range(args.dim)],
+            fields=json.dumps({"bucket": i % 4}),
+        )
+        for i in range(args.rows)
+    ]
+    config = index_config(args.rows, args.dim)
+
+    timings = {}
+    results = {}
+    query = [rng.random() for _ in range(args.dim)]
+    for name, add in (("per-request", add_per_request), ("add_vectors", IndexEngineProxy.add_data)):
+        proxy = IndexEngineProxy(config, args.normalize)
+        start = time.perf_counter()
+        add(proxy, cands)
+        timings[name] = time.perf_counter() - start
+        results[name] = proxy.search(query, 10)[0]
+
+    for name, seconds in timings.items():
+        print(f"{name:12s} {args.rows} x {args.dim}: {seconds:.2f} s")
+    print(f"same results: {results['per-request'] == results['add_vectors']}")
+
+
+if __name__ == "__main__":
+    main()
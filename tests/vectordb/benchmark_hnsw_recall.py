@@ -0,0 +1,151 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""Recall vs. latency of the HNSW index against the flat index.
+
+Builds one collection with a flat index (ground truth) and one HNSW index per
+EfSearch value, then reports recall@k and mean/p99 query latency for each.
+
+    python tests/vectordb/benchmark_hnsw_recall.py --count 100000 --dim 128
+"""
+
+import argparse
+import random
+import time
+
+from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
+
+DEFAULT_DIM = 128
+DEFAULT_EF_SEARCH = "16,32,64,128,256"
+
+
+def percentile(data, pct):
+    if not data:
+        return 0.0
+    ordered = sorted(data)
+    idx = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+    return ordered[idx]
+
+
+def timed_search(collection, index_name, queries, topk, filters=None):
+    latencies = []
+    results = []
+    for query in queries:
+        start = time.perf_counter()
+        res = collection.search_by_vector(
+            index_name, dense_vector=query, limit=topk, filters=filters
+        )
+        latencies.append(time.perf_counter() - start)
+        results.append([item.id for item in res.data])
+    return results, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HNSW vs flat recall/latency benchmark")
+    parser.add_argument("--count", type=int, default=50000, help="Number of vectors")
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--topk", type=int, default=10, help="Results per query")
+    parser.add_argument("--distance", type=str, default="ip", help="ip | l2 | cosine")
+    parser.add_argument("--m", type=int, default=16, help="HNSW M")
+    parser.add_argument("--ef_construction", type=int, default=200, help="HNSW EfConstruction")
+    parser.add_argument(
+        "--ef_search", type=str, default=DEFAULT_EF_SEARCH, help="Comma separated EfSearch values"
+    )
+    parser.add_argument(
+        "--filter_buckets",
+        type=int,
+        default=0,
+        help="If > 0, also benchmark a filter matching 1/N of the rows",
+    )
+    args = parser.parse_args()
+
+    random.seed(42)
+    meta_data = {
+        "CollectionName": "benchmark_hnsw",
+        "Fields": [
+            {"FieldName": "id", "FieldType": "int64", "IsPrimaryKey": True},
+            {"FieldName": "vector", "FieldType": "vector", "Dim": args.dim},
+            {"FieldName": "bucket", "FieldType": "int64"},
+        ],
+    }
+    collection = get_or_create_local_collection(meta_data=meta_data)
+
+    print(f"Inserting {args.count} vectors (dim={args.dim})...")
+    batch = []
+    for i in range(args.count):
+        batch.append(
+            {
+                "id": i,
+                "vector": [random.gauss(0, 1) for _ in range(args.dim)],
+                "bucket": i % max(1, args.filter_buckets),
+            }
+        )
+        if len(batch) == 1000:
+            collection.upsert_data(batch)
+            batch = []
+    if batch:
+        collection.upsert_data(batch)
+
+    queries = [[random.gauss(0, 1) for _ in range(args.dim)] for _ in range(args.queries)]
+    filters = None
+    if args.filter_buckets > 0:
+        filters = {"op": "must", "field": "bucket", "conds": [0]}
+
+    start = time.perf_counter()
+    collection.create_index(
+        "idx_flat",
+        {
+            "IndexName": "idx_flat",
+            "VectorIndex": {"IndexType": "flat", "Distance": args.distance},
+            "ScalarIndex": ["bucket"],
+        },
+    )
+    print(f"flat build: {time.perf_counter() - start:.2f}s")
+
+    truth, flat_lat = timed_search(collection, "idx_flat", queries, args.topk)
+    rows = [("flat", "-", 1.0, flat_lat)]
+    if filters:
+        filtered_truth, flat_filtered_lat = timed_search(
+            collection, "idx_flat", queries, args.topk, filters
+        )
+        rows.append(("flat+filter", "-", 1.0, flat_filtered_lat))
+
+    for ef in [int(v) for v in args.ef_search.split(",") if v]:
+        name = f"idx_hnsw_{ef}"
+        start = time.perf_counter()
+        collection.create_index(
+            name,
+            {
+                "IndexName": name,
+                "VectorIndex": {
+                    "IndexType": "hnsw",
+                    "Distance": args.distance,
+                    "M": args.m,
+                    "EfConstruction": args.ef_construction,
+                    "EfSearch": ef,
+                },
+                "ScalarIndex": ["bucket"],
+            },
+        )
+        print(f"hnsw build (ef_search={ef}): {time.perf_counter() - start:.2f}s")
+
+        approx, lat = timed_search(collection, name, queries, args.topk)
+        hits = sum(len(set(a) & set(t)) for a, t in zip(approx, truth))
+        rows.append(("hnsw", ef, hits / (args.topk * len(queries)), lat))
+        if filters:
+            approx, lat = timed_search(collection, name, queries, args.topk, filters)
+            hits = sum(len(set(a) & set(t)) for a, t in zip(approx, filtered_truth))
+            rows.append(("hnsw+filter", ef, hits / (args.topk * len(queries)), lat))
+        collection.drop_index(name)
+
+    print(f"\n{'index':<12} {'ef':>6} {'recall':>8} {'mean(ms)':>10} {'p99(ms)':>10}")
+    for kind, ef, recall, lat in rows:
+        mean_ms = sum(lat) / len(lat) * 1000
+        p99_ms = percentile(lat, 99) * 1000
+        print(f"{kind:<12} {ef!s:>6} {recall:>8.4f} {mean_ms:>10.3f} {p99_ms:>10.3f}")
+
+    collection.drop()
+
+
+if __name__ == "__main__":
+    main()
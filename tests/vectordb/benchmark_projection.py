@@ -0,0 +1,65 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""Search result materialization cost with and without output_fields projection.
+
+python tests/vectordb/benchmark_projection.py --rows 3000 --limit 1000 --dim 1024
+"""
+
+import argparse
+import random
+import time
+
+from openviking.storage.collection_schemas import CollectionSchemas
+from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=3000)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    collection = get_or_create_local_collection(
+        meta_data=CollectionSchemas.context_collection("benchmark_projection", args.dim)
+    )
+    collection.create_index(
+        "default",
+        {
+            "IndexName": "default",
+            "VectorIndex": {"IndexType": "flat", "Distance": "cosine"},
+            "ScalarIndex": ["uri"],
+        },
+    )
+    rows = [
+        {
+            "id": f"id{i}",
+            "uri": f"viking://resources/bench/{i}.md",
+            "parent_uri": "viking://resources/bench",
+            "context_type": "resource",
+            "level": 2,
+            "abstract": "word " * 150,
+            "account_id": "default",
+            "vector": [rng.random() for _ in range(args.dim)],
+        }
+        for i in range(args.rows)
+    ]
+    for start in range(0, len(rows), 500):
+        collection.upsert_data(rows[start : start + 500])
+
+    query = [rng.random() for _ in range(args.dim)]
+    for output_fields in (None, ["uri", "level", "abstract", "context_type"]):
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            collection.search_by_vector(
+                "default", dense_vector=query, limit=args.limit, output_fields=output_fields
+            )
+        elapsed = (time.perf_counter() - start) / args.rounds * 1000
+        print(f"output_fields={output_fields}: {elapsed:.1f} ms/search")
+    collection.drop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""N single searches against one search_by_vector_batch call on a flat index.
+
+python tests/vectordb/benchmark_search_batch.py --rows 50000 --dim 1024 --queries 8
+"""
+
+import argparse
+import random
+import time
+
+from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--queries", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    collection = get_or_create_local_collection(
+        meta_data={
+            "CollectionName": "benchmark_search_batch",
+            "Fields": [
+                {"FieldName": "id", "FieldType": "int64", "IsPrimaryKey": True},
+                {"FieldName": "vector", "FieldType": "vector", "Dim": args.dim},
+                {"FieldName": "bucket", "FieldType": "int64"},
+            ],
+        }
+    )
+    collection.create_index(
+        "default",
+        {
+            "IndexName": "default",
+            "VectorIndex": {"IndexType": "flat", "Distance": "ip"},
+            "ScalarIndex": ["bucket"],
+        },
+    )
+    for start in range(0, args.rows, 2000):
+        collection.upsert_data(
+            [
+                {"id": i, "vector": [rng.random() for _ in range(args.dim)], "bucket": i % 4}
+                for i in range(start, min(args.rows, start + 2000))
+            ]
+        )
+
+    queries = [
+        {
+            "dense_vector": [rng.random() for _ in range(args.dim)],
+            "limit": args.limit,
+            "filters": {"op": "must", "field": "bucket", "conds": [0, 1, 2]} if i % 2 else None,
+        }
+        for i in range(args.queries)
+    ]
+    output_fields = ["bucket"]
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        single = [
+            collection.search_by_vector("default", output_fields=output_fields, **query)
+            for query in queries
+        ]
+    single_ms = (time.perf_counter() - start) / args.rounds * 1000
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        batch = collection.search_by_vector_batch("default", queries, output_fields)
+    batch_ms = (time.perf_counter() - start) / args.rounds * 1000
+
+    agree = all(
+        [item.id for item in a.data] == [item.id for item in b.data] for a, b in zip(single, batch)
+    )
+    print(f"{args.queries} single searches: {single_ms:.1f} ms")
+    print(f"one batched search:   {batch_ms:.1f} ms")
+    print(f"same results: {agree}")
+    collection.drop()
+
+
+if __name__ == "__main__":
+    main()
@@ -283,6 +283,20 @@ class TestBytesRowConsistency(unittest.TestCase):
         self.assertEqual(len(py_bytes), len(cpp_bytes), "Binary length mismatch")
         self.assertEqual(py_bytes, cpp_bytes, "Binary content mismatch")
 
+    def test_replace_fields_consistency(self):
+        """replace_fields re-encodes identically in C++ and Python, keeping other fields"""
+        data_dict = self.generate_random_data()
+        serialized = self.cpp_row.serialize(data_dict)
+        new_fields = json.dumps({"key": "updated"})
+
+        cpp_bytes = self.cpp_row.replace_fields(serialized, {"fields": new_fields})
+        py_bytes = self.py_row.replace_fields(serialized, {"fields": new_fields})
+
+        self.assertEqual(cpp_bytes, py_bytes)
+        self.assertEqual(cpp_bytes, self.cpp_row.serialize({**data_dict, "fields": new_fields}))
+        with self.assertRaises(TypeError):
+            self.cpp_row.replace_fields(serialized, {"expire_ns_ts": "0"})
+
 
 if __name__ == "__main__":
     unittest.main()
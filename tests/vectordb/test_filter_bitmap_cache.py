@@ -0,0 +1,129 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
+
+
+def setup_collection():
+    meta_data = {
+        "CollectionName": "filter_bitmap_cache_col",
+        "Fields": [
+            {"FieldName": "id", "FieldType": "int64", "IsPrimaryKey": True},
+            {"FieldName": "vector", "FieldType": "vector", "Dim": 4},
+            {"FieldName": "owner", "FieldType": "string"},
+            {"FieldName": "kind", "FieldType": "string"},
+            {"FieldName": "count", "FieldType": "int64"},
+        ],
+    }
+    col = get_or_create_local_collection(meta_data=meta_data)
+    col.create_index(
+        "idx",
+        {
+            "IndexName": "idx",
+            "VectorIndex": {"IndexType": "flat", "Distance": "l2"},
+            "ScalarIndex": ["owner", "kind", "count"],
+        },
+    )
+    return col
+
+
+def records(ids):
+    return [
+        {
+            "id": i,
+            "vector": [float(i), 1.0, 0.5, 0.25],
+            "owner": f"user_{i % 3}",
+            "kind": "memory" if i % 2 else "resource",
+            "count": i,
+        }
+        for i in ids
+    ]
+
+
+# Tenant scope as compiled by the backend: a top-level "and" whose nested
+# conjuncts are memoized by the engine, followed by a per-query leaf.
+SCOPE = {
+    "op": "or",
+    "conds": [
+        {"op": "must", "field": "owner", "conds": ["user_0"]},
+        {
+            "op": "and",
+            "conds": [
+                {"op": "must", "field": "owner", "conds": ["user_1"]},
+                {"op": "must", "field": "kind", "conds": ["memory"]},
+            ],
+        },
+    ],
+}
+
+
+def scoped(leaf):
+    return {"op": "and", "conds": [SCOPE, leaf]}
+
+
+def search_ids(col, filters):
+    result = col.search_by_vector("idx", dense_vector=[0.0] * 4, limit=1000, filters=filters)
+    return sorted(item.id for item in result.data)
+
+
+def expected_ids(rows, min_count):
+    return sorted(
+        r["id"]
+        for r in rows
+        if r["count"] >= min_count
+        and (r["owner"] == "user_0" or (r["owner"] == "user_1" and r["kind"] == "memory"))
+    )
+
+
+class TestFilterBitmapCache(unittest.TestCase):
+    def setUp(self):
+        self.col = setup_collection()
+        self.rows = {r["id"]: r for r in records(range(60))}
+        self.col.upsert_data(list(self.rows.values()))
+
+    def tearDown(self):
+        self.col.close()
+
+    def assert_scope_matches(self, min_count):
+        leaf = {"op": "range", "field": "count", "gte": min_count}
+        expected = expected_ids(self.rows.values(), min_count)
+        # Repeat so the second search is answered from the memoized scope bitmap.
+        self.assertEqual(search_ids(self.col, scoped(leaf)), expected)
+        self.assertEqual(search_ids(self.col, scoped(leaf)), expected)
+        self.assertEqual(search_ids(self.col, {"op": "and", "conds": [leaf, SCOPE]}), expected)
+
+    def test_repeated_scope_with_varying_leaf(self):
+        for min_count in (0, 10, 30, 59, 100):
+            self.assert_scope_matches(min_count)
+
+    def test_memoized_scope_follows_upsert_update_and_delete(self):
+        self.assert_scope_matches(0)
+
+        new_rows = records(range(60, 70))
+        self.col.upsert_data(new_rows)
+        self.rows.update({r["id"]: r for r in new_rows})
+        self.assert_scope_matches(0)
+
+        self.col.update_scalar_fields({1: {"owner": "user_0"}, 3: {"kind": "resource"}})
+        self.rows[1]["owner"] = "user_0"
+        self.rows[3]["kind"] = "resource"
+        self.assert_scope_matches(0)
+
+        self.col.delete_data([0, 4, 7])
+        for i in (0, 4, 7):
+            del self.rows[i]
+        self.assert_scope_matches(0)
+
+    def test_empty_scope_conjunct(self):
+        leaf = {"op": "range", "field": "count", "gte": 0}
+        nobody = {
+            "op": "or",
+            "conds": [{"op": "must", "field": "owner", "conds": ["nobody"]}],
+        }
+        self.assertEqual(search_ids(self.col, {"op": "and", "conds": [nobody, leaf]}), [])
+        self.assertEqual(search_ids(self.col, {"op": "and", "conds": [nobody, leaf]}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
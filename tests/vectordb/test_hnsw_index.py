@@ -0,0 +1,217 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+import random
+import shutil
+import unittest
+
+from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
+from openviking.storage.vectordb.utils.validation import VectorIndexConfig
+
+# Test data path
+TEST_DB_PATH = "./test_data/test_hnsw_collection/"
+
+DIM = 32
+TOTAL_RECORDS = 2000
+
+
+def _make_meta(name):
+    return {
+        "CollectionName": name,
+        "Fields": [
+            {"FieldName": "id", "FieldType": "int64", "IsPrimaryKey": True},
+            {"FieldName": "vector", "FieldType": "vector", "Dim": DIM},
+            {"FieldName": "bucket", "FieldType": "int64"},
+        ],
+    }
+
+
+def _make_data(seed=42):
+    rng = random.Random(seed)
+    data = []
+    for i in range(TOTAL_RECORDS):
+        vec = [rng.uniform(-1, 1) for _ in range(DIM)]
+        data.append({"id": i, "vector": vec, "bucket": i % 10})
+    return data
+
+
+class TestHnswIndex(unittest.TestCase):
+    """HNSW index type against the flat index on the same collection"""
+
+    def setUp(self):
+        shutil.rmtree(TEST_DB_PATH, ignore_errors=True)
+        self.collections = []
+
+    def tearDown(self):
+        for collection in self.collections:
+            try:
+                collection.drop()
+            except Exception:
+                pass
+        self.collections.clear()
+        shutil.rmtree(TEST_DB_PATH, ignore_errors=True)
+
+    def register_collection(self, collection):
+        self.collections.append(collection)
+        return collection
+
+    def _create_indexes(self, collection, distance="l2"):
+        collection.create_index(
+            "idx_flat",
+            {
+                "IndexName": "idx_flat",
+                "VectorIndex": {"IndexType": "flat", "Distance": distance},
+                "ScalarIndex": ["id", "bucket"],
+            },
+        )
+        collection.create_index(
+            "idx_hnsw",
+            {
+                "IndexName": "idx_hnsw",
+                "VectorIndex": {
+                    "IndexType": "hnsw",
+                    "Distance": distance,
+                    "M": 16,
+                    "EfConstruction": 100,
+                    "EfSearch": 64,
+                },
+                "ScalarIndex": ["id", "bucket"],
+            },
+        )
+
+    def _recall(self, collection, queries, limit=10, filters=None):
+        hits = 0
+        for query in queries:
+            exact = collection.search_by_vector(
+                "idx_flat", dense_vector=query, limit=limit, filters=filters
+            )
+            approx = collection.search_by_vector(
+                "idx_hnsw", dense_vector=query, limit=limit, filters=filters
+            )
+            exact_ids = {item.id for item in exact.data}
+            hits += len(exact_ids & {item.id for item in approx.data})
+        return hits / (limit * len(queries))
+
+    def test_config_accepts_hnsw(self):
+        config = VectorIndexConfig(IndexType="hnsw_hybrid", M=8, EfSearch=32)
+        self.assertEqual(config.M, 8)
+        with self.assertRaises(ValueError):
+            VectorIndexConfig(IndexType="hnsw", M=1)
+
+    def test_upper_case_hybrid_type_enables_sparse(self):
+        meta = _make_meta("test_hnsw_hybrid_case")
+        meta["Fields"].append({"FieldName": "sparse_vector", "FieldType": "sparse_vector"})
+        collection = self.register_collection(get_or_create_local_collection(meta_data=meta))
+        for index_type in ("HNSW_HYBRID", "FLAT_HYBRID"):
+            collection.create_index(
+                index_type,
+                {"IndexName": index_type, "VectorIndex": {"IndexType": index_type}},
+            )
+            index = collection._Collection__collection.indexes.get(index_type)
+            vector_index = index.meta.get_build_index_dict()["VectorIndex"]
+            self.assertEqual(vector_index["IndexType"], index_type.split("_")[0].lower())
+            self.assertTrue(vector_index["EnableSparse"])
+
+            # Searching the still empty index returns no stale results.
+            result = collection.search_by_vector(
+                index_type, dense_vector=[1.0] * DIM, sparse_vector={"a": 1.0}, limit=5
+            )
+            self.assertEqual(result.data, [])
+
+    def test_recall_against_flat(self):
+        for distance in ("l2", "ip"):
+            collection = self.register_collection(
+                get_or_create_local_collection(meta_data=_make_meta(f"test_hnsw_{distance}"))
+            )
+            data = _make_data()
+            collection.upsert_data(data)
+            self._create_indexes(collection, distance)
+
+            queries = [data[i]["vector"] for i in range(0, TOTAL_RECORDS, 100)]
+            self.assertGreaterEqual(self._recall(collection, queries), 0.9, distance)
+
+            # The query vector itself must come back first.
+            result = collection.search_by_vector("idx_hnsw", dense_vector=queries[3], limit=1)
+            self.assertEqual(result.data[0].id, 300)
+
+    def test_filtered_search(self):
+        collection = self.register_collection(
+            get_or_create_local_collection(meta_data=_make_meta("test_hnsw_filter"))
+        )
+        data = _make_data()
+        collection.upsert_data(data)
+        self._create_indexes(collection)
+        queries = [data[i]["vector"] for i in range(5, TOTAL_RECORDS, 200)]
+
+        # Broad filter: walks the graph and drops non-matching nodes.
+        broad = {"op": "range", "field": "bucket", "lt": 5}
+        self.assertGreaterEqual(self._recall(collection, queries, filters=broad), 0.9)
+        result = collection.search_by_vector(
+            "idx_hnsw", dense_vector=queries[0], limit=20, filters=broad
+        )
+        self.assertEqual(len(result.data), 20)
+        self.assertTrue(all(item.id % 10 < 5 for item in result.data))
+
+        # Selective filter: answered exactly from the bitmap.
+        narrow = {"op": "must", "field": "id", "conds": [1, 2, 3]}
+        result = collection.search_by_vector(
+            "idx_hnsw", dense_vector=queries[0], limit=10, filters=narrow
+        )
+        self.assertEqual(sorted(item.id for item in result.data), [1, 2, 3])
+
+    def test_update_and_delete(self):
+        collection = self.register_collection(
+            get_or_create_local_collection(meta_data=_make_meta("test_hnsw_update"))
+        )
+        data = _make_data()
+        collection.upsert_data(data)
+        self._create_indexes(collection)
+
+        moved = [1.0] * DIM
+        collection.upsert_data([{"id": 7, "vector": moved, "bucket": 7}])
+        result = collection.search_by_vector("idx_hnsw", dense_vector=moved, limit=1)
+        self.assertEqual(result.data[0].id, 7)
+
+        # Delete enough rows to trigger graph compaction in the engine.
+        deleted = list(range(0, TOTAL_RECORDS, 2))
+        collection.delete_data(deleted)
+        result = collection.search_by_vector("idx_hnsw", dense_vector=data[1]["vector"], limit=50)
+        ids = [item.id for item in result.data]
+        self.assertEqual(ids[0], 1)
+        self.assertTrue(all(i % 2 == 1 for i in ids))
+
+        # Scalar filters keep working on compacted nodes.
+        result = collection.search_by_vector(
+            "idx_hnsw",
+            dense_vector=moved,
+            limit=5,
+            filters={"op": "must", "field": "bucket", "conds": [7]},
+        )
+        self.assertEqual(result.data[0].id, 7)
+
+    def test_persist_and_reload(self):
+        path = TEST_DB_PATH + "persist/"
+        data = _make_data()
+        collection = get_or_create_local_collection(
+            meta_data=_make_meta("test_hnsw_persist"), path=path
+        )
+        collection.upsert_data(data)
+        self._create_indexes(collection)
+        collection.delete_data([11])
+        expected = collection.search_by_vector(
+            "idx_hnsw", dense_vector=data[10]["vector"], limit=10
+        )
+        collection.close()
+
+        collection = self.register_collection(
+            get_or_create_local_collection(meta_data=_make_meta("test_hnsw_persist"), path=path)
+        )
+        meta = collection.get_index_meta_data("idx_hnsw")
+        self.assertEqual(meta["VectorIndex"]["IndexType"], "hnsw")
+        self.assertEqual(meta["VectorIndex"]["EfConstruction"], 100)
+        result = collection.search_by_vector("idx_hnsw", dense_vector=data[10]["vector"], limit=10)
+        self.assertEqual([item.id for item in result.data], [item.id for item in expected.data])
+        self.assertNotIn(11, [item.id for item in result.data])
+
+
+if __name__ == "__main__":
+    unittest.main()
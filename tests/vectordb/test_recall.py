@@ -419,6 +419,136 @@ class TestRecall(unittest.TestCase):
         )
         print("✓ Hybrid dense+sparse mix verified")
 
+    def test_sparse_postings_match_bruteforce(self):
+        """Sparse ranking through the term postings survives updates and deletes"""
+        print("\n=== Test: Sparse Postings vs Bruteforce ===")
+
+        meta_data = {
+            "CollectionName": "test_sparse_postings",
+            "Fields": [
+                {"FieldName": "id", "FieldType": "int64", "IsPrimaryKey": True},
+                {"FieldName": "vector", "FieldType": "vector", "Dim": 4},
+                {"FieldName": "sparse_vector", "FieldType": "sparse_vector"},
+            ],
+        }
+        collection = self.register_collection(
+            get_or_create_local_collection(meta_data=meta_data, path=TEST_DB_PATH)
+        )
+        collection.create_index(
+            "idx_sparse",
+            {
+                "IndexName": "idx_sparse",
+                "VectorIndex": {
+                    "IndexType": "flat_hybrid",
+                    "Distance": "ip",
+                    "SearchWithSparseLogitAlpha": 1.0,
+                },
+            },
+        )
+
+        rng = random.Random(7)
+        dense_vec = [1.0, 0.0, 0.0, 0.0]
+        vocab = [f"t{i}" for i in range(200)]
+        rows = {}
+
+        def random_rows(ids):
+            return [
+                {
+                    "id": i,
+                    "vector": dense_vec,
+                    "sparse_vector": {t: rng.uniform(0.1, 1.0) for t in rng.sample(vocab, 5)},
+                }
+                for i in ids
+            ]
+
+        # Rewriting every row three times leaves more stale postings than live
+        # ones, which forces a compaction of the posting lists.
+        for _ in range(3):
+            batch = random_rows(range(600))
+            collection.upsert_data(batch)
+            rows.update({row["id"]: row["sparse_vector"] for row in batch})
+        deleted = list(range(0, 600, 6))
+        collection.delete_data(deleted)
+        for i in deleted:
+            rows.pop(i)
+
+        for query in ({"t1": 1.0, "t2": 0.5, "t3": 0.25}, {"t10": 0.7, "t11": 0.9}):
+            expected = sorted(
+                rows,
+                key=lambda i: -sum(w * rows[i].get(t, 0.0) for t, w in query.items()),
+            )[:10]
+            result = collection.search_by_vector(
+                "idx_sparse", dense_vector=dense_vec, sparse_vector=query, limit=10
+            )
+            self.assertEqual([item.id for item in result.data], expected)
+        print("✓ Sparse postings ranking verified")
+
+    def test_hnsw_hybrid_sparse_candidates(self):
+        """HNSW hybrid search returns rows matched only through sparse terms"""
+        print("\n=== Test: HNSW Hybrid Sparse Candidates ===")
+
+        dim = 16
+        meta_data = {
+            "CollectionName": "test_hnsw_sparse",
+            "Fields": [
+                {"FieldName": "id", "FieldType": "int64", "IsPrimaryKey": True},
+                {"FieldName": "vector", "FieldType": "vector", "Dim": dim},
+                {"FieldName": "sparse_vector", "FieldType": "sparse_vector"},
+                {"FieldName": "bucket", "FieldType": "int64"},
+            ],
+        }
+        collection = self.register_collection(
+            get_or_create_local_collection(meta_data=meta_data, path=TEST_DB_PATH)
+        )
+        rng = random.Random(11)
+        query = [1.0] + [0.0] * (dim - 1)
+        data = []
+        for i in range(1000):
+            vec = [rng.uniform(0.5, 1.0)] + [rng.uniform(-0.1, 0.1) for _ in range(dim - 1)]
+            data.append({"id": i, "vector": vec, "sparse_vector": {"common": 0.1}, "bucket": i % 2})
+        # Far from the query in dense space, but the only rows with the rare term.
+        for i in (1000, 1001):
+            data.append(
+                {
+                    "id": i,
+                    "vector": [-1.0] + [0.0] * (dim - 1),
+                    "sparse_vector": {"rare": 1.0},
+                    "bucket": i % 2,
+                }
+            )
+        collection.upsert_data(data)
+        collection.create_index(
+            "idx_hnsw_hybrid",
+            {
+                "IndexName": "idx_hnsw_hybrid",
+                "VectorIndex": {
+                    "IndexType": "hnsw_hybrid",
+                    "Distance": "ip",
+                    "EfSearch": 16,
+                    "SearchWithSparseLogitAlpha": 0.9,
+                },
+                "ScalarIndex": ["id", "bucket"],
+            },
+        )
+
+        result = collection.search_by_vector(
+            "idx_hnsw_hybrid", dense_vector=query, sparse_vector={"rare": 1.0}, limit=5
+        )
+        self.assertEqual(sorted(item.id for item in result.data[:2]), [1000, 1001])
+
+        result = collection.search_by_vector(
+            "idx_hnsw_hybrid",
+            dense_vector=query,
+            sparse_vector={"rare": 1.0},
+            limit=5,
+            filters={"op": "must", "field": "bucket", "conds": [1]},
+        )
+        ids = [item.id for item in result.data]
+        self.assertEqual(ids[0], 1001)
+        self.assertNotIn(1000, ids)
+        self.assertTrue(all(i % 2 == 1 for i in ids))
+        print("✓ HNSW hybrid sparse candidates verified")
+
     def test_complex_schema_missing_fields(self):
         """Test adding data with missing optional fields using complex schema"""
         print("\n=== Test: Complex Schema Missing Fields ===")
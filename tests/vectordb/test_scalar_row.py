@@ -0,0 +1,106 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+
+from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
+from openviking.storage.vectordb.store.scalar_row import ScalarRowCodec
+
+FIELDS = {
+    "id": {"FieldName": "id", "FieldType": "string", "IsPrimaryKey": True},
+    "uri": {"FieldName": "uri", "FieldType": "path"},
+    "vector": {"FieldName": "vector", "FieldType": "vector", "Dim": 4},
+    "level": {"FieldName": "level", "FieldType": "int64"},
+    "score": {"FieldName": "score", "FieldType": "float32"},
+    "is_leaf": {"FieldName": "is_leaf", "FieldType": "bool"},
+    "abstract": {"FieldName": "abstract", "FieldType": "text"},
+    "tags": {"FieldName": "tags", "FieldType": "list<string>"},
+    "ids": {"FieldName": "ids", "FieldType": "list<int64>"},
+    "created_at": {"FieldName": "created_at", "FieldType": "date_time"},
+}
+
+
+class TestScalarRowCodec(unittest.TestCase):
+    def setUp(self):
+        self.codec = ScalarRowCodec(FIELDS)
+
+    def test_round_trip(self):
+        record = {
+            "id": "doc-1",
+            "uri": "viking://resources/项目/a.md",
+            "level": -(2**40),
+            "score": 0.1,
+            "is_leaf": True,
+            "abstract": "x" * 70000,
+            "tags": ["a", "ß"],
+            "ids": [1, 2**62],
+            "created_at": "2026-01-01T00:00:00",
+        }
+        self.assertEqual(self.codec.decode(self.codec.encode(record)), record)
+
+    def test_untyped_values_go_to_side_field(self):
+        record = {"id": "doc-1", "level": None, "score": 3, "meta": {"k": [1]}, "ids": [2**64]}
+        self.assertEqual(self.codec.decode(self.codec.encode(record)), record)
+
+    def test_projection_skips_absent_fields(self):
+        data = self.codec.encode({"id": "doc-1", "uri": "viking://a", "level": 2, "extra": 1})
+        self.assertEqual(
+            self.codec.decode(data, ["uri", "extra", "abstract", "unknown"]),
+            {"uri": "viking://a", "extra": 1},
+        )
+
+    def test_other_layout_is_rejected(self):
+        data = self.codec.encode({"id": "doc-1"})
+        other = ScalarRowCodec(dict(FIELDS, name={"FieldName": "name", "FieldType": "string"}))
+        self.assertIsNone(other.decode(data))
+        self.assertIsNone(self.codec.decode(b""))
+
+
+class TestCollectionProjection(unittest.TestCase):
+    def setUp(self):
+        self.collection = get_or_create_local_collection(
+            meta_data={
+                "CollectionName": "test_scalar_row",
+                "Fields": list(FIELDS.values()),
+            }
+        )
+        self.collection.create_index(
+            "default",
+            {
+                "IndexName": "default",
+                "VectorIndex": {"IndexType": "flat", "Distance": "ip"},
+                "ScalarIndex": ["uri", "level"],
+            },
+        )
+        self.collection.upsert_data(
+            [
+                {"id": "a", "uri": "viking://a", "vector": [1.0, 0, 0, 0], "level": 0},
+                {"id": "b", "uri": "viking://b", "vector": [0, 1.0, 0, 0], "tags": ["t"]},
+            ]
+        )
+
+    def tearDown(self):
+        self.collection.drop()
+
+    def test_search_projects_output_fields(self):
+        result = self.collection.search_by_vector(
+            "default", dense_vector=[1.0, 0, 0, 0], limit=2, output_fields=["uri"]
+        )
+        self.assertEqual([item.id for item in result.data], ["a", "b"])
+        self.assertEqual(result.data[0].fields, {"uri": "viking://a"})
+
+        result = self.collection.search_by_vector(
+            "default", dense_vector=[1.0, 0, 0, 0], limit=1, output_fields=["level", "vector"]
+        )
+        self.assertEqual(result.data[0].fields, {"level": 0, "vector": [1.0, 0, 0, 0]})
+
+    def test_fetch_after_schema_change_falls_back_to_json(self):
+        self.collection.update(
+            fields=list(FIELDS.values()) + [{"FieldName": "name", "FieldType": "string"}]
+        )
+        item = self.collection.fetch_data(["b"]).items[0]
+        self.assertEqual(item.fields["uri"], "viking://b")
+        self.assertEqual(item.fields["tags"], ["t"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+import random
+import shutil
+import unittest
+
+from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
+
+# Test data path
+TEST_DB_PATH = "./test_data/test_search_batch_collection/"
+
+DIM = 16
+TOTAL_RECORDS = 1500
+
+
+def _make_meta(name):
+    return {
+        "CollectionName": name,
+        "Fields": [
+            {"FieldName": "id", "FieldType": "int64", "IsPrimaryKey": True},
+            {"FieldName": "vector", "FieldType": "vector", "Dim": DIM},
+            {"FieldName": "sparse_vector", "FieldType": "sparse_vector"},
+            {"FieldName": "bucket", "FieldType": "int64"},
+        ],
+    }
+
+
+def _make_data(seed=3):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": i,
+            "vector": [rng.uniform(-1, 1) for _ in range(DIM)],
+            "sparse_vector": {f"t{rng.randrange(50)}": rng.uniform(0.1, 1.0) for _ in range(3)},
+            "bucket": i % 20,
+        }
+        for i in range(TOTAL_RECORDS)
+    ]
+
+
+class TestSearchBatch(unittest.TestCase):
+    """search_by_vector_batch returns the same hits as one search_by_vector per query"""
+
+    def setUp(self):
+        shutil.rmtree(TEST_DB_PATH, ignore_errors=True)
+        self.collections = []
+
+    def tearDown(self):
+        for collection in self.collections:
+            try:
+                collection.drop()
+            except Exception:
+                pass
+        self.collections.clear()
+        shutil.rmtree(TEST_DB_PATH, ignore_errors=True)
+
+    def register_collection(self, collection):
+        self.collections.append(collection)
+        return collection
+
+    def _queries(self, data):
+        rng = random.Random(5)
+        queries = []
+        for i in range(12):
+            query = {
+                "dense_vector": [rng.uniform(-1, 1) for _ in range(DIM)],
+                "limit": 5 + i % 4,
+                "offset": i % 3,
+            }
+            if i % 4 == 1:
+                # Broad filter: joins the shared scan.
+                query["filters"] = {"op": "range", "field": "bucket", "lt": 10}
+            elif i % 4 == 2:
+                # Selective filter: answered from its bitmap.
+                query["filters"] = {"op": "must", "field": "bucket", "conds": [7]}
+            elif i % 4 == 3:
+                query["filters"] = {"op": "must", "field": "id", "conds": [-1]}
+            if i % 2 == 0:
+                query["sparse_vector"] = data[i]["sparse_vector"]
+            queries.append(query)
+        return queries
+
+    def _assert_batch_matches(self, index_type, distance):
+        collection = self.register_collection(
+            get_or_create_local_collection(meta_data=_make_meta(f"batch_{index_type}_{distance}"))
+        )
+        data = _make_data()
+        collection.upsert_data(data)
+        collection.create_index(
+            "idx",
+            {
+                "IndexName": "idx",
+                "VectorIndex": {
+                    "IndexType": index_type,
+                    "Distance": distance,
+                    "SearchWithSparseLogitAlpha": 0.3,
+                },
+                "ScalarIndex": ["id", "bucket"],
+            },
+        )
+        queries = self._queries(data)
+
+        batch = collection.search_by_vector_batch("idx", queries, output_fields=["bucket"])
+
+        self.assertEqual(len(batch), len(queries))
+        for query, result in zip(queries, batch):
+            single = collection.search_by_vector("idx", output_fields=["bucket"], **query)
+            self.assertEqual(
+                [(item.id, item.fields) for item in result.data],
+                [(item.id, item.fields) for item in single.data],
+            )
+            for got, expected in zip(result.data, single.data):
+                self.assertAlmostEqual(got.score, expected.score, places=5)
+        self.assertEqual(batch[3].data, [])
+        self.assertTrue(all(item.fields["bucket"] == 7 for item in batch[2].data))
+
+    def test_flat_batch_matches_single_queries(self):
+        for distance in ("ip", "l2"):
+            self._assert_batch_matches("flat_hybrid", distance)
+
+    def test_hnsw_batch_matches_single_queries(self):
+        self._assert_batch_matches("hnsw_hybrid", "ip")
+
+    def test_failed_filter_reports_status_per_query(self):
+        collection = self.register_collection(
+            get_or_create_local_collection(meta_data=_make_meta("batch_status"))
+        )
+        collection.upsert_data(_make_data())
+        collection.create_index(
+            "idx",
+            {
+                "IndexName": "idx",
+                "VectorIndex": {"IndexType": "flat", "Distance": "ip"},
+                "ScalarIndex": ["id", "bucket"],
+            },
+        )
+        index = collection._Collection__collection.get_index("idx")
+        query_vector = [0.5] * DIM
+        queries = [
+            {"query_vector": query_vector, "limit": 3},
+            # The field is not indexed, so the filter cannot be evaluated.
+            {
+                "query_vector": query_vector,
+                "limit": 3,
+                "filters": {"op": "must", "field": "missing", "conds": [1]},
+            },
+        ]
+        engine = index.engine_proxy.index_engine
+        reqs = [index.engine_proxy._make_search_request(**query) for query in queries]
+
+        batch = engine.search_batch(reqs)
+        single = [engine.search(req) for req in reqs]
+
+        self.assertEqual([result.status for result in batch], [0, -1])
+        self.assertEqual([result.status for result in single], [0, -1])
+        self.assertEqual(batch[0].result_num, 3)
+        self.assertEqual(batch[1].labels, [])
+
+    def test_missing_index_and_empty_batch(self):
+        collection = self.register_collection(
+            get_or_create_local_collection(meta_data=_make_meta("batch_empty"))
+        )
+        self.assertEqual(collection.search_by_vector_batch("missing", [{"limit": 3}])[0].data, [])
+        self.assertEqual(collection.search_by_vector_batch("missing", []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+import multiprocessing
+import shutil
+import sys
+import threading
+import time
+import unittest
+
+from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
+
+DB_PATH = "./test_data/test_db_update_scalar_fields"
+
+
+def setup_collection(path=""):
+    meta_data = {
+        "CollectionName": "update_scalar_col",
+        "Fields": [
+            {"FieldName": "id", "FieldType": "int64", "IsPrimaryKey": True},
+            {"FieldName": "vector", "FieldType": "vector", "Dim": 4},
+            {"FieldName": "name", "FieldType": "string"},
+            {"FieldName": "count", "FieldType": "int64"},
+        ],
+    }
+    col = get_or_create_local_collection(meta_data=meta_data, path=path)
+    if not col.has_index("idx"):
+        col.create_index(
+            "idx",
+            {
+                "IndexName": "idx",
+                "VectorIndex": {"IndexType": "flat", "Distance": "l2"},
+                "ScalarIndex": ["name", "count"],
+            },
+        )
+    return col
+
+
+def records(n=10):
+    return [
+        {"id": i, "vector": [float(i), 1.0, 0.5, 0.25], "name": f"item_{i}", "count": i}
+        for i in range(n)
+    ]
+
+
+def search_ids(col, filters):
+    result = col.search_by_vector("idx", dense_vector=[0.0] * 4, limit=100, filters=filters)
+    return sorted(item.id for item in result.data)
+
+
+def worker_update_and_crash(path, event_ready):
+    """Upsert, update scalar fields, then wait to be killed without close()."""
+    try:
+        col = setup_collection(path)
+        col.upsert_data(records())
+        col.update_scalar_fields({2: {"count": 100}, 5: {"count": 200}})
+        event_ready.set()
+        time.sleep(60)
+    except Exception as e:
+        print(f"[Subprocess] Error: {e}")
+        sys.exit(1)
+
+
+class TestUpdateScalarFields(unittest.TestCase):
+    def setUp(self):
+        shutil.rmtree(DB_PATH, ignore_errors=True)
+
+    def tearDown(self):
+        shutil.rmtree(DB_PATH, ignore_errors=True)
+
+    def test_updates_fields_and_scalar_index_keeping_vectors(self):
+        col = setup_collection()
+        col.upsert_data(records())
+        before = {item.id: item.fields for item in col.fetch_data([3, 4]).items}
+
+        updated = col.update_scalar_fields({3: {"count": 50}, 4: {"count": 60}, 99: {"count": 1}})
+
+        self.assertEqual(updated, 2)
+        after = {item.id: item.fields for item in col.fetch_data([3, 4]).items}
+        self.assertEqual(after[3]["count"], 50)
+        self.assertEqual(after[3]["name"], "item_3")
+        self.assertEqual(after[3]["vector"], before[3]["vector"])
+        self.assertEqual(search_ids(col, {"op": "range", "field": "count", "gte": 50}), [3, 4])
+        # Old values are gone from the scalar index
+        self.assertEqual(search_ids(col, {"op": "must", "field": "count", "conds": [3]}), [])
+        # Vector search still finds the updated records
+        nearest = col.search_by_vector("idx", dense_vector=[3.0, 1.0, 0.5, 0.25], limit=1)
+        self.assertEqual(nearest.data[0].id, 3)
+        col.close()
+
+    def test_rejects_vector_and_unknown_fields(self):
+        col = setup_collection()
+        col.upsert_data(records(2))
+
+        with self.assertRaises(ValueError):
+            col.update_scalar_fields({0: {"vector": [0.0] * 4}})
+        with self.assertRaises(ValueError):
+            col.update_scalar_fields({0: {"missing": 1}})
+        col.close()
+
+    def test_concurrent_upsert_is_not_reverted(self):
+        col = setup_collection()
+        col.upsert_data(records())
+        store_mgr = col._Collection__collection.store_mgr
+        fetch = store_mgr.fetch_cands_columns
+        upsert = threading.Thread(
+            target=col.upsert_data,
+            args=([{"id": 3, "vector": [3.0, 1.0, 0.5, 0.25], "name": "renamed", "count": 7}],),
+        )
+
+        def fetch_then_race(*args, **kwargs):
+            columns = fetch(*args, **kwargs)
+            if upsert.ident is not None:
+                return columns
+            upsert.start()
+            # The upsert waits for the update to finish instead of landing
+            # between its read and its write.
+            upsert.join(0.2)
+            self.assertTrue(upsert.is_alive())
+            return columns
+
+        store_mgr.fetch_cands_columns = fetch_then_race
+        col.update_scalar_fields({3: {"count": 50}})
+        upsert.join(5)
+
+        fields = col.fetch_data([3]).items[0].fields
+        self.assertEqual((fields["name"], fields["count"]), ("renamed", 7))
+        self.assertEqual(
+            search_ids(col, {"op": "must", "field": "name", "conds": ["renamed"]}), [3]
+        )
+        self.assertEqual(search_ids(col, {"op": "range", "field": "count", "gte": 50}), [])
+        col.close()
+
+    def test_updates_are_replayed_after_crash(self):
+        ctx = multiprocessing.get_context("spawn")
+        event = ctx.Event()
+        p = ctx.Process(target=worker_update_and_crash, args=(DB_PATH, event))
+        p.start()
+        self.assertTrue(event.wait(timeout=30), "Subprocess timed out")
+        time.sleep(0.5)
+        p.terminate()
+        p.join()
+
+        col = setup_collection(DB_PATH)
+        fetched = {item.id: item.fields["count"] for item in col.fetch_data([2, 5]).items}
+        self.assertEqual(fetched, {2: 100, 5: 200})
+        self.assertEqual(search_ids(col, {"op": "range", "field": "count", "gte": 100}), [2, 5])
+        self.assertEqual(len(search_ids(col, {})), 10)
+        col.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
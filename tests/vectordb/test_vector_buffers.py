@@ -0,0 +1,148 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+import json
+import math
+import random
+import unittest
+from array import array
+
+import openviking.storage.vectordb.engine as engine
+
+from openviking.storage.vectordb.collection.local_collection import get_or_create_local_collection
+from openviking.storage.vectordb.index.local_index import IndexEngineProxy, normalize_vector
+from openviking.storage.vectordb.store.data import CandidateData, DeltaRecord
+
+DIM = 8
+
+
+def index_config(n):
+    meta_data = {
+        "CollectionName": "vector_buffers_col",
+        "Fields": [
+            {"FieldName": "id", "FieldType": "int64", "IsPrimaryKey": True},
+            {"FieldName": "vector", "FieldType": "vector", "Dim": DIM},
+            {"FieldName": "bucket", "FieldType": "int64"},
+        ],
+    }
+    col = get_or_create_local_collection(meta_data=meta_data)
+    col.create_index(
+        "idx",
+        {
+            "IndexName": "idx",
+            "VectorIndex": {"IndexType": "flat", "Distance": "ip"},
+            "ScalarIndex": ["bucket"],
+        },
+    )
+    config = col._Collection__collection.indexes.get("idx").meta.get_build_index_dict()
+    col.close()
+    config["VectorIndex"]["ElementCount"] = 0
+    config["VectorIndex"]["MaxElementCount"] = n
+    return json.dumps(config)
+
+
+def candidates(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        CandidateData(
+            label=i + 1,
+            vector=[rng.uniform(-1, 1) for _ in range(DIM)],
+            fields=json.dumps({"bucket": i % 3}),
+        )
+        for i in range(n)
+    ]
+
+
+def reference_normalize(vector):
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else list(vector)
+
+
+class TestVectorBuffers(unittest.TestCase):
+    def test_normalize_vector(self):
+        vector = [3.0, 4.0, 0.0, 12.0]
+        expected = reference_normalize(vector)
+        for value in (vector, array("f", vector), array("d", vector), tuple(vector)):
+            for got, want in zip(normalize_vector(value), expected):
+                self.assertAlmostEqual(got, want, places=6)
+        self.assertEqual(normalize_vector([0.0, 0.0]), [0.0, 0.0])
+        self.assertEqual(normalize_vector([]), [])
+
+    def test_batched_add_matches_per_request_add(self):
+        cands = candidates(200)
+        query = [0.5] * DIM
+        results = []
+        for normalize in (False, True):
+            batched = IndexEngineProxy(index_config(200), normalize)
+            batched.add_data(cands)
+
+            per_request = IndexEngineProxy(index_config(200), normalize)
+            reqs = [engine.AddDataRequest() for _ in cands]
+            for req, data in zip(reqs, cands):
+                req.label = data.label
+                req.vector = reference_normalize(data.vector) if normalize else data.vector
+                req.fields_str = data.fields
+            per_request.index_engine.add_data(reqs)
+
+            for proxy in (batched, per_request):
+                results.append(
+                    proxy.search(query, 10, {"op": "must", "field": "bucket", "conds": [1]})
+                )
+            self.assertEqual(results[-2][0], results[-1][0])
+            for a, b in zip(results[-2][1], results[-1][1]):
+                self.assertAlmostEqual(a, b, places=5)
+        # Normalization changes the ranking of the unnormalized vectors
+        self.assertNotEqual(results[0][1], results[2][1])
+
+    def test_upsert_and_buffer_queries(self):
+        proxy = IndexEngineProxy(index_config(10), True)
+        proxy.add_data(candidates(10))
+        moved = [DeltaRecord(label=3, vector=[1.0] * DIM, fields=json.dumps({"bucket": 2}))]
+        moved[0].old_fields = json.dumps({"bucket": 2})
+        proxy.upsert_data(moved)
+
+        labels, scores = proxy.search([1.0] * DIM, 1)
+        self.assertEqual(labels, [3])
+        # Both the stored vector and the query are normalized
+        self.assertAlmostEqual(scores[0], 1.0, places=5)
+        self.assertEqual(proxy.search(array("f", [1.0] * DIM), 1)[0], [3])
+        self.assertEqual(proxy.search(array("d", [1.0] * DIM), 1)[0], [3])
+
+    def test_add_vectors_from_2d_buffer(self):
+        cands = candidates(20)
+        flat = array("f", [x for data in cands for x in data.vector])
+        matrix = memoryview(flat).cast("B").cast("f", [len(cands), DIM])
+        labels = [data.label for data in cands]
+        fields = [data.fields for data in cands]
+
+        from_buffer = IndexEngineProxy(index_config(20), False)
+        from_buffer.index_engine.add_vectors(labels, matrix, DIM, fields, [], [], [])
+        from_flat = IndexEngineProxy(index_config(20), False)
+        from_flat.index_engine.add_vectors(labels, flat, DIM, fields, [], [], [])
+        from_rows = IndexEngineProxy(index_config(20), False)
+        from_rows.add_data(cands)
+
+        query = [0.25] * DIM
+        expected = from_rows.search(query, 5)
+        self.assertEqual(from_buffer.search(query, 5), expected)
+        self.assertEqual(from_flat.search(query, 5), expected)
+
+    def test_add_vectors_rejects_bad_input(self):
+        proxy = IndexEngineProxy(index_config(4), False)
+        add = proxy.index_engine.add_vectors
+        fields = ["{}"] * 2
+        with self.assertRaises(TypeError):
+            add([1, 2], array("d", [0.0] * 2 * DIM), DIM, fields, [], [], [])
+        with self.assertRaises(ValueError):
+            add([1, 2], memoryview(array("f", [0.0] * 4 * DIM))[::2], DIM, fields, [], [], [])
+        with self.assertRaises(ValueError):
+            add([1, 2], array("f", [0.0] * 3 * DIM), DIM, fields, [], [], [])
+        with self.assertRaises(ValueError):
+            add([1, 2], [[0.0] * DIM, [0.0] * (DIM - 1)], DIM, fields, [], [], [])
+        with self.assertRaises(ValueError):
+            add([1, 2], [[0.0] * DIM] * 2, DIM, ["{}"], [], [], [])
+        with self.assertRaises(TypeError):
+            add([1], [["x"] * DIM], DIM, ["{}"], [], [], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
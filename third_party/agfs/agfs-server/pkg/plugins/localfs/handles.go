@@ -0,0 +1,110 @@
+package localfs
+
+import (
+	"fmt"
+	"os"
+
+	"github.com/c4pt0r/agfs/agfs-server/pkg/filesystem"
+)
+
+// HandleFS Implementation
+//
+// Handles delegate reads and writes to LocalFS.Read/Write, so a handle opened
+// with O_APPEND appends through an O_APPEND open of the local file: the cost of
+// a write depends on the size of the data, not on the size of the file.
+
+// localFileHandle is a BaseFileHandle that unregisters itself on Close
+type localFileHandle struct {
+	*filesystem.BaseFileHandle
+	lfs *LocalFS
+}
+
+// Close closes the handle and releases its ID
+func (h *localFileHandle) Close() error {
+	h.lfs.handlesMu.Lock()
+	delete(h.lfs.handles, h.ID())
+	h.lfs.handlesMu.Unlock()
+	return h.BaseFileHandle.Close()
+}
+
+// OpenHandle opens a file and returns a handle for stateful operations
+func (fs *LocalFS) OpenHandle(path string, flags filesystem.OpenFlag, mode uint32) (filesystem.FileHandle, error) {
+	localPath := fs.resolvePath(path)
+
+	openFlags := os.O_RDONLY
+	switch {
+	case flags&filesystem.O_RDWR != 0:
+		openFlags = os.O_RDWR
+	case flags&filesystem.O_WRONLY != 0:
+		openFlags = os.O_WRONLY
+	}
+	if flags&filesystem.O_CREATE != 0 {
+		openFlags |= os.O_CREATE
+	}
+	if flags&filesystem.O_EXCL != 0 {
+		openFlags |= os.O_EXCL
+	}
+	if flags&filesystem.O_TRUNC != 0 {
+		openFlags |= os.O_TRUNC
+	}
+
+	// Open once to apply O_CREATE/O_EXCL/O_TRUNC and validate the path
+	fs.mu.Lock()
+	if info, err := os.Stat(localPath); err == nil && info.IsDir() {
+		fs.mu.Unlock()
+		return nil, fmt.Errorf("is a directory: %s", path)
+	}
+	f, err := os.OpenFile(localPath, openFlags, os.FileMode(mode))
+	fs.mu.Unlock()
+	if err != nil {
+		if os.IsNotExist(err) {
+			return nil, filesystem.NewNotFoundError("openhandle", path)
+		}
+		if os.IsExist(err) {
+			return nil, filesystem.NewAlreadyExistsError("file", path)
+		}
+		return nil, fmt.Errorf("failed to open file: %w", err)
+	}
+	f.Close()
+
+	fs.handlesMu.Lock()
+	handleID := fs.nextHandleID
+	fs.nextHandleID++
+	handle := &localFileHandle{
+		BaseFileHandle: filesystem.NewBaseFileHandle(handleID, path, flags, fs),
+		lfs:            fs,
+	}
+	fs.handles[handleID] = handle
+	fs.handlesMu.Unlock()
+
+	return handle, nil
+}
+
+// GetHandle retrieves an existing handle by its ID
+func (fs *LocalFS) GetHandle(id int64) (filesystem.FileHandle, error) {
+	fs.handlesMu.RLock()
+	defer fs.handlesMu.RUnlock()
+
+	handle, exists := fs.handles[id]
+	if !exists {
+		return nil, filesystem.ErrNotFound
+	}
+
+	return handle, nil
+}
+
+// CloseHandle closes a handle by its ID
+func (fs *LocalFS) CloseHandle(id int64) error {
+	fs.handlesMu.RLock()
+	handle, exists := fs.handles[id]
+	fs.handlesMu.RUnlock()
+
+	if !exists {
+		return filesystem.ErrNotFound
+	}
+
+	return handle.Close()
+}
+
+// Ensure LocalFS implements HandleFS interface
+var _ filesystem.HandleFS = (*LocalFS)(nil)
@@ -24,6 +24,11 @@ type LocalFS struct {
 	basePath   string // The local directory to mount
 	mu         sync.RWMutex
 	pluginName string
+
+	// Handle management
+	handles      map[int64]*localFileHandle
+	handlesMu    sync.RWMutex
+	nextHandleID int64
 }
 
 // NewLocalFS creates a new local file system
@@ -48,8 +53,10 @@ func NewLocalFS(basePath string) (*LocalFS, error) {
 	}
 
 	return &LocalFS{
-		basePath:   absPath,
-		pluginName: PluginName,
+		basePath:     absPath,
+		pluginName:   PluginName,
+		handles:      make(map[int64]*localFileHandle),
+		nextHandleID: 1,
 	}, nil
 }
 
@@ -199,6 +199,44 @@ func TestLocalFSWriteAppend(t *testing.T) {
 	}
 }
 
+func TestLocalFSHandleAppend(t *testing.T) {
+	dir, cleanup := setupTestDir(t)
+	defer cleanup()
+
+	fs := newTestFS(t, dir)
+	path := "/log.jsonl"
+	flags := filesystem.O_WRONLY | filesystem.O_APPEND | filesystem.O_CREATE
+
+	for _, line := range []string{"first\n", "second\n"} {
+		handle, err := fs.OpenHandle(path, flags, 0644)
+		if err != nil {
+			t.Fatalf("OpenHandle failed: %v", err)
+		}
+		if _, err := handle.Write([]byte(line)); err != nil {
+			t.Fatalf("Handle write failed: %v", err)
+		}
+		if err := fs.CloseHandle(handle.ID()); err != nil {
+			t.Fatalf("CloseHandle failed: %v", err)
+		}
+		if _, err := fs.GetHandle(handle.ID()); err == nil {
+			t.Errorf("Handle %d still registered after close", handle.ID())
+		}
+	}
+
+	content, err := readIgnoreEOF(fs, path)
+	if err != nil {
+		t.Fatalf("Read failed: %v", err)
+	}
+	expected := "first\nsecond\n"
+	if string(content) != expected {
+		t.Errorf("Content mismatch: got %q, want %q", string(content), expected)
+	}
+
+	if _, err := fs.OpenHandle("/missing.txt", filesystem.O_WRONLY|filesystem.O_APPEND, 0644); err == nil {
+		t.Error("OpenHandle without O_CREATE should fail for a missing file")
+	}
+}
+
 func TestLocalFSWriteTruncate(t *testing.T) {
 	dir, cleanup := setupTestDir(t)
 	defer cleanup()